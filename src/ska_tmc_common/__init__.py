@@ -13,6 +13,7 @@ ska-tmc-common
 from .adapters import (
     AdapterFactory,
     AdapterType,
+    AttributeSnapshot,
     BaseAdapter,
     CspMasterAdapter,
     CspMasterLeafNodeAdapter,
@@ -25,6 +26,7 @@ from .adapters import (
     SubarrayAdapter,
 )
 from .aggregators import Aggregator
+from .clock import AcceleratedClock, Clock, VirtualClock, get_clock, set_clock
 from .dev_factory import DevFactory
 from .device_info import (
     DeviceInfo,
@@ -36,6 +38,7 @@ from .device_info import (
 from .dish_utils import AntennaLocation, AntennaParams, DishHelper
 from .enum import (
     Band,
+    CircuitBreakerState,
     DishMode,
     FaultType,
     LivelinessProbeType,
@@ -46,6 +49,7 @@ from .enum import (
 from .error_propagation_decorator import error_propagation_decorator
 from .event_callback import EventCallback
 from .event_receiver import EventReceiver
+from .event_recorder import EventLogReader, EventRecorder, EventReplayer
 from .exceptions import (
     CommandNotAllowed,
     ConversionError,
@@ -58,12 +62,15 @@ from .exceptions import (
     SubarrayNotPresentError,
 )
 from .input import InputParameter
+from .latency_histogram import EventLatencyTracker, LatencyHistogram
+from .latency_statistics import LatencyStatistics
 from .liveliness_probe import (
     BaseLivelinessProbe,
     MultiDeviceLivelinessProbe,
     SingleDeviceLivelinessProbe,
 )
 from .lrcr_callback import LRCRCallback
+from .metrics import Counter, Gauge, Histogram, MetricsRegistry
 from .op_state_model import TMCOpStateMachine, TMCOpStateModel
 from .test_helpers.empty_component_manager import EmptyComponentManager
 from .test_helpers.helper_adapter_factory import HelperAdapterFactory
@@ -124,6 +131,7 @@ __all__ = [
     "SubarrayAdapter",
     "SdpSubArrayAdapter",
     "BaseAdapter",
+    "AttributeSnapshot",
     "MCCSMasterLeafNodeAdapter",
     "MCCSControllerAdapter",
     "CspMasterLeafNodeAdapter",
@@ -140,6 +148,7 @@ __all__ = [
     "PointingState",
     "Band",
     "LivelinessProbeType",
+    "CircuitBreakerState",
     "TimeoutState",
     "FaultType",
     "EventReceiver",
@@ -153,9 +162,19 @@ __all__ = [
     "InvalidReceptorIdError",
     "ConversionError",
     "InputParameter",
+    "EventLatencyTracker",
+    "EventLogReader",
+    "EventRecorder",
+    "EventReplayer",
+    "LatencyHistogram",
+    "LatencyStatistics",
     "BaseLivelinessProbe",
     "MultiDeviceLivelinessProbe",
     "SingleDeviceLivelinessProbe",
+    "MetricsRegistry",
+    "Counter",
+    "Gauge",
+    "Histogram",
     "TMCOpStateMachine",
     "TMCOpStateModel",
     "TimeoutCallback",
@@ -192,6 +211,11 @@ __all__ = [
     "DummyTmcDevice",
     "HelperSdpQueueConnector",
     "TimeKeeper",
+    "Clock",
+    "AcceleratedClock",
+    "VirtualClock",
+    "get_clock",
+    "set_clock",
     "timeout_decorator",
     "error_propagation_decorator",
     "SdpQueueConnectorDeviceInfo",
@@ -5,7 +5,9 @@ functions of adapters by creating proxy for devices.
 
 import enum
 import logging
-from typing import List, Tuple, Union
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import tango
 from ska_ser_logging.configuration import configure_logging
@@ -40,6 +42,123 @@ class AdapterType(enum.IntEnum):
     DISHLN_POINTING_DEVICE = 10
 
 
+class AttributeSnapshot:
+    """
+    Values of several attributes of a device, read together with a single
+    read_attributes call on the device proxy.
+
+    Attribute names are matched case insensitively, as in Tango.
+    """
+
+    def __init__(
+        self,
+        dev_name: str,
+        device_attributes: Sequence[tango.DeviceAttribute],
+        read_time: Optional[float] = None,
+    ) -> None:
+        """
+        :param dev_name: name of the device the attributes belong to
+        :type dev_name: str
+        :param device_attributes: DeviceAttribute objects returned by the
+            proxy
+        :type device_attributes: Sequence[tango.DeviceAttribute]
+        :param read_time: time at which the attributes were read, i.e. the
+            read time of the oldest one when some were read earlier,
+            defaults to now
+        :type read_time: float, optional
+        """
+        self.dev_name = dev_name
+        self.read_time = read_time if read_time is not None else time.time()
+        self._attributes: Dict[str, tango.DeviceAttribute] = {
+            device_attribute.name.lower(): device_attribute
+            for device_attribute in device_attributes
+        }
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Returns the names of the attributes in the snapshot.
+        :return: attribute names as reported by the device
+        """
+        return [attribute.name for attribute in self._attributes.values()]
+
+    @property
+    def failed(self) -> List[str]:
+        """
+        Returns the names of the attributes which could not be read.
+        :return: names of failed attributes
+        """
+        return [
+            attribute.name
+            for attribute in self._attributes.values()
+            if attribute.has_failed
+        ]
+
+    def _get_attribute(self, name: str) -> tango.DeviceAttribute:
+        """
+        Returns the DeviceAttribute for the given name.
+
+        :raises KeyError: if the attribute is not part of the snapshot
+        """
+        try:
+            return self._attributes[name.lower()]
+        except KeyError as exception:
+            raise KeyError(
+                f"Attribute {name} is not part of the snapshot of "
+                f"{self.dev_name}"
+            ) from exception
+
+    def __getitem__(self, name: str) -> Any:
+        return self._get_attribute(name).value
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._attributes
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Returns the value of the attribute, or default if the attribute is
+        not part of the snapshot or could not be read.
+
+        :param name: attribute name
+        :param default: value returned when no value is available
+        :return: attribute value
+        """
+        device_attribute = self._attributes.get(name.lower())
+        if device_attribute is None or device_attribute.has_failed:
+            return default
+        return device_attribute.value
+
+    def quality(self, name: str) -> tango.AttrQuality:
+        """
+        Returns the quality of the attribute.
+        :param name: attribute name
+        :return: attribute quality
+        """
+        return self._get_attribute(name).quality
+
+    def timestamp(self, name: str) -> float:
+        """
+        Returns the device side timestamp of the attribute value.
+        :param name: attribute name
+        :return: timestamp in seconds since epoch
+        """
+        return self._get_attribute(name).time.totime()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the snapshot as a dictionary of attribute name to value.
+        Attributes which could not be read are mapped to None.
+        :return: attribute values
+        """
+        return {
+            attribute.name: (None if attribute.has_failed else attribute.value)
+            for attribute in self._attributes.values()
+        }
+
+
 class BaseAdapter:
     """
     It is base class used in creating adapters.
@@ -48,6 +167,10 @@ class BaseAdapter:
     def __init__(self, dev_name: str, proxy: tango.DeviceProxy) -> None:
         self._proxy = proxy
         self._dev_name = dev_name
+        self._snapshot_cache: Dict[
+            str, Tuple[float, tango.DeviceAttribute]
+        ] = {}
+        self._snapshot_cache_lock = threading.Lock()
 
     @property
     def proxy(self) -> tango.DeviceProxy:
@@ -88,6 +211,71 @@ class BaseAdapter:
         """
         self._proxy.adminMode = value
 
+    def read_snapshot(
+        self, names: Sequence[str], max_age: float = 0.0
+    ) -> AttributeSnapshot:
+        """
+        Reads the given attributes of the device with a single
+        read_attributes call, instead of one network call per attribute.
+
+        When max_age is given, attribute values read by a previous snapshot
+        not more than max_age seconds ago are reused, and only the missing or
+        older attributes are read from the device. This allows several reads
+        inside one command step to share a single round trip. The read time
+        of the snapshot is then the one of its oldest value.
+
+        :param names: names of the attributes to read
+        :type names: Sequence[str]
+        :param max_age: maximum age in seconds of cached values that may be
+            reused, defaults to 0 (always read from the device)
+        :type max_age: float
+        :return: snapshot of the attribute values
+        :rtype: AttributeSnapshot
+        """
+        now = time.time()
+        read_times: List[float] = []
+        device_attributes: Dict[str, tango.DeviceAttribute] = {}
+        names_to_read: List[str] = []
+        with self._snapshot_cache_lock:
+            for name in names:
+                cached = self._snapshot_cache.get(name.lower())
+                if max_age > 0 and cached and now - cached[0] <= max_age:
+                    device_attributes[name.lower()] = cached[1]
+                    read_times.append(cached[0])
+                else:
+                    names_to_read.append(name)
+
+        if names_to_read:
+            read_time = time.time()
+            read_times.append(read_time)
+            read_attributes = self._proxy.read_attributes(names_to_read)
+            with self._snapshot_cache_lock:
+                for device_attribute in read_attributes:
+                    key = device_attribute.name.lower()
+                    device_attributes[key] = device_attribute
+                    if not device_attribute.has_failed:
+                        self._snapshot_cache[key] = (
+                            read_time,
+                            device_attribute,
+                        )
+
+        return AttributeSnapshot(
+            self._dev_name,
+            [
+                device_attributes[name.lower()]
+                for name in names
+                if name.lower() in device_attributes
+            ],
+            min(read_times, default=now),
+        )
+
+    def invalidate_snapshot_cache(self) -> None:
+        """
+        Discards the attribute values cached by read_snapshot.
+        """
+        with self._snapshot_cache_lock:
+            self._snapshot_cache.clear()
+
     def On(self) -> Tuple[List[ResultCode], List[str]]:
         """
         Sets device proxies to ON state.
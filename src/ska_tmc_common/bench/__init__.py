@@ -0,0 +1,9 @@
+"""
+Offline benchmarks for ska-tmc-common.
+
+The benchmarks run against in-process stub devices, or helper devices
+started in one in-process device server by the device harness, instead
+of a Tango deployment, so that they can be used to size TMC nodes and to
+compare the performance of different implementations on a single
+machine.
+"""
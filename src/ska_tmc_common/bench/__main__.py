@@ -0,0 +1,214 @@
+"""
+Command line entry point of the offline benchmarks, which runs scenarios
+of the hot path benchmark suite against stub device proxies and prints a
+summary table or the JSON report.
+
+For instance, to check whether a leaf node process handles the events of
+200 dishes sending 20 events per second each::
+
+    python -m ska_tmc_common.bench event_load --devices 200 \\
+        --event-rate 20 --duration 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from ska_tmc_common.bench.hot_paths import SCENARIOS, run_benchmark
+
+
+def _positive(value_type: type) -> Callable[[str], Any]:
+    """Returns the argparse type of the strictly positive values of the
+    given type."""
+
+    def parse(value: str) -> Any:
+        try:
+            parsed_value = value_type(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"invalid {value_type.__name__} value: {value!r}"
+            ) from None
+        if parsed_value <= 0:
+            raise argparse.ArgumentTypeError(
+                f"{value!r} is not a positive value"
+            )
+        return parsed_value
+
+    return parse
+
+
+def parse_arguments(arguments: Optional[Sequence[str]] = None):
+    """Parses the command line arguments.
+
+    :param arguments: command line arguments, defaults to sys.argv
+    :type arguments: Sequence[str], optional
+    :return: parsed arguments
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m ska_tmc_common.bench",
+        description=(
+            "Runs benchmark scenarios of ska-tmc-common against in-process "
+            "stub devices, without a Tango deployment."
+        ),
+    )
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        metavar="scenario",
+        help=(
+            "scenarios to run, among "
+            + ", ".join(SCENARIOS)
+            + " (default: all)"
+        ),
+    )
+    parser.add_argument(
+        "-n",
+        "--devices",
+        type=_positive(int),
+        default=100,
+        help="number of simulated devices (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-r",
+        "--event-rate",
+        type=_positive(float),
+        default=10.0,
+        help=(
+            "events per second of every device of the event load "
+            "(default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "-d",
+        "--duration",
+        type=_positive(float),
+        default=5.0,
+        help="duration of the event load in seconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=_positive(int),
+        default=4,
+        help=(
+            "threads delivering the events of the event load "
+            "(default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "-i",
+        "--iterations",
+        type=_positive(int),
+        default=1000,
+        help="measured operations per scenario (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print the JSON report instead of the summary table",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="also write the JSON report to this file",
+    )
+    options = parser.parse_args(arguments)
+    unknown_scenarios = set(options.scenarios) - set(SCENARIOS)
+    if unknown_scenarios:
+        parser.error(
+            "unknown scenarios: " + ", ".join(sorted(unknown_scenarios))
+        )
+    return options
+
+
+def _flatten(result: Any, prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """Yields the dotted names and the values of the leaves of a result."""
+    if isinstance(result, dict):
+        for key, value in result.items():
+            yield from _flatten(value, f"{prefix}.{key}" if prefix else key)
+    else:
+        yield prefix, result
+
+
+def _format_value(value: Any) -> str:
+    """Formats a value of the summary table."""
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+def format_table(report: dict) -> str:
+    """Formats the results of a benchmark report as a table with one line
+    per measured value.
+
+    :param report: report returned by run_benchmark
+    :type report: dict
+    :return: summary table
+    :rtype: str
+    """
+    rows = [("scenario", "metric", "value")]
+    for scenario, result in report["results"].items():
+        for metric, value in _flatten(result):
+            rows.append((scenario, metric, _format_value(value)))
+    widths = [max(len(row[column]) for row in rows) for column in range(3)]
+    lines = [
+        f"ska-tmc-common {report['version']}, parameters: "
+        + ", ".join(
+            f"{name}={value}"
+            for name, value in report["parameters"].items()
+            if name != "scenarios"
+        )
+    ]
+    for index, row in enumerate(rows):
+        lines.append(
+            "  ".join(
+                cell.ljust(width) if column < 2 else cell.rjust(width)
+                for column, (cell, width) in enumerate(zip(row, widths))
+            )
+        )
+        if index == 0:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    """Runs the benchmark scenarios and prints their results.
+
+    :param arguments: command line arguments, defaults to sys.argv
+    :type arguments: Sequence[str], optional
+    :return: exit code
+    :rtype: int
+    """
+    options = parse_arguments(arguments)
+    # The benchmarked code logs at info level, which would distort the
+    # measurements.
+    disabled_level = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        report = run_benchmark(
+            options.scenarios,
+            device_count=options.devices,
+            iterations=options.iterations,
+            event_rate=options.event_rate,
+            duration=options.duration,
+            workers=options.workers,
+        )
+    finally:
+        logging.disable(disabled_level)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    if options.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_table(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+This module contains helpers shared by the offline benchmarks.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+import time
+from typing import Sequence
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Returns the given percentile of the values, using the nearest rank
+    method.
+
+    :param values: measured values
+    :type values: Sequence[float]
+    :param fraction: percentile as a fraction, e.g. 0.99
+    :type fraction: float
+    :return: percentile value, 0 if there are no values
+    :rtype: float
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def summarise(values: Sequence[float], scale: float = 1.0) -> dict:
+    """Returns the count, mean, p50, p99 and maximum of the values.
+
+    :param values: measured values
+    :type values: Sequence[float]
+    :param scale: factor applied to the reported values, e.g. 1e3 to report
+        seconds in milliseconds
+    :type scale: float
+    :return: summary of the values
+    :rtype: dict
+    """
+    if not values:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "count": len(values),
+        "mean": statistics.fmean(values) * scale,
+        "p50": percentile(values, 0.50) * scale,
+        "p99": percentile(values, 0.99) * scale,
+        "max": max(values) * scale,
+    }
+
+
+class CpuTimer:
+    """Context manager measuring the wall clock time and the CPU time used
+    by the whole process, including all its threads."""
+
+    def __init__(self) -> None:
+        self.wall_time: float = 0.0
+        self.cpu_time: float = 0.0
+        self._wall_start: float = 0.0
+        self._cpu_start: float = 0.0
+
+    def __enter__(self) -> CpuTimer:
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.wall_time = time.perf_counter() - self._wall_start
+        self.cpu_time = time.process_time() - self._cpu_start
+
+    @property
+    def cpu_percent(self) -> float:
+        """Returns the CPU time as a percentage of one core.
+
+        :return: CPU usage in percent
+        :rtype: float
+        """
+        if not self.wall_time:
+            return 0.0
+        return 100.0 * self.cpu_time / self.wall_time
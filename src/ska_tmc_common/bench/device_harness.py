@@ -0,0 +1,783 @@
+"""
+Capacity harness running a configurable number of helper devices in one
+in-process device server started with tango.test_context.
+MultiDeviceTestContext: N HelperDishDevice and N HelperDishLNDevice
+instances, M HelperSubArrayDevice instances with their SDP, CSP and MCCS
+subarrays, and the CSP and MCCS controllers. A TmcComponentManager, with
+its event manager and liveliness probe, monitors all of them, the way a
+central node does, so that its capacity is measured against real Tango
+devices on a single machine. Its internal model looks the devices up by
+scanning their list, as the TMC nodes do, or, with indexed_model, through
+an index by name:
+
+* subscription: time taken by the event manager to subscribe the state
+  and healthState attributes of every device,
+* probe_cycle: time taken by the liveliness probe to probe every device
+  once,
+* command_fan_out: time taken to invoke a command on every device
+  concurrently, and for the resulting state change events to update the
+  internal model of the component manager.
+
+For instance::
+
+    with SimulationHarness(dish_count=197) as harness:
+        print(harness.measure_subscription())
+        print(harness.measure_probe_cycle())
+        print(harness.measure_command_fan_out())
+
+The module runs the three measurements at 64, 197 and 512 dishes, with
+both internal models, when executed with
+``python -m ska_tmc_common.bench.device_harness``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from typing import Any, Callable, Optional, Sequence
+
+import tango
+from tango import DevState
+from tango.test_context import MultiDeviceTestContext
+
+from ska_tmc_common import release
+from ska_tmc_common.bench.common import CpuTimer, summarise
+from ska_tmc_common.bench.stub_device import StubDatabase
+from ska_tmc_common.dev_factory import DevFactory
+from ska_tmc_common.device_info import DeviceInfo
+from ska_tmc_common.enum import LivelinessProbeType
+from ska_tmc_common.input import InputParameter
+from ska_tmc_common.test_helpers.helper_csp_master_device import (
+    HelperCspMasterDevice,
+)
+from ska_tmc_common.test_helpers.helper_csp_subarray_device import (
+    HelperCSPSubarrayDevice,
+)
+from ska_tmc_common.test_helpers.helper_dish_device import HelperDishDevice
+from ska_tmc_common.test_helpers.helper_dish_ln_device import (
+    HelperDishLNDevice,
+)
+from ska_tmc_common.test_helpers.helper_mccs_controller_device import (
+    HelperMCCSController,
+)
+from ska_tmc_common.test_helpers.helper_mccs_subarray_device import (
+    HelperMccsSubarrayDevice,
+)
+from ska_tmc_common.test_helpers.helper_sdp_subarray import HelperSdpSubarray
+from ska_tmc_common.test_helpers.helper_subarray_device import (
+    HelperSubArrayDevice,
+)
+from ska_tmc_common.v2.event_manager import EventManager
+from ska_tmc_common.v2.liveliness_probe import MultiDeviceLivelinessProbe
+from ska_tmc_common.v2.tmc_component_manager import (
+    TmcComponent,
+    TmcComponentManager,
+)
+
+LOGGER = logging.getLogger(__name__)
+SUBSCRIBED_ATTRIBUTES: tuple[str, ...] = ("state", "healthState")
+CSP_CONTROLLER: str = "mid-csp/control/0"
+MCCS_CONTROLLER: str = "low-mccs/control/control"
+
+# Period of the liveliness probe during the measurement. It is short, so
+# that the probe thread exits quickly once the measured cycle is complete.
+HARNESS_CHECK_PERIOD: float = 0.05
+
+
+class HarnessComponent(TmcComponent):
+    """Internal model of the harness, which looks the device infos up by
+    scanning the list of devices, the way the internal models of the TMC
+    nodes do, so that the measurements reflect a real central node."""
+
+    internal_model: str = "linear_scan"
+
+    def get_device(self, device_name: str) -> Optional[DeviceInfo]:
+        """Returns the device info of the given device.
+
+        :param device_name: name of the device
+        :type device_name: str
+        :return: the device info, None if the device is not monitored
+        :rtype: Optional[DeviceInfo]
+        """
+        device_name = device_name.lower()
+        for dev_info in self._devices:
+            if dev_info.dev_name.lower() == device_name:
+                return dev_info
+        return None
+
+    def update_device(self, dev_info: DeviceInfo) -> None:
+        """Adds the device info, or replaces the device info of the same
+        device.
+
+        :param dev_info: device info
+        :type dev_info: DeviceInfo
+        """
+        device_name = dev_info.dev_name.lower()
+        for index, previous_dev_info in enumerate(self._devices):
+            if previous_dev_info.dev_name.lower() == device_name:
+                self._devices[index] = dev_info
+                return
+        self._devices.append(dev_info)
+
+    def update_device_exception(
+        self, device_info: DeviceInfo, exception: str
+    ) -> None:
+        """Marks the device as unresponsive.
+
+        :param device_info: device info
+        :type device_info: DeviceInfo
+        :param exception: reason of the unresponsiveness
+        :type exception: str
+        """
+        device_info.update_unresponsive(True, exception)
+
+    def to_dict(self) -> dict:
+        """Returns the device infos as a dictionary.
+
+        :return: internal model
+        :rtype: dict
+        """
+        return {"devices": [dev_info.to_dict() for dev_info in self._devices]}
+
+
+class IndexedHarnessComponent(HarnessComponent):
+    """Internal model of the harness which indexes the device infos by
+    name, so that the events of hundreds of devices are looked up in
+    constant time. It is measured next to HarnessComponent to show the
+    gain of an indexed internal model."""
+
+    internal_model: str = "indexed"
+
+    def __init__(self, logger: Logger) -> None:
+        super().__init__(logger)
+        self._device_index: dict[str, DeviceInfo] = {}
+
+    def get_device(self, device_name: str) -> Optional[DeviceInfo]:
+        """Returns the device info of the given device.
+
+        :param device_name: name of the device
+        :type device_name: str
+        :return: the device info, None if the device is not monitored
+        :rtype: Optional[DeviceInfo]
+        """
+        return self._device_index.get(device_name.lower())
+
+    def update_device(self, dev_info: DeviceInfo) -> None:
+        """Adds the device info, or replaces the device info of the same
+        device.
+
+        :param dev_info: device info
+        :type dev_info: DeviceInfo
+        """
+        key = dev_info.dev_name.lower()
+        previous_dev_info = self._device_index.get(key)
+        if previous_dev_info is None:
+            self._devices.append(dev_info)
+        else:
+            self._devices[self._devices.index(previous_dev_info)] = dev_info
+        self._device_index[key] = dev_info
+
+
+# pylint: disable=abstract-method
+class HarnessComponentManager(TmcComponentManager):
+    """Component manager monitoring the helper devices of the harness. The
+    liveliness probe is not started with it, the harness starts it when
+    the probe cycle is measured."""
+
+    def __init__(
+        self,
+        logger: Logger = LOGGER,
+        indexed_model: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        :param logger: logger
+        :type logger: Logger
+        :param indexed_model: whether the internal model indexes the
+            device infos by name, defaults to False, in which case they are
+            looked up as in the TMC nodes.
+        :type indexed_model: bool
+        """
+        component_class = (
+            IndexedHarnessComponent if indexed_model else HarnessComponent
+        )
+        super().__init__(
+            InputParameter(None),
+            logger,
+            _component=component_class(logger),
+            _liveliness_probe=LivelinessProbeType.NONE,
+            **kwargs,
+        )
+
+    def is_command_allowed(self, command_name: str) -> bool:
+        """Allows every command.
+
+        :param command_name: name of the command
+        :type command_name: str
+        :return: True
+        :rtype: bool
+        """
+        return True
+
+
+class HarnessEventManager(EventManager):
+    """Event manager updating the internal model of the harness component
+    manager with the state and healthState events, the way the event
+    managers of the TMC nodes do."""
+
+    def __init__(self, component_manager, *args, **kwargs) -> None:
+        super().__init__(component_manager, *args, **kwargs)
+        self._component_manager = component_manager
+        # Called with the device name and the state of every state event,
+        # once the internal model is updated.
+        self.state_observer: Optional[Callable[[str, DevState], None]] = None
+
+    def state_event_callback(self, event: tango.EventData) -> None:
+        """Updates the state of the event's device.
+
+        :param event: change event
+        :type event: tango.EventData
+        """
+        if self._component_manager.check_event_error(
+            event, "state_event_callback"
+        ):
+            return
+        device_name = event.device.dev_name()
+        self._component_manager.update_device_state(
+            device_name, event.attr_value.value
+        )
+        state_observer = self.state_observer
+        if state_observer is not None:
+            state_observer(device_name, event.attr_value.value)
+
+    def healthstate_event_callback(self, event: tango.EventData) -> None:
+        """Updates the health state of the event's device.
+
+        :param event: change event
+        :type event: tango.EventData
+        """
+        if self._component_manager.check_event_error(
+            event, "healthstate_event_callback"
+        ):
+            return
+        self._component_manager.update_device_health_state(
+            event.device.dev_name(), event.attr_value.value
+        )
+
+
+class SimulationHarness:
+    """
+    Context manager starting the helper devices in one in-process device
+    server and the component manager monitoring them.
+
+    The devices are named after the devices of the Mid telescope: the
+    dishes are ska001/elt/master to skaNNN/elt/master, their leaf nodes
+    mid-tmc/leaf-node-dish/ska001 and so on, and subarray 01 has the
+    devices mid-tmc/subarray/01, mid-sdp/subarray/01, mid-csp/subarray/01
+    and low-mccs/subarray/01.
+    """
+
+    def __init__(
+        self,
+        dish_count: int = 64,
+        subarray_count: int = 1,
+        logger: Logger = LOGGER,
+        workers: int = 16,
+        server_timeout: float = 300.0,
+        indexed_model: bool = False,
+    ) -> None:
+        """
+        :param dish_count: number of dishes, and of dish leaf nodes
+        :type dish_count: int
+        :param subarray_count: number of subarrays, each with its SDP, CSP
+            and MCCS subarray
+        :type subarray_count: int
+        :param logger: logger of the harness and of its component manager
+        :type logger: Logger
+        :param workers: number of threads invoking the commands of the
+            fan-out
+        :type workers: int
+        :param server_timeout: maximum time in seconds to wait for the
+            device server to start
+        :type server_timeout: float
+        :param indexed_model: whether the internal model of the component
+            manager indexes the device infos by name, defaults to False, in
+            which case they are looked up as in the TMC nodes.
+        :type indexed_model: bool
+        """
+        self.dish_count = dish_count
+        self.subarray_count = subarray_count
+        self.workers = workers
+        self.server_timeout = server_timeout
+        self.indexed_model = indexed_model
+        self.startup_time: float = 0.0
+        self.context: Optional[MultiDeviceTestContext] = None
+        self.component_manager: Optional[HarnessComponentManager] = None
+        self.event_manager: Optional[HarnessEventManager] = None
+        self._logger = logger
+        self._previous_test_context = None
+        self._subscribed_devices: list[str] = []
+
+    @property
+    def internal_model(self) -> str:
+        """Returns the name of the internal model of the measured component
+        manager: linear_scan, as in the TMC nodes, or indexed.
+
+        :return: internal model
+        :rtype: str
+        """
+        return (
+            IndexedHarnessComponent.internal_model
+            if self.indexed_model
+            else HarnessComponent.internal_model
+        )
+
+    @property
+    def dish_names(self) -> list[str]:
+        """Returns the names of the dishes.
+
+        :return: dish names
+        :rtype: list[str]
+        """
+        return [
+            f"ska{index:03d}/elt/master"
+            for index in range(1, self.dish_count + 1)
+        ]
+
+    @property
+    def dish_leaf_node_names(self) -> list[str]:
+        """Returns the names of the dish leaf nodes, in the order of their
+        dishes.
+
+        :return: dish leaf node names
+        :rtype: list[str]
+        """
+        return [
+            f"mid-tmc/leaf-node-dish/ska{index:03d}"
+            for index in range(1, self.dish_count + 1)
+        ]
+
+    def subarray_names(self, prefix: str = "mid-tmc") -> list[str]:
+        """Returns the names of the subarrays of the given domain.
+
+        :param prefix: domain of the subarrays, mid-tmc, mid-sdp, mid-csp
+            or low-mccs
+        :type prefix: str
+        :return: subarray names
+        :rtype: list[str]
+        """
+        return [
+            f"{prefix}/subarray/{index:02d}"
+            for index in range(1, self.subarray_count + 1)
+        ]
+
+    @property
+    def fan_out_device_names(self) -> list[str]:
+        """Returns the names of the devices whose On and Off commands take
+        no argument, which are all of them but the CSP controller.
+
+        :return: device names
+        :rtype: list[str]
+        """
+        return (
+            self.dish_names
+            + self.dish_leaf_node_names
+            + self.subarray_names("mid-tmc")
+            + self.subarray_names("mid-sdp")
+            + self.subarray_names("mid-csp")
+            + self.subarray_names("low-mccs")
+            + [MCCS_CONTROLLER]
+        )
+
+    @property
+    def device_names(self) -> list[str]:
+        """Returns the names of all the devices of the harness.
+
+        :return: device names
+        :rtype: list[str]
+        """
+        return self.fan_out_device_names + [CSP_CONTROLLER]
+
+    def devices_to_load(self) -> tuple[dict, ...]:
+        """Returns the device classes and devices of the device server, in
+        the format of MultiDeviceTestContext.
+
+        :return: devices to load
+        :rtype: tuple[dict, ...]
+        """
+
+        def devices(names: list[str]) -> list[dict]:
+            return [{"name": name} for name in names]
+
+        return (
+            {"class": HelperDishDevice, "devices": devices(self.dish_names)},
+            {
+                "class": HelperDishLNDevice,
+                "devices": [
+                    {
+                        "name": leaf_node_name,
+                        "properties": {"DishMasterFQDN": dish_name},
+                    }
+                    for dish_name, leaf_node_name in zip(
+                        self.dish_names, self.dish_leaf_node_names
+                    )
+                ],
+            },
+            {
+                "class": HelperSubArrayDevice,
+                "devices": devices(self.subarray_names("mid-tmc")),
+            },
+            {
+                "class": HelperSdpSubarray,
+                "devices": devices(self.subarray_names("mid-sdp")),
+            },
+            {
+                "class": HelperCSPSubarrayDevice,
+                "devices": devices(self.subarray_names("mid-csp")),
+            },
+            {
+                "class": HelperMccsSubarrayDevice,
+                "devices": devices(self.subarray_names("low-mccs")),
+            },
+            {
+                "class": HelperCspMasterDevice,
+                "devices": devices([CSP_CONTROLLER]),
+            },
+            {
+                "class": HelperMCCSController,
+                "devices": devices([MCCS_CONTROLLER]),
+            },
+        )
+
+    def __enter__(self) -> SimulationHarness:
+        start_time = time.perf_counter()
+        self.context = MultiDeviceTestContext(
+            self.devices_to_load(),
+            process=False,
+            timeout=self.server_timeout,
+        )
+        self.context.__enter__()
+        self.startup_time = time.perf_counter() - start_time
+        self._previous_test_context = DevFactory._test_context
+        DevFactory._test_context = self.context
+        self.component_manager = None
+        try:
+            self.component_manager = HarnessComponentManager(
+                self._logger, self.indexed_model
+            )
+            for device_name in self.device_names:
+                self.component_manager.add_device(device_name)
+            # The event manager is replaced rather than started with
+            # start_event_manager, so that the subscriptions are made, and
+            # measured, in the calling thread.
+            self.event_manager = HarnessEventManager(
+                self.component_manager,
+                logger=self._logger,
+                event_subscription_check_period=0,
+            )
+            self.component_manager.event_manager_object = self.event_manager
+        except BaseException:
+            if self.component_manager is not None:
+                self.component_manager.stop_liveliness_probe()
+            DevFactory._test_context = self._previous_test_context
+            self.context.__exit__(*sys.exc_info())
+            self.context = None
+            raise
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            self.component_manager.stop_liveliness_probe()
+            for device_name in self._subscribed_devices:
+                self.event_manager.unsubscribe_events(
+                    device_name, list(SUBSCRIBED_ATTRIBUTES)
+                )
+            self._subscribed_devices = []
+            self.event_manager.stop()
+        finally:
+            DevFactory._test_context = self._previous_test_context
+            self.context.__exit__(*exc_info)
+            self.context = None
+
+    def measure_subscription(self, timeout: int = 300) -> dict:
+        """Subscribes the state and healthState attributes of every device
+        with the event manager.
+
+        :param timeout: maximum time in seconds to retry the failed
+            subscriptions
+        :type timeout: int
+        :return: subscription time and rate
+        :rtype: dict
+        """
+        configuration = {
+            device_name: list(SUBSCRIBED_ATTRIBUTES)
+            for device_name in self.device_names
+        }
+        with CpuTimer() as timer:
+            self.event_manager.subscribe_events(configuration, timeout)
+        self._subscribed_devices = self.device_names
+        subscription_registry = self.event_manager.subscription_registry
+        subscribed_devices = sum(
+            1
+            for device_name in self.device_names
+            if subscription_registry.is_completed(device_name)
+        )
+        subscription_count = subscribed_devices * len(SUBSCRIBED_ATTRIBUTES)
+        return {
+            "devices": len(self.device_names),
+            "subscribed_devices": subscribed_devices,
+            "subscription_time_s": timer.wall_time,
+            "subscriptions_per_second": subscription_count / timer.wall_time,
+            "cpu_percent": timer.cpu_percent,
+            "threads": threading.active_count(),
+        }
+
+    def measure_probe_cycle(
+        self,
+        probe_class: type[
+            MultiDeviceLivelinessProbe
+        ] = MultiDeviceLivelinessProbe,
+        timeout: float = 300.0,
+    ) -> dict:
+        """Starts the liveliness probe of the component manager and waits
+        until it has probed every device once.
+
+        The devices of the test context are not registered in a Tango
+        database, so the database lookup of the probe is answered by a
+        StubDatabase, while the state of the devices is read from the
+        devices themselves.
+
+        :param probe_class: threaded liveliness probe class to run
+        :type probe_class: type[MultiDeviceLivelinessProbe]
+        :param timeout: maximum time in seconds to wait for the cycle
+        :type timeout: float
+        :return: statistics of the cycle
+        :rtype: dict
+        """
+        probe = probe_class(
+            self.component_manager,
+            logger=self._logger,
+            proxy_timeout=self.component_manager.proxy_timeout,
+            liveliness_check_period=HARNESS_CHECK_PERIOD,
+        )
+        probe.get_device_and_database = StubDatabase().get_device_and_database
+        device_count = len(self.device_names)
+        probed_devices: set[str] = set()
+        probe_durations: list[float] = []
+        cycle_done = threading.Event()
+        device_task = probe.device_task
+
+        def timed_device_task(dev_info: DeviceInfo) -> None:
+            start_time = time.perf_counter()
+            device_task(dev_info)
+            probe_durations.append(time.perf_counter() - start_time)
+            probed_devices.add(dev_info.dev_name)
+            if len(probed_devices) == device_count:
+                cycle_done.set()
+
+        probe.device_task = timed_device_task
+        probe.add_devices(self.device_names)
+        self.component_manager.liveliness_probe_object = probe
+        with CpuTimer() as timer:
+            probe.start()
+            completed = cycle_done.wait(timeout)
+        thread_count = threading.active_count()
+        probe.stop()
+        probe._thread.join(timeout)  # pylint: disable=protected-access
+        self.component_manager.liveliness_probe_object = None
+        unresponsive_devices = sum(
+            1
+            for dev_info in self.component_manager.devices
+            if dev_info.unresponsive
+        )
+        return {
+            "completed": completed,
+            "cycle_time_s": timer.wall_time,
+            "probes_per_second": len(probed_devices) / timer.wall_time,
+            "cpu_percent": timer.cpu_percent,
+            "threads": thread_count,
+            "probe_time_ms": summarise(probe_durations, 1e3),
+            "unresponsive_devices": unresponsive_devices,
+        }
+
+    def _invoke_on_all(
+        self,
+        proxies: dict[str, tango.DeviceProxy],
+        command_name: str,
+        argument: Any = None,
+    ) -> list[float]:
+        """Invokes the command on every proxy from the worker threads and
+        returns the round trip time of every invocation."""
+
+        def invoke(proxy: tango.DeviceProxy) -> float:
+            start_time = time.perf_counter()
+            if argument is None:
+                proxy.command_inout(command_name)
+            else:
+                proxy.command_inout(command_name, argument)
+            return time.perf_counter() - start_time
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(invoke, proxies.values()))
+
+    def _wait_for_state(
+        self, device_names: list[str], state: DevState, timeout: float
+    ) -> bool:
+        """Waits until the internal model has the given state for every
+        device."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if all(
+                self.component_manager.get_device(device_name).state == state
+                for device_name in device_names
+            ):
+                return True
+            time.sleep(0.01)
+        return False
+
+    def measure_command_fan_out(
+        self,
+        command_name: str = "On",
+        initial_state: DevState = DevState.OFF,
+        final_state: DevState = DevState.ON,
+        timeout: float = 300.0,
+    ) -> dict:
+        """Sets every device to the initial state, then invokes the command
+        on all of them concurrently and waits until the state change
+        events have brought the internal model of every device to the
+        final state. The attributes must have been subscribed with
+        measure_subscription.
+
+        :param command_name: command invoked on every device
+        :type command_name: str
+        :param initial_state: state of the devices before the command
+        :type initial_state: DevState
+        :param final_state: state of the devices after the command
+        :type final_state: DevState
+        :param timeout: maximum time in seconds to wait for the events
+        :type timeout: float
+        :return: command round trip times and event propagation times
+        :rtype: dict
+        """
+        device_names = self.fan_out_device_names
+        proxies = {
+            device_name: DevFactory().get_device(device_name)
+            for device_name in device_names
+        }
+        self._invoke_on_all(proxies, "SetDirectState", initial_state)
+        if not self._wait_for_state(device_names, initial_state, timeout):
+            return {"devices": len(device_names), "completed": False}
+
+        pending_devices = {device_name.lower() for device_name in device_names}
+        arrival_times: list[float] = []
+        all_arrived = threading.Event()
+        lock = threading.Lock()
+
+        def observe_state(device_name: str, state: DevState) -> None:
+            if state != final_state:
+                return
+            with lock:
+                if device_name.lower() in pending_devices:
+                    pending_devices.discard(device_name.lower())
+                    arrival_times.append(time.perf_counter())
+                    if not pending_devices:
+                        all_arrived.set()
+
+        self.event_manager.state_observer = observe_state
+        try:
+            with CpuTimer() as timer:
+                start_time = time.perf_counter()
+                command_times = self._invoke_on_all(proxies, command_name)
+                fan_out_time = time.perf_counter() - start_time
+                completed = all_arrived.wait(timeout)
+        finally:
+            self.event_manager.state_observer = None
+        with lock:
+            propagation_times = [
+                arrival_time - start_time for arrival_time in arrival_times
+            ]
+        return {
+            "devices": len(device_names),
+            "completed": completed,
+            "fan_out_time_s": fan_out_time,
+            "total_time_s": timer.wall_time,
+            "cpu_percent": timer.cpu_percent,
+            "threads": threading.active_count(),
+            "command_time_ms": summarise(command_times, 1e3),
+            "event_propagation_ms": summarise(propagation_times, 1e3),
+        }
+
+
+def run_benchmark(
+    dish_counts: Sequence[int] = (64, 197, 512),
+    subarray_count: int = 1,
+    workers: int = 16,
+    indexed_models: Sequence[bool] = (False, True),
+) -> dict:
+    """Measures the subscription time, the probe cycle and the command
+    fan-out with the given numbers of dishes, starting a new harness for
+    every number and internal model. The results of every number of
+    dishes are reported per internal model: linear_scan, which looks the
+    devices up as the TMC nodes do, and indexed.
+
+    :param dish_counts: numbers of dishes, defaults to 64, 197 and 512
+    :type dish_counts: Sequence[int]
+    :param subarray_count: number of subarrays
+    :type subarray_count: int
+    :param workers: number of threads invoking the commands of the fan-out
+    :type workers: int
+    :param indexed_models: whether the internal model of every measured
+        harness indexes the device infos, defaults to both models
+    :type indexed_models: Sequence[bool]
+    :return: package version, platform, parameters and results of every
+        run
+    :rtype: dict
+    """
+    results = {}
+    for dish_count in dish_counts:
+        results[str(dish_count)] = {}
+        for indexed_model in indexed_models:
+            with SimulationHarness(
+                dish_count,
+                subarray_count,
+                workers=workers,
+                indexed_model=indexed_model,
+            ) as harness:
+                results[str(dish_count)][harness.internal_model] = {
+                    "startup_time_s": harness.startup_time,
+                    "subscription": harness.measure_subscription(),
+                    "probe_cycle": harness.measure_probe_cycle(),
+                    "command_fan_out": harness.measure_command_fan_out(),
+                }
+    return {
+        "benchmark": "device_harness",
+        "version": release.version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "parameters": {
+            "dish_counts": list(dish_counts),
+            "subarray_count": subarray_count,
+            "workers": workers,
+            "internal_models": [
+                (
+                    IndexedHarnessComponent.internal_model
+                    if indexed_model
+                    else HarnessComponent.internal_model
+                )
+                for indexed_model in indexed_models
+            ],
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+    print(json.dumps(run_benchmark(), indent=2))
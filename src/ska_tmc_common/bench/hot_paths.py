@@ -0,0 +1,597 @@
+"""
+Benchmark suite of the hot paths of ska-tmc-common, run against stub
+device proxies installed as DevFactory._test_context:
+
+* event_subscription: subscription of the attributes of N devices by the
+  event manager, and resubscription of every device as done on event
+  errors,
+* event_load: events of N devices received at a given rate by the event
+  manager, which updates the internal model with them, to check whether
+  a node process keeps up with the rate,
+* probe_cycle: time taken by the threaded and the asyncio multi device
+  liveliness probes to probe N devices once,
+* command_tracker: latency of the command completion, from the attribute
+  change completing the command to the update of its task status, with
+  other commands being tracked concurrently,
+* observable_dispatch: time taken to notify K observers of an attribute
+  change,
+* adapter_lookup: time taken by the adapter factory to find the adapter of
+  a device among N adapters,
+* model_serialization: time taken to serialize the device infos of N
+  devices, as done when the internal model is read.
+
+The results are reported as JSON, with the package version, so that they
+can be compared from one release to the next.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import platform
+import random
+import threading
+import time
+from typing import Callable, Optional, Sequence
+
+import tango
+
+from ska_tmc_common import release
+from ska_tmc_common.adapters import AdapterFactory, AdapterType
+from ska_tmc_common.bench.common import CpuTimer, summarise
+from ska_tmc_common.bench.liveliness_asyncio import run_probe_cycle
+from ska_tmc_common.bench.liveliness_scheduling import stub_device_names
+from ska_tmc_common.bench.stub_device import (
+    StubComponentManager,
+    StubTestContextInstalled,
+)
+from ska_tmc_common.command_callback_tracker import CommandCallbackTracker
+from ska_tmc_common.device_info import (
+    DeviceInfo,
+    DishDeviceInfo,
+    SubArrayDeviceInfo,
+)
+from ska_tmc_common.lrcr_callback import LRCRCallback
+from ska_tmc_common.observable import Observable
+from ska_tmc_common.observer import AttributeValueObserver
+from ska_tmc_common.v2.event_manager import EventManager
+from ska_tmc_common.v2.liveliness_probe import (
+    AsyncMultiDeviceLivelinessProbe,
+    MultiDeviceLivelinessProbe,
+)
+
+LOGGER = logging.getLogger(__name__)
+SUBSCRIBED_ATTRIBUTES: tuple[str, ...] = ("state", "healthState")
+
+
+class BenchEventManager(EventManager):
+    """Event manager counting the received change events."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.event_count: int = 0
+
+    def state_event_callback(self, event) -> None:
+        """Handles the state events.
+
+        :param event: change event
+        """
+        self.handle_event(event)
+
+    def healthstate_event_callback(self, event) -> None:
+        """Handles the healthState events.
+
+        :param event: change event
+        """
+        self.handle_event(event)
+
+    def handle_event(self, event) -> None:
+        """Counts the event.
+
+        :param event: change event
+        """
+        self.event_count += 1
+
+
+class BenchModelEventManager(BenchEventManager):
+    """Event manager updating the device infos of the component manager
+    with the received events, the way the event managers of the TMC nodes
+    do."""
+
+    def __init__(self, component_manager, *args, **kwargs) -> None:
+        super().__init__(component_manager, *args, **kwargs)
+        self._component_manager = component_manager
+
+    def handle_event(self, event) -> None:
+        """Updates the device info of the event's device.
+
+        :param event: change event
+        """
+        with self._component_manager.lock:
+            device_info = self._component_manager.get_device(
+                event.device.dev_name()
+            )
+            if event.attr_value.name == "state":
+                device_info.state = event.attr_value.value
+            else:
+                device_info.health_state = event.attr_value.value
+            device_info.record_change_event(time.time())
+            self.event_count += 1
+
+
+def bench_event_subscription(
+    device_count: int = 100, latency: float = 0.0
+) -> dict:
+    """Subscribes the attributes of the stub devices with the event manager,
+    then resubscribes every device, the way the event manager does when
+    the events of a device time out.
+
+    :param device_count: number of simulated devices
+    :type device_count: int
+    :param latency: simulated round trip time of a proxy call in seconds
+    :type latency: float
+    :return: subscription time and rate, and resubscription time per device
+    :rtype: dict
+    """
+    dev_names = stub_device_names(device_count)
+    component_manager = StubComponentManager(dev_names)
+    with StubTestContextInstalled(latency) as context:
+        event_manager = BenchEventManager(
+            component_manager,
+            logger=LOGGER,
+            event_subscription_check_period=0,
+        )
+        configuration = {
+            dev_name: list(SUBSCRIBED_ATTRIBUTES) for dev_name in dev_names
+        }
+        with CpuTimer() as subscription_timer:
+            event_manager.subscribe_events(configuration)
+        resubscription_times: list[float] = []
+        for dev_name in dev_names:
+            start_time = time.perf_counter()
+            event_manager.unsubscribe_events(
+                dev_name, list(SUBSCRIBED_ATTRIBUTES)
+            )
+            event_manager.subscribe_events(
+                {dev_name: list(SUBSCRIBED_ATTRIBUTES)}
+            )
+            resubscription_times.append(time.perf_counter() - start_time)
+        subscriptions = sum(
+            proxy.subscription_count for proxy in context.proxies.values()
+        )
+    subscription_count = device_count * len(SUBSCRIBED_ATTRIBUTES)
+    return {
+        "subscriptions": subscriptions,
+        "subscription_time_s": subscription_timer.wall_time,
+        "subscriptions_per_second": (
+            subscription_count / subscription_timer.wall_time
+        ),
+        "cpu_percent": subscription_timer.cpu_percent,
+        "resubscription_time_ms": summarise(resubscription_times, 1e3),
+    }
+
+
+def _push_events(
+    proxies: list,
+    event_rate: float,
+    duration: float,
+    lateness: list[float],
+    handler_times: list[float],
+) -> None:
+    """Pushes the events of the proxies, in turn, at the given rate per
+    device, recording how late and how long the events were handled."""
+    if not proxies:
+        return
+    interval = 1.0 / (event_rate * len(proxies))
+    start_time = time.perf_counter()
+    event_count = int(duration * event_rate * len(proxies))
+    for index in range(event_count):
+        due_time = start_time + index * interval
+        delay = due_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        proxy = proxies[index % len(proxies)]
+        push_time = time.perf_counter()
+        if (index // len(proxies)) % 2:
+            proxy.push_change_event("healthState", index % 3)
+        else:
+            proxy.push_change_event("state", tango.DevState.ON)
+        handled_time = time.perf_counter()
+        lateness.append(push_time - due_time)
+        handler_times.append(handled_time - push_time)
+
+
+def bench_event_load(
+    device_count: int = 100,
+    event_rate: float = 10.0,
+    duration: float = 5.0,
+    workers: int = 4,
+) -> dict:
+    """Sends change events of the stub devices at the given rate to an event
+    manager, which updates the device infos of the component manager with
+    them. The events are sent by the given number of threads, standing for
+    the threads on which Tango delivers the events, each sending the events
+    of a share of the devices. The node keeps up with the rate if the events
+    are handled on time.
+
+    :param device_count: number of simulated devices
+    :type device_count: int
+    :param event_rate: number of events per second of every device
+    :type event_rate: float
+    :param duration: duration of the run in seconds
+    :type duration: float
+    :param workers: number of threads sending the events
+    :type workers: int
+    :return: target and achieved event rates, lateness of the events,
+        handler time and CPU usage
+    :rtype: dict
+    """
+    dev_names = stub_device_names(device_count)
+    component_manager = StubComponentManager(dev_names)
+    with StubTestContextInstalled() as context:
+        event_manager = BenchModelEventManager(
+            component_manager,
+            logger=LOGGER,
+            event_subscription_check_period=0,
+        )
+        event_manager.subscribe_events(
+            {dev_name: list(SUBSCRIBED_ATTRIBUTES) for dev_name in dev_names}
+        )
+        proxies = [context.get_device(dev_name) for dev_name in dev_names]
+    lateness: list[list[float]] = [[] for _ in range(workers)]
+    handler_times: list[list[float]] = [[] for _ in range(workers)]
+    threads = [
+        threading.Thread(
+            target=_push_events,
+            args=(
+                proxies[index::workers],
+                event_rate,
+                duration,
+                lateness[index],
+                handler_times[index],
+            ),
+            name=f"bench_event_worker_{index}",
+        )
+        for index in range(workers)
+    ]
+    with CpuTimer() as timer:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    all_lateness = [value for values in lateness for value in values]
+    target_rate = event_rate * device_count
+    achieved_rate = event_manager.event_count / timer.wall_time
+    lateness_summary = summarise(all_lateness, 1e3)
+    return {
+        "events": event_manager.event_count,
+        "target_events_per_second": target_rate,
+        "events_per_second": achieved_rate,
+        "kept_up": lateness_summary["p99"] < 1e3 / event_rate,
+        "cpu_percent": timer.cpu_percent,
+        "lateness_ms": lateness_summary,
+        "handler_time_us": summarise(
+            [value for values in handler_times for value in values], 1e6
+        ),
+    }
+
+
+def bench_probe_cycle(device_count: int = 100, latency: float = 0.001) -> dict:
+    """Measures the time taken by the threaded and the asyncio multi device
+    liveliness probes to probe every stub device once.
+
+    :param device_count: number of simulated devices
+    :type device_count: int
+    :param latency: simulated round trip time of a probe in seconds
+    :type latency: float
+    :return: cycle statistics of both probes
+    :rtype: dict
+    """
+    return {
+        "threaded": run_probe_cycle(
+            MultiDeviceLivelinessProbe, device_count, latency
+        ),
+        "asyncio": run_probe_cycle(
+            AsyncMultiDeviceLivelinessProbe, device_count, latency
+        ),
+    }
+
+
+class BenchTrackedComponentManager:
+    """Component manager providing what the command callback tracker uses,
+    with an observation state changed by the benchmark."""
+
+    def __init__(self) -> None:
+        self.observable = Observable()
+        self.long_running_result_callback = LRCRCallback(LOGGER)
+        self.command_id: str = ""
+        self.obs_state: Optional[int] = None
+
+    def get_obs_state(self) -> Optional[int]:
+        """Returns the observation state.
+
+        :return: observation state
+        :rtype: int, optional
+        """
+        return self.obs_state
+
+    def stop_timer(self) -> None:
+        """The commands of the benchmark have no timer."""
+
+
+class BenchCommand:
+    """Command recording when its task status is updated."""
+
+    def __init__(self, component_manager: BenchTrackedComponentManager):
+        self.component_manager = component_manager
+        self.completed_time: Optional[float] = None
+
+    def update_task_status(self, **kwargs) -> None:
+        """Records the completion time of the command.
+
+        :param kwargs: task status
+        """
+        self.completed_time = time.perf_counter()
+
+
+def bench_command_tracker(
+    iterations: int = 1000, concurrent_commands: int = 10
+) -> dict:
+    """Measures the completion latency of commands tracked by the command
+    callback tracker, which complete after two observation state changes.
+
+    :param iterations: number of tracked commands
+    :type iterations: int
+    :param concurrent_commands: number of other commands being tracked
+        while the measured commands complete
+    :type concurrent_commands: int
+    :return: completion latency
+    :rtype: dict
+    """
+    component_manager = BenchTrackedComponentManager()
+    for index in range(concurrent_commands):
+        component_manager.command_id = f"{index}_Pending"
+        CommandCallbackTracker(
+            BenchCommand(component_manager),
+            LOGGER,
+            threading.Event(),
+            "get_obs_state",
+            [-1],
+        )
+    latencies: list[float] = []
+    for index in range(iterations):
+        component_manager.command_id = f"{index}_Bench"
+        component_manager.obs_state = None
+        command = BenchCommand(component_manager)
+        CommandCallbackTracker(
+            command, LOGGER, threading.Event(), "get_obs_state", [1, 2]
+        )
+        component_manager.obs_state = 1
+        component_manager.observable.notify_observers(
+            attribute_value_change=True
+        )
+        component_manager.obs_state = 2
+        start_time = time.perf_counter()
+        component_manager.observable.notify_observers(
+            attribute_value_change=True
+        )
+        if command.completed_time is not None:
+            latencies.append(command.completed_time - start_time)
+    return {
+        "completed": len(latencies),
+        "completion_latency_us": summarise(latencies, 1e6),
+    }
+
+
+class BenchCommandTracker:
+    """Stand-in for a command callback tracker counting the notifications
+    of its observer."""
+
+    def __init__(self, command_id: str) -> None:
+        self.command_id = command_id
+        self.notification_count: int = 0
+
+    def update_attr_value_change(self) -> None:
+        """Counts the attribute change notifications."""
+        self.notification_count += 1
+
+
+def bench_observable_dispatch(
+    observer_count: int = 100, iterations: int = 1000
+) -> dict:
+    """Measures the time taken by the observable to notify its observers of
+    an attribute change.
+
+    :param observer_count: number of observers
+    :type observer_count: int
+    :param iterations: number of notifications
+    :type iterations: int
+    :return: dispatch time and rate
+    :rtype: dict
+    """
+    observable = Observable()
+    trackers = [
+        BenchCommandTracker(f"{index}_Bench")
+        for index in range(observer_count)
+    ]
+    for tracker in trackers:
+        AttributeValueObserver(LOGGER, tracker, observable)
+    dispatch_times: list[float] = []
+    with CpuTimer() as timer:
+        for _ in range(iterations):
+            start_time = time.perf_counter()
+            observable.notify_observers(attribute_value_change=True)
+            dispatch_times.append(time.perf_counter() - start_time)
+    notifications = sum(tracker.notification_count for tracker in trackers)
+    return {
+        "notifications": notifications,
+        "notifications_per_second": notifications / timer.wall_time,
+        "dispatch_time_us": summarise(dispatch_times, 1e6),
+    }
+
+
+def bench_adapter_lookup(
+    adapter_count: int = 100, iterations: int = 10000
+) -> dict:
+    """Measures the time taken by the adapter factory to create adapters
+    and to look up existing ones.
+
+    :param adapter_count: number of adapters
+    :type adapter_count: int
+    :param iterations: number of lookups
+    :type iterations: int
+    :return: creation and lookup time
+    :rtype: dict
+    """
+    dev_names = stub_device_names(adapter_count)
+    adapter_types = list(AdapterType)
+    lookup_names = random.Random(0).choices(dev_names, k=iterations)
+    with StubTestContextInstalled():
+        adapter_factory = AdapterFactory()
+        creation_times: list[float] = []
+        for index, dev_name in enumerate(dev_names):
+            start_time = time.perf_counter()
+            adapter_factory.get_or_create_adapter(
+                dev_name, adapter_types[index % len(adapter_types)]
+            )
+            creation_times.append(time.perf_counter() - start_time)
+        lookup_times: list[float] = []
+        for dev_name in lookup_names:
+            start_time = time.perf_counter()
+            adapter_factory.get_or_create_adapter(dev_name)
+            lookup_times.append(time.perf_counter() - start_time)
+    return {
+        "adapters": len(adapter_factory.adapters),
+        "creation_time_us": summarise(creation_times, 1e6),
+        "lookup_time_us": summarise(lookup_times, 1e6),
+    }
+
+
+def bench_model_serialization(
+    device_count: int = 100, iterations: int = 100
+) -> dict:
+    """Measures the time taken to serialize the internal model of a node
+    monitoring devices of different kinds.
+
+    :param device_count: number of device infos in the model
+    :type device_count: int
+    :param iterations: number of serializations of the model
+    :type iterations: int
+    :return: serialization time and size of the model
+    :rtype: dict
+    """
+    device_info_classes = (DeviceInfo, SubArrayDeviceInfo, DishDeviceInfo)
+    devices = [
+        device_info_classes[index % len(device_info_classes)](dev_name)
+        for index, dev_name in enumerate(stub_device_names(device_count))
+    ]
+    serialization_times: list[float] = []
+    model_json = ""
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        model_json = json.dumps(
+            {"devices": [device.to_dict() for device in devices]}
+        )
+        serialization_times.append(time.perf_counter() - start_time)
+    return {
+        "model_bytes": len(model_json),
+        "serialization_time_ms": summarise(serialization_times, 1e3),
+        "devices_per_second": (
+            device_count * iterations / sum(serialization_times)
+        ),
+    }
+
+
+SCENARIOS: dict[str, Callable[..., dict]] = {
+    "event_subscription": bench_event_subscription,
+    "event_load": bench_event_load,
+    "probe_cycle": bench_probe_cycle,
+    "command_tracker": bench_command_tracker,
+    "observable_dispatch": bench_observable_dispatch,
+    "adapter_lookup": bench_adapter_lookup,
+    "model_serialization": bench_model_serialization,
+}
+
+
+def run_benchmark(
+    scenarios: Optional[Sequence[str]] = None,
+    device_count: int = 100,
+    iterations: int = 1000,
+    event_rate: float = 10.0,
+    duration: float = 1.0,
+    workers: int = 4,
+) -> dict:
+    """Runs the given scenarios of the suite.
+
+    :param scenarios: names of the scenarios to run, defaults to all of
+        them
+    :type scenarios: Sequence[str], optional
+    :param device_count: number of simulated devices, observers and
+        adapters
+    :type device_count: int
+    :param iterations: number of measured operations of the scenarios
+        measuring single operations
+    :type iterations: int
+    :param event_rate: number of events per second of every device of
+        the event load
+    :type event_rate: float
+    :param duration: duration of the event load in seconds
+    :type duration: float
+    :param workers: number of threads sending the events of the event
+        load
+    :type workers: int
+    :raises ValueError: if a scenario is unknown
+    :return: package version, platform, parameters and results of every
+        scenario
+    :rtype: dict
+    """
+    scenarios = list(scenarios or SCENARIOS)
+    unknown_scenarios = set(scenarios) - set(SCENARIOS)
+    if unknown_scenarios:
+        raise ValueError(f"Unknown scenarios: {sorted(unknown_scenarios)}")
+    scenario_arguments: dict[str, dict] = {
+        "event_subscription": {"device_count": device_count},
+        "event_load": {
+            "device_count": device_count,
+            "event_rate": event_rate,
+            "duration": duration,
+            "workers": workers,
+        },
+        "probe_cycle": {"device_count": device_count},
+        "command_tracker": {"iterations": iterations},
+        "observable_dispatch": {
+            "observer_count": device_count,
+            "iterations": iterations,
+        },
+        "adapter_lookup": {
+            "adapter_count": device_count,
+            "iterations": iterations,
+        },
+        "model_serialization": {
+            "device_count": device_count,
+            "iterations": max(1, iterations // 10),
+        },
+    }
+    return {
+        "benchmark": "hot_paths",
+        "version": release.version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "parameters": {
+            "scenarios": scenarios,
+            "device_count": device_count,
+            "iterations": iterations,
+            "event_rate": event_rate,
+            "duration": duration,
+            "workers": workers,
+        },
+        "results": {
+            scenario: SCENARIOS[scenario](**scenario_arguments[scenario])
+            for scenario in scenarios
+        },
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2))
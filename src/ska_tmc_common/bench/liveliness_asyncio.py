@@ -0,0 +1,157 @@
+"""
+Simulation benchmark comparing the threaded multi device liveliness probe,
+which probes the devices one after the other, with the asyncio liveliness
+probe, which probes them concurrently from a single event loop.
+
+It reports for each probe the time taken to probe every device once, the
+resulting probe rate, the CPU usage and the number of threads.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from typing import Sequence
+
+from ska_tmc_common.bench.common import CpuTimer, summarise
+from ska_tmc_common.bench.liveliness_scheduling import stub_device_names
+from ska_tmc_common.bench.stub_device import (
+    StubComponentManager,
+    StubDatabase,
+    StubTestContext,
+)
+from ska_tmc_common.dev_factory import DevFactory
+from ska_tmc_common.v2.liveliness_probe import (
+    AsyncMultiDeviceLivelinessProbe,
+    MultiDeviceLivelinessProbe,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# Period of the probes during the benchmark. It is short, so that the
+# probe threads exit quickly once the measured cycle is complete.
+BENCHMARK_CHECK_PERIOD: float = 0.05
+
+
+def run_probe_cycle(
+    probe_class: type[MultiDeviceLivelinessProbe],
+    device_count: int,
+    latency: float = 0.001,
+    timeout: float = 60.0,
+) -> dict:
+    """Runs the given liveliness probe class until every stub device has
+    been probed once and returns the measured statistics.
+
+    :param probe_class: liveliness probe class to run
+    :type probe_class: type[MultiDeviceLivelinessProbe]
+    :param device_count: number of simulated devices
+    :type device_count: int
+    :param latency: simulated round trip time of a probe in seconds
+    :type latency: float
+    :param timeout: maximum time in seconds to wait for the cycle
+    :type timeout: float
+    :return: statistics of the cycle
+    :rtype: dict
+    """
+    dev_names = stub_device_names(device_count)
+    component_manager = StubComponentManager(dev_names)
+    probe = probe_class(
+        component_manager,
+        LOGGER,
+        liveliness_check_period=BENCHMARK_CHECK_PERIOD,
+    )
+    probe.get_device_and_database = StubDatabase().get_device_and_database
+    asynchronous = isinstance(probe, AsyncMultiDeviceLivelinessProbe)
+    probed_devices: set[str] = set()
+    probe_durations: list[float] = []
+    cycle_done = threading.Event()
+
+    def record(dev_name: str, start_time: float) -> None:
+        probe_durations.append(time.perf_counter() - start_time)
+        probed_devices.add(dev_name)
+        if len(probed_devices) == device_count:
+            cycle_done.set()
+
+    if asynchronous:
+        async_device_task = probe.async_device_task
+
+        async def timed_async_device_task(dev_info) -> None:
+            start_time = time.perf_counter()
+            await async_device_task(dev_info)
+            record(dev_info.dev_name, start_time)
+
+        probe.async_device_task = timed_async_device_task
+    else:
+        device_task = probe.device_task
+
+        def timed_device_task(dev_info) -> None:
+            start_time = time.perf_counter()
+            device_task(dev_info)
+            record(dev_info.dev_name, start_time)
+
+        probe.device_task = timed_device_task
+
+    previous_context = DevFactory._test_context
+    DevFactory._test_context = StubTestContext(latency, asynchronous)
+    try:
+        for dev_name in dev_names:
+            probe.add_device(dev_name)
+        with CpuTimer() as timer:
+            probe.start()
+            completed = cycle_done.wait(timeout)
+        thread_count = threading.active_count()
+        probe.stop()
+        probe._thread.join(timeout)
+    finally:
+        DevFactory._test_context = previous_context
+
+    return {
+        "completed": completed,
+        "cycle_time_s": timer.wall_time,
+        "probes_per_second": len(probed_devices) / timer.wall_time,
+        "cpu_percent": timer.cpu_percent,
+        "threads": thread_count,
+        "probe_time_ms": summarise(probe_durations, 1e3),
+        "unresponsive_devices": component_manager.unresponsive_count,
+    }
+
+
+def run_benchmark(
+    device_counts: Sequence[int] = (100, 1000, 5000),
+    latency: float = 0.001,
+) -> dict:
+    """Runs the threaded and the asyncio liveliness probe against the
+    given numbers of stub devices.
+
+    :param device_counts: numbers of simulated devices, defaults to 100,
+        1000 and 5000
+    :type device_counts: Sequence[int]
+    :param latency: simulated round trip time of a probe in seconds
+    :type latency: float
+    :return: parameters and statistics of every run
+    :rtype: dict
+    """
+    results = {}
+    for device_count in device_counts:
+        results[str(device_count)] = {
+            "threaded": run_probe_cycle(
+                MultiDeviceLivelinessProbe, device_count, latency
+            ),
+            "asyncio": run_probe_cycle(
+                AsyncMultiDeviceLivelinessProbe, device_count, latency
+            ),
+        }
+    return {
+        "benchmark": "liveliness_asyncio",
+        "parameters": {
+            "device_counts": list(device_counts),
+            "latency": latency,
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2))
@@ -0,0 +1,195 @@
+"""
+Simulation benchmark comparing the burst liveliness probe, which probes
+every device at once and then sleeps, with the staggered liveliness probe,
+which spreads the probes evenly over the liveliness check period.
+
+It reports for each probe the jitter of the interval between two probes of
+the same device, how spiky the probe load is, and the CPU usage.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+
+from ska_tmc_common.bench.common import CpuTimer, summarise
+from ska_tmc_common.bench.stub_device import (
+    StubComponentManager,
+    StubDatabase,
+    StubTestContext,
+)
+from ska_tmc_common.dev_factory import DevFactory
+from ska_tmc_common.v2.liveliness_probe import (
+    MultiDeviceLivelinessProbe,
+    StaggeredMultiDeviceLivelinessProbe,
+)
+
+LOGGER = logging.getLogger(__name__)
+LOAD_BUCKETS_PER_PERIOD: int = 100
+
+
+def stub_device_names(device_count: int) -> list[str]:
+    """Returns the names of the simulated devices.
+
+    :param device_count: number of devices
+    :type device_count: int
+    :return: device names
+    :rtype: list[str]
+    """
+    return [f"bench/stub/{index:05d}" for index in range(device_count)]
+
+
+def _probe_statistics(
+    probe_times: list[tuple[str, float]],
+    liveliness_check_period: float,
+) -> dict:
+    """Computes the interval jitter and load statistics of the probes."""
+    times_per_device: dict[str, list[float]] = defaultdict(list)
+    for dev_name, probe_time in probe_times:
+        times_per_device[dev_name].append(probe_time)
+    jitter = [
+        abs(later - earlier - liveliness_check_period)
+        for times in times_per_device.values()
+        for earlier, later in zip(times, times[1:])
+    ]
+    bucket_size = liveliness_check_period / LOAD_BUCKETS_PER_PERIOD
+    buckets = Counter(
+        int(probe_time // bucket_size) for _, probe_time in probe_times
+    )
+    peak_to_mean = 0.0
+    if buckets:
+        bucket_count = max(buckets) - min(buckets) + 1
+        peak_to_mean = max(buckets.values()) / (
+            len(probe_times) / bucket_count
+        )
+    return {
+        "interval_jitter_ms": summarise(jitter, 1e3),
+        "peak_to_mean_load": peak_to_mean,
+    }
+
+
+def run_probe(
+    probe_class: type[MultiDeviceLivelinessProbe],
+    device_count: int,
+    liveliness_check_period: float,
+    duration: float,
+    latency: float = 0.0,
+) -> dict:
+    """Runs the given liveliness probe class against stub devices and
+    returns the measured statistics.
+
+    :param probe_class: liveliness probe class to run
+    :type probe_class: type[MultiDeviceLivelinessProbe]
+    :param device_count: number of simulated devices
+    :type device_count: int
+    :param liveliness_check_period: liveliness check period in seconds
+    :type liveliness_check_period: float
+    :param duration: duration of the run in seconds
+    :type duration: float
+    :param latency: simulated round trip time of a probe in seconds
+    :type latency: float
+    :return: statistics of the run
+    :rtype: dict
+    """
+    dev_names = stub_device_names(device_count)
+    component_manager = StubComponentManager(dev_names)
+    probe = probe_class(
+        component_manager,
+        LOGGER,
+        liveliness_check_period=liveliness_check_period,
+    )
+    probe.get_device_and_database = StubDatabase().get_device_and_database
+    probe_times: list[tuple[str, float]] = []
+    lateness: list[float] = []
+    device_task = probe.device_task
+
+    def timed_device_task(dev_info) -> None:
+        probe_times.append((dev_info.dev_name, time.monotonic()))
+        device_task(dev_info)
+
+    probe.device_task = timed_device_task
+    if isinstance(probe, StaggeredMultiDeviceLivelinessProbe):
+        probe_device = probe.probe_device
+
+        def timed_probe_device(dev_name: str, due_time: float) -> None:
+            lateness.append(time.monotonic() - due_time)
+            probe_device(dev_name, due_time)
+
+        probe.probe_device = timed_probe_device
+
+    previous_context = DevFactory._test_context
+    DevFactory._test_context = StubTestContext(latency)
+    try:
+        for dev_name in dev_names:
+            probe.add_device(dev_name)
+        with CpuTimer() as timer:
+            probe.start()
+            time.sleep(duration)
+            probe.stop()
+            probe._thread.join(liveliness_check_period + 1)
+    finally:
+        DevFactory._test_context = previous_context
+
+    result = {
+        "probes": len(probe_times),
+        "probes_per_second": len(probe_times) / timer.wall_time,
+        "cpu_percent": timer.cpu_percent,
+        "unresponsive_devices": component_manager.unresponsive_count,
+    }
+    result.update(_probe_statistics(probe_times, liveliness_check_period))
+    if lateness:
+        result["schedule_lateness_ms"] = summarise(lateness, 1e3)
+    return result
+
+
+def run_benchmark(
+    device_count: int = 1000,
+    liveliness_check_period: float = 1.0,
+    duration: float = 5.0,
+    latency: float = 0.0,
+) -> dict:
+    """Runs the burst and the staggered liveliness probe against the same
+    number of stub devices.
+
+    :param device_count: number of simulated devices, defaults to 1000
+    :type device_count: int
+    :param liveliness_check_period: liveliness check period in seconds
+    :type liveliness_check_period: float
+    :param duration: duration of each run in seconds
+    :type duration: float
+    :param latency: simulated round trip time of a probe in seconds
+    :type latency: float
+    :return: parameters and statistics of both runs
+    :rtype: dict
+    """
+    return {
+        "benchmark": "liveliness_scheduling",
+        "parameters": {
+            "device_count": device_count,
+            "liveliness_check_period": liveliness_check_period,
+            "duration": duration,
+            "latency": latency,
+        },
+        "results": {
+            "burst": run_probe(
+                MultiDeviceLivelinessProbe,
+                device_count,
+                liveliness_check_period,
+                duration,
+                latency,
+            ),
+            "staggered": run_probe(
+                StaggeredMultiDeviceLivelinessProbe,
+                device_count,
+                liveliness_check_period,
+                duration,
+                latency,
+            ),
+        },
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2))
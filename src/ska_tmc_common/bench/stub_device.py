@@ -0,0 +1,368 @@
+"""
+This module provides in-process stand-ins for Tango device proxies, the
+Tango database and a component manager, used by the offline benchmarks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import tango
+
+from ska_tmc_common.dev_factory import DevFactory
+from ska_tmc_common.device_info import DeviceInfo
+from ska_tmc_common.event_recorder import RecordedEvent
+
+
+class StubDeviceProxy:
+    """A stand-in for tango.DeviceProxy which answers from memory, with an
+    optional simulated network latency."""
+
+    def __init__(self, dev_name: str, latency: float = 0.0) -> None:
+        """
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :param latency: simulated round trip time in seconds of every call.
+        :type latency: float
+        """
+        self._dev_name = dev_name
+        self.latency = latency
+        self.call_count: int = 0
+        self._state = tango.DevState.ON
+        self._subscriptions: dict[int, tuple[str, Callable]] = {}
+        self._subscription_ids = itertools.count(1)
+        self._subscriptions_lock = threading.Lock()
+
+    def _simulate_call(self) -> None:
+        """Accounts for a call and waits for the simulated latency."""
+        self.call_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def dev_name(self) -> str:
+        """Returns the device name.
+
+        :return: device name
+        :rtype: str
+        """
+        return self._dev_name
+
+    def state(self) -> tango.DevState:
+        """Returns the device state.
+
+        :return: device state
+        :rtype: tango.DevState
+        """
+        self._simulate_call()
+        return self._state
+
+    def ping(self) -> int:
+        """Returns the simulated round trip time.
+
+        :return: round trip time in microseconds
+        :rtype: int
+        """
+        self._simulate_call()
+        return int(self.latency * 1e6)
+
+    def subscribe_event(
+        self,
+        attr_name: str,
+        event_type: tango.EventType,
+        callback: Callable,
+        stateless: bool = False,
+    ) -> int:
+        """Registers the callback of the change events of the attribute,
+        which are sent by push_change_event.
+
+        :param attr_name: attribute name
+        :type attr_name: str
+        :param event_type: event type, only change events are sent
+        :type event_type: tango.EventType
+        :param callback: event callback
+        :type callback: Callable
+        :param stateless: unused
+        :type stateless: bool
+        :return: subscription id
+        :rtype: int
+        """
+        self._simulate_call()
+        with self._subscriptions_lock:
+            subscription_id = next(self._subscription_ids)
+            self._subscriptions[subscription_id] = (
+                attr_name.lower(),
+                callback,
+            )
+        return subscription_id
+
+    def unsubscribe_event(self, subscription_id: int) -> None:
+        """Removes a subscription.
+
+        :param subscription_id: subscription id
+        :type subscription_id: int
+        """
+        self._simulate_call()
+        with self._subscriptions_lock:
+            self._subscriptions.pop(subscription_id, None)
+
+    @property
+    def subscription_count(self) -> int:
+        """Returns the number of subscriptions of the proxy.
+
+        :return: number of subscriptions
+        :rtype: int
+        """
+        with self._subscriptions_lock:
+            return len(self._subscriptions)
+
+    def push_change_event(self, attr_name: str, value: Any) -> int:
+        """Sends a change event of the attribute to its subscribers, from
+        the calling thread.
+
+        :param attr_name: attribute name
+        :type attr_name: str
+        :param value: attribute value
+        :type value: Any
+        :return: number of callbacks the event was sent to
+        :rtype: int
+        """
+        attr_name = attr_name.lower()
+        with self._subscriptions_lock:
+            callbacks = [
+                callback
+                for name, callback in self._subscriptions.values()
+                if name == attr_name
+            ]
+        now = time.time()
+        event = RecordedEvent(
+            self._dev_name,
+            attr_name,
+            value,
+            tango.AttrQuality.ATTR_VALID,
+            now,
+            now,
+        )
+        for callback in callbacks:
+            callback(event)
+        return len(callbacks)
+
+
+class AsyncStubDeviceProxy(StubDeviceProxy):
+    """A stand-in for a tango.DeviceProxy in asyncio green mode, whose
+    calls are coroutines."""
+
+    async def _simulate_async_call(self) -> None:
+        """Accounts for a call and waits for the simulated latency without
+        blocking the event loop."""
+        self.call_count += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def state(self) -> tango.DevState:
+        """Returns the device state.
+
+        :return: device state
+        :rtype: tango.DevState
+        """
+        await self._simulate_async_call()
+        return self._state
+
+    async def ping(self) -> int:
+        """Returns the simulated round trip time.
+
+        :return: round trip time in microseconds
+        :rtype: int
+        """
+        await self._simulate_async_call()
+        return int(self.latency * 1e6)
+
+
+class StubTestContext:
+    """A stand-in for tango.test_context.MultiDeviceTestContext, to be
+    installed as DevFactory._test_context. Proxies are created on first use.
+    """
+
+    def __init__(
+        self, latency: float = 0.0, asynchronous: bool = False
+    ) -> None:
+        """
+        :param latency: simulated round trip time in seconds of every call
+            made on the created proxies.
+        :type latency: float
+        :param asynchronous: when True, the created proxies behave as
+            proxies in asyncio green mode.
+        :type asynchronous: bool
+        """
+        self.latency = latency
+        self._proxy_class = (
+            AsyncStubDeviceProxy if asynchronous else StubDeviceProxy
+        )
+        self.proxies: dict[str, StubDeviceProxy] = {}
+        self._lock = threading.Lock()
+
+    def get_device(self, dev_name: str) -> StubDeviceProxy:
+        """Returns the stub proxy for the given device.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :return: stub proxy
+        :rtype: StubDeviceProxy
+        """
+        with self._lock:
+            proxy = self.proxies.get(dev_name)
+            if proxy is None:
+                proxy = self._proxy_class(dev_name, self.latency)
+                self.proxies[dev_name] = proxy
+            return proxy
+
+    @property
+    def call_count(self) -> int:
+        """Returns the number of calls made on all the stub proxies.
+
+        :return: number of calls
+        :rtype: int
+        """
+        with self._lock:
+            return sum(proxy.call_count for proxy in self.proxies.values())
+
+
+class StubTestContextInstalled:
+    """Context manager installing a StubTestContext as
+    DevFactory._test_context, and restoring the previous one on exit."""
+
+    def __init__(
+        self, latency: float = 0.0, asynchronous: bool = False
+    ) -> None:
+        self.context = StubTestContext(latency, asynchronous)
+        self._previous_context = None
+
+    def __enter__(self) -> StubTestContext:
+        self._previous_context = DevFactory._test_context
+        DevFactory._test_context = self.context
+        return self.context
+
+    def __exit__(self, *exc_info) -> None:
+        DevFactory._test_context = self._previous_context
+
+
+class StubDbDeviceInfo:
+    """A stand-in for the device information returned by the database."""
+
+    def __init__(self, name: str, exported: bool = True) -> None:
+        self.name = name
+        self.exported = exported
+
+
+class StubDatabase:
+    """A stand-in for tango.Database in which every device is exported,
+    unless it is listed as unexported."""
+
+    def __init__(self) -> None:
+        self.unexported_devices: set[str] = set()
+
+    def get_device_info(self, device_name: str) -> StubDbDeviceInfo:
+        """Returns the database information of the given device.
+
+        :param device_name: Tango device FQDN.
+        :type device_name: str
+        :return: device information
+        :rtype: StubDbDeviceInfo
+        """
+        return StubDbDeviceInfo(
+            device_name, device_name not in self.unexported_devices
+        )
+
+    def get_device_and_database(
+        self, device_name: str
+    ) -> tuple[str, StubDatabase]:
+        """Replacement for BaseLivelinessProbe.get_device_and_database which
+        resolves every device in this stub database.
+
+        :param device_name: Tango device FQDN.
+        :type device_name: str
+        :return: device name and database
+        :rtype: tuple[str, StubDatabase]
+        """
+        return device_name, self
+
+
+class StubComponentManager:
+    """A minimal component manager holding the internal model of the
+    monitored devices, with the callbacks used by the liveliness probes."""
+
+    def __init__(self, dev_names: Optional[list[str]] = None) -> None:
+        """
+        :param dev_names: names of the monitored devices
+        :type dev_names: list[str], optional
+        """
+        self.lock = threading.Lock()
+        self.devices: dict[str, DeviceInfo] = {
+            dev_name: DeviceInfo(dev_name) for dev_name in dev_names or []
+        }
+
+    def get_device(self, dev_name: str) -> Optional[DeviceInfo]:
+        """Returns the device info of the given device.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :return: device info
+        :rtype: DeviceInfo, optional
+        """
+        return self.devices.get(dev_name)
+
+    def update_exception_for_unresponsiveness(
+        self, device_info: DeviceInfo, exception: str
+    ) -> None:
+        """Marks the device as unresponsive.
+
+        :param device_info: a device info
+        :type device_info: DeviceInfo
+        :param exception: exception message
+        :type exception: str
+        """
+        with self.lock:
+            device_info.update_unresponsive(True, exception)
+
+    def update_responsiveness_info(self, device_name: str) -> None:
+        """Marks the device as responsive.
+
+        :param device_name: Tango device FQDN.
+        :type device_name: str
+        """
+        with self.lock:
+            self.devices[device_name].update_unresponsive(False, "")
+
+    def update_device_availabiity_for_subscription(
+        self, device_name: str
+    ) -> None:
+        """Called when a device becomes available again.
+
+        :param device_name: Tango device FQDN.
+        :type device_name: str
+        """
+
+    def check_device_responsiveness(self, device_name: str) -> bool:
+        """Checks whether the device is responsive.
+
+        :param device_name: Tango device FQDN.
+        :type device_name: str
+        :return: False if the device is marked as unresponsive, else True
+        :rtype: bool
+        """
+        device = self.devices.get(device_name)
+        return device is None or not device.unresponsive
+
+    @property
+    def unresponsive_count(self) -> int:
+        """Returns the number of unresponsive devices.
+
+        :return: number of unresponsive devices
+        :rtype: int
+        """
+        return sum(
+            1 for device in self.devices.values() if device.unresponsive
+        )
@@ -0,0 +1,326 @@
+"""
+This module provides the clock used for the timeouts, periods and simulated
+delays of ska-tmc-common. The default clock follows the wall clock time. An
+AcceleratedClock runs a given number of times faster and a VirtualClock only
+moves when it is advanced, so that long scenarios run in a fraction of
+their duration with the same ordering of their timers.
+
+The clock of the process is returned by get_clock and is replaced with
+set_clock, before the devices and component managers are started. A device
+server started with the TMC_CLOCK_SPEED environment variable uses an
+AcceleratedClock of that speed.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+CLOCK_SPEED_ENV_VAR: str = "TMC_CLOCK_SPEED"
+
+
+class ClockTimer(threading.Timer):
+    """A threading.Timer whose interval is measured on a clock."""
+
+    def __init__(
+        self,
+        clock: Clock,
+        interval: float,
+        function: Callable,
+        args: Optional[list] = None,
+        kwargs: Optional[dict] = None,
+    ) -> None:
+        """
+        :param clock: clock measuring the interval
+        :type clock: Clock
+        :param interval: interval in seconds of the clock
+        :type interval: float
+        :param function: function called after the interval
+        :type function: Callable
+        :param args: positional arguments of the call
+        :type args: list, optional
+        :param kwargs: keyword arguments of the call
+        :type kwargs: dict, optional
+        """
+        super().__init__(interval, function, args, kwargs)
+        self._clock = clock
+
+    def run(self) -> None:
+        self._clock.wait(self.finished, self.interval)
+        if not self.finished.is_set():
+            self.function(*self.args, **self.kwargs)
+        self.finished.set()
+
+
+class Clock:
+    """The wall clock, used by default."""
+
+    # Clock seconds per real second.
+    speed: float = 1.0
+
+    def time(self) -> float:
+        """Returns the time since the epoch, as time.time.
+
+        :return: time in seconds
+        :rtype: float
+        """
+        return time.time()
+
+    def monotonic(self) -> float:
+        """Returns the value of a monotonic clock, as time.monotonic.
+
+        :return: time in seconds
+        :rtype: float
+        """
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        """Suspends the calling thread for the given duration.
+
+        :param seconds: duration in seconds of the clock
+        :type seconds: float
+        """
+        time.sleep(seconds)
+
+    def wait(self, waitable: Any, timeout: Optional[float] = None) -> bool:
+        """Waits for a threading.Event, or a threading.Condition whose lock
+        is held, for at most the given duration.
+
+        :param waitable: event or condition to wait for
+        :type waitable: threading.Event | threading.Condition
+        :param timeout: duration in seconds of the clock, defaults to None,
+            which waits without time limit.
+        :type timeout: float, optional
+        :return: the result of the wait method of the waitable, False when
+            the timeout expired
+        :rtype: bool
+        """
+        return waitable.wait(timeout)
+
+    def timer(
+        self,
+        interval: float,
+        function: Callable,
+        args: Optional[list] = None,
+        kwargs: Optional[dict] = None,
+    ) -> threading.Timer:
+        """Creates a timer calling the function once the interval has
+        elapsed on this clock. It takes the arguments of threading.Timer.
+
+        :param interval: interval in seconds of the clock
+        :type interval: float
+        :param function: function to call
+        :type function: Callable
+        :param args: positional arguments of the call
+        :type args: list, optional
+        :param kwargs: keyword arguments of the call
+        :type kwargs: dict, optional
+        :return: timer, to be started
+        :rtype: threading.Timer
+        """
+        return threading.Timer(interval, function, args, kwargs)
+
+
+class AcceleratedClock(Clock):
+    """A clock running the given number of times faster than the wall
+    clock, from the time it is created.
+    """
+
+    def __init__(self, speed: float) -> None:
+        """
+        :param speed: clock seconds per real second
+        :type speed: float
+        :raises ValueError: when the speed is not positive
+        """
+        if speed <= 0:
+            raise ValueError(f"Clock speed must be positive, got {speed}")
+        self.speed = speed
+        self._real_origin = time.monotonic()
+        self._wall_origin = time.time()
+
+    def _elapsed(self) -> float:
+        """Returns the clock time elapsed since the creation of the clock."""
+        return (time.monotonic() - self._real_origin) * self.speed
+
+    def time(self) -> float:
+        return self._wall_origin + self._elapsed()
+
+    def monotonic(self) -> float:
+        return self._real_origin + self._elapsed()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(max(0.0, seconds) / self.speed)
+
+    def wait(self, waitable: Any, timeout: Optional[float] = None) -> bool:
+        if timeout is None:
+            return waitable.wait()
+        return waitable.wait(max(0.0, timeout) / self.speed)
+
+    def timer(
+        self,
+        interval: float,
+        function: Callable,
+        args: Optional[list] = None,
+        kwargs: Optional[dict] = None,
+    ) -> threading.Timer:
+        return ClockTimer(self, interval, function, args, kwargs)
+
+
+class VirtualClock(Clock):
+    """
+    A clock which only moves when it is advanced. The sleeps, waits and
+    timers measured on it complete once the clock has been advanced past
+    their deadline, whatever the real time it took, so a test drives the
+    simulated time with advance, or with step, which jumps to the next
+    deadline.
+    """
+
+    speed: float = 0.0
+
+    # Real time in seconds between two checks of the clock by a thread
+    # waiting for an event or a condition.
+    POLL_INTERVAL: float = 0.001
+
+    def __init__(self, start_time: Optional[float] = None) -> None:
+        """
+        :param start_time: time since the epoch at which the clock starts,
+            defaults to the current time
+        :type start_time: float, optional
+        """
+        self._start_time = time.time() if start_time is None else start_time
+        self._elapsed = 0.0
+        self._deadlines: dict[float, int] = {}
+        self._condition = threading.Condition()
+
+    def time(self) -> float:
+        return self._start_time + self._elapsed
+
+    def monotonic(self) -> float:
+        return self._elapsed
+
+    def advance(self, seconds: float) -> None:
+        """Moves the clock forward, releasing the sleeps, waits and timers
+        whose deadline is reached.
+
+        :param seconds: duration in seconds
+        :type seconds: float
+        """
+        with self._condition:
+            self._elapsed += max(0.0, seconds)
+            self._condition.notify_all()
+
+    def next_deadline(self) -> Optional[float]:
+        """Returns the earliest deadline of the pending sleeps, waits and
+        timers.
+
+        :return: monotonic time of the deadline, None if nothing waits
+        :rtype: Optional[float]
+        """
+        with self._condition:
+            return min(self._deadlines, default=None)
+
+    def step(self) -> bool:
+        """Advances the clock to the earliest pending deadline.
+
+        :return: False if nothing waits for the clock
+        :rtype: bool
+        """
+        with self._condition:
+            deadline = min(self._deadlines, default=None)
+            if deadline is None:
+                return False
+            self._elapsed = max(self._elapsed, deadline)
+            self._condition.notify_all()
+            return True
+
+    def _add_deadline(self, timeout: float) -> float:
+        """Registers the deadline of a wait starting now."""
+        with self._condition:
+            deadline = self._elapsed + max(0.0, timeout)
+            self._deadlines[deadline] = self._deadlines.get(deadline, 0) + 1
+            return deadline
+
+    def _remove_deadline(self, deadline: float) -> None:
+        """Unregisters the deadline of a completed wait."""
+        with self._condition:
+            count = self._deadlines.pop(deadline) - 1
+            if count:
+                self._deadlines[deadline] = count
+
+    def sleep(self, seconds: float) -> None:
+        deadline = self._add_deadline(seconds)
+        try:
+            with self._condition:
+                while self._elapsed < deadline:
+                    self._condition.wait()
+        finally:
+            self._remove_deadline(deadline)
+
+    def wait(self, waitable: Any, timeout: Optional[float] = None) -> bool:
+        if timeout is None:
+            return waitable.wait()
+        deadline = self._add_deadline(timeout)
+        try:
+            while self._elapsed < deadline:
+                if waitable.wait(self.POLL_INTERVAL):
+                    return True
+            return waitable.wait(0)
+        finally:
+            self._remove_deadline(deadline)
+
+    def timer(
+        self,
+        interval: float,
+        function: Callable,
+        args: Optional[list] = None,
+        kwargs: Optional[dict] = None,
+    ) -> threading.Timer:
+        return ClockTimer(self, interval, function, args, kwargs)
+
+
+_CLOCK_LOCK = threading.Lock()
+_clock: Optional[Clock] = None
+
+
+def clock_from_environment() -> Clock:
+    """Returns an AcceleratedClock when the TMC_CLOCK_SPEED environment
+    variable is set to a speed other than 1, the wall clock otherwise.
+
+    :return: clock of the process
+    :rtype: Clock
+    """
+    speed = float(os.environ.get(CLOCK_SPEED_ENV_VAR) or 1)
+    if speed == 1:
+        return Clock()
+    return AcceleratedClock(speed)
+
+
+def get_clock() -> Clock:
+    """Returns the clock of the process.
+
+    :return: clock set with set_clock, or the clock configured by the
+        environment
+    :rtype: Clock
+    """
+    global _clock  # pylint: disable=global-statement
+    if _clock is None:
+        with _CLOCK_LOCK:
+            if _clock is None:
+                _clock = clock_from_environment()
+    return _clock
+
+
+def set_clock(clock: Optional[Clock]) -> None:
+    """Replaces the clock of the process. It must be set before starting
+    the devices and component managers, whose pending timers keep the
+    clock they were started with.
+
+    :param clock: new clock, None to use the clock configured by the
+        environment again
+    :type clock: Clock, optional
+    """
+    global _clock  # pylint: disable=global-statement
+    with _CLOCK_LOCK:
+        _clock = clock
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 from operator import methodcaller
 from typing import TYPE_CHECKING
 
@@ -19,6 +20,12 @@ from ska_tmc_common.observer import (
 if TYPE_CHECKING:
     from ska_tmc_common.tmc_command import BaseTMCCommand
 
+# Values of the result label of the command duration metric.
+COMMAND_RESULT_OK: str = "ok"
+COMMAND_RESULT_FAILED: str = "failed"
+COMMAND_RESULT_TIMEOUT: str = "timeout"
+COMMAND_RESULT_ABORTED: str = "aborted"
+
 
 class CommandCallbackTracker:
     """CommandCallbackTracker class helps to track command status
@@ -60,6 +67,21 @@ class CommandCallbackTracker:
         self.attribute_change_observer = AttributeValueObserver(
             logger, self, self.observable
         )
+        self._start_time = time.perf_counter()
+        self._in_flight_gauge = None
+        self._metrics_registry = getattr(
+            self.component_manager, "metrics_registry", None
+        )
+        self._command_labels = {
+            "command": type(command_class_instance).__name__
+        }
+        if self._metrics_registry is not None:
+            self._in_flight_gauge = self._metrics_registry.gauge(
+                "tmc_commands_in_flight",
+                "Commands waiting for their completion, per command",
+                self._command_labels,
+            )
+            self._in_flight_gauge.inc()
 
         self.update_attr_value_change()
         self.is_exception_received()
@@ -86,7 +108,7 @@ class CommandCallbackTracker:
                 ),
                 exception="Timeout has occurred, command failed",
             )
-            self.clean_up()
+            self.clean_up(COMMAND_RESULT_TIMEOUT)
 
     def update_attr_value_change(self):
         """This method is invoked when attribute changes."""
@@ -106,12 +128,12 @@ class CommandCallbackTracker:
                         attribute_value,
                     )
                 if not self.states_to_track:  # the list is empty
-                    self.clean_up()
+                    self.clean_up(COMMAND_RESULT_OK)
                     self.command_class_instance.update_task_status(
                         result=(ResultCode.OK, "Command Completed")
                     )
             elif self.abort_event.is_set():
-                self.clean_up()
+                self.clean_up(COMMAND_RESULT_ABORTED)
                 self.command_class_instance.update_task_status(
                     status=TaskStatus.ABORTED
                 )
@@ -136,7 +158,7 @@ class CommandCallbackTracker:
                     exception_message = self.lrcr_callback.command_data[
                         self.command_id
                     ]["exception_message"]
-                    self.clean_up()
+                    self.clean_up(COMMAND_RESULT_FAILED)
                     self.command_class_instance.update_task_status(
                         result=(
                             ResultCode.FAILED,
@@ -149,13 +171,19 @@ class CommandCallbackTracker:
                 "Error occurred while updating exception %s", exception
             )
 
-    def clean_up(self):
+    def clean_up(self, result: str = COMMAND_RESULT_OK):
         """
         This method is used for clean up of command variables and
         stopping timer.
+
+        Args:
+            result (str): outcome of the command reported in the command
+                duration metric: ok, failed, timeout or aborted.
         """
 
         try:
+            if not self.command_completed:
+                self.record_completion_metrics(result)
             self.command_completed = True
             if hasattr(self.command_class_instance, "timekeeper"):
                 self.command_class_instance.timekeeper.stop_timer()
@@ -169,3 +197,25 @@ class CommandCallbackTracker:
                 self.lrcr_callback.remove_data(self.command_id)
         except (AttributeError, ValueError, TypeError) as exception:
             self.logger.error("Error occurred while clean up %s", exception)
+
+    def record_completion_metrics(
+        self, result: str = COMMAND_RESULT_OK
+    ) -> None:
+        """
+        This method reports the completion of the command in the metrics
+        registry of the component manager, if any. The duration of the
+        command is labelled with its outcome.
+
+        Args:
+            result (str): outcome of the command: ok, failed, timeout or
+                aborted.
+        """
+        if self._metrics_registry is None:
+            return
+        self._in_flight_gauge.dec()
+        self._metrics_registry.histogram(
+            "tmc_command_duration_seconds",
+            "Time from the invocation to the completion of the commands, "
+            "per command and result",
+            {**self._command_labels, "result": result},
+        ).observe(time.perf_counter() - self._start_time)
@@ -33,12 +33,19 @@ class DevFactory:
         self.logger = logging.getLogger(__name__)
         self.default_green_mode = green_mode
 
-    def get_device(self, dev_name: str, green_mode=None) -> tango.DeviceProxy:
+    def get_device(
+        self, dev_name: str, green_mode=None, asyncio_executor=None
+    ) -> tango.DeviceProxy:
         """
         Create (if not done before) a DeviceProxy for the Device fqnm
 
         :param dev_name: Device name
         :param green_mode: tango.GreenMode (synchronous by default)
+        :param asyncio_executor: executor of the event loop running the
+            calls of an asyncio green mode proxy. It must be created in
+            the thread of its event loop, else the calls of the proxy run
+            synchronously. Such a proxy is only usable from that loop, so
+            it is not cached, and the caller keeps it.
 
         :return: DeviceProxy
         """
@@ -46,6 +53,13 @@ class DevFactory:
             green_mode = self.default_green_mode
         # import debugpy; debugpy.debug_this_thread()
         if DevFactory._test_context is None:
+            if asyncio_executor is not None:
+                self.logger.debug("Creating Proxy for %s", dev_name)
+                return tango.DeviceProxy(
+                    dev_name,
+                    green_mode=green_mode,
+                    asyncio_executor=asyncio_executor,
+                )
             if dev_name not in self.dev_proxys:
                 self.logger.debug("Creating Proxy for %s", dev_name)
                 self.dev_proxys[dev_name] = tango.DeviceProxy(
@@ -11,10 +11,12 @@ from tango import DevState
 
 from ska_tmc_common.enum import (
     Band,
+    CircuitBreakerState,
     DishMode,
     PointingState,
     TrackTableLoadMode,
 )
+from ska_tmc_common.latency_statistics import LatencyStatistics
 
 
 def dev_state_2_str(value: DevState) -> str:
@@ -64,13 +66,16 @@ class DeviceInfo:
         self._health_state: HealthState = HealthState.UNKNOWN
         self._device_availability = False
         self._ping: int = -1
+        self._ping_statistics = LatencyStatistics()
         self.last_event_arrived = None
+        self.last_change_event_arrived = None
         self.exception = None
         self._unresponsive = _unresponsive
         self.lock = threading.Lock()
         self._source_dish_vcc_config = ""
         self._dish_vcc_config = ""
         self._admin_mode = None
+        self._circuit_breaker_state = CircuitBreakerState.CLOSED
 
     @property
     def state(self) -> DevState:
@@ -141,9 +146,24 @@ class DeviceInfo:
         self.state = dev_info.state
         self.health_state = dev_info.health_state
         self.ping = dev_info.ping
+        self._ping_statistics = dev_info.ping_statistics
         self.last_event_arrived = dev_info.last_event_arrived
+        self.last_change_event_arrived = dev_info.last_change_event_arrived
+        self.circuit_breaker_state = dev_info.circuit_breaker_state
         self.lock = dev_info.lock
 
+    def record_change_event(self, arrival_time: float) -> None:
+        """
+        Records the arrival of a change event carrying a value. Unlike an
+        error event, which also updates last_event_arrived, it proves that
+        the device is alive.
+
+        :param arrival_time: arrival time of the event
+        :type arrival_time: float
+        """
+        self.last_event_arrived = arrival_time
+        self.last_change_event_arrived = arrival_time
+
     def update_unresponsive(self, value: bool, exception: str = "") -> None:
         """
         Set device unresponsive
@@ -169,12 +189,24 @@ class DeviceInfo:
 
     @ping.setter
     def ping(self, value: int) -> None:
-        """Updates the ping value for current device
+        """Updates the ping value for current device. Valid values are
+        added to the rolling ping statistics.
 
-        :param value: updated ping value for device
+        :param value: updated ping value for device in microseconds
         :type value: int
         """
         self._ping = value
+        if value >= 0:
+            self._ping_statistics.add_sample(value)
+
+    @property
+    def ping_statistics(self) -> LatencyStatistics:
+        """Return the rolling ping statistics for current device
+
+        :return: ping statistics for device
+        :rtype: LatencyStatistics
+        """
+        return self._ping_statistics
 
     @property
     def source_dish_vcc_config(self) -> str:
@@ -215,6 +247,25 @@ class DeviceInfo:
         """
         return self._unresponsive
 
+    @property
+    def circuit_breaker_state(self) -> CircuitBreakerState:
+        """Return the state of the circuit breaker guarding the liveliness
+        probes of this device.
+
+        :return: circuit breaker state
+        :rtype: CircuitBreakerState
+        """
+        return self._circuit_breaker_state
+
+    @circuit_breaker_state.setter
+    def circuit_breaker_state(self, value: CircuitBreakerState) -> None:
+        """Updates the circuit breaker state of this device.
+
+        :param value: circuit breaker state
+        :type value: CircuitBreakerState
+        """
+        self._circuit_breaker_state = value
+
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, DeviceInfo):
             return self.dev_name == other.dev_name
@@ -239,10 +290,14 @@ class DeviceInfo:
             "state": dev_state_2_str(DevState(self.state)),
             "healthState": str(HealthState(self.health_state)),
             "ping": str(self.ping),
+            "pingStatistics": self.ping_statistics.to_dict(),
             "last_event_arrived": str(self.last_event_arrived),
             "unresponsive": str(self.unresponsive),
             "exception": str(self.exception),
             "isSubarrayAvailable": self.device_availability,
+            "circuitBreakerState": str(
+                CircuitBreakerState(self.circuit_breaker_state)
+            ),
         }
         return result
 
@@ -65,6 +65,23 @@ class LivelinessProbeType(IntEnum):
     NONE = 0
     SINGLE_DEVICE = 1
     MULTI_DEVICE = 2
+    STAGGERED_MULTI_DEVICE = 3
+    ASYNC_MULTI_DEVICE = 4
+
+
+@unique
+class CircuitBreakerState(IntEnum):
+    """Enum class for the state of the circuit breaker guarding the
+    liveliness probes of a device.
+
+    :CLOSED: The device is responsive and is probed normally.
+    :OPEN: The device failed and is not probed until its backoff expires.
+    :HALF_OPEN: The backoff expired and a single trial probe is allowed.
+    """
+
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
 
 
 @unique
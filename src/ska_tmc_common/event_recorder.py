@@ -0,0 +1,672 @@
+"""
+This module records the change events received by a TMC node in a compact
+append-only binary log, and replays them into a component manager without
+Tango, so that the event callbacks and the aggregation of the component
+managers can be load tested against real event traces.
+
+The log starts with an 8 bytes header, followed by two kinds of records,
+all the integers being little endian:
+
+* name records, which assign an id to a device or attribute name the first
+  time it is recorded: type (B, 0), name id (H), length (H) and the UTF-8
+  encoded name,
+* event records: type (B, 1), attribute timestamp (d), reception time (d),
+  device name id (H), attribute name id (H), quality (B, 255 if unknown),
+  error flag (B), value type (B), value length (I) and the encoded value.
+  The value of an error event is the list of its (reason, description)
+  pairs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Callable, Iterator, Mapping, Optional
+
+import tango
+
+from ska_tmc_common.latency_histogram import LatencyHistogram
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+LOG_HEADER: bytes = b"TMCEVL\x00\x01"
+NAME_RECORD: int = 0
+EVENT_RECORD: int = 1
+UNKNOWN_QUALITY: int = 255
+
+_NAME_STRUCT = struct.Struct("<BHH")
+_EVENT_STRUCT = struct.Struct("<BddHHBBBI")
+
+# Types of the recorded values.
+_NONE_VALUE: int = 0
+_BOOL_VALUE: int = 1
+_INT_VALUE: int = 2
+_FLOAT_VALUE: int = 3
+_STRING_VALUE: int = 4
+_STATE_VALUE: int = 5
+_LIST_VALUE: int = 6
+_TUPLE_VALUE: int = 7
+
+_INT_STRUCT = struct.Struct("<q")
+_FLOAT_STRUCT = struct.Struct("<d")
+
+
+def _encode_value(value: Any) -> tuple[int, bytes]:
+    """Encodes an attribute value as its value type and its bytes."""
+    if hasattr(value, "tolist"):
+        # numpy scalars and arrays
+        value = value.tolist()
+    if value is None:
+        return _NONE_VALUE, b""
+    if isinstance(value, tango.DevState):
+        return _STATE_VALUE, bytes((int(value),))
+    if isinstance(value, bool):
+        return _BOOL_VALUE, bytes((value,))
+    if isinstance(value, int):
+        return _INT_VALUE, _INT_STRUCT.pack(value)
+    if isinstance(value, float):
+        return _FLOAT_VALUE, _FLOAT_STRUCT.pack(value)
+    if isinstance(value, str):
+        return _STRING_VALUE, value.encode()
+    value_type = _TUPLE_VALUE if isinstance(value, tuple) else _LIST_VALUE
+    return value_type, json.dumps(value, default=str).encode()
+
+
+def _decode_value(value_type: int, data: bytes) -> Any:
+    """Decodes an attribute value from its value type and its bytes."""
+    if value_type == _NONE_VALUE:
+        return None
+    if value_type == _STATE_VALUE:
+        return tango.DevState(data[0])
+    if value_type == _BOOL_VALUE:
+        return bool(data[0])
+    if value_type == _INT_VALUE:
+        return _INT_STRUCT.unpack(data)[0]
+    if value_type == _FLOAT_VALUE:
+        return _FLOAT_STRUCT.unpack(data)[0]
+    if value_type == _STRING_VALUE:
+        return data.decode()
+    value = json.loads(data)
+    return tuple(value) if value_type == _TUPLE_VALUE else value
+
+
+def _to_seconds(timestamp: Optional[tango.TimeVal]) -> float:
+    """Converts a tango.TimeVal to seconds since epoch, 0 if unknown."""
+    try:
+        return timestamp.totime()
+    except AttributeError:
+        return 0.0
+
+
+class RecordedDevice:
+    """Stand-in for the device proxy of a recorded event."""
+
+    __slots__ = ("_dev_name",)
+
+    def __init__(self, dev_name: str) -> None:
+        self._dev_name = dev_name
+
+    def dev_name(self) -> str:
+        """Returns the device name.
+
+        :return: device name
+        :rtype: str
+        """
+        return self._dev_name
+
+
+class RecordedError:
+    """Stand-in for the tango.DevError of a recorded error event."""
+
+    __slots__ = ("reason", "desc")
+
+    def __init__(self, reason: str, desc: str) -> None:
+        self.reason: str = reason
+        self.desc: str = desc
+
+
+class RecordedAttributeValue:
+    """Stand-in for the tango.DeviceAttribute of a recorded event."""
+
+    __slots__ = ("name", "value", "quality", "time")
+
+    def __init__(
+        self,
+        name: str,
+        value: Any,
+        quality: Optional[tango.AttrQuality],
+        source_time: float,
+    ) -> None:
+        self.name: str = name
+        self.value: Any = value
+        self.quality: Optional[tango.AttrQuality] = quality
+        self.time: tango.TimeVal = tango.TimeVal.fromtimestamp(source_time)
+
+
+class RecordedEvent:
+    """
+    A recorded change event. It provides the members of tango.EventData
+    used by the event callbacks, so that the recorded events can be replayed
+    into the same callbacks as the change events.
+    """
+
+    __slots__ = (
+        "device_name",
+        "attribute_name",
+        "source_time",
+        "reception_time",
+        "device",
+        "attr_name",
+        "attr_value",
+        "err",
+        "errors",
+        "event",
+        "reception_date",
+    )
+
+    def __init__(
+        self,
+        device_name: str,
+        attribute_name: str,
+        value: Any,
+        quality: Optional[tango.AttrQuality],
+        source_time: float,
+        reception_time: float,
+        errors: tuple[RecordedError, ...] = (),
+    ) -> None:
+        """
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: attribute name
+        :type attribute_name: str
+        :param value: attribute value, None for an error event
+        :type value: Any
+        :param quality: attribute quality, None if unknown
+        :type quality: tango.AttrQuality, optional
+        :param source_time: attribute timestamp, in seconds since epoch
+        :type source_time: float
+        :param reception_time: event reception time, in seconds since epoch
+        :type reception_time: float
+        :param errors: errors of an error event
+        :type errors: tuple[RecordedError, ...]
+        """
+        self.device_name: str = device_name
+        self.attribute_name: str = attribute_name
+        self.source_time: float = source_time
+        self.reception_time: float = reception_time
+        self.device: RecordedDevice = RecordedDevice(device_name)
+        self.attr_name: str = f"{device_name}/{attribute_name}"
+        self.attr_value: Optional[RecordedAttributeValue] = (
+            None
+            if errors
+            else RecordedAttributeValue(
+                attribute_name, value, quality, source_time
+            )
+        )
+        self.err: bool = bool(errors)
+        self.errors: tuple[RecordedError, ...] = errors
+        self.event: str = "change"
+        self.reception_date: tango.TimeVal = tango.TimeVal.fromtimestamp(
+            reception_time
+        )
+
+    @property
+    def value(self) -> Any:
+        """Returns the attribute value, None for an error event.
+
+        :return: attribute value
+        :rtype: Any
+        """
+        return self.attr_value.value if self.attr_value else None
+
+    def replayed_at(self, reception_time: float) -> RecordedEvent:
+        """Returns a copy of the event received at the given time. The
+        delay between the attribute timestamp and the reception of the
+        event is kept.
+
+        :param reception_time: reception time, in seconds since epoch
+        :type reception_time: float
+        :return: replayed event
+        :rtype: RecordedEvent
+        """
+        transport_delay = max(0.0, self.reception_time - self.source_time)
+        return RecordedEvent(
+            self.device_name,
+            self.attribute_name,
+            self.value,
+            self.attr_value.quality if self.attr_value else None,
+            reception_time - transport_delay,
+            reception_time,
+            self.errors,
+        )
+
+
+class EventRecorder:
+    """
+    Appends the received change events to a binary event log. The device
+    and attribute names are written once, the events referring to them by
+    id, so that a recorded event usually takes a few tens of bytes.
+
+    The recorder is installed on the event callbacks with wrap. The event
+    manager does it for all its subscriptions when it is given a recorder.
+    With an EventReceiver, wrap the handlers of its attribute dictionary.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: path of the event log. The events are appended to it
+            if it already exists, after its last complete record: a record
+            truncated by an interrupted recording is discarded.
+        :type path: str
+        """
+        self._path = path
+        self._names: dict[str, int] = {}
+        if os.path.exists(path) and os.path.getsize(path):
+            with EventLogReader(path) as reader:
+                for _ in reader:
+                    pass
+                self._names = {
+                    name: name_id for name_id, name in reader.names.items()
+                }
+                end_offset = reader.end_offset
+            if end_offset < os.path.getsize(path):
+                os.truncate(path, end_offset)
+        self._file = open(path, "ab")  # pylint: disable=consider-using-with
+        if not self._file.tell():
+            self._file.write(LOG_HEADER)
+        self._event_count: int = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> EventRecorder:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def path(self) -> str:
+        """Returns the path of the event log.
+
+        :return: path
+        :rtype: str
+        """
+        return self._path
+
+    @property
+    def event_count(self) -> int:
+        """Returns the number of events recorded by this recorder.
+
+        :return: number of events
+        :rtype: int
+        """
+        return self._event_count
+
+    def record(self, event: tango.EventData) -> None:
+        """Appends the event to the log.
+
+        :param event: received event
+        :type event: tango.EventData
+        """
+        device_name, _, attribute_name = event.attr_name.rpartition("/")
+        if device_name.startswith("tango://"):
+            device_name = device_name.split("/", 3)[-1]
+        if event.err:
+            value_type, data = _encode_value(
+                [[error.reason, error.desc] for error in event.errors]
+            )
+            quality = UNKNOWN_QUALITY
+            source_time = 0.0
+        else:
+            attr_value = event.attr_value
+            value_type, data = _encode_value(attr_value.value)
+            quality = getattr(attr_value, "quality", None)
+            quality = UNKNOWN_QUALITY if quality is None else int(quality)
+            source_time = _to_seconds(getattr(attr_value, "time", None))
+        reception_time = _to_seconds(getattr(event, "reception_date", None))
+        with self._lock:
+            self._file.write(
+                _EVENT_STRUCT.pack(
+                    EVENT_RECORD,
+                    source_time,
+                    reception_time or time.time(),
+                    self._get_name_id(device_name),
+                    self._get_name_id(attribute_name),
+                    quality,
+                    bool(event.err),
+                    value_type,
+                    len(data),
+                )
+            )
+            self._file.write(data)
+            self._event_count += 1
+
+    def wrap(self, callback: Callable) -> Callable:
+        """Returns a callback which records every event before providing it
+        to the given callback.
+
+        :param callback: event callback
+        :type callback: Callable
+        :return: recording event callback
+        :rtype: Callable
+        """
+
+        def recording_callback(event: tango.EventData) -> None:
+            try:
+                self.record(event)
+            except Exception as exception:
+                LOGGER.error(
+                    "Error occurred while recording event: %s", exception
+                )
+            callback(event)
+
+        return recording_callback
+
+    def flush(self) -> None:
+        """Writes the buffered events to the log."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Writes the buffered events and closes the log."""
+        with self._lock:
+            self._file.close()
+
+    def _get_name_id(self, name: str) -> int:
+        """Returns the id of the name, writing its name record on first
+        use. The lock is held."""
+        name_id = self._names.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names[name] = name_id
+            data = name.encode()
+            self._file.write(
+                _NAME_STRUCT.pack(NAME_RECORD, name_id, len(data))
+            )
+            self._file.write(data)
+        return name_id
+
+
+class EventLogReader:
+    """
+    Reads the events of an event log, which is memory mapped so that large
+    logs are read without being loaded in memory. A record truncated by an
+    interrupted recording ends the log.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: path of the event log
+        :type path: str
+        :raises ValueError: if the file is not an event log
+        """
+        # pylint: disable=consider-using-with
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not an event log") from None
+        if self._map[: len(LOG_HEADER)] != LOG_HEADER:
+            self.close()
+            raise ValueError(f"{path} is not an event log")
+        self.names: dict[int, str] = {}
+        # Offset of the end of the last complete record read.
+        self.end_offset: int = len(LOG_HEADER)
+
+    def __enter__(self) -> EventLogReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[RecordedEvent]:
+        buffer = self._map
+        size = len(buffer)
+        offset = len(LOG_HEADER)
+        names = self.names
+        while offset < size:
+            record_type = buffer[offset]
+            if record_type == NAME_RECORD:
+                if offset + _NAME_STRUCT.size > size:
+                    return
+                _, name_id, length = _NAME_STRUCT.unpack_from(buffer, offset)
+                start = offset + _NAME_STRUCT.size
+                offset = start + length
+                if offset > size:
+                    return
+                names[name_id] = buffer[start:offset].decode()
+                self.end_offset = offset
+                continue
+            if record_type != EVENT_RECORD or (
+                offset + _EVENT_STRUCT.size > size
+            ):
+                return
+            (
+                _,
+                source_time,
+                reception_time,
+                device_id,
+                attribute_id,
+                quality,
+                err,
+                value_type,
+                length,
+            ) = _EVENT_STRUCT.unpack_from(buffer, offset)
+            start = offset + _EVENT_STRUCT.size
+            offset = start + length
+            if offset > size:
+                return
+            value = _decode_value(value_type, buffer[start:offset])
+            self.end_offset = offset
+            yield RecordedEvent(
+                names[device_id],
+                names[attribute_id],
+                None if err else value,
+                (
+                    None
+                    if quality == UNKNOWN_QUALITY
+                    else tango.AttrQuality(quality)
+                ),
+                source_time,
+                reception_time,
+                (
+                    tuple(RecordedError(*error) for error in value)
+                    if err
+                    else ()
+                ),
+            )
+
+    def close(self) -> None:
+        """Unmaps and closes the log."""
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+
+def component_manager_callbacks(component_manager) -> dict[str, Callable]:
+    """Returns the callbacks through which the events of every attribute
+    are provided to a component manager, the way the event manager and the
+    event receiver do: the leaf node component managers queue the events
+    of their device, the other component managers update the device info of
+    the event's device.
+
+    :param component_manager: a TmcComponentManager or
+        TmcLeafNodeComponentManager
+    :return: event callback per lower case attribute name
+    :rtype: dict[str, Callable]
+    """
+    leaf_node_methods = {
+        "healthstate": "update_health_state_event",
+        "state": "update_state_event",
+        "obsstate": "update_obs_state_event",
+        "longrunningcommandresult": "update_command_result_event",
+        "adminmode": "update_admin_mode_event",
+        "dishvccconfig": "update_dishvcc_config_event",
+        "sourcedishvccconfig": "update_source_dishvcc_config_event",
+    }
+    if hasattr(component_manager, "update_health_state_event"):
+        return {
+            attribute_name: getattr(component_manager, method_name)
+            for attribute_name, method_name in leaf_node_methods.items()
+            if hasattr(component_manager, method_name)
+        }
+
+    def device_info_callback(method_name: str) -> Callable:
+        update_method = getattr(component_manager, method_name)
+
+        def callback(event: RecordedEvent) -> None:
+            if event.err:
+                component_manager.update_event_failure(event.device.dev_name())
+            else:
+                update_method(event.device.dev_name(), event.attr_value.value)
+
+        return callback
+
+    callbacks = {
+        "healthstate": device_info_callback("update_device_health_state"),
+        "state": device_info_callback("update_device_state"),
+    }
+    if hasattr(component_manager, "update_device_obs_state"):
+        callbacks["obsstate"] = device_info_callback("update_device_obs_state")
+    return callbacks
+
+
+class EventReplayer:
+    """
+    Replays an event log into event callbacks, at the recorded pace, N
+    times faster, or as fast as possible.
+
+    The replayed events are received at the time they are replayed, their
+    attribute timestamp preceding it by the recorded transport delay, so
+    that the latency instrumentation of the component managers measures the
+    replay. The replayer reports the throughput, how late the events were
+    replayed compared to the recorded pace, and the time spent in the
+    callbacks.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        speed: float = 1.0,
+        logger: logging.Logger = LOGGER,
+    ) -> None:
+        """
+        :param path: path of the event log
+        :type path: str
+        :param speed: replay speed relative to the recorded pace, 0 to
+            replay the events as fast as possible, defaults to 1.
+        :type speed: float
+        :param logger: logger
+        :type logger: logging.Logger
+        """
+        self._path = path
+        self._speed = speed
+        self._logger = logger
+
+    def replay(self, callbacks: Mapping[str, Callable]) -> dict:
+        """Replays the events into the callbacks of their attributes. The
+        events of the attributes without callback are skipped.
+
+        :param callbacks: event callback per lower case attribute name
+        :type callbacks: Mapping[str, Callable]
+        :return: number of replayed, skipped and failed events, duration,
+            throughput, and lateness and callback time statistics in
+            microseconds
+        :rtype: dict
+        """
+        lateness = LatencyHistogram()
+        callback_time = LatencyHistogram()
+        replayed = skipped = failed = 0
+        first_reception_time: Optional[float] = None
+        start_time = time.perf_counter()
+        start_epoch = time.time()
+        with EventLogReader(self._path) as reader:
+            for recorded_event in reader:
+                callback = callbacks.get(recorded_event.attribute_name.lower())
+                if callback is None:
+                    skipped += 1
+                    continue
+                if first_reception_time is None:
+                    first_reception_time = recorded_event.reception_time
+                scheduled_time = start_time
+                if self._speed > 0:
+                    scheduled_time += (
+                        recorded_event.reception_time - first_reception_time
+                    ) / self._speed
+                    delay = scheduled_time - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                replay_time = time.perf_counter()
+                lateness.record((replay_time - scheduled_time) * 1e6)
+                event = recorded_event.replayed_at(
+                    start_epoch + replay_time - start_time
+                )
+                try:
+                    callback(event)
+                except Exception as exception:
+                    failed += 1
+                    self._logger.error(
+                        "Error occurred while replaying event of attribute "
+                        "%s: %s",
+                        event.attr_name,
+                        exception,
+                    )
+                callback_time.record((time.perf_counter() - replay_time) * 1e6)
+                replayed += 1
+        duration = time.perf_counter() - start_time
+        return {
+            "speed": self._speed,
+            "replayed_events": replayed,
+            "skipped_events": skipped,
+            "failed_events": failed,
+            "duration_s": duration,
+            "events_per_second": replayed / duration if duration else 0.0,
+            "lateness_us": lateness.to_dict(),
+            "callback_time_us": callback_time.to_dict(),
+        }
+
+    def replay_into_component_manager(
+        self, component_manager, drain_timeout: float = 60.0
+    ) -> dict:
+        """Replays the events into a component manager, and waits until its
+        event queues are drained. The event processing threads of a leaf
+        node component manager must have been started.
+
+        :param component_manager: a TmcComponentManager or
+            TmcLeafNodeComponentManager
+        :param drain_timeout: maximum time in seconds to wait for the event
+            queues to be drained, defaults to 60 seconds.
+        :type drain_timeout: float
+        :return: the replay statistics, with the time taken to process
+            all the events and the resulting throughput
+        :rtype: dict
+        """
+        report = self.replay(component_manager_callbacks(component_manager))
+        start_time = time.perf_counter()
+        deadline = start_time + drain_timeout
+        event_queues = getattr(component_manager, "event_queues", {})
+        while any(not queue.empty() for queue in event_queues.values()):
+            if time.perf_counter() > deadline:
+                break
+            time.sleep(0.001)
+        processing_time = (
+            report["duration_s"] + time.perf_counter() - start_time
+        )
+        report["drained"] = all(
+            queue.empty() for queue in event_queues.values()
+        )
+        report["processing_time_s"] = processing_time
+        report["processed_events_per_second"] = (
+            report["replayed_events"] / processing_time
+            if processing_time
+            else 0.0
+        )
+        return report
@@ -0,0 +1,326 @@
+"""
+This module keeps histograms of the end-to-end latency of the change
+events, from their emission by the subordinate device to the completion of
+their processing.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+import tango
+
+# Latency stages recorded for every event.
+TRANSPORT_STAGE: str = "transport"
+QUEUE_WAIT_STAGE: str = "queue_wait"
+HANDLER_STAGE: str = "handler"
+END_TO_END_STAGE: str = "end_to_end"
+CALLBACK_STAGE: str = "callback"
+LATENCY_STAGES: tuple[str, ...] = (
+    TRANSPORT_STAGE,
+    QUEUE_WAIT_STAGE,
+    HANDLER_STAGE,
+    END_TO_END_STAGE,
+    CALLBACK_STAGE,
+)
+
+
+class LatencyHistogram:
+    """
+    HDR style histogram of latencies in microseconds. Every power of two
+    range is split into 2 ** significant_bits linear buckets, so that the
+    relative error of the reported percentiles is bounded by
+    2 ** -significant_bits whatever the magnitude of the latency, while
+    recording a sample is a constant time bucket increment.
+    """
+
+    def __init__(self, significant_bits: int = 5) -> None:
+        """
+        :param significant_bits: number of bits of the latency kept
+            exactly, defaults to 5, i.e. a relative error of about 3%.
+        :type significant_bits: int
+        """
+        self._significant_bits = significant_bits
+        self._sub_bucket_count = 1 << significant_bits
+        self._counts: dict[int, int] = {}
+        self._count: int = 0
+        self._total: int = 0
+        self._min: int = -1
+        self._max: int = -1
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, latency: int) -> None:
+        """Adds a latency sample. Negative latencies, which are caused by
+        clock offsets between hosts, are recorded as zero.
+
+        :param latency: latency in microseconds
+        :type latency: int
+        """
+        latency = max(0, int(latency))
+        index = self._bucket_index(latency)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self._count += 1
+            self._total += latency
+            if self._min < 0 or latency < self._min:
+                self._min = latency
+            if latency > self._max:
+                self._max = latency
+
+    def percentile(self, percentile: float) -> int:
+        """Returns the latency below which the given percentage of the
+        samples fall, as the upper bound of its bucket.
+
+        :param percentile: percentage, between 0 and 100
+        :type percentile: float
+        :return: latency in microseconds, -1 without samples
+        :rtype: int
+        """
+        with self._lock:
+            return self._percentile(percentile)
+
+    def to_dict(self) -> dict:
+        """Returns the latency statistics. All the values are -1 when no
+        sample has been recorded yet.
+
+        :return: number of samples, and minimum, mean, maximum, median,
+            90th, 99th and 99.9th percentile latency in microseconds
+        :rtype: dict
+        """
+        with self._lock:
+            if not self._count:
+                return {
+                    "count": 0,
+                    "min": -1,
+                    "mean": -1,
+                    "max": -1,
+                    "p50": -1,
+                    "p90": -1,
+                    "p99": -1,
+                    "p999": -1,
+                }
+            return {
+                "count": self._count,
+                "min": self._min,
+                "mean": round(self._total / self._count, 1),
+                "max": self._max,
+                "p50": self._percentile(50),
+                "p90": self._percentile(90),
+                "p99": self._percentile(99),
+                "p999": self._percentile(99.9),
+            }
+
+    def reset(self) -> None:
+        """Discards all the samples."""
+        with self._lock:
+            self._counts.clear()
+            self._count = 0
+            self._total = 0
+            self._min = -1
+            self._max = -1
+
+    def _bucket_index(self, latency: int) -> int:
+        """Returns the index of the bucket of the latency."""
+        if latency < self._sub_bucket_count:
+            return latency
+        shift = latency.bit_length() - self._significant_bits - 1
+        return (shift + 1) * self._sub_bucket_count + (
+            (latency >> shift) - self._sub_bucket_count
+        )
+
+    def _bucket_upper_bound(self, index: int) -> int:
+        """Returns the highest latency of the bucket."""
+        if index < self._sub_bucket_count:
+            return index
+        shift = index // self._sub_bucket_count - 1
+        mantissa = index % self._sub_bucket_count + self._sub_bucket_count
+        return ((mantissa + 1) << shift) - 1
+
+    def _percentile(self, percentile: float) -> int:
+        """Computes the percentile, the lock being held."""
+        if not self._count:
+            return -1
+        threshold = max(1, round(self._count * percentile / 100.0))
+        cumulative = 0
+        for index in sorted(self._counts):
+            cumulative += self._counts[index]
+            if cumulative >= threshold:
+                return min(self._bucket_upper_bound(index), self._max)
+        return self._max
+
+
+class EventLatencyTracker:
+    """
+    Latency histograms per device attribute of the change events, for
+    each stage of their delivery:
+
+    * transport: from the attribute timestamp set by the subordinate device
+      to the reception of the event,
+    * queue_wait: from the reception of the event to the start of its
+      processing,
+    * handler: processing time of the event,
+    * end_to_end: from the attribute timestamp to the end of the
+      processing,
+    * callback: duration of the event callback, when it only queues the
+      event for a processing thread which records the other stages.
+    """
+
+    def __init__(self, significant_bits: int = 5) -> None:
+        """
+        :param significant_bits: number of bits of the latency kept exactly
+            by the histograms.
+        :type significant_bits: int
+        """
+        self._significant_bits = significant_bits
+        self._histograms: dict[str, dict[str, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        device_name: str,
+        attribute_name: str,
+        source_time: Optional[float],
+        received_time: Optional[float],
+        started_time: float,
+        completed_time: float,
+    ) -> None:
+        """Records the latencies of an event. The stages starting from an
+        unknown time are not recorded.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: attribute name
+        :type attribute_name: str
+        :param source_time: attribute timestamp, in seconds since epoch
+        :type source_time: float, optional
+        :param received_time: event reception time, in seconds since epoch
+        :type received_time: float, optional
+        :param started_time: processing start time, in seconds since epoch
+        :type started_time: float
+        :param completed_time: processing completion time, in seconds since
+            epoch
+        :type completed_time: float
+        """
+        histograms = self._get_histograms(f"{device_name}/{attribute_name}")
+        histograms[HANDLER_STAGE].record((completed_time - started_time) * 1e6)
+        if received_time is not None:
+            histograms[QUEUE_WAIT_STAGE].record(
+                (started_time - received_time) * 1e6
+            )
+        if source_time is not None:
+            histograms[END_TO_END_STAGE].record(
+                (completed_time - source_time) * 1e6
+            )
+            if received_time is not None:
+                histograms[TRANSPORT_STAGE].record(
+                    (received_time - source_time) * 1e6
+                )
+
+    def record_event(
+        self,
+        event: tango.EventData,
+        started_time: float,
+        completed_time: Optional[float] = None,
+    ) -> None:
+        """Records the latencies of a processed event, using its attribute
+        timestamp and reception date.
+
+        :param event: processed event
+        :type event: tango.EventData
+        :param started_time: processing start time, in seconds since epoch
+        :type started_time: float
+        :param completed_time: processing completion time, in seconds since
+            epoch, defaults to now
+        :type completed_time: float, optional
+        """
+        if completed_time is None:
+            completed_time = time.time()
+        device_name, _, attribute_name = event.attr_name.rpartition("/")
+        if device_name.startswith("tango://"):
+            device_name = device_name.split("/", 3)[-1]
+        self.record(
+            device_name,
+            attribute_name,
+            _to_seconds(getattr(event.attr_value, "time", None)),
+            _to_seconds(getattr(event, "reception_date", None)),
+            started_time,
+            completed_time,
+        )
+
+    def record_callback(
+        self,
+        event: tango.EventData,
+        started_time: float,
+        completed_time: Optional[float] = None,
+    ) -> None:
+        """Records the duration of the callback of an event which is queued
+        for processing. The other stages are recorded by record_event once
+        the event is processed.
+
+        :param event: queued event
+        :type event: tango.EventData
+        :param started_time: callback start time, in seconds since epoch
+        :type started_time: float
+        :param completed_time: callback completion time, in seconds since
+            epoch, defaults to now
+        :type completed_time: float, optional
+        """
+        if completed_time is None:
+            completed_time = time.time()
+        device_name, _, attribute_name = event.attr_name.rpartition("/")
+        if device_name.startswith("tango://"):
+            device_name = device_name.split("/", 3)[-1]
+        histograms = self._get_histograms(f"{device_name}/{attribute_name}")
+        histograms[CALLBACK_STAGE].record(
+            (completed_time - started_time) * 1e6
+        )
+
+    def to_dict(self) -> dict:
+        """Returns the latency statistics per attribute and stage.
+
+        :return: statistics per stage per "device/attribute"
+        :rtype: dict
+        """
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {
+            attribute: {
+                stage: histogram.to_dict()
+                for stage, histogram in stages.items()
+            }
+            for attribute, stages in histograms.items()
+        }
+
+    def reset(self) -> None:
+        """Discards all the histograms."""
+        with self._lock:
+            self._histograms.clear()
+
+    def _get_histograms(self, attribute: str) -> dict[str, LatencyHistogram]:
+        """Returns the histograms of the attribute, created on first use."""
+        histograms = self._histograms.get(attribute)
+        if histograms is None:
+            with self._lock:
+                histograms = self._histograms.setdefault(
+                    attribute,
+                    {
+                        stage: LatencyHistogram(self._significant_bits)
+                        for stage in LATENCY_STAGES
+                    },
+                )
+        return histograms
+
+
+def _to_seconds(timestamp: Optional[tango.TimeVal]) -> Optional[float]:
+    """Converts a tango.TimeVal to seconds since epoch."""
+    if timestamp is None:
+        return None
+    try:
+        return timestamp.totime()
+    except AttributeError:
+        return None
@@ -0,0 +1,88 @@
+"""
+This module keeps rolling statistics of the round-trip latency measured
+by the liveliness probe for the monitored devices.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from typing import Iterable
+
+
+class LatencyStatistics:
+    """
+    Rolling min, mean and p99 of the last latency samples of a device.
+    Latencies are in microseconds, as for the Tango ping.
+    """
+
+    def __init__(self, window: int = 100) -> None:
+        """
+        :param window: number of latest samples the statistics are
+            computed over
+        :type window: int
+        """
+        self._samples: deque[int] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add_sample(self, latency: int) -> None:
+        """Adds a latency sample.
+
+        :param latency: latency in microseconds
+        :type latency: int
+        """
+        with self._lock:
+            self._samples.append(latency)
+
+    def reset(self) -> None:
+        """Discards all the samples."""
+        with self._lock:
+            self._samples.clear()
+
+    def to_dict(self) -> dict:
+        """Returns the latency statistics. All the values are -1 when no
+        sample has been recorded yet.
+
+        :return: minimum, mean, 99th percentile and last latency in
+            microseconds, and number of samples
+        :rtype: dict
+        """
+        with self._lock:
+            samples = list(self._samples)
+        if not samples:
+            return {"min": -1, "mean": -1, "p99": -1, "last": -1, "count": 0}
+        last = samples[-1]
+        samples.sort()
+        rank = max(0, math.ceil(0.99 * len(samples)) - 1)
+        return {
+            "min": samples[0],
+            "mean": round(sum(samples) / len(samples), 1),
+            "p99": samples[rank],
+            "last": last,
+            "count": len(samples),
+        }
+
+
+def summarise_latency(device_infos: Iterable) -> dict:
+    """Returns the latency summary of the given devices, with the device
+    having the highest 99th percentile latency reported as the slowest.
+
+    :param device_infos: DeviceInfo instances of the monitored devices
+    :type device_infos: Iterable
+    :return: latency statistics per device and slowest device
+    :rtype: dict
+    """
+    devices = {}
+    slowest_device = None
+    slowest_p99 = -1
+    for dev_info in device_infos:
+        statistics = dev_info.ping_statistics.to_dict()
+        devices[dev_info.dev_name] = statistics
+        if statistics["p99"] > slowest_p99:
+            slowest_device = dev_info.dev_name
+            slowest_p99 = statistics["p99"]
+    return {"devices": devices, "slowest_device": slowest_device}
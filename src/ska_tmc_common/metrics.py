@@ -0,0 +1,493 @@
+"""
+This module provides a registry of counters, gauges and histograms
+describing the operation of a TMC node, which is exposed in the Prometheus
+text format and in JSON by the metrics attributes of the TMCBaseDevice.
+
+The counters, the gauges and the histograms are updated on the hot paths of
+the event callbacks, the liveliness probe and the command trackers. Their
+updates do not take a lock: every thread updates its own cell of the metric,
+and the cells are summed when the metrics are collected.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import threading
+from typing import Callable, Optional
+
+# Upper bounds in seconds of the default histogram buckets.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+COUNTER: str = "counter"
+GAUGE: str = "gauge"
+HISTOGRAM: str = "histogram"
+
+
+class _ThreadCells:
+    """
+    Per thread cells of a metric. A thread only ever writes its own cell,
+    which it finds in a thread local, so that updating the metric does not
+    take a lock. The cells of the threads which have terminated are folded
+    into a retired cell when a thread registers its cell and when the metric
+    is collected, so that short lived threads do not accumulate cells.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._cells: list[tuple[threading.Thread, list[float]]] = []
+        self._retired: list[float] = [0] * size
+        self._lock = threading.Lock()
+
+    def cell(self) -> list[float]:
+        """Returns the cell of the calling thread, which is registered on
+        the first update of the metric by the thread.
+
+        :return: cell of the calling thread
+        :rtype: list[float]
+        """
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell: list[float] = [0] * self._size
+            with self._lock:
+                self._retire_dead_cells()
+                self._cells.append((threading.current_thread(), cell))
+            self._local.cell = cell
+            return cell
+
+    def totals(self) -> list[float]:
+        """Returns the sum of the cells of all the threads.
+
+        :return: sum of the cells, element by element
+        :rtype: list[float]
+        """
+        with self._lock:
+            self._retire_dead_cells()
+            totals = list(self._retired)
+            for _, cell in self._cells:
+                for index, value in enumerate(cell):
+                    totals[index] += value
+            return totals
+
+    def _retire_dead_cells(self) -> None:
+        """Folds the cells of the terminated threads into the retired cell.
+        The lock is held by the caller."""
+        live_cells = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                live_cells.append((thread, cell))
+            else:
+                for index, value in enumerate(cell):
+                    self._retired[index] += value
+        self._cells = live_cells
+
+
+class Counter:
+    """A monotonically increasing value, e.g. the number of errors."""
+
+    kind: str = COUNTER
+
+    def __init__(self) -> None:
+        self._cells = _ThreadCells(1)
+
+    def inc(self, amount: float = 1) -> None:
+        """Increments the counter.
+
+        :param amount: increment, defaults to 1
+        :type amount: float
+        """
+        self._cells.cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        """Returns the value of the counter.
+
+        :return: counter value
+        :rtype: float
+        """
+        return self._cells.totals()[0]
+
+    def sample(self) -> dict:
+        """Returns the sample of the counter.
+
+        :return: value of the counter
+        :rtype: dict
+        """
+        return {"value": self.value}
+
+
+class Gauge:
+    """
+    A value which goes up and down, e.g. the number of commands in flight.
+    A gauge either accumulates its increments, or reports the value of a
+    function evaluated when it is collected, e.g. the depth of a queue.
+    """
+
+    kind: str = GAUGE
+
+    def __init__(self, function: Optional[Callable[[], float]] = None):
+        """
+        :param function: function returning the value of the gauge,
+            defaults to None
+        :type function: Callable, optional
+        """
+        self._cells = _ThreadCells(1)
+        self._offset: float = 0
+        self._function = function
+
+    def inc(self, amount: float = 1) -> None:
+        """Increments the gauge.
+
+        :param amount: increment, defaults to 1
+        :type amount: float
+        """
+        self._cells.cell()[0] += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """Decrements the gauge.
+
+        :param amount: decrement, defaults to 1
+        :type amount: float
+        """
+        self._cells.cell()[0] -= amount
+
+    def set(self, value: float) -> None:
+        """Sets the value of the gauge.
+
+        :param value: gauge value
+        :type value: float
+        """
+        self._offset = value - self._cells.totals()[0]
+
+    def set_function(self, function: Optional[Callable[[], float]]) -> None:
+        """Sets the function returning the value of the gauge, or removes
+        it when None.
+
+        :param function: function returning the value of the gauge
+        :type function: Callable, optional
+        """
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        """Returns the value of the gauge. A failing function reports NaN.
+
+        :return: gauge value
+        :rtype: float
+        """
+        if self._function is not None:
+            try:
+                return self._function()
+            except Exception:
+                return math.nan
+        return self._offset + self._cells.totals()[0]
+
+    def sample(self) -> dict:
+        """Returns the sample of the gauge.
+
+        :return: value of the gauge
+        :rtype: dict
+        """
+        return {"value": self.value}
+
+
+class Histogram:
+    """
+    Distribution of observed values, e.g. command latencies in seconds,
+    counted in buckets with fixed upper bounds.
+    """
+
+    kind: str = HISTOGRAM
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """
+        :param buckets: increasing upper bounds of the buckets, the +Inf
+            bucket is added, defaults to DEFAULT_BUCKETS
+        :type buckets: tuple[float, ...]
+        :raises ValueError: if the bounds are not increasing
+        """
+        if not buckets or any(
+            lower >= upper for lower, upper in zip(buckets, buckets[1:])
+        ):
+            raise ValueError(f"Invalid histogram buckets: {buckets}")
+        self._buckets = tuple(float(bound) for bound in buckets)
+        # One count per bucket, the +Inf bucket, then the sum.
+        self._cells = _ThreadCells(len(self._buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        """Counts a value in its bucket.
+
+        :param value: observed value
+        :type value: float
+        """
+        cell = self._cells.cell()
+        cell[bisect.bisect_left(self._buckets, value)] += 1
+        cell[-1] += value
+
+    def sample(self) -> dict:
+        """Returns the cumulative bucket counts, the sum and the count of
+        the observed values.
+
+        :return: count, sum and cumulative count per upper bound
+        :rtype: dict
+        """
+        totals = self._cells.totals()
+        cumulative_counts = {}
+        count = 0
+        for bound, bucket_count in zip(
+            self._buckets + (math.inf,), totals[:-1]
+        ):
+            count += bucket_count
+            cumulative_counts[_format_value(bound)] = count
+        return {
+            "count": count,
+            "sum": totals[-1],
+            "buckets": cumulative_counts,
+        }
+
+
+class _MetricFamily:
+    """Metrics of the same name, one per set of label values."""
+
+    def __init__(self, name: str, kind: str, documentation: str) -> None:
+        self.name = name
+        self.kind = kind
+        self.documentation = documentation
+        self.metrics: dict[tuple, Counter | Gauge | Histogram] = {}
+
+
+class MetricsRegistry:
+    """
+    Registry of the metrics of a TMC node. A metric is created on its first
+    request and returned by the later requests of the same name and labels,
+    so that the modules feeding the registry do not need to coordinate.
+    Only the creation of a metric takes the registry lock.
+    """
+
+    def __init__(self) -> None:
+        self._families: dict[str, _MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self,
+        name: str,
+        documentation: str = "",
+        labels: Optional[dict[str, str]] = None,
+    ) -> Counter:
+        """Returns the counter of the given name and labels.
+
+        :param name: metric name
+        :type name: str
+        :param documentation: description of the metric
+        :type documentation: str
+        :param labels: label values, defaults to None
+        :type labels: dict[str, str], optional
+        :return: counter
+        :rtype: Counter
+        """
+        return self._get_metric(COUNTER, name, documentation, labels, Counter)
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str = "",
+        labels: Optional[dict[str, str]] = None,
+        function: Optional[Callable[[], float]] = None,
+    ) -> Gauge:
+        """Returns the gauge of the given name and labels. The function, if
+        provided, replaces the function of an existing gauge.
+
+        :param name: metric name
+        :type name: str
+        :param documentation: description of the metric
+        :type documentation: str
+        :param labels: label values, defaults to None
+        :type labels: dict[str, str], optional
+        :param function: function returning the value of the gauge,
+            defaults to None
+        :type function: Callable, optional
+        :return: gauge
+        :rtype: Gauge
+        """
+        gauge = self._get_metric(GAUGE, name, documentation, labels, Gauge)
+        if function is not None:
+            gauge.set_function(function)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str = "",
+        labels: Optional[dict[str, str]] = None,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Returns the histogram of the given name and labels.
+
+        :param name: metric name
+        :type name: str
+        :param documentation: description of the metric
+        :type documentation: str
+        :param labels: label values, defaults to None
+        :type labels: dict[str, str], optional
+        :param buckets: upper bounds of the buckets of a new histogram,
+            defaults to DEFAULT_BUCKETS
+        :type buckets: tuple[float, ...]
+        :return: histogram
+        :rtype: Histogram
+        """
+        return self._get_metric(
+            HISTOGRAM,
+            name,
+            documentation,
+            labels,
+            lambda: Histogram(buckets),
+        )
+
+    def _get_metric(
+        self,
+        kind: str,
+        name: str,
+        documentation: str,
+        labels: Optional[dict[str, str]],
+        factory: Callable,
+    ):
+        """Returns the metric of the given name and labels, which is created
+        under the lock if it does not exist yet.
+
+        :raises ValueError: if the name is already used by a metric of
+            another kind
+        """
+        key = tuple(sorted((labels or {}).items()))
+        family = self._families.get(name)
+        if family is not None and family.kind == kind:
+            metric = family.metrics.get(key)
+            if metric is not None:
+                return metric
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = _MetricFamily(name, kind, documentation)
+                self._families[name] = family
+            elif family.kind != kind:
+                raise ValueError(
+                    f"Metric {name} is a {family.kind}, not a {kind}"
+                )
+            metric = family.metrics.get(key)
+            if metric is None:
+                metric = factory()
+                family.metrics[key] = metric
+            return metric
+
+    def to_dict(self) -> dict:
+        """Returns the samples of all the metrics.
+
+        :return: type, description and samples with their labels per
+            metric name
+        :rtype: dict
+        """
+        with self._lock:
+            families = [
+                (family, list(family.metrics.items()))
+                for family in self._families.values()
+            ]
+        metrics = {}
+        for family, family_metrics in families:
+            metrics[family.name] = {
+                "type": family.kind,
+                "help": family.documentation,
+                "samples": [
+                    {"labels": dict(key), **metric.sample()}
+                    for key, metric in family_metrics
+                ],
+            }
+        return metrics
+
+    def to_json(self) -> str:
+        """Returns the samples of all the metrics in JSON.
+
+        :return: JSON encoded samples of the metrics
+        :rtype: str
+        """
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self) -> str:
+        """Returns all the metrics in the Prometheus text exposition format.
+
+        :return: metrics in the Prometheus text format
+        :rtype: str
+        """
+        lines = []
+        for name, family in self.to_dict().items():
+            lines.append(f"# HELP {name} {_escape_help(family['help'])}")
+            lines.append(f"# TYPE {name} {family['type']}")
+            for sample in family["samples"]:
+                labels = sample["labels"]
+                if family["type"] != HISTOGRAM:
+                    lines.append(
+                        f"{name}{_format_labels(labels)} "
+                        f"{_format_value(sample['value'])}"
+                    )
+                    continue
+                for bound, count in sample["buckets"].items():
+                    bucket_labels = _format_labels({**labels, "le": bound})
+                    lines.append(f"{name}_bucket{bucket_labels} {count}")
+                lines.append(
+                    f"{name}_sum{_format_labels(labels)} "
+                    f"{_format_value(sample['sum'])}"
+                )
+                lines.append(
+                    f"{name}_count{_format_labels(labels)} {sample['count']}"
+                )
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _format_value(value: float) -> str:
+    """Formats a sample value as Prometheus does, integers without a
+    decimal point."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    """Escapes the description of a metric."""
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label_value(value: str) -> str:
+    """Escapes the value of a label."""
+    return _escape_help(value).replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    """Formats the labels of a sample."""
+    if not labels:
+        return ""
+    formatted_labels = ",".join(
+        f'{name}="{_escape_label_value(str(value))}"'
+        for name, value in labels.items()
+    )
+    return "{" + formatted_labels + "}"
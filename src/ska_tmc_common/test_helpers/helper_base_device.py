@@ -3,9 +3,8 @@ A common module for different helper devices(mock devices)"
 """
 
 import json
-import threading
 import time
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 
 import tango
 from ska_tango_base.base.base_device import SKABaseDevice
@@ -21,15 +20,23 @@ from ska_tmc_common.test_helpers.constants import SETADMINMODE
 from ska_tmc_common.test_helpers.empty_component_manager import (
     EmptyComponentManager,
 )
+from ska_tmc_common.test_helpers.latency_profile import LatencyInjector
+from ska_tmc_common.test_helpers.simulation_scheduler import (
+    SimulationScheduler,
+)
 
 
 # pylint: disable=attribute-defined-outside-init,invalid-name
 class HelperBaseDevice(SKABaseDevice):
     """A common base device for helper devices."""
 
+    _latency_injector: Optional[LatencyInjector] = None
+
     def init_device(self) -> None:
         super().init_device()
         self._delay: int = 2
+        self._scheduler = SimulationScheduler.get_instance()
+        self._latency_injector = LatencyInjector(self._scheduler, self.logger)
         self._health_state = HealthState.OK
         self.dev_name = self.get_name()
         self._isSubsystemAvailable = True
@@ -66,6 +73,7 @@ class HelperBaseDevice(SKABaseDevice):
 
     delay = attribute(dtype=int, access=AttrWriteType.READ)
     defective = attribute(dtype=str, access=AttrWriteType.READ)
+    latencyProfile = attribute(dtype=str, access=AttrWriteType.READ)
     isSubsystemAvailable = attribute(dtype=bool, access=AttrWriteType.READ)
     isAdminModeEnabled = attribute(dtype=bool, access=AttrWriteType.READ_WRITE)
     adminMode = attribute(
@@ -104,6 +112,14 @@ class HelperBaseDevice(SKABaseDevice):
         """
         return json.dumps(self.defective_params)
 
+    def read_latencyProfile(self) -> str:
+        """
+        Returns the latency profile set with SetLatencyProfile
+        :return: JSON latency profile, {} when none is set
+        :rtype: str
+        """
+        return self._latency_injector.to_json()
+
     def read_isSubsystemAvailable(self) -> bool:
         """
         Returns availability status for the leaf nodes devices
@@ -161,6 +177,46 @@ class HelperBaseDevice(SKABaseDevice):
         self.logger.info("Setting defective params to %s", input_dict)
         self.defective_params = input_dict
 
+    @command(
+        dtype_in=str,
+        doc_in="Set latency profile",
+    )
+    def SetLatencyProfile(self, profile_json: str) -> None:
+        """
+        Set the latency distributions of the commands and change events,
+        and the drop probability of the change events. See
+        ska_tmc_common.test_helpers.latency_profile for the format.
+        :param profile_json: JSON latency profile, {} to remove it
+        :type profile_json: str
+        """
+        self._latency_injector.set_profile(profile_json)
+        self.logger.info(
+            "Latency profile set to %s", self._latency_injector.to_json()
+        )
+
+    def push_change_event(
+        self, attr_name: str, *args, command_name: Optional[str] = None
+    ) -> None:
+        """
+        Push a change event, delayed or dropped according to the latency
+        profile
+        :param attr_name: name of the attribute
+        :type attr_name: str
+        :param command_name: name of the command whose result the
+            longRunningCommandResult event carries, so that the command
+            latency of the profile delays it
+        :type command_name: str, optional
+        """
+        if self._latency_injector is None:
+            super().push_change_event(attr_name, *args)
+        else:
+            self._latency_injector.push_change_event(
+                super().push_change_event,
+                attr_name,
+                *args,
+                command_name=command_name,
+            )
+
     def induce_fault(
         self, command_name: str, command_id: str, is_dish: bool = False
     ) -> Tuple[List[ResultCode], List[str]]:
@@ -231,7 +287,7 @@ class HelperBaseDevice(SKABaseDevice):
             return [result], [fault_message]
 
         if fault_type == FaultType.LONG_RUNNING_EXCEPTION:
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay,
                 function=self.push_command_result,
                 args=[result, command_name],
@@ -249,7 +305,7 @@ class HelperBaseDevice(SKABaseDevice):
             return [ResultCode.QUEUED], [command_id]
 
         if fault_type == FaultType.COMMAND_NOT_ALLOWED_AFTER_QUEUING:
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay,
                 function=self.push_command_result,
                 args=[
@@ -265,7 +321,7 @@ class HelperBaseDevice(SKABaseDevice):
             return [ResultCode.QUEUED], [command_id]
 
         if fault_type == FaultType.COMMAND_NOT_ALLOWED_EXCEPTION_AFTER_QUEUING:
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay,
                 function=self.push_command_result,
                 args=[
@@ -289,7 +345,7 @@ class HelperBaseDevice(SKABaseDevice):
             FaultType.GPM_URI_NOT_REACHABLE,
             FaultType.GPM_ERROR_REPORTED_BY_DISH,
         ]:
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay,
                 function=self.push_command_result,
                 args=[result, command_name],
@@ -300,6 +356,23 @@ class HelperBaseDevice(SKABaseDevice):
 
         return [ResultCode.OK], [command_id]
 
+    def _call_after(
+        self, delay: float, function: Callable, *args, **kwargs
+    ) -> None:
+        """Calls the function once the simulated transitions scheduled for
+        the given delay are over, or right away when there is no delay.
+
+        :param delay: delay in seconds, as returned by
+            _follow_state_duration
+        :type delay: float
+        :param function: function to call
+        :type function: Callable
+        """
+        if delay > 0:
+            self._scheduler.call_later(delay, function, *args, **kwargs)
+        else:
+            function(*args, **kwargs)
+
     def push_pointing_state_event(self, pointing_state: PointingState) -> None:
         """Push Pointing State Change Event"""
         with tango.EnsureOmniThread():
@@ -341,7 +414,11 @@ class HelperBaseDevice(SKABaseDevice):
             "Pushing longRunningCommandResult Event with data: %s",
             command_result,
         )
-        self.push_change_event("longRunningCommandResult", command_result)
+        self.push_change_event(
+            "longRunningCommandResult",
+            command_result,
+            command_name=command_name,
+        )
 
     @command(
         dtype_in="DevState",
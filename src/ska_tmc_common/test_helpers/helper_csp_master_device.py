@@ -5,7 +5,6 @@ This module defines a helper device that acts as csp master in our testing.
 # pylint: disable=attribute-defined-outside-init
 # pylint: disable=unused-argument
 import json
-import threading
 import time
 from typing import List, Tuple
 
@@ -329,14 +328,14 @@ class HelperCspMasterDevice(HelperBaseDevice):
         self._source_dish_vcc_config = argin
         self._dish_vcc_config = mid_cbf_initial_parameters_str
 
-        push_dish_vcc_config_thread = threading.Timer(
+        push_dish_vcc_config_thread = self._scheduler.timer(
             self._delay, self.push_dish_vcc_config_and_source_dish_vcc_config
         )
         push_dish_vcc_config_thread.start()
 
         # Provided additional 1 sec delay to push
         # command result after sys param event pushed
-        push_command_result_thread = threading.Timer(
+        push_command_result_thread = self._scheduler.timer(
             self._delay + 1,
             self.push_command_result,
             args=[
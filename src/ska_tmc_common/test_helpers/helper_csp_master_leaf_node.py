@@ -5,7 +5,6 @@ This module defines a helper device that acts as csp master in our testing.
 # pylint: disable=attribute-defined-outside-init
 # pylint: disable=unused-argument
 import json
-import threading
 import time
 from typing import List, Tuple
 
@@ -222,7 +221,7 @@ class HelperCspMasterLeafDevice(HelperBaseDevice):
         )
         self.push_change_event("dishVccConfig", self._dish_vcc_config)
 
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "LoadDishCfg"],
@@ -249,7 +248,7 @@ class HelperCspMasterLeafDevice(HelperBaseDevice):
         :return: ResultCode and message
         """
         self._dish_vcc_map_validation_result = int(result)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_change_event,
             args=["DishVccMapValidationResult", result],
@@ -278,7 +277,9 @@ class HelperCspMasterLeafDevice(HelperBaseDevice):
 
     def start_dish_vcc_validation(self):
         """Push Dish Vcc Validation result after Initialization"""
-        start_thread = threading.Timer(5, self.push_dish_vcc_validation_result)
+        start_thread = self._scheduler.timer(
+            5, self.push_dish_vcc_validation_result
+        )
         start_thread.start()
 
 
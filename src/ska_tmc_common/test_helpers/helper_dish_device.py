@@ -9,7 +9,6 @@ from datetime import datetime
 from typing import List, Tuple, Union
 
 import numpy as np
-import tango
 from astropy.time import Time
 from ska_tango_base.base.base_device import SKABaseDevice
 from ska_tango_base.commands import ResultCode
@@ -70,7 +69,6 @@ class HelperDishDevice(HelperDishLNDevice):
         self._band4PointingModelParams = []
         self._band5aPointingModelParams = []
         self._band5bPointingModelParams = []
-        self.thread: None | threading.Thread = None
         self.track_stop: bool = False
         self._lrcr_event_delay = 0.2
 
@@ -521,14 +519,14 @@ class HelperDishDevice(HelperDishLNDevice):
         self.set_dish_mode(DishMode.OPERATE)
 
         spf_setopearatemode_cmd_id = f"{time.time()}_SPF_SetOperateMode"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "SetOperateMode", "None"],
             kwargs={"command_id": spf_setopearatemode_cmd_id},
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             2 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "SetOperateMode", "SetOperateMode completed"],
@@ -623,7 +621,7 @@ class HelperDishDevice(HelperDishLNDevice):
             return self.induce_fault(
                 "TrackLoadStaticOff", command_id, is_dish=True
             )
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "TrackLoadStaticOff"],
@@ -682,8 +680,9 @@ class HelperDishDevice(HelperDishLNDevice):
         # Set the Dish Mode
         current_dish_mode = self._dish_mode
         self.set_dish_mode(DishMode.CONFIG)
-        thread = threading.Thread(
-            target=self.set_dish_mode,
+        thread = self._scheduler.timer(
+            0,
+            self.set_dish_mode,
             args=[current_dish_mode],
         )
         thread.start()
@@ -691,7 +690,7 @@ class HelperDishDevice(HelperDishLNDevice):
         self.set_configured_band(Band.B1)
 
         set_index_position_command_id = f"{time.time()}_DS_SetIndexPosition"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "SetIndexPosition"],
@@ -699,14 +698,14 @@ class HelperDishDevice(HelperDishLNDevice):
         )
         thread.start()
         sprfx_configureband1_cmd_id = f"{time.time()}_SPFRX_ConfigureBand1"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             2 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "ConfigureBand1", "None"],
             kwargs={"command_id": sprfx_configureband1_cmd_id},
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             3 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "ConfigureBand1", "ConfigureBand1 completed"],
@@ -780,15 +779,16 @@ class HelperDishDevice(HelperDishLNDevice):
         # Set the Dish Mode
         current_dish_mode = self._dish_mode
         self.set_dish_mode(DishMode.CONFIG)
-        thread = threading.Thread(
-            target=self.set_dish_mode,
+        thread = self._scheduler.timer(
+            0,
+            self.set_dish_mode,
             args=[current_dish_mode],
         )
         thread.start()
         # Set dish configured band
         self.set_configured_band(Band.B2)
         set_index_position_command_id = f"{time.time()}_DS_SetIndexPosition"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "SetIndexPosition"],
@@ -796,14 +796,14 @@ class HelperDishDevice(HelperDishLNDevice):
         )
         thread.start()
         sprfx_configureband2_cmd_id = f"{time.time()}_SPFRX_ConfigureBand2"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             2 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "ConfigureBand2", "None"],
             kwargs={"command_id": sprfx_configureband2_cmd_id},
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             3 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "ConfigureBand2", "ConfigureBand2 completed"],
@@ -857,15 +857,16 @@ class HelperDishDevice(HelperDishLNDevice):
         # Set dish mode
         current_dish_mode = self._dish_mode
         self.set_dish_mode(DishMode.CONFIG)
-        thread = threading.Thread(
-            target=self.set_dish_mode,
+        thread = self._scheduler.timer(
+            0,
+            self.set_dish_mode,
             args=[current_dish_mode],
         )
         thread.start()
         # Set dish configured band
         self.set_configured_band(Band.B3)
         set_index_position_command_id = f"{time.time()}_DS_SetIndexPosition"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "SetIndexPosition"],
@@ -873,14 +874,14 @@ class HelperDishDevice(HelperDishLNDevice):
         )
         thread.start()
         sprfx_configureband3_cmd_id = f"{time.time()}_SPFRX_ConfigureBand3"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             2 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "ConfigureBand3", "None"],
             kwargs={"command_id": sprfx_configureband3_cmd_id},
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             3 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "ConfigureBand3", "ConfigureBand3 completed"],
@@ -933,15 +934,16 @@ class HelperDishDevice(HelperDishLNDevice):
         # Set dish mode
         current_dish_mode = self._dish_mode
         self.set_dish_mode(DishMode.CONFIG)
-        thread = threading.Thread(
-            target=self.set_dish_mode,
+        thread = self._scheduler.timer(
+            0,
+            self.set_dish_mode,
             args=[current_dish_mode],
         )
         thread.start()
         # Set dish configured band
         self.set_configured_band(Band.B4)
         set_index_position_command_id = f"{time.time()}_DS_SetIndexPosition"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "SetIndexPosition"],
@@ -949,14 +951,14 @@ class HelperDishDevice(HelperDishLNDevice):
         )
         thread.start()
         sprfx_configureband4_cmd_id = f"{time.time()}_SPFRX_ConfigureBand4"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             2 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "ConfigureBand4", "None"],
             kwargs={"command_id": sprfx_configureband4_cmd_id},
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             3 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "ConfigureBand4", "ConfigureBand4 completed"],
@@ -1008,15 +1010,16 @@ class HelperDishDevice(HelperDishLNDevice):
         # Set dish mode
         current_dish_mode = self._dish_mode
         self.set_dish_mode(DishMode.CONFIG)
-        thread = threading.Thread(
-            target=self.set_dish_mode,
+        thread = self._scheduler.timer(
+            0,
+            self.set_dish_mode,
             args=[current_dish_mode],
         )
         thread.start()
         # Set dish configured band
         self.set_configured_band(Band.B5a)
         set_index_position_command_id = f"{time.time()}_DS_SetIndexPosition"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "SetIndexPosition"],
@@ -1024,14 +1027,14 @@ class HelperDishDevice(HelperDishLNDevice):
         )
         thread.start()
         sprfx_configureband5a_cmd_id = f"{time.time()}_SPFRX_ConfigureBand5a"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             2 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "ConfigureBand5a", "None"],
             kwargs={"command_id": sprfx_configureband5a_cmd_id},
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             3 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[
@@ -1088,15 +1091,16 @@ class HelperDishDevice(HelperDishLNDevice):
         # Set dish mode
         current_dish_mode = self._dish_mode
         self.set_dish_mode(DishMode.CONFIG)
-        thread = threading.Thread(
-            target=self.set_dish_mode,
+        thread = self._scheduler.timer(
+            0,
+            self.set_dish_mode,
             args=[current_dish_mode],
         )
         thread.start()
         # Set dish configured band
         self.set_configured_band(Band.B5b)
         set_index_position_command_id = f"{time.time()}_DS_SetIndexPosition"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "SetIndexPosition"],
@@ -1104,14 +1108,14 @@ class HelperDishDevice(HelperDishLNDevice):
         )
         thread.start()
         sprfx_configureband5b_cmd_id = f"{time.time()}_SPFRX_ConfigureBand5b"
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             2 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "ConfigureBand5b", "None"],
             kwargs={"command_id": sprfx_configureband5b_cmd_id},
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             3 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[
@@ -1131,33 +1135,36 @@ class HelperDishDevice(HelperDishLNDevice):
         self, command_name: str = "", command_id: str = ""
     ) -> None:
         """Updates the longrunningcommandresult  after a delay."""
-        delay_value = self._delay
-        with tango.EnsureOmniThread():
-            time.sleep(delay_value)
-            if not self.track_stop:
-                if self._pointing_state != PointingState.TRACK:
-                    if self._state_duration_info:
-                        self._follow_state_duration()
-                    else:
-                        self._pointing_state = PointingState.TRACK
-                        self.push_change_event(
-                            "pointingState", self._pointing_state
-                        )
-
-                # Set dish mode
-                self.set_dish_mode(DishMode.OPERATE)
-                command_result_message = (
-                    "Track command has been executed on "
-                    + "DS. Monitor the achievedTargetLock attribute to "
-                    + "determine when the dish is on source."
-                )
-                self.push_command_result(
-                    ResultCode.OK,
-                    command_name,
-                    command_result_message,
-                    command_id=command_id,
-                )
-                self.logger.info("%s command completed.", command_name)
+        if not self.track_stop:
+            delay = 0.0
+            if self._pointing_state != PointingState.TRACK:
+                if self._state_duration_info:
+                    delay = self._follow_state_duration()
+                else:
+                    self._pointing_state = PointingState.TRACK
+                    self.push_change_event(
+                        "pointingState", self._pointing_state
+                    )
+            self._call_after(
+                delay, self._complete_track, command_name, command_id
+            )
+
+    def _complete_track(self, command_name: str, command_id: str) -> None:
+        """Sets the dish mode and pushes the result of the Track command."""
+        # Set dish mode
+        self.set_dish_mode(DishMode.OPERATE)
+        command_result_message = (
+            "Track command has been executed on "
+            + "DS. Monitor the achievedTargetLock attribute to "
+            + "determine when the dish is on source."
+        )
+        self.push_command_result(
+            ResultCode.OK,
+            command_name,
+            command_result_message,
+            command_id=command_id,
+        )
+        self.logger.info("%s command completed.", command_name)
 
     @command(
         dtype_out="DevVarLongStringArray",
@@ -1180,10 +1187,9 @@ class HelperDishDevice(HelperDishLNDevice):
         if self.defective_params["enabled"]:
             return self.induce_fault("Track", command_id, is_dish=True)
 
-        self.thread = threading.Thread(
-            target=self.update_track_lrcr, args=["Track", command_id]
+        self._scheduler.call_later(
+            self._delay, self.update_track_lrcr, "Track", command_id
         )
-        self.thread.start()
         return ([ResultCode.QUEUED], [command_id])
 
     def is_Scan_allowed(self) -> Union[bool, CommandNotAllowed]:
@@ -1223,7 +1229,7 @@ class HelperDishDevice(HelperDishLNDevice):
         if self.defective_params["enabled"]:
             return self.induce_fault("Scan", command_id, is_dish=True)
         self._scan_id = argin
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "Scan", "Scan completed"],
@@ -1269,7 +1275,7 @@ class HelperDishDevice(HelperDishLNDevice):
         if self.defective_params["enabled"]:
             return self.induce_fault("EndScan", command_id, is_dish=True)
         self._scan_id = ""
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "EndScan", "EndScan completed"],
@@ -1360,7 +1366,7 @@ class HelperDishDevice(HelperDishLNDevice):
             if self.defective_params[
                 "enabled"
             ]:  # Temporary change to set status as failed.
-                thread = threading.Timer(
+                thread = self._scheduler.timer(
                     self._delay,
                     function=self.push_command_result,
                     args=[ResultCode.FAILED, "ApplyPointingModel"],
@@ -1370,7 +1376,7 @@ class HelperDishDevice(HelperDishLNDevice):
                     },
                 )
             else:
-                thread = threading.Timer(
+                thread = self._scheduler.timer(
                     self._delay,
                     function=self.push_command_result,
                     args=[ResultCode.OK, "ApplyPointingModel"],
@@ -1428,25 +1434,26 @@ class HelperDishDevice(HelperDishLNDevice):
             return self.induce_fault("TrackStop", command_id, is_dish=True)
 
         self.track_stop = True
+        delay = 0.0
         if self._pointing_state != PointingState.READY:
             if self._state_duration_info:
-                self._follow_state_duration()
+                delay = self._follow_state_duration()
             else:
                 self._pointing_state = PointingState.READY
                 self.push_change_event("pointingState", self._pointing_state)
                 self.logger.info("Pointing State: %s", self._pointing_state)
         # Set dish mode
-        self.set_dish_mode(DishMode.OPERATE)
+        self._call_after(delay, self.set_dish_mode, DishMode.OPERATE)
         ds_trackstop_command_id = f"{time.time()}_DS_TrackStop"
-        thread = threading.Timer(
-            self._lrcr_event_delay,
+        thread = self._scheduler.timer(
+            delay + self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "TrackStop"],
             kwargs={"command_id": ds_trackstop_command_id},
         )
         thread.start()
-        thread = threading.Timer(
-            2 * self._lrcr_event_delay,
+        thread = self._scheduler.timer(
+            delay + 2 * self._lrcr_event_delay,
             function=self.push_command_result,
             args=[ResultCode.OK, "TrackStop", "TrackStop completed"],
             kwargs={"command_id": command_id},
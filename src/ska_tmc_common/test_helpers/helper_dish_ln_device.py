@@ -5,7 +5,6 @@ integrated TMC.
 """
 import json
 import re
-import threading
 import time
 from datetime import datetime as dt
 from typing import List, Tuple, Union
@@ -338,15 +337,20 @@ class HelperDishLNDevice(HelperBaseDevice):
             elevation,
         )
 
-    def _follow_state_duration(self):
-        """This method will update pointing state as per state duration"""
+    def _follow_state_duration(self) -> float:
+        """This method will update pointing state as per state duration,
+        from the simulation scheduler.
+
+        :return: delay in seconds of the last pointing state update
+        :rtype: float
+        """
+        delay = 0.0
         for pointing_state, duration in self._state_duration_info:
-            time.sleep(duration)
-            pointing_state_enum = PointingState[pointing_state]
-            thread = threading.Thread(
-                target=self.set_pointing_state, args=[pointing_state_enum]
+            delay += duration
+            self._scheduler.call_later(
+                delay, self.set_pointing_state, PointingState[pointing_state]
             )
-            thread.start()
+        return delay
 
     @command(
         dtype_in=str,
@@ -414,7 +418,7 @@ class HelperDishLNDevice(HelperBaseDevice):
         """This method gets invoked only once after initialization
         and push the k-value validation result.
         """
-        start_thread = threading.Timer(
+        start_thread = self._scheduler.timer(
             5, self.push_dish_kvalue_validation_result
         )
         start_thread.start()
@@ -816,16 +820,23 @@ class HelperDishLNDevice(HelperBaseDevice):
 
         if self.defective_params["enabled"]:
             return self.induce_fault("Track", command_id)
+        delay = 0.0
         if self._pointing_state != PointingState.TRACK:
             if self._state_duration_info:
-                self._follow_state_duration()
+                delay = self._follow_state_duration()
             else:
                 self._pointing_state = PointingState.TRACK
                 self.push_change_event("pointingState", self._pointing_state)
 
         # Set dish mode
-        self.set_dish_mode(DishMode.OPERATE)
-        self.push_command_result(ResultCode.OK, "Track", command_id=command_id)
+        self._call_after(delay, self.set_dish_mode, DishMode.OPERATE)
+        self._call_after(
+            delay,
+            self.push_command_result,
+            ResultCode.OK,
+            "Track",
+            command_id=command_id,
+        )
         self.logger.info("Track command completed.")
         return [ResultCode.QUEUED], [command_id]
 
@@ -869,19 +880,24 @@ class HelperDishLNDevice(HelperBaseDevice):
 
         if self.defective_params["enabled"]:
             return self.induce_fault("TrackStop", command_id, is_dish=True)
+        delay = 0.0
         if self._pointing_state != PointingState.READY:
             if self._state_duration_info:
-                self._follow_state_duration()
+                delay = self._follow_state_duration()
             else:
                 self._pointing_state = PointingState.READY
                 self.push_change_event("pointingState", self._pointing_state)
                 self.logger.info("Pointing State: %s", self._pointing_state)
 
         # Set dish mode
-        self.set_dish_mode(DishMode.OPERATE)
+        self._call_after(delay, self.set_dish_mode, DishMode.OPERATE)
 
-        self.push_command_result(
-            ResultCode.OK, "TrackStop", command_id=command_id
+        self._call_after(
+            delay,
+            self.push_command_result,
+            ResultCode.OK,
+            "TrackStop",
+            command_id=command_id,
         )
         self.logger.info("TrackStop command completed.")
         return [ResultCode.QUEUED], [command_id]
@@ -976,12 +992,13 @@ class HelperDishLNDevice(HelperBaseDevice):
 
         if self.defective_params["enabled"]:
             return self.induce_fault("Configure", command_id, is_dish=True)
+        delay = 0.0
         if self._pointing_state != PointingState.TRACK:
             if self._state_duration_info:
-                self._follow_state_duration()
+                delay = self._follow_state_duration()
             else:
                 self._pointing_state = PointingState.TRACK
-                thread = threading.Timer(
+                thread = self._scheduler.timer(
                     interval=self._delay,
                     function=self.push_change_event,
                     args=["pointingState", self._pointing_state],
@@ -990,15 +1007,15 @@ class HelperDishLNDevice(HelperBaseDevice):
                 self.logger.info("Pointing State: %s", self._pointing_state)
 
         # Set dish mode
-        thread = threading.Timer(
-            interval=self._delay,
+        thread = self._scheduler.timer(
+            interval=delay + self._delay,
             function=self.set_dish_mode,
             args=[DishMode.OPERATE],
         )
         thread.start()
 
-        thread = threading.Timer(
-            self._delay,
+        thread = self._scheduler.timer(
+            delay + self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "Configure"],
             kwargs={"command_id": command_id},
@@ -1194,7 +1211,7 @@ class HelperDishLNDevice(HelperBaseDevice):
 
             # TBD: Add your dish mode change logic here if required
 
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "Scan"],
@@ -1225,7 +1242,7 @@ class HelperDishLNDevice(HelperBaseDevice):
         if self.defective_params["enabled"]:
             return self.induce_fault("ApplyPointingModel", command_id)
 
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "ApplyPointingModel"],
@@ -4,7 +4,6 @@ an integrated TMC
 """
 
 import json
-import threading
 import time
 from typing import List, Tuple
 
@@ -142,7 +141,7 @@ class HelperMCCSController(HelperBaseDevice):
         mccs_subarray_proxy = dev_factory.get_device(mccs_subarray_device_name)
         mccs_subarray_proxy.AssignResources(argin)
 
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "Allocate"],
@@ -202,8 +201,9 @@ class HelperMCCSController(HelperBaseDevice):
         dev_factory = DevFactory()
         mccs_subarray_proxy = dev_factory.get_device(mccs_subarray_device_name)
         mccs_subarray_proxy.ReleaseResources(argin)
-        thread = threading.Thread(
-            target=self.push_command_result,
+        thread = self._scheduler.timer(
+            0,
+            self.push_command_result,
             args=[ResultCode.OK, "Release"],
             kwargs={
                 "command_id": command_id,
@@ -259,8 +259,9 @@ class HelperMCCSController(HelperBaseDevice):
         mccs_subarray_proxy = dev_factory.get_device(mccs_subarray_device_name)
         mccs_subarray_proxy.Restart()
 
-        thread = threading.Thread(
-            target=self.push_command_result,
+        thread = self._scheduler.timer(
+            0,
+            self.push_command_result,
             args=[ResultCode.OK, "RestartSubarray"],
             kwargs={
                 "command_id": command_id,
@@ -3,7 +3,6 @@ This module implements the Helper MCCS master leaf node devices for testing
 an integrated TMC
 """
 
-import threading
 import time
 from typing import List, Tuple
 
@@ -119,7 +118,7 @@ class HelperMCCSMasterLeafNode(HelperBaseDevice):
         if self.defective_params["enabled"]:
             return self.induce_fault("AssignResources", command_id)
 
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "AssignResources"],
@@ -173,7 +172,7 @@ class HelperMCCSMasterLeafNode(HelperBaseDevice):
         command_id = f"{time.time()}-ReleaseAllResources"
         if self.defective_params["enabled"]:
             return self.induce_fault("ReleaseAllResources", command_id)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "ReleaseAllResources"],
@@ -2,7 +2,6 @@
 This module implements the Helper Mccs subarray device
 """
 
-import threading
 import time
 
 # pylint: disable=attribute-defined-outside-init
@@ -51,13 +50,13 @@ class HelperMccsSubarrayDevice(HelperSubArrayDevice):
             return self.induce_fault("ReleaseResources", command_id)
 
         self.update_device_obsstate(ObsState.RESOURCING, RELEASE_RESOURCES)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.update_device_obsstate,
             args=[ObsState.EMPTY, RELEASE_RESOURCES],
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, RELEASE_RESOURCES],
@@ -3,7 +3,6 @@
 """Helper device for SdpSubarray device"""
 import json
 import logging
-import threading
 from typing import Tuple
 
 import tango
@@ -188,7 +187,7 @@ class HelperSdpSubarray(HelperSubArrayDevice):
                 tango.ErrSeverity.ERR,
             )
 
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._command_delay_info[ASSIGN_RESOURCES],
             self.update_device_obsstate,
             args=[ObsState.IDLE, ASSIGN_RESOURCES],
@@ -203,7 +202,7 @@ class HelperSdpSubarray(HelperSubArrayDevice):
         self.update_command_info(RELEASE_RESOURCES)
         self._obs_state = ObsState.RESOURCING
         self.update_device_obsstate(self._obs_state, RELEASE_RESOURCES)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._command_delay_info[RELEASE_RESOURCES],
             self.update_device_obsstate,
             args=[ObsState.IDLE, RELEASE_RESOURCES],
@@ -226,7 +225,7 @@ class HelperSdpSubarray(HelperSubArrayDevice):
             self._obs_state = ObsState.IDLE
             self.induce_fault()
         self.update_device_obsstate(self._obs_state, RELEASE_ALL_RESOURCES)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._command_delay_info[RELEASE_ALL_RESOURCES],
             self.update_device_obsstate,
             args=[ObsState.EMPTY, RELEASE_ALL_RESOURCES],
@@ -266,7 +265,7 @@ class HelperSdpSubarray(HelperSubArrayDevice):
             self.update_device_obsstate(self._obs_state, CONFIGURE)
             self.logger.info("Wrong scan_type in the Configure input json")
             self._obs_state = ObsState.IDLE
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 1,
                 self.update_device_obsstate,
                 args=[self._obs_state, CONFIGURE],
@@ -298,7 +297,7 @@ class HelperSdpSubarray(HelperSubArrayDevice):
         else:
             self._obs_state = ObsState.CONFIGURING
             self.update_device_obsstate(self._obs_state, CONFIGURE)
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._command_delay_info[CONFIGURE],
                 self.update_device_obsstate,
                 args=[ObsState.READY, CONFIGURE],
@@ -332,7 +331,7 @@ class HelperSdpSubarray(HelperSubArrayDevice):
                     "SdpSubarry.Configure()",
                     tango.ErrSeverity.ERR,
                 )
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._command_delay_info[SCAN],
                 self.update_device_obsstate,
                 args=[ObsState.SCANNING, SCAN],
@@ -356,7 +355,7 @@ class HelperSdpSubarray(HelperSubArrayDevice):
             self._obs_state = ObsState.SCANNING
             self.induce_fault()
         else:
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._command_delay_info[END_SCAN],
                 self.update_device_obsstate,
                 args=[ObsState.READY, END_SCAN],
@@ -379,7 +378,7 @@ class HelperSdpSubarray(HelperSubArrayDevice):
         if self._state_duration_info:
             self._follow_state_duration()
         else:
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._command_delay_info[END],
                 self.update_device_obsstate,
                 args=[ObsState.IDLE, END],
@@ -405,7 +404,7 @@ class HelperSdpSubarray(HelperSubArrayDevice):
         )
         for timer in self.timers:
             timer.cancel()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._command_delay_info[ABORT],
             self.update_device_obsstate,
             args=[ObsState.ABORTED, ABORT],
@@ -419,7 +418,7 @@ class HelperSdpSubarray(HelperSubArrayDevice):
         self.update_command_info(RESTART)
         self._obs_state = ObsState.RESTARTING
         self.update_device_obsstate(self._obs_state, RESTART)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._command_delay_info[RESTART],
             self.update_device_obsstate,
             args=[ObsState.EMPTY, RESTART],
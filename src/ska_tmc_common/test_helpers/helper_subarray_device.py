@@ -7,7 +7,6 @@ an integrated TMC
 import json
 
 # pylint: disable=attribute-defined-outside-init
-import threading
 import time
 from logging import Logger
 from typing import Any, Callable, List, Optional, Tuple
@@ -38,6 +37,10 @@ from ska_tmc_common.test_helpers.constants import (
     SETADMINMODE,
     STAND_BY,
 )
+from ska_tmc_common.test_helpers.latency_profile import LatencyInjector
+from ska_tmc_common.test_helpers.simulation_scheduler import (
+    SimulationScheduler,
+)
 
 
 # pylint: disable=abstract-method,invalid-name
@@ -195,8 +198,12 @@ class HelperSubArrayDevice(SKASubarray):
     """A generic subarray device for triggering state changes with a command.
     It can be used as helper device for element subarray node"""
 
+    _latency_injector: Optional[LatencyInjector] = None
+
     def init_device(self):
         super().init_device()
+        self._scheduler = SimulationScheduler.get_instance()
+        self._latency_injector = LatencyInjector(self._scheduler, self.logger)
         self._health_state = HealthState.OK
         self._isSubsystemAvailable = True
         self._isAdminModeEnabled: bool = True
@@ -236,6 +243,8 @@ class HelperSubArrayDevice(SKASubarray):
 
     defective = attribute(dtype=str, access=AttrWriteType.READ)
 
+    latencyProfile = attribute(dtype=str, access=AttrWriteType.READ)
+
     commandDelayInfo = attribute(dtype=str, access=AttrWriteType.READ)
     isAdminModeEnabled = attribute(dtype=bool, access=AttrWriteType.READ_WRITE)
     adminMode = attribute(
@@ -411,6 +420,14 @@ class HelperSubArrayDevice(SKASubarray):
         """
         return json.dumps(self.defective_params)
 
+    def read_latencyProfile(self) -> str:
+        """
+        Returns the latency profile set with SetLatencyProfile
+        :return: JSON latency profile, {} when none is set
+        :rtype: str
+        """
+        return self._latency_injector.to_json()
+
     def read_receiveAddresses(self) -> str:
         """
         This method is used to read receiveAddresses attribute
@@ -461,7 +478,11 @@ class HelperSubArrayDevice(SKASubarray):
             "Pushing longRunningCommandResult Event with data: %s",
             command_result,
         )
-        self.push_change_event("longRunningCommandResult", command_result)
+        self.push_change_event(
+            "longRunningCommandResult",
+            command_result,
+            command_name=command_name,
+        )
 
     def update_device_obsstate(
         self, value: ObsState, command_name: str = ""
@@ -505,21 +526,22 @@ class HelperSubArrayDevice(SKASubarray):
         self.push_change_event("commandCallInfo", self._command_call_info)
         self.logger.info("CommandCallInfo updates are pushed")
 
-    def _follow_state_duration(self):
-        """This method will update obs state as per state duration
-        in separate thread.
-        To avoid Tango default 3 sec timeout creating seperate thread
-        for updating obs state.As Updating Obs state might take
-        more than 3 sec.
+    def _follow_state_duration(self) -> float:
+        """This method will update obs state as per state duration.
+        To avoid Tango default 3 sec timeout, the obs state updates are
+        scheduled on the simulation scheduler instead of blocking the
+        command, as updating obs state might take more than 3 sec.
+
+        :return: delay in seconds of the last obs state update
+        :rtype: float
         """
+        delay = 0.0
         for obs_state, duration in self._state_duration_info:
-            obs_state = ObsState[obs_state]
-            time.sleep(duration)
-            thread = threading.Thread(
-                target=self.push_obs_state_event,
-                args=[obs_state],
+            delay += duration
+            self._scheduler.call_later(
+                delay, self.push_obs_state_event, ObsState[obs_state]
             )
-            thread.start()
+        return delay
 
     def create_component_manager(self) -> EmptySubArrayComponentManager:
         """
@@ -848,12 +870,14 @@ class HelperSubArrayDevice(SKASubarray):
                     "pushing longRunningCommandResult %s event", command_result
                 )
                 self.push_change_event(
-                    "longRunningCommandResult", command_result
+                    "longRunningCommandResult",
+                    command_result,
+                    command_name=command_name,
                 )
             return [result], [command_id]
 
         if fault_type == FaultType.LONG_RUNNING_EXCEPTION:
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay,
                 function=self.push_command_result,
                 args=[result, command_name],
@@ -868,7 +892,7 @@ class HelperSubArrayDevice(SKASubarray):
             return [ResultCode.QUEUED], [command_id]
 
         if fault_type == FaultType.COMMAND_NOT_ALLOWED_AFTER_QUEUING:
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay,
                 function=self.push_command_result,
                 args=[
@@ -899,11 +923,15 @@ class HelperSubArrayDevice(SKASubarray):
             self.logger.info(
                 "pushing longRunningCommandResult %s event", command_result
             )
-            self.push_change_event("longRunningCommandResult", command_result)
+            self.push_change_event(
+                "longRunningCommandResult",
+                command_result,
+                command_name=command_name,
+            )
             return [ResultCode.QUEUED], [command_id]
 
         if fault_type == FaultType.COMMAND_NOT_ALLOWED_EXCEPTION_AFTER_QUEUING:
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay,
                 function=self.push_command_result,
                 args=[
@@ -937,6 +965,46 @@ class HelperSubArrayDevice(SKASubarray):
         self.logger.info("Setting defective params to %s", input_dict)
         self.defective_params = input_dict
 
+    @command(
+        dtype_in=str,
+        doc_in="Set latency profile",
+    )
+    def SetLatencyProfile(self, profile_json: str) -> None:
+        """
+        Set the latency distributions of the commands and change events,
+        and the drop probability of the change events. See
+        ska_tmc_common.test_helpers.latency_profile for the format.
+        :param profile_json: JSON latency profile, {} to remove it
+        :type profile_json: str
+        """
+        self._latency_injector.set_profile(profile_json)
+        self.logger.info(
+            "Latency profile set to %s", self._latency_injector.to_json()
+        )
+
+    def push_change_event(
+        self, attr_name: str, *args, command_name: Optional[str] = None
+    ) -> None:
+        """
+        Push a change event, delayed or dropped according to the latency
+        profile
+        :param attr_name: name of the attribute
+        :type attr_name: str
+        :param command_name: name of the command whose result the
+            longRunningCommandResult event carries, so that the command
+            latency of the profile delays it
+        :type command_name: str, optional
+        """
+        if self._latency_injector is None:
+            super().push_change_event(attr_name, *args)
+        else:
+            self._latency_injector.push_change_event(
+                super().push_change_event,
+                attr_name,
+                *args,
+                command_name=command_name,
+            )
+
     @admin_mode_check()
     def is_Standby_allowed(self) -> bool:
         """
@@ -1026,13 +1094,13 @@ class HelperSubArrayDevice(SKASubarray):
 
         self._obs_state = ObsState.RESOURCING
         self.push_change_event("obsState", self._obs_state)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             function=self.update_device_obsstate,
             args=[ObsState.IDLE, ASSIGN_RESOURCES],
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, ASSIGN_RESOURCES],
@@ -1089,13 +1157,13 @@ class HelperSubArrayDevice(SKASubarray):
             return self.induce_fault("ReleaseResources", command_id)
 
         self.update_device_obsstate(ObsState.RESOURCING, RELEASE_RESOURCES)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.update_device_obsstate,
             args=[ObsState.IDLE, RELEASE_RESOURCES],
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, RELEASE_RESOURCES],
@@ -1152,13 +1220,13 @@ class HelperSubArrayDevice(SKASubarray):
 
         self._obs_state = ObsState.RESOURCING
         self.push_change_event("obsState", self._obs_state)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             interval=2,
             function=self.update_device_obsstate,
             args=[ObsState.EMPTY, RELEASE_ALL_RESOURCES],
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, RELEASE_ALL_RESOURCES],
@@ -1216,13 +1284,13 @@ class HelperSubArrayDevice(SKASubarray):
             self._obs_state = ObsState.CONFIGURING
             self.push_change_event("obsState", self._obs_state)
             self.logger.info("Starting Thread for configure")
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 interval=self._command_delay_info[CONFIGURE],
                 function=self.update_device_obsstate,
                 args=[ObsState.READY, CONFIGURE],
             )
             thread.start()
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay,
                 self.push_command_result,
                 args=[ResultCode.OK, CONFIGURE],
@@ -1278,7 +1346,7 @@ class HelperSubArrayDevice(SKASubarray):
         if self._obs_state != ObsState.SCANNING:
             self._obs_state = ObsState.SCANNING
             self.push_change_event("obsState", self._obs_state)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, SCAN],
@@ -1498,14 +1566,14 @@ class HelperSubArrayDevice(SKASubarray):
             self._obs_state = ObsState.ABORTING
             self.push_change_event("obsState", self._obs_state)
 
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 interval=self._delay,
                 function=self.update_device_obsstate,
                 args=[ObsState.ABORTED, ABORT],
             )
             thread.start()
 
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay,
                 self.push_command_result,
                 args=[ResultCode.OK, ABORT],
@@ -1598,13 +1666,13 @@ class HelperSubArrayDevice(SKASubarray):
         if self._obs_state != ObsState.EMPTY:
             self._obs_state = ObsState.RESTARTING
             self.push_change_event("obsState", self._obs_state)
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 interval=self._delay,
                 function=self.update_device_obsstate,
                 args=[ObsState.EMPTY, RESTART],
             )
             thread.start()
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay,
                 self.push_command_result,
                 args=[ResultCode.OK, RESTART],
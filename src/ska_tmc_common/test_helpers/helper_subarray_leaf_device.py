@@ -7,7 +7,6 @@ import json
 
 # pylint: disable=attribute-defined-outside-init
 # pylint: disable=unused-argument
-import threading
 import time
 from typing import List, Tuple
 
@@ -128,21 +127,22 @@ class HelperSubarrayLeafDevice(HelperBaseDevice):
         )
         self.push_change_event("commandCallInfo", self._command_call_info)
 
-    def _follow_state_duration(self):
-        """This method will update obs state as per state duration
-        in separate thread.
-        To avoid Tango default 3 sec timeout creating seperate thread
-        for updating obs state.As Updating Obs state might take
-        more than 3 sec.
+    def _follow_state_duration(self) -> float:
+        """This method will update obs state as per state duration.
+        To avoid Tango default 3 sec timeout, the obs state updates are
+        scheduled on the simulation scheduler instead of blocking the
+        command, as updating obs state might take more than 3 sec.
+
+        :return: delay in seconds of the last obs state update
+        :rtype: float
         """
+        delay = 0.0
         for obs_state, duration in self._state_duration_info:
-            obs_state = ObsState[obs_state]
-            time.sleep(duration)
-            thread = threading.Thread(
-                target=self.push_obs_state_event,
-                args=[obs_state],
+            delay += duration
+            self._scheduler.call_later(
+                delay, self.push_obs_state_event, ObsState[obs_state]
             )
-            thread.start()
+        return delay
 
     @command(
         doc_in="Clears commandCallInfo",
@@ -248,11 +248,11 @@ class HelperSubarrayLeafDevice(HelperBaseDevice):
             self._follow_state_duration()
         else:
             self.push_obs_state_event(ObsState.RESOURCING)
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay, self.push_obs_state_event, args=[ObsState.IDLE]
             )
             thread.start()
-            result_thread = threading.Timer(
+            result_thread = self._scheduler.timer(
                 self._delay,
                 function=self.push_command_result,
                 args=[ResultCode.OK, "AssignResources"],
@@ -307,11 +307,11 @@ class HelperSubarrayLeafDevice(HelperBaseDevice):
             self._follow_state_duration()
         else:
             self.push_obs_state_event(ObsState.CONFIGURING)
-            thread = threading.Timer(
+            thread = self._scheduler.timer(
                 self._delay, self.push_obs_state_event, args=[ObsState.READY]
             )
             thread.start()
-            result_thread = threading.Timer(
+            result_thread = self._scheduler.timer(
                 self._delay,
                 function=self.push_command_result,
                 args=[
@@ -368,7 +368,7 @@ class HelperSubarrayLeafDevice(HelperBaseDevice):
 
         self.push_obs_state_event(ObsState.SCANNING)
 
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "Scan"],
@@ -545,11 +545,11 @@ class HelperSubarrayLeafDevice(HelperBaseDevice):
             return self.induce_fault("Abort", command_id)
 
         self.push_obs_state_event(ObsState.ABORTING)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay, self.push_obs_state_event, args=[ObsState.ABORTED]
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "Abort"],
@@ -600,11 +600,11 @@ class HelperSubarrayLeafDevice(HelperBaseDevice):
             return self.induce_fault("Restart", command_id)
 
         self.push_obs_state_event(ObsState.RESTARTING)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay, self.push_obs_state_event, args=[ObsState.EMPTY]
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "Restart"],
@@ -651,11 +651,11 @@ class HelperSubarrayLeafDevice(HelperBaseDevice):
             return self.induce_fault("ReleaseAllResources", command_id)
 
         self.push_obs_state_event(ObsState.RESOURCING)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay, self.push_obs_state_event, args=[ObsState.EMPTY]
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "ReleaseAllResources"],
@@ -710,11 +710,11 @@ class HelperSubarrayLeafDevice(HelperBaseDevice):
             return self.induce_fault("ReleaseResources", command_id)
 
         self.push_obs_state_event(ObsState.RESOURCING)
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay, self.push_obs_state_event, args=[ObsState.IDLE]
         )
         thread.start()
-        thread = threading.Timer(
+        thread = self._scheduler.timer(
             self._delay,
             self.push_command_result,
             args=[ResultCode.OK, "ReleaseResources"],
@@ -0,0 +1,431 @@
+"""
+This module provides the latency profiles of the helper devices, which
+delay the completion of their commands and the change events of their
+attributes by durations drawn from a distribution, and drop a fraction of
+the change events, so that the trackers, timeouts and liveliness probes
+of the TMC nodes are exercised with realistic tail latencies.
+
+A profile is set on a helper device with the SetLatencyProfile command,
+for instance::
+
+    {
+        "seed": 7,
+        "commands": {
+            "AssignResources": {
+                "distribution": "lognormal",
+                "median": 0.5,
+                "sigma": 0.8,
+                "stall_probability": 0.01,
+                "stall_duration": 30
+            }
+        },
+        "attributes": {
+            "obsState": {"distribution": "uniform", "low": 0, "high": 0.2}
+        },
+        "event_jitter": {"distribution": "uniform", "low": 0, "high": 0.05},
+        "drop_probability": 0.001
+    }
+
+The latency of a command delays the longRunningCommandResult events
+carrying its result, pushed by push_command_result of the helper devices.
+The latency of an attribute and the event jitter
+delay the change events of the attribute. The events of an attribute are
+never reordered: an event is pushed after the events of the same
+attribute pushed before it.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import threading
+from collections import deque
+from logging import Logger
+from typing import Any, Callable, Optional
+
+from ska_tmc_common.test_helpers.simulation_scheduler import (
+    SimulationScheduler,
+)
+
+
+class LatencyDistribution:
+    """A distribution of latencies in seconds, with a probability of a
+    stall, a much longer latency modelling a device which hangs."""
+
+    DISTRIBUTIONS: tuple[str, ...] = ("fixed", "uniform", "lognormal")
+
+    def __init__(
+        self,
+        distribution: str = "fixed",
+        value: float = 0.0,
+        low: float = 0.0,
+        high: float = 0.0,
+        median: float = 0.0,
+        sigma: float = 0.0,
+        stall_probability: float = 0.0,
+        stall_duration: float = 0.0,
+    ) -> None:
+        """
+        :param distribution: fixed, uniform or lognormal
+        :type distribution: str
+        :param value: latency of the fixed distribution
+        :type value: float
+        :param low: lower bound of the uniform distribution
+        :type low: float
+        :param high: upper bound of the uniform distribution
+        :type high: float
+        :param median: median of the lognormal distribution
+        :type median: float
+        :param sigma: standard deviation of the logarithm of the latencies
+            of the lognormal distribution
+        :type sigma: float
+        :param stall_probability: probability of a stall, between 0 and 1
+        :type stall_probability: float
+        :param stall_duration: latency of a stall
+        :type stall_duration: float
+        :raises ValueError: when a parameter is invalid
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution {distribution!r}, expected "
+                + " or ".join(self.DISTRIBUTIONS)
+            )
+        if min(value, low, high, median, sigma, stall_duration) < 0:
+            raise ValueError("Latency parameters must not be negative")
+        if distribution == "uniform" and low > high:
+            raise ValueError(f"Uniform latency low {low} exceeds high {high}")
+        if distribution == "lognormal" and median <= 0:
+            raise ValueError("Lognormal latency median must be positive")
+        if not 0 <= stall_probability <= 1:
+            raise ValueError(
+                f"Stall probability must be in [0, 1], got {stall_probability}"
+            )
+        self.distribution = distribution
+        self.value = value
+        self.low = low
+        self.high = high
+        self.median = median
+        self.sigma = sigma
+        self.stall_probability = stall_probability
+        self.stall_duration = stall_duration
+
+    @classmethod
+    def from_dict(cls, parameters: dict) -> LatencyDistribution:
+        """Creates a distribution from its JSON parameters.
+
+        :param parameters: keyword arguments of the distribution
+        :type parameters: dict
+        :return: distribution
+        :rtype: LatencyDistribution
+        :raises ValueError: when a parameter is unknown or invalid
+        """
+        try:
+            return cls(**parameters)
+        except TypeError as exception:
+            raise ValueError(
+                f"Invalid latency distribution {parameters}: {exception}"
+            ) from exception
+
+    def to_dict(self) -> dict:
+        """Returns the JSON parameters of the distribution.
+
+        :return: parameters
+        :rtype: dict
+        """
+        parameters: dict[str, Any] = {"distribution": self.distribution}
+        if self.distribution == "fixed":
+            parameters["value"] = self.value
+        elif self.distribution == "uniform":
+            parameters.update(low=self.low, high=self.high)
+        else:
+            parameters.update(median=self.median, sigma=self.sigma)
+        if self.stall_probability:
+            parameters.update(
+                stall_probability=self.stall_probability,
+                stall_duration=self.stall_duration,
+            )
+        return parameters
+
+    def sample(self, rng: random.Random) -> float:
+        """Draws a latency.
+
+        :param rng: random number generator
+        :type rng: random.Random
+        :return: latency in seconds
+        :rtype: float
+        """
+        if self.stall_probability and rng.random() < self.stall_probability:
+            return self.stall_duration
+        if self.distribution == "fixed":
+            return self.value
+        if self.distribution == "uniform":
+            return rng.uniform(self.low, self.high)
+        return rng.lognormvariate(math.log(self.median), self.sigma)
+
+
+class LatencyProfile:
+    """The latencies of the commands and attributes of a helper device,
+    with the jitter and the drop probability of its change events."""
+
+    def __init__(
+        self,
+        commands: Optional[dict[str, LatencyDistribution]] = None,
+        attributes: Optional[dict[str, LatencyDistribution]] = None,
+        event_jitter: Optional[LatencyDistribution] = None,
+        drop_probability: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        :param commands: latency of the completion of the commands, by
+            command name
+        :type commands: dict[str, LatencyDistribution], optional
+        :param attributes: latency of the change events, by attribute name
+        :type attributes: dict[str, LatencyDistribution], optional
+        :param event_jitter: latency added to every change event
+        :type event_jitter: LatencyDistribution, optional
+        :param drop_probability: probability that a change event is not
+            pushed, between 0 and 1
+        :type drop_probability: float
+        :param seed: seed of the random number generator, for repeatable
+            runs
+        :type seed: int, optional
+        :raises ValueError: when the drop probability is not in [0, 1]
+        """
+        if not 0 <= drop_probability <= 1:
+            raise ValueError(
+                f"Drop probability must be in [0, 1], got {drop_probability}"
+            )
+        self.commands = dict(commands or {})
+        # Attribute names are case insensitive in Tango.
+        self.attributes = {
+            name.lower(): distribution
+            for name, distribution in (attributes or {}).items()
+        }
+        self.event_jitter = event_jitter
+        self.drop_probability = drop_probability
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_json(cls, profile_json: str) -> LatencyProfile:
+        """Creates a profile from its JSON representation, as set with the
+        SetLatencyProfile command of the helper devices.
+
+        :param profile_json: JSON profile
+        :type profile_json: str
+        :return: profile
+        :rtype: LatencyProfile
+        :raises ValueError: when the profile is invalid
+        """
+        parameters = json.loads(profile_json)
+        unknown_keys = set(parameters) - {
+            "commands",
+            "attributes",
+            "event_jitter",
+            "drop_probability",
+            "seed",
+        }
+        if unknown_keys:
+            raise ValueError(
+                f"Unknown latency profile keys: {sorted(unknown_keys)}"
+            )
+        event_jitter = parameters.get("event_jitter")
+        return cls(
+            commands={
+                name: LatencyDistribution.from_dict(distribution)
+                for name, distribution in parameters.get(
+                    "commands", {}
+                ).items()
+            },
+            attributes={
+                name: LatencyDistribution.from_dict(distribution)
+                for name, distribution in parameters.get(
+                    "attributes", {}
+                ).items()
+            },
+            event_jitter=(
+                LatencyDistribution.from_dict(event_jitter)
+                if event_jitter
+                else None
+            ),
+            drop_probability=parameters.get("drop_probability", 0.0),
+            seed=parameters.get("seed"),
+        )
+
+    def to_dict(self) -> dict:
+        """Returns the JSON representation of the profile.
+
+        :return: profile
+        :rtype: dict
+        """
+        profile: dict[str, Any] = {
+            "commands": {
+                name: distribution.to_dict()
+                for name, distribution in self.commands.items()
+            },
+            "attributes": {
+                name: distribution.to_dict()
+                for name, distribution in self.attributes.items()
+            },
+            "drop_probability": self.drop_probability,
+        }
+        if self.event_jitter is not None:
+            profile["event_jitter"] = self.event_jitter.to_dict()
+        if self.seed is not None:
+            profile["seed"] = self.seed
+        return profile
+
+    def command_latency(self, command_name: str) -> float:
+        """Draws the latency of the completion of the command.
+
+        :param command_name: name of the command
+        :type command_name: str
+        :return: latency in seconds, 0 if the command has no latency
+        :rtype: float
+        """
+        distribution = self.commands.get(command_name)
+        if distribution is None:
+            return 0.0
+        with self._lock:
+            return distribution.sample(self._rng)
+
+    def event_delay(
+        self, attr_name: str, command_name: Optional[str] = None
+    ) -> Optional[float]:
+        """Draws the delay of a change event of the attribute.
+
+        :param attr_name: name of the attribute
+        :type attr_name: str
+        :param command_name: name of the command whose result the event
+            carries, for the longRunningCommandResult events
+        :type command_name: str, optional
+        :return: delay in seconds, None if the event is dropped
+        :rtype: Optional[float]
+        """
+        with self._lock:
+            if (
+                self.drop_probability
+                and self._rng.random() < self.drop_probability
+            ):
+                return None
+            delay = 0.0
+            distribution = self.attributes.get(attr_name.lower())
+            if distribution is not None:
+                delay += distribution.sample(self._rng)
+            if self.event_jitter is not None:
+                delay += self.event_jitter.sample(self._rng)
+        if command_name is not None:
+            delay += self.command_latency(command_name)
+        return delay
+
+
+class LatencyInjector:
+    """Pushes the change events of a helper device according to its latency
+    profile: right away when the device has no profile, otherwise later on
+    the simulation scheduler, or not at all when the event is dropped."""
+
+    def __init__(
+        self,
+        scheduler: SimulationScheduler,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        :param scheduler: scheduler of the delayed events
+        :type scheduler: SimulationScheduler
+        :param logger: logger of the dropped events
+        :type logger: Logger, optional
+        """
+        self._scheduler = scheduler
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._last_due_times: dict[str, float] = {}
+        # Events of every attribute waiting on the scheduler, in the order
+        # they are pushed in.
+        self._pending_events: dict[str, deque] = {}
+        self.profile: Optional[LatencyProfile] = None
+        self.dropped_events: int = 0
+
+    def set_profile(self, profile_json: str) -> None:
+        """Sets the latency profile from its JSON representation. An empty
+        profile, {}, removes the profile.
+
+        :param profile_json: JSON profile
+        :type profile_json: str
+        :raises ValueError: when the profile is invalid
+        """
+        profile = LatencyProfile.from_json(profile_json)
+        self.profile = (
+            profile
+            if profile.commands
+            or profile.attributes
+            or profile.event_jitter
+            or profile.drop_probability
+            else None
+        )
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the latency profile.
+
+        :return: JSON profile, {} when the device has no profile
+        :rtype: str
+        """
+        if self.profile is None:
+            return json.dumps({})
+        return json.dumps(self.profile.to_dict())
+
+    def push_change_event(
+        self,
+        push: Callable,
+        attr_name: str,
+        *args,
+        command_name: Optional[str] = None,
+    ) -> None:
+        """Pushes the change event with the given push method, after the
+        delay drawn from the latency profile.
+
+        :param push: push_change_event method of the Tango device
+        :type push: Callable
+        :param attr_name: name of the attribute
+        :type attr_name: str
+        :param command_name: name of the command whose result the event
+            carries, whose latency is added to the delay of the event
+        :type command_name: str, optional
+        """
+        profile = self.profile
+        if profile is None:
+            push(attr_name, *args)
+            return
+        key = attr_name.lower()
+        delay = profile.event_delay(attr_name, command_name)
+        if delay is None:
+            self.dropped_events += 1
+            if self._logger:
+                self._logger.info("Dropped %s change event", attr_name)
+            return
+        clock = self._scheduler.clock
+        with self._lock:
+            now = clock.monotonic()
+            due_time = max(now + delay, self._last_due_times.get(key, now))
+            self._last_due_times[key] = due_time
+            pending_events = self._pending_events.setdefault(key, deque())
+            push_now = due_time <= now and not pending_events
+            if not push_now:
+                pending_events.append((push, attr_name, args))
+        if push_now:
+            push(attr_name, *args)
+        else:
+            self._scheduler.call_later(due_time - now, self._push_next, key)
+
+    def _push_next(self, key: str) -> None:
+        """Pushes the oldest pending event of the attribute. The event is
+        removed once pushed, so that an event pushed meanwhile waits for
+        it."""
+        with self._lock:
+            push, attr_name, args = self._pending_events[key][0]
+        try:
+            push(attr_name, *args)
+        finally:
+            with self._lock:
+                self._pending_events[key].popleft()
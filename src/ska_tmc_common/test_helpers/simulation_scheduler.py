@@ -0,0 +1,221 @@
+"""
+This module contains the scheduler shared by the helper devices of a device
+server to simulate their delayed transitions, such as obsState changes and
+long running command results, from a single thread.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+import tango
+
+from ska_tmc_common.clock import Clock, get_clock
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+SCHEDULER_THREAD_NAME: str = "helper_simulation_scheduler"
+
+
+class ScheduledCall:
+    """
+    A call scheduled on the simulation scheduler. It has the start and
+    cancel methods of threading.Timer, so that it can be used in place of
+    one.
+    """
+
+    __slots__ = (
+        "_scheduler",
+        "interval",
+        "function",
+        "args",
+        "kwargs",
+        "due_time",
+        "cancelled",
+    )
+
+    def __init__(
+        self,
+        scheduler: SimulationScheduler,
+        interval: float,
+        function: Callable,
+        args: Optional[list] = None,
+        kwargs: Optional[dict] = None,
+    ) -> None:
+        self._scheduler = scheduler
+        self.interval: float = interval
+        self.function: Callable = function
+        self.args: list = args or []
+        self.kwargs: dict = kwargs or {}
+        self.due_time: Optional[float] = None
+        self.cancelled: bool = False
+
+    def start(self) -> None:
+        """Schedules the call after its interval."""
+        self._scheduler.schedule(self)
+
+    def cancel(self) -> None:
+        """Cancels the call, if it has not been made yet."""
+        self.cancelled = True
+
+    def run(self) -> Any:
+        """Makes the call.
+
+        :return: result of the call
+        :rtype: Any
+        """
+        return self.function(*self.args, **self.kwargs)
+
+
+class SimulationScheduler:
+    """
+    Makes the scheduled calls of all the helper devices of a process from a
+    single thread, in the order of their due time, the calls due at the
+    same time being made in the order they were scheduled. The thread is
+    started with the first scheduled call.
+
+    The scheduled calls must not block, as they delay all the calls due
+    after them: a sequence of transitions is simulated by scheduling one
+    call per transition.
+
+    The delays are measured on the clock of the process, so that the
+    simulated transitions follow an accelerated or virtual clock.
+
+    The scheduler shared by all the helper devices of a process is provided
+    by get_instance.
+    """
+
+    _instance: Optional[SimulationScheduler] = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(
+        self, logger: logging.Logger = LOGGER, clock: Optional[Clock] = None
+    ) -> None:
+        """
+        :param logger: logger
+        :type logger: logging.Logger
+        :param clock: clock measuring the delays, defaults to the clock of
+            the process
+        :type clock: Clock, optional
+        """
+        self._logger = logger
+        self._clock = clock
+        self._queue: list[tuple[float, int, ScheduledCall]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_instance(cls) -> SimulationScheduler:
+        """Returns the scheduler shared by the whole process.
+
+        :return: process level simulation scheduler
+        :rtype: SimulationScheduler
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @property
+    def clock(self) -> Clock:
+        """Returns the clock measuring the delays.
+
+        :return: clock
+        :rtype: Clock
+        """
+        return self._clock or get_clock()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return sum(1 for *_, call in self._queue if not call.cancelled)
+
+    def timer(
+        self,
+        interval: float,
+        function: Callable,
+        args: Optional[list] = None,
+        kwargs: Optional[dict] = None,
+    ) -> ScheduledCall:
+        """Creates a call of the function after the interval, made once
+        started. It takes the arguments of threading.Timer.
+
+        :param interval: delay in seconds between the start and the call
+        :type interval: float
+        :param function: function to call
+        :type function: Callable
+        :param args: positional arguments of the call
+        :type args: list, optional
+        :param kwargs: keyword arguments of the call
+        :type kwargs: dict, optional
+        :return: call, to be started
+        :rtype: ScheduledCall
+        """
+        return ScheduledCall(self, interval, function, args, kwargs)
+
+    def call_later(
+        self, delay: float, function: Callable, *args, **kwargs
+    ) -> ScheduledCall:
+        """Schedules a call of the function after the delay.
+
+        :param delay: delay in seconds
+        :type delay: float
+        :param function: function to call
+        :type function: Callable
+        :return: scheduled call
+        :rtype: ScheduledCall
+        """
+        call = ScheduledCall(self, delay, function, list(args), kwargs)
+        self.schedule(call)
+        return call
+
+    def schedule(self, call: ScheduledCall) -> None:
+        """Schedules the call after its interval.
+
+        :param call: call to schedule
+        :type call: ScheduledCall
+        """
+        with self._condition:
+            call.due_time = self.clock.monotonic() + max(0.0, call.interval)
+            heapq.heappush(
+                self._queue, (call.due_time, next(self._sequence), call)
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=SCHEDULER_THREAD_NAME, daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _next_call(self) -> ScheduledCall:
+        """Waits for the next due call and removes it from the queue."""
+        with self._condition:
+            while True:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                clock = self.clock
+                delay = self._queue[0][0] - clock.monotonic()
+                if delay > 0:
+                    clock.wait(self._condition, delay)
+                    continue
+                return heapq.heappop(self._queue)[2]
+
+    def _run(self) -> None:
+        """Makes the calls as they become due."""
+        with tango.EnsureOmniThread():
+            while True:
+                call = self._next_call()
+                if call.cancelled:
+                    continue
+                try:
+                    call.run()
+                except Exception as exception:
+                    self._logger.exception(
+                        "Error occurred in scheduled call of %s: %s",
+                        getattr(call.function, "__name__", call.function),
+                        exception,
+                    )
@@ -3,6 +3,7 @@
 import threading
 from logging import Logger
 
+from ska_tmc_common.clock import get_clock
 from ska_tmc_common.enum import TimeoutState
 from ska_tmc_common.timeout_callback import TimeoutCallback
 
@@ -21,8 +22,8 @@ class TimeKeeper:
         self, timeout_id: str, timeout_callback: TimeoutCallback
     ) -> None:
         """Starts a timer for the command execution which will run for the
-        specified amount of time. After the timer runs out, it will execute the
-        timeout handler method.
+        specified amount of time, measured on the clock of the process. After
+        the timer runs out, it will execute the timeout handler method.
 
         :param timeout_id: Id for TimeoutCallback class object.
         :type timeout_id: str
@@ -34,7 +35,7 @@ class TimeKeeper:
         :rtype: None
         """
         try:
-            self.timer_object = threading.Timer(
+            self.timer_object = get_clock().timer(
                 interval=self.time_out,
                 function=self.timeout_handler,
                 args=[timeout_id, timeout_callback],
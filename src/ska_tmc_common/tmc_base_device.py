@@ -107,6 +107,162 @@ class TMCBaseDevice(SKABaseDevice):
         """
         return self.component_manager.component.to_json()
 
+    @attribute(
+        dtype="DevString",
+        doc="Json String representing the round-trip latency statistics \
+            of the monitored devices.",
+    )
+    def latencySummary(self) -> str:
+        """
+        Returns the latency statistics of the monitored devices
+        :return: latency summary
+        """
+        return self.latencySummary_read()
+
+    def latencySummary_read(self) -> str:
+        """
+        This method returns the rolling min, mean and p99 round-trip
+        latency in microseconds of every monitored device, as measured by
+        the liveliness probe, together with the slowest device. Component
+        managers which do not measure the latency report an empty summary.
+        :return: json string with the latency summary
+        Sample Output:
+        {"devices": {"mccs": {"min": 310, "mean": 402.5, "p99": 980,
+        "last": 350, "count": 100}}, "slowest_device": "mccs"}
+        """
+        get_latency_summary = getattr(
+            self.component_manager, "get_latency_summary", None
+        )
+        if get_latency_summary is None:
+            return json.dumps({"devices": {}, "slowest_device": None})
+        return json.dumps(get_latency_summary())
+
+    @attribute(
+        dtype="DevString",
+        doc="Json String representing the latency histograms of the \
+            change events.",
+    )
+    def eventLatency(self) -> str:
+        """
+        Returns the latency histograms of the change events
+        :return: event latency
+        """
+        return self.eventLatency_read()
+
+    def eventLatency_read(self) -> str:
+        """
+        This method returns, per device attribute, the latency statistics
+        in microseconds of the change events for each stage of their
+        delivery: transport from the subordinate device, wait in the event
+        queue, handler time and end to end, and on leaf nodes the time of
+        the event callback queueing the event. The statistics are only
+        recorded when the event latency instrumentation of the component
+        manager is enabled.
+        :return: json string with the event latency
+        Sample Output:
+        {"mccs/obsState": {"handler": {"count": 10, "min": 40, "mean": 52.3,
+        "max": 90, "p50": 51, "p90": 63, "p99": 90, "p999": 90}, ...}}
+        """
+        get_event_latency = getattr(
+            self.component_manager, "get_event_latency", None
+        )
+        if get_event_latency is None:
+            return json.dumps({})
+        return json.dumps(get_event_latency())
+
+    @attribute(
+        dtype="DevString",
+        doc="Json String representing the event timeout error rates of \
+            the subscribed attributes.",
+    )
+    def eventErrorRates(self) -> str:
+        """
+        Returns the event timeout error rates of the subscribed attributes
+        :return: event error rates
+        """
+        return self.eventErrorRates_read()
+
+    def eventErrorRates_read(self) -> str:
+        """
+        This method returns the number of event timeout errors of every
+        attribute within the sliding window of the event manager, which
+        triggers a resubscription when more than max_count errors are
+        received within the window. Component managers without event error
+        detector report an empty object.
+        :return: json string with the event error rates
+        Sample Output:
+        {"window": 300.0, "max_count": 10, "devices": {"mccs": {"obsState":
+        {"errors_in_window": 3, "rate_per_minute": 0.6}}}}
+        """
+        get_event_error_rates = getattr(
+            self.component_manager, "get_event_error_rates", None
+        )
+        if get_event_error_rates is None:
+            return json.dumps({})
+        return json.dumps(get_event_error_rates())
+
+    @attribute(
+        dtype="DevString",
+        doc="Json String representing the metrics of the event manager, \
+            the liveliness probe, the commands and the event queues.",
+    )
+    def metrics(self) -> str:
+        """
+        Returns the metrics of the device
+        :return: metrics
+        """
+        return self.metrics_read()
+
+    def metrics_read(self) -> str:
+        """
+        This method returns the counters, gauges and histograms of the
+        metrics registry of the component manager: event subscriptions,
+        errors and resubscriptions, liveliness probe results, cycle time
+        and unresponsive devices, commands in flight and their duration per
+        result, event queue depths and thread count. Component managers
+        without metrics registry report an empty object.
+        :return: json string with the metrics
+        Sample Output:
+        {"tmc_event_errors_total": {"type": "counter", "help": "Change
+        events received with an error", "samples": [{"labels": {},
+        "value": 3}]}, ...}
+        """
+        get_metrics = getattr(self.component_manager, "get_metrics", None)
+        if get_metrics is None:
+            return json.dumps({})
+        return json.dumps(get_metrics())
+
+    @attribute(
+        dtype="DevString",
+        doc="Metrics of the device in the Prometheus text exposition \
+            format.",
+    )
+    def metricsPrometheus(self) -> str:
+        """
+        Returns the metrics of the device in the Prometheus text format
+        :return: metrics
+        """
+        return self.metricsPrometheus_read()
+
+    def metricsPrometheus_read(self) -> str:
+        """
+        This method returns the metrics of the metrics attribute in the
+        Prometheus text exposition format, so that they can be scraped
+        through a Tango to Prometheus exporter. Component managers without
+        metrics registry report an empty string.
+        :return: metrics in the Prometheus text format
+        Sample Output:
+        # HELP tmc_event_errors_total Change events received with an error
+        # TYPE tmc_event_errors_total counter
+        tmc_event_errors_total 3
+        """
+        get_metrics_prometheus = getattr(
+            self.component_manager, "get_metrics_prometheus", None
+        )
+        if get_metrics_prometheus is None:
+            return ""
+        return get_metrics_prometheus()
+
     def create_component_manager(self):
         """
         Create and return a component manager for this device.
@@ -28,6 +28,7 @@ from ska_tmc_common.adapters import (
     SdpSubArrayAdapter,
     SubarrayAdapter,
 )
+from ska_tmc_common.clock import get_clock
 from ska_tmc_common.enum import TimeoutState
 from ska_tmc_common.lrcr_callback import LRCRCallback
 from ska_tmc_common.op_state_model import TMCOpStateModel
@@ -333,7 +334,7 @@ class BaseTMCCommand:
                 # pylint: enable=broad-exception-caught
                 if self._stop:
                     break
-                time.sleep(0.5)
+                get_clock().sleep(0.5)
 
             if command_id:
                 lrcr_callback.remove_data(command_id)
@@ -18,6 +18,7 @@ import tango
 from ska_tango_base.control_model import AdminMode, HealthState
 from ska_tango_base.executor import TaskExecutorComponentManager
 
+from ska_tmc_common.clock import get_clock
 from ska_tmc_common.device_info import (
     DeviceInfo,
     DishDeviceInfo,
@@ -252,8 +253,8 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
         self, timeout_id: str, timeout: int, timeout_callback: TimeoutCallback
     ) -> None:
         """Starts a timer for the command execution which will run for given
-        amount of seconds. After the timer runs out, it will execute the
-        task failed method.
+        amount of seconds, measured on the clock of the process. After the
+        timer runs out, it will execute the task failed method.
 
         :param timeout_id: Id for TimeoutCallback class object.
 
@@ -263,7 +264,7 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
                     as a callable functions to call in the event of timeout.
         """
         try:
-            self.timer_object = threading.Timer(
+            self.timer_object = get_clock().timer(
                 interval=timeout,
                 function=self.timeout_handler,
                 args=[timeout_id, timeout_callback],
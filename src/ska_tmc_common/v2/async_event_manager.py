@@ -0,0 +1,671 @@
+"""
+This module contains an asyncio based variant of the event manager, which
+runs all subscriptions, retries, resubscriptions and event error handling
+as tasks on a single event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import itertools
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional
+
+import tango
+from tango.asyncio_executor import AsyncioExecutor
+
+from ska_tmc_common.dev_factory import DevFactory
+from ska_tmc_common.log_manager import LogManager
+from ska_tmc_common.v2.event_manager import (
+    API_EVENT_TIMEOUT,
+    COMPLETION_INDICATOR_KEY,
+    EVENT_ERROR_DESC,
+    EVENT_ERRORS_METRIC,
+    LOGGER,
+    RESUBSCRIPTIONS_METRIC,
+    SUBSCRIPTIONS_METRIC,
+    EventManager,
+)
+
+if TYPE_CHECKING:
+    from tmc_component_manager import (
+        TmcComponentManager,
+        TmcLeafNodeComponentManager,
+    )
+
+EVENT_LOOP_THREAD_NAME: str = "async_event_manager_loop"
+PROXY_CREATION_THREAD_NAME_PREFIX: str = "async_event_manager_proxy"
+
+
+async def _resolve(result: Any) -> Any:
+    """Awaits the result of a Tango call if the proxy is in asyncio green
+    mode, else returns it as is, as the proxies of a test context are
+    synchronous."""
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+# pylint: disable=too-many-instance-attributes
+class AsyncEventManager(EventManager):
+    """
+    This class provides the event subscription management of EventManager
+    on a single asyncio event loop. Subscriptions, retries, resubscriptions
+    and event error handling run as tasks on that loop instead of as
+    threads and timers, so the number of threads stays constant however
+    many attributes are subscribed. Tango proxies are created in asyncio
+    green mode, on a small pool of threads, as their creation connects to
+    the device and would otherwise block the event loop. They are bound to
+    a Tango asyncio executor created in the thread of the event loop, so
+    that their calls are awaited on that loop, and are created again when
+    the event loop is restarted.
+
+    The ids returned by start_event_subscription and
+    unsubscribe_event_async identify tasks, and can be passed to
+    cancel_subscription_thread and cancel_unsubscription_thread.
+    """
+
+    def __init__(
+        self,
+        component_manager: TmcComponentManager | TmcLeafNodeComponentManager,
+        subscription_configuration: Optional[dict[str, list]] = None,
+        logger: logging.Logger = LOGGER,
+        stateless: bool = True,
+        event_subscription_check_period: int = 1,
+        event_error_max_count: int = 10,
+        status_update_callback: Optional[Callable] = None,
+        maximum_status_queue_size: int = 50,
+        max_concurrent_subscriptions: int = 64,
+        proxy_creation_workers: int = 4,
+        **kwargs,
+    ) -> None:
+        """This method initialises the event manager class instances with
+        necessary configurations. The parameters are the ones of
+        EventManager, plus:
+
+        :param max_concurrent_subscriptions: Maximum number of devices being
+            subscribed at the same time, defaults to 64.
+        :type max_concurrent_subscriptions: int
+        :param proxy_creation_workers: Number of threads creating the device
+            proxies, defaults to 4.
+        :type proxy_creation_workers: int
+        :param kwargs: further keyword arguments of EventManager, such as
+            event_error_window.
+        """
+        super().__init__(
+            component_manager,
+            subscription_configuration,
+            logger,
+            stateless,
+            event_subscription_check_period,
+            event_error_max_count,
+            status_update_callback,
+            maximum_status_queue_size,
+            **kwargs,
+        )
+        self._logger: logging.Logger = logger
+        self._component_manager = component_manager
+        self._event_subscription_check_period = event_subscription_check_period
+        self._max_concurrent_subscriptions = max_concurrent_subscriptions
+        self._device_factory = DevFactory()
+        self._proxies: dict[str, tango.DeviceProxy] = {}
+        self._asyncio_executor: Optional[AsyncioExecutor] = None
+        self._proxy_creation_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=proxy_creation_workers,
+            thread_name_prefix=PROXY_CREATION_THREAD_NAME_PREFIX,
+        )
+        self._log_manager: LogManager = LogManager(10)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._task_ids = itertools.count(1)
+        self._tasks: dict[int, concurrent.futures.Future] = {}
+        self._tasks_lock = threading.Lock()
+        self._subscription_counters = {
+            succeeded: self.metrics_registry.counter(
+                SUBSCRIPTIONS_METRIC,
+                labels={"result": "success" if succeeded else "failure"},
+            )
+            for succeeded in (True, False)
+        }
+        self._event_error_counter = self.metrics_registry.counter(
+            EVENT_ERRORS_METRIC
+        )
+        self._resubscription_counter = self.metrics_registry.counter(
+            RESUBSCRIPTIONS_METRIC
+        )
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """This method provides the event loop of the event manager,
+        starting it on first use.
+
+        :return: Returns the event loop.
+        :rtype: asyncio.AbstractEventLoop
+        """
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._semaphore = None
+                self._loop_thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(self._loop,),
+                    name=EVENT_LOOP_THREAD_NAME,
+                    daemon=True,
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    @property
+    def active_task_count(self) -> int:
+        """This method provides the number of subscription, unsubscription
+        and error handling tasks not yet completed.
+
+        :return: Returns the number of active tasks.
+        :rtype: int
+        """
+        with self._tasks_lock:
+            return len(self._tasks)
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """Runs the event loop in the current thread until it is stopped."""
+        with tango.EnsureOmniThread():
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_forever()
+            finally:
+                loop.close()
+
+    def _in_loop_thread(self) -> bool:
+        """Checks whether the caller runs in the event loop thread."""
+        return threading.current_thread() is self._loop_thread
+
+    def submit(self, coroutine: Coroutine) -> int:
+        """This method schedules the coroutine as a task on the event loop.
+
+        :param coroutine: The coroutine to run.
+        :type coroutine: Coroutine
+        :return: Returns the task id
+        :rtype: int
+        """
+        return self._schedule(coroutine)[0]
+
+    def _schedule(
+        self, coroutine: Coroutine
+    ) -> tuple[int, concurrent.futures.Future]:
+        """Schedules the coroutine on the event loop and keeps track of it
+        until it completes."""
+        task_id: int = next(self._task_ids)
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        with self._tasks_lock:
+            self._tasks[task_id] = future
+        future.add_done_callback(lambda _: self._discard_task(task_id))
+        return task_id, future
+
+    def _discard_task(self, task_id: int) -> None:
+        """Forgets a completed task."""
+        with self._tasks_lock:
+            self._tasks.pop(task_id, None)
+
+    def cancel_task(self, task_id: int) -> None:
+        """This method cancels the task with the given id, if it is still
+        running.
+
+        :param task_id: task id
+        :type task_id: int
+        """
+        with self._tasks_lock:
+            future = self._tasks.get(task_id)
+        if future is not None:
+            future.cancel()
+
+    def stop(self) -> None:
+        """This method cancels all the tasks, stops the event loop and the
+        threads of EventManager."""
+        with self._tasks_lock:
+            futures = list(self._tasks.values())
+        for future in futures:
+            future.cancel()
+        with self._loop_lock:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+        super().stop()
+
+    def start_event_subscription(
+        self,
+        subscription_configuration: Optional[dict[str, list]] = None,
+        timeout: int = 1000,
+    ) -> int:
+        """This method starts a task to subscribe events.
+
+        :param subscription_configuration: This is optional parameter,
+            if user wants to start the task with different configuration.
+        :type subscription_configuration: dict[str, list], optional
+        :param timeout: The duration till when it will try to subscribe,
+            defaults to 1000 seconds.
+        :type timeout: int
+        :return: Returns the task id
+        :rtype: int
+        """
+        subscription_configuration = dict(
+            subscription_configuration or self.subscription_configruation or {}
+        )
+        return self.submit(
+            self.async_subscribe_events(subscription_configuration, timeout)
+        )
+
+    def cancel_subscription_thread(self, thread_id: int) -> None:
+        """This method cancels the event subscription task.
+
+        :param thread_id: Task id to be stopped
+        :type thread_id: int
+        """
+        self.cancel_task(thread_id)
+
+    def cancel_unsubscription_thread(self, thread_id: int) -> None:
+        """This method cancels the unsubscription task.
+
+        :param thread_id: task id
+        :type thread_id: int
+        """
+        self.cancel_task(thread_id)
+
+    def get_device_proxy(
+        self,
+        device_name: str,
+        asyncio_executor: Optional[AsyncioExecutor] = None,
+    ) -> tango.DeviceProxy:
+        """This method creates the device proxy for the provided device
+        name. The proxy is in asyncio green mode when an asyncio executor is
+        given, else it is the synchronous proxy used by the attribute
+        poller thread.
+
+        :param device_name: Tango device FQDN.
+        :type device_name: str
+        :param asyncio_executor: Tango asyncio executor of the event loop.
+        :type asyncio_executor: AsyncioExecutor, optional
+        :return: Returns device proxy
+        :rtype: tango.DeviceProxy
+        """
+        try:
+            if asyncio_executor is None:
+                return self._device_factory.get_device(device_name)
+            return self._device_factory.get_device(
+                device_name,
+                green_mode=tango.GreenMode.Asyncio,
+                asyncio_executor=asyncio_executor,
+            )
+        except Exception as exception:
+            if self._log_manager.is_logging_allowed(f"{device_name}_log"):
+                self._logger.error(
+                    "Following exception occured: %s "
+                    "while connecting with device : %s",
+                    exception,
+                    device_name,
+                )
+            return None
+
+    async def async_get_device_proxy(
+        self, device_name: str
+    ) -> Optional[tango.DeviceProxy]:
+        """This coroutine provides the cached asyncio device proxy for the
+        provided device name. The proxy is created on the proxy creation
+        pool, so that connecting to a slow or down device does not block the
+        other subscriptions.
+
+        :param device_name: Tango device FQDN.
+        :type device_name: str
+        :return: Returns device proxy, None if it could not be created
+        :rtype: tango.DeviceProxy
+        """
+        asyncio_executor = self._get_asyncio_executor()
+        proxy = self._proxies.get(device_name)
+        if proxy is None:
+            proxy = await asyncio_executor.loop.run_in_executor(
+                self._proxy_creation_pool,
+                functools.partial(
+                    self.get_device_proxy, device_name, asyncio_executor
+                ),
+            )
+            if proxy is not None:
+                self._proxies[device_name] = proxy
+        return proxy
+
+    def _get_asyncio_executor(self) -> AsyncioExecutor:
+        """Returns the Tango asyncio executor of the running event loop.
+        It is created in the thread of the loop, on first use, and the
+        proxies bound to the executor of a previous loop are discarded."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._asyncio_executor is None
+            or self._asyncio_executor.loop is not loop
+        ):
+            self._asyncio_executor = AsyncioExecutor(loop=loop)
+            self._proxies.clear()
+        return self._asyncio_executor
+
+    def subscribe_events(
+        self, subscription_configuration: dict[str, list], timeout: int = 1000
+    ) -> None:
+        """This function subscribes to the attributes of the subscription
+        configuration and waits for the subscription to end.
+
+        :param subscription_configuration: The variable contains the detail
+            of devices and their attributes to be subscribed.
+            For Example: {"device_name":["attribute1","attribute2"]}.
+        :type subscription_configuration: dict[str, list]
+        :param timeout: The duration till when it will try to subscribe,
+            defaults to 1000 seconds
+        :type timeout: int
+        """
+        self._run(
+            self.async_subscribe_events(subscription_configuration, timeout)
+        )
+
+    async def async_subscribe_events(
+        self, subscription_configuration: dict[str, list], timeout: int = 1000
+    ) -> None:
+        """This coroutine subscribes to the attributes of the subscription
+        configuration, retrying every event subscription check period until
+        all the devices are subscribed or the timeout expires. Devices are
+        subscribed concurrently. The devices still not subscribed are added
+        to the pending configuration.
+
+        :param subscription_configuration: The variable contains the detail
+            of devices and their attributes to be subscribed.
+        :type subscription_configuration: dict[str, list]
+        :param timeout: The duration till when it will try to subscribe,
+            defaults to 1000 seconds
+        :type timeout: int
+        """
+        loop = asyncio.get_running_loop()
+        deadline: float = loop.time() + timeout
+        try:
+            while subscription_configuration and loop.time() < deadline:
+                await asyncio.gather(
+                    *(
+                        self._subscribe_device(device_name, attribute_names)
+                        for device_name, attribute_names in list(
+                            subscription_configuration.items()
+                        )
+                    )
+                )
+                self.remove_subscribed_devices(subscription_configuration)
+                if subscription_configuration:
+                    await asyncio.sleep(self._event_subscription_check_period)
+        finally:
+            if subscription_configuration:
+                self.pending_configuration.update(subscription_configuration)
+
+    async def _subscribe_device(
+        self, device_name: str, attribute_names: list
+    ) -> None:
+        """Subscribes to the attributes of the device not yet subscribed."""
+        async with self._get_semaphore():
+            self.init_device_subscriptions(device_name)
+            if not self._component_manager.check_device_responsiveness(
+                device_name
+            ):
+                return
+            proxy = await self.async_get_device_proxy(device_name)
+            if not proxy:
+                return
+            subscription_completion: list = []
+            for attribute_name in attribute_names:
+                if self.subscription_registry.is_subscribed(
+                    device_name, attribute_name
+                ):
+                    continue
+                try:
+                    subscription_id: int = await _resolve(
+                        proxy.subscribe_event(
+                            attribute_name,
+                            tango.EventType.CHANGE_EVENT,
+                            getattr(
+                                self,
+                                f"{attribute_name.lower()}_event_callback",
+                            ),
+                            stateless=self.stateless_flag,
+                        )
+                    )
+                    self.update_device_subscriptions(
+                        device_name, attribute_name, subscription_id
+                    )
+                    self._subscription_counters[True].inc()
+                    subscription_completion.append(True)
+                except Exception as exception:
+                    if self._log_manager.is_logging_allowed(
+                        f"{attribute_name}_log"
+                    ):
+                        self._logger.error(
+                            "Following exception occured: %s"
+                            "while subscribing to attribute : %s"
+                            + "of device: %s",
+                            exception,
+                            attribute_name,
+                            device_name,
+                        )
+                    self._subscription_counters[False].inc()
+                    subscription_completion.append(False)
+            self.update_device_subscriptions(
+                device_name,
+                is_subscription_completed=all(subscription_completion),
+            )
+
+    def unsubscribe_event_async(
+        self, device_name: str, attribute_names: Optional[list] = None
+    ) -> int:
+        """This method starts a task to unsubscribe the events of the
+        specified device name or some attributes under that device name.
+
+        :param device_name: This variable consists of device name whose events
+            needs to be unsubscribed.
+        :type device_name: str
+        :param attribute_names: This list contains names of specific attributes
+            that needs to be unsubscribed.
+        :type attribute_names: list, optional
+        :return: Returns the task id
+        :rtype: int
+        """
+        return self.submit(
+            self.async_unsubscribe_events(device_name, attribute_names)
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Returns the semaphore bounding the number of devices subscribed
+        or unsubscribed concurrently, created on the event loop on first
+        use."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(
+                self._max_concurrent_subscriptions
+            )
+        return self._semaphore
+
+    def unsubscribe_devices(
+        self, device_configuration: dict[str, Optional[list]]
+    ) -> tuple[int, concurrent.futures.Future]:
+        """This method unsubscribes the events of many devices in a single
+        task on the event loop, at most max_concurrent_subscriptions
+        devices at once. The unsubscription can be cancelled by providing
+        the returned id to cancel_unsubscription_thread, or by cancelling
+        the returned future.
+
+        :param device_configuration: attribute names to unsubscribe per
+            device name. All the subscribed attributes of a device are
+            unsubscribed when its attribute names are None.
+        :type device_configuration: dict[str, list | None]
+        :return: Returns the task id, and a future completed with the
+            unsubscribed attributes per device.
+        :rtype: tuple[int, concurrent.futures.Future]
+        """
+        return self._schedule(
+            self.async_unsubscribe_devices(dict(device_configuration))
+        )
+
+    async def async_unsubscribe_devices(
+        self, device_configuration: dict[str, Optional[list]]
+    ) -> dict[str, list[str]]:
+        """This coroutine unsubscribes the events of many devices
+        concurrently.
+
+        :param device_configuration: attribute names to unsubscribe per
+            device name. All the subscribed attributes of a device are
+            unsubscribed when its attribute names are None.
+        :type device_configuration: dict[str, list | None]
+        :return: Returns the unsubscribed attributes per device.
+        :rtype: dict[str, list[str]]
+        """
+        registry = self.subscription_registry
+        semaphore = self._get_semaphore()
+
+        async def unsubscribe_device(
+            device_name: str, attribute_names: Optional[list]
+        ) -> list[str]:
+            async with semaphore:
+                attribute_list = [
+                    attribute_name
+                    for attribute_name in (
+                        attribute_names
+                        or registry.subscribed_attributes(device_name)
+                    )
+                    if attribute_name != COMPLETION_INDICATOR_KEY
+                ]
+                await self.async_unsubscribe_events(
+                    device_name, attribute_list
+                )
+                return [
+                    attribute_name
+                    for attribute_name in attribute_list
+                    if not registry.is_subscribed(device_name, attribute_name)
+                ]
+
+        results = await asyncio.gather(
+            *(
+                unsubscribe_device(device_name, attribute_names)
+                for device_name, attribute_names in (
+                    device_configuration.items()
+                )
+            )
+        )
+        return dict(zip(device_configuration, results))
+
+    def unsubscribe_events(
+        self, device_name: str, attribute_names: Optional[list] = None
+    ) -> None:
+        """This method unsubcribes the events of the specified device name
+        or some attributes under that device name, and waits for the
+        unsubscription to complete.
+
+        :param device_name: This variable consists of device name whose events
+            needs to be unsubscribed.
+        :type device_name: str
+        :param attribute_names: This list contains names of specific attributes
+            that needs to be unsubscribed.
+        :type attribute_names: list, optional
+        """
+        self._run(self.async_unsubscribe_events(device_name, attribute_names))
+
+    async def async_unsubscribe_events(
+        self, device_name: str, attribute_names: Optional[list] = None
+    ) -> None:
+        """This coroutine unsubcribes the events of the specified device
+        name or some attributes under that device name.
+
+        :param device_name: This variable consists of device name whose events
+            needs to be unsubscribed.
+        :type device_name: str
+        :param attribute_names: This list contains names of specific attributes
+            that needs to be unsubscribed.
+        :type attribute_names: list, optional
+        """
+        try:
+            registry = self.subscription_registry
+            attribute_list = attribute_names or registry.subscribed_attributes(
+                device_name
+            )
+            proxy = await self.async_get_device_proxy(device_name)
+            for attribute_name in attribute_list:
+                if attribute_name == COMPLETION_INDICATOR_KEY:
+                    continue
+                await _resolve(
+                    proxy.unsubscribe_event(
+                        registry.get_subscription_id(
+                            device_name, attribute_name
+                        )
+                    )
+                )
+                registry.remove_subscription(device_name, attribute_name)
+        except Exception as exception:
+            self._logger.error(
+                "Error occurred while unsubscribing: %s", exception
+            )
+
+    def _run(self, coroutine: Coroutine) -> None:
+        """Runs the coroutine on the event loop and waits for it, unless
+        the caller is the event loop itself, in which case the coroutine
+        is only scheduled."""
+        if self._in_loop_thread():
+            self.loop.create_task(coroutine)
+            return
+        _, future = self._schedule(coroutine)
+        try:
+            future.result()
+        except concurrent.futures.CancelledError:
+            pass
+
+    def check_and_handle_event_error(self, event: tango.EventData) -> bool:
+        """Checks event error and handles the API timeout error, if it
+        persists, in a task on the event loop.
+
+        :param event: Change event data
+        :type event: tango.EventData
+        :return: Returns True if event data has error,
+            else returns False.
+        :rtype: bool
+        """
+        if not event.err:
+            return False
+        self._event_error_counter.inc()
+        self.submit(self.async_handle_event_error(event))
+        return True
+
+    async def async_handle_event_error(self, event: tango.EventData) -> None:
+        """This coroutine handles the event error by tracking the event
+        timeouts of the attribute, and resubscribes the attribute when they
+        persist.
+
+        :param event: change event data with error.
+        :type event: tango.EventData
+        """
+        if self._log_manager.is_logging_allowed(
+            f"{event.attr_name}_error_log"
+        ):
+            error_message: str = f"Change event error: {event.errors}"
+            self._logger.error(error_message)
+            self.update_status_queue(error_message)
+        if (
+            event.errors[0].reason == API_EVENT_TIMEOUT
+            and EVENT_ERROR_DESC in event.errors[0].desc
+        ):
+            device_name, attribute_name = self.get_device_and_attribute_name(
+                event.attr_name
+            )
+            if self.record_event_timeout(device_name, attribute_name):
+                self.update_status_queue(
+                    f"Resubscribing attribute: {attribute_name}"
+                    f" of device: {device_name}"
+                )
+                self._resubscription_counter.inc()
+                await self.async_unsubscribe_events(
+                    device_name, [attribute_name]
+                )
+                await self.async_subscribe_events(
+                    {device_name: [attribute_name]}
+                )
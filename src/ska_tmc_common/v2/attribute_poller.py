@@ -0,0 +1,233 @@
+"""
+This module contains the attribute poller used by the event manager as a
+fallback for the attributes whose change events cannot be subscribed.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Optional
+
+import tango
+
+from ska_tmc_common.log_manager import LogManager
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+POLLER_THREAD_NAME: str = "event_manager_attribute_poller"
+
+
+class PolledEventData:
+    """
+    Event data built from a polled attribute value. It provides the members
+    of tango.EventData used by the event callbacks, so that the polled
+    values are handled by the same callbacks as the change events.
+    """
+
+    __slots__ = (
+        "device",
+        "attr_name",
+        "attr_value",
+        "err",
+        "errors",
+        "event",
+        "reception_date",
+    )
+
+    def __init__(
+        self,
+        device: tango.DeviceProxy,
+        attr_name: str,
+        attr_value: tango.DeviceAttribute,
+    ) -> None:
+        self.device = device
+        self.attr_name: str = attr_name
+        self.attr_value: tango.DeviceAttribute = attr_value
+        self.err: bool = False
+        self.errors: tuple = ()
+        self.event: str = "change"
+        self.reception_date: tango.TimeVal = tango.TimeVal.now()
+
+
+class AttributePoller:
+    """
+    Periodically reads the polled attributes and forwards their values to
+    the event callbacks. The attributes of a device are read together with
+    a single read_attributes call per period. The polling thread is started
+    when the first attribute is added and exits once no attribute is left.
+    """
+
+    def __init__(
+        self,
+        get_device_proxy: Callable[[str], Optional[tango.DeviceProxy]],
+        get_event_callback: Callable[[str], Callable],
+        polling_period: float = 1.0,
+        logger: logging.Logger = LOGGER,
+    ) -> None:
+        """
+        :param get_device_proxy: provides the proxy of a device from its
+            name, or None if the device cannot be reached.
+        :type get_device_proxy: Callable[[str], tango.DeviceProxy]
+        :param get_event_callback: provides the event callback of an
+            attribute from its name.
+        :type get_event_callback: Callable[[str], Callable]
+        :param polling_period: interval in seconds between two reads of the
+            attributes, defaults to 1 second.
+        :type polling_period: float
+        :param logger: logger
+        :type logger: logging.Logger
+        """
+        self._get_device_proxy = get_device_proxy
+        self._get_event_callback = get_event_callback
+        self._polling_period = polling_period
+        self._logger = logger
+        self._log_manager = LogManager(10)
+        self._attributes: dict[str, dict[str, None]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def polled_attributes(self) -> dict[str, list]:
+        """Returns the polled attributes per device.
+
+        :return: attribute names per device name
+        :rtype: dict[str, list]
+        """
+        with self._lock:
+            return {
+                device_name: list(attribute_names)
+                for device_name, attribute_names in self._attributes.items()
+            }
+
+    def is_polled(self, device_name: str, attribute_name: str) -> bool:
+        """Checks whether the attribute of the device is polled.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        :return: True if the attribute is polled
+        :rtype: bool
+        """
+        with self._lock:
+            return attribute_name in self._attributes.get(device_name, {})
+
+    def add(self, device_name: str, attribute_name: str) -> bool:
+        """Starts polling the attribute of the device.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        :return: False if the attribute was already polled, else True
+        :rtype: bool
+        """
+        with self._lock:
+            attribute_names = self._attributes.setdefault(device_name, {})
+            if attribute_name in attribute_names:
+                return False
+            attribute_names[attribute_name] = None
+            if self._thread is None:
+                self._stop_event = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._stop_event,),
+                    name=POLLER_THREAD_NAME,
+                    daemon=True,
+                )
+                self._thread.start()
+            return True
+
+    def remove(self, device_name: str, attribute_name: str) -> bool:
+        """Stops polling the attribute of the device.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        :return: False if the attribute was not polled, else True
+        :rtype: bool
+        """
+        with self._lock:
+            attribute_names = self._attributes.get(device_name)
+            if attribute_names is None or attribute_name not in (
+                attribute_names
+            ):
+                return False
+            del attribute_names[attribute_name]
+            if not attribute_names:
+                del self._attributes[device_name]
+            return True
+
+    def stop(self) -> None:
+        """Stops the polling thread, the polled attributes are kept."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop_event.set()
+        if thread and thread is not threading.current_thread():
+            thread.join()
+
+    def poll(self) -> None:
+        """Reads the polled attributes of every device once and forwards
+        their values to the event callbacks."""
+        for device_name, attribute_names in self.polled_attributes.items():
+            self.poll_device(device_name, attribute_names)
+
+    def poll_device(self, device_name: str, attribute_names: list) -> None:
+        """Reads the attributes of the device with a single read_attributes
+        call and forwards their values to the event callbacks.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_names: Attribute names under provided device.
+        :type attribute_names: list
+        """
+        proxy = self._get_device_proxy(device_name)
+        if proxy is None:
+            return
+        try:
+            attribute_values = proxy.read_attributes(attribute_names)
+        except Exception as exception:
+            if self._log_manager.is_logging_allowed(f"{device_name}_poll"):
+                self._logger.error(
+                    "Error occurred while polling attributes %s of device "
+                    "%s: %s",
+                    attribute_names,
+                    device_name,
+                    exception,
+                )
+            return
+        for attribute_name, attribute_value in zip(
+            attribute_names, attribute_values
+        ):
+            if attribute_value.has_failed:
+                continue
+            try:
+                self._get_event_callback(attribute_name)(
+                    PolledEventData(
+                        proxy,
+                        f"{device_name}/{attribute_name}",
+                        attribute_value,
+                    )
+                )
+            except Exception as exception:
+                self._logger.error(
+                    "Error occurred while handling polled value of "
+                    "attribute %s of device %s: %s",
+                    attribute_name,
+                    device_name,
+                    exception,
+                )
+
+    def _run(self, stop_event: threading.Event) -> None:
+        """Polls the attributes every polling period, until stopped or no
+        attribute is left."""
+        with tango.EnsureOmniThread():
+            while not stop_event.wait(self._polling_period):
+                with self._lock:
+                    if not self._attributes:
+                        if self._thread is threading.current_thread():
+                            self._thread = None
+                        return
+                self.poll()
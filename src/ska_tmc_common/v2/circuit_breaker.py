@@ -0,0 +1,159 @@
+"""
+This module provides a per-device circuit breaker with exponential backoff,
+used by the liveliness probe to avoid probing unresponsive devices in every
+cycle.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Callable
+
+from ska_tmc_common.enum import CircuitBreakerState
+
+
+class DeviceCircuitBreaker:
+    """
+    Circuit breaker guarding the probes of a single device.
+
+    While CLOSED every probe is allowed. After failure_threshold consecutive
+    failures the breaker opens and the device is not probed until the
+    backoff expires. The breaker then becomes HALF_OPEN and allows a single
+    trial probe: a success closes it, a failure opens it again with a
+    doubled backoff, up to max_backoff. The backoff is jittered so that
+    devices failing together are not retried together.
+    """
+
+    def __init__(
+        self,
+        base_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        failure_threshold: int = 1,
+        jitter: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param base_backoff: backoff in seconds after the breaker opens for
+            the first time.
+        :type base_backoff: float
+        :param max_backoff: upper bound in seconds of the backoff.
+        :type max_backoff: float
+        :param failure_threshold: consecutive failures which open the
+            breaker.
+        :type failure_threshold: int
+        :param jitter: fraction of the backoff by which the retry time is
+            randomly brought forward.
+        :type jitter: float
+        :param clock: monotonic clock, defaults to time.monotonic
+        :type clock: Callable[[], float]
+        """
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._failure_threshold = failure_threshold
+        self._jitter = jitter
+        self._clock = clock
+        self._state = CircuitBreakerState.CLOSED
+        self._consecutive_failures: int = 0
+        self._open_count: int = 0
+        self._retry_at: float = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        """Returns the state of the breaker.
+
+        :return: breaker state
+        :rtype: CircuitBreakerState
+        """
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Returns the number of consecutive failed probes.
+
+        :return: consecutive failures
+        :rtype: int
+        """
+        return self._consecutive_failures
+
+    @property
+    def current_backoff(self) -> float:
+        """Returns the backoff applied the next time the breaker opens.
+
+        :return: backoff in seconds
+        :rtype: float
+        """
+        return min(
+            self._max_backoff,
+            self._base_backoff * 2 ** max(0, self._open_count - 1),
+        )
+
+    @property
+    def retry_in(self) -> float:
+        """Returns the time until the backoff of an OPEN breaker expires.
+
+        :return: time in seconds, 0 if the breaker is not OPEN
+        :rtype: float
+        """
+        with self._lock:
+            if self._state != CircuitBreakerState.OPEN:
+                return 0.0
+            return max(0.0, self._retry_at - self._clock())
+
+    def allow_request(self) -> bool:
+        """Checks whether the device may be probed now. When the backoff of
+        an OPEN breaker has expired, the breaker becomes HALF_OPEN and a
+        single trial probe is allowed.
+
+        :return: True if the device may be probed
+        :rtype: bool
+        """
+        with self._lock:
+            if self._state == CircuitBreakerState.CLOSED:
+                return True
+            if (
+                self._state == CircuitBreakerState.OPEN
+                and self._clock() >= self._retry_at
+            ):
+                self._state = CircuitBreakerState.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Records a successful probe, which closes the breaker."""
+        with self._lock:
+            self._state = CircuitBreakerState.CLOSED
+            self._consecutive_failures = 0
+            self._open_count = 0
+
+    def record_failure(self) -> None:
+        """Records a failed probe. The breaker opens when the failure
+        threshold is reached or when the trial probe of a HALF_OPEN breaker
+        fails."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if (
+                self._state == CircuitBreakerState.HALF_OPEN
+                or self._consecutive_failures >= self._failure_threshold
+            ):
+                self._open_count += 1
+                backoff = self.current_backoff
+                self._retry_at = self._clock() + backoff * (
+                    1 - random.uniform(0, self._jitter)
+                )
+                self._state = CircuitBreakerState.OPEN
+
+    def to_dict(self) -> dict:
+        """Returns the breaker information.
+
+        :return: breaker state, consecutive failures and time until the
+            next trial probe
+        :rtype: dict
+        """
+        return {
+            "state": str(self._state),
+            "consecutive_failures": self._consecutive_failures,
+            "retry_in": self.retry_in,
+        }
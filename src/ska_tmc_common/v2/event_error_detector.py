@@ -0,0 +1,163 @@
+"""
+This module contains the detector of the event errors which require the
+resubscription of an attribute.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+
+class EventErrorRateDetector:
+    """
+    Sliding window detector of the event errors per device attribute.
+
+    The times of the latest errors of every attribute are kept in a ring of
+    max_count + 1 entries. The attribute needs to be resubscribed when the
+    ring is full and its oldest error is within the window, i.e. when more
+    than max_count errors were received within window seconds. Errors older
+    than the window no longer count, so that sporadic errors spread over a
+    long time do not trigger a resubscription.
+    """
+
+    def __init__(
+        self,
+        max_count: int = 10,
+        window: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param max_count: maximum tolerable number of errors within the
+            window, one more error requires the resubscription of the
+            attribute.
+        :type max_count: int
+        :param window: duration of the window in seconds.
+        :type window: float
+        :param clock: monotonic clock, defaults to time.monotonic
+        :type clock: Callable[[], float]
+        """
+        self._max_count = max(0, max_count)
+        self._window = window
+        self._clock = clock
+        self._errors: dict[str, dict[str, deque[float]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def window(self) -> float:
+        """Returns the duration of the window.
+
+        :return: window in seconds
+        :rtype: float
+        """
+        return self._window
+
+    def record_error(self, device_name: str, attribute_name: str) -> bool:
+        """Records an error of the attribute, and checks whether the error
+        rate of the attribute requires its resubscription. The errors of the
+        attribute are forgotten when it does.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: attribute name
+        :type attribute_name: str
+        :return: True if the attribute needs to be resubscribed
+        :rtype: bool
+        """
+        now = self._clock()
+        with self._lock:
+            attributes = self._errors.setdefault(device_name, {})
+            errors = attributes.get(attribute_name)
+            if errors is None:
+                errors = deque(maxlen=self._max_count + 1)
+                attributes[attribute_name] = errors
+            errors.append(now)
+            if len(errors) > self._max_count and (
+                now - errors[0] <= self._window
+            ):
+                del attributes[attribute_name]
+                if not attributes:
+                    del self._errors[device_name]
+                return True
+            return False
+
+    def error_count(self, device_name: str, attribute_name: str) -> int:
+        """Returns the number of errors of the attribute within the window.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: attribute name
+        :type attribute_name: str
+        :return: number of errors
+        :rtype: int
+        """
+        with self._lock:
+            errors = self._errors.get(device_name, {}).get(attribute_name)
+            return self._count_recent(errors) if errors else 0
+
+    def reset(self, device_name: str) -> None:
+        """Forgets the errors of the device.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        """
+        with self._lock:
+            self._errors.pop(device_name, None)
+
+    def error_counts(self) -> dict[str, dict[str, int]]:
+        """Returns the number of errors within the window per attribute.
+
+        :return: number of errors per attribute per device
+        :rtype: dict[str, dict[str, int]]
+        """
+        with self._lock:
+            result: dict[str, dict[str, int]] = {}
+            for device_name, attributes in self._errors.items():
+                counts = {
+                    attribute_name: self._count_recent(errors)
+                    for attribute_name, errors in attributes.items()
+                }
+                counts = {
+                    name: count for name, count in counts.items() if count
+                }
+                if counts:
+                    result[device_name] = counts
+            return result
+
+    def to_dict(self) -> dict:
+        """Returns the state of the detector.
+
+        :return: window, maximum tolerable error count, and the number of
+            errors within the window and the error rate per minute of every
+            attribute
+        :rtype: dict
+        """
+        return {
+            "window": self._window,
+            "max_count": self._max_count,
+            "devices": {
+                device_name: {
+                    attribute_name: {
+                        "errors_in_window": count,
+                        "rate_per_minute": round(
+                            count * 60.0 / self._window, 3
+                        ),
+                    }
+                    for attribute_name, count in attributes.items()
+                }
+                for device_name, attributes in self.error_counts().items()
+            },
+        }
+
+    def _count_recent(self, errors: deque[float]) -> int:
+        """Counts the errors within the window, the most recent errors being
+        at the end of the ring."""
+        oldest_time = self._clock() - self._window
+        count = 0
+        for error_time in reversed(errors):
+            if error_time < oldest_time:
+                break
+            count += 1
+        return count
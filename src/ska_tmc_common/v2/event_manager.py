@@ -4,18 +4,41 @@ This module contains event management functionality.
 
 from __future__ import annotations
 
-import datetime
+import itertools
 import logging
 import threading
 import time
-from queue import Queue
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Callable, Optional
 
 import tango
 from ska_ser_logging import configure_logging
 
+from ska_tmc_common.clock import get_clock
 from ska_tmc_common.dev_factory import DevFactory
+from ska_tmc_common.event_recorder import EventRecorder
+from ska_tmc_common.latency_histogram import EventLatencyTracker
 from ska_tmc_common.log_manager import LogManager
+from ska_tmc_common.metrics import MetricsRegistry
+from ska_tmc_common.v2.attribute_poller import AttributePoller
+from ska_tmc_common.v2.circuit_breaker import DeviceCircuitBreaker
+from ska_tmc_common.v2.event_error_detector import EventErrorRateDetector
+from ska_tmc_common.v2.status_ring import StatusRing
+from ska_tmc_common.v2.subscription_hub import SubscriptionHub
+from ska_tmc_common.v2.subscription_registry import (
+    COMPLETION_INDICATOR_KEY,
+    SUBSCRITPTION_ID_KEY,
+    SubscriptionRegistry,
+)
+
+# Kept importable from this module for existing users.
+__all__ = [
+    "API_EVENT_TIMEOUT",
+    "COMPLETION_INDICATOR_KEY",
+    "EVENT_ERROR_DESC",
+    "SUBSCRITPTION_ID_KEY",
+    "EventManager",
+]
 
 if TYPE_CHECKING:
     from tmc_component_manager import (
@@ -24,12 +47,15 @@ if TYPE_CHECKING:
     )
 
 LOGGER: logging.Logger = logging.getLogger("EventManager")
-COMPLETION_INDICATOR_KEY: str = "is_subscription_completed"
-SUBSCRITPTION_ID_KEY: str = "subscription_id"
 EVENT_MANAGER_THREAD_NAME_PREFIX: str = "event_manager_thread_"
 TIMER_THREAD_NAME_PREFIX: str = "event_timer_thread_"
+ERROR_HANDLER_THREAD_NAME_PREFIX: str = "event_error_handler"
+UNSUBSCRIPTION_THREAD_NAME_PREFIX: str = "event_unsubscription"
 API_EVENT_TIMEOUT: str = "API_EventTimeout"
 EVENT_ERROR_DESC: str = "Event channel is not responding anymore"
+SUBSCRIPTIONS_METRIC: str = "tmc_event_subscriptions_total"
+EVENT_ERRORS_METRIC: str = "tmc_event_errors_total"
+RESUBSCRIPTIONS_METRIC: str = "tmc_event_resubscriptions_total"
 
 configure_logging()
 
@@ -50,6 +76,20 @@ class EventManager:
         event_error_max_count: int = 10,
         status_update_callback: Optional[Callable] = None,
         maximum_status_queue_size: int = 50,
+        error_handling_workers: int = 4,
+        maximum_error_queue_size: int = 100,
+        event_driven_resubscription: bool = False,
+        maximum_resubscription_backoff: float = 30.0,
+        subscription_hub: Optional[SubscriptionHub] = None,
+        polling_fallback_attempts: int = 0,
+        polling_period: float = 1.0,
+        unsubscription_workers: int = 8,
+        event_error_window: float = 300.0,
+        minimum_status_update_interval: float = 0.1,
+        event_latency_tracker: Optional[EventLatencyTracker] = None,
+        queued_event_processing: bool = False,
+        event_recorder: Optional[EventRecorder] = None,
+        metrics_registry: Optional[MetricsRegistry] = None,
     ) -> None:
         """This method initialises the event manager class instances with
         necessary configurations.
@@ -71,18 +111,87 @@ class EventManager:
             between subscription retries, defaults to 1 second.
         :type event_subscription_check_period: int
         :param event_error_max_count: This is maximum tolerable count for
-            API EventTimeout error.
+            API EventTimeout error within the event error window.
         :type event_error_max_count: int
         :param status_update_callback: This callback can be used to update
             tango attribute. The callback will be provided with the statuses
             list, which can be populated in the attribute.
         :type status_update_callback: Callable
-        :param maximum_status_queue_size: Maximum status queue size, defaults
-            to 50.
+        :param maximum_status_queue_size: Maximum number of statuses kept,
+            defaults to 50.
         :type maximum_status_queue_size: int
+        :param error_handling_workers: Number of threads handling event
+            errors, defaults to 4.
+        :type error_handling_workers: int
+        :param maximum_error_queue_size: Maximum number of event errors
+            waiting for a worker, further errors are dropped, defaults to
+            100.
+        :type maximum_error_queue_size: int
+        :param event_driven_resubscription: When enabled, the devices which
+            are not responsive are not polled: they are parked in the pending
+            configuration until the device availability callback is invoked
+            for them. Devices which are responsive but whose subscription
+            fails are retried with a jittered exponential backoff per device.
+            Defaults to False.
+        :type event_driven_resubscription: bool
+        :param maximum_resubscription_backoff: Upper bound in seconds of the
+            backoff between two subscription attempts of a device, in the
+            event driven resubscription mode, defaults to 30 seconds.
+        :type maximum_resubscription_backoff: float
+        :param subscription_hub: Hub through which the events are
+            subscribed, so that the subscriptions of the same attribute are
+            shared with the other event managers using the hub. Provide
+            SubscriptionHub.get_instance() to share them within the process.
+            Defaults to None, in which case every subscription is made
+            directly on the device proxy.
+        :type subscription_hub: SubscriptionHub, optional
+        :param polling_fallback_attempts: Number of failed subscription
+            attempts of an attribute after which its value is polled, until
+            its subscription succeeds. The polled values are provided to the
+            event callback of the attribute. Defaults to 0, which disables
+            the polling fallback.
+        :type polling_fallback_attempts: int
+        :param polling_period: Interval in seconds between two reads of the
+            polled attributes, defaults to 1 second.
+        :type polling_period: float
+        :param unsubscription_workers: Number of threads unsubscribing the
+            devices provided to unsubscribe_devices, defaults to 8.
+        :type unsubscription_workers: int
+        :param event_error_window: Duration in seconds of the sliding window
+            over which the API EventTimeout errors of an attribute are
+            counted, defaults to 300 seconds. Older errors do not count
+            towards event_error_max_count.
+        :type event_error_window: float
+        :param minimum_status_update_interval: Minimum interval in seconds
+            between two invocations of the status update callback. The
+            statuses reported in between are provided together at the end
+            of the interval. Defaults to 0.1 second.
+        :type minimum_status_update_interval: float
+        :param event_latency_tracker: When provided, the latency of every
+            event, from the attribute timestamp to the completion of its
+            event callback, is recorded in this tracker. Defaults to None.
+        :type event_latency_tracker: EventLatencyTracker, optional
+        :param queued_event_processing: Set when the event callbacks only
+            queue the events for a processing thread which records their
+            latency, as in the leaf node component managers. The duration
+            of the event callbacks is then recorded in the callback stage
+            of the event latency tracker only, so that every event is
+            recorded once. Defaults to False.
+        :type queued_event_processing: bool
+        :param event_recorder: When provided, every received event is
+            appended to the event log of this recorder, so that it can be
+            replayed with an EventReplayer. Defaults to None.
+        :type event_recorder: EventRecorder, optional
+        :param metrics_registry: Registry in which the subscription
+            attempts, the event errors, the resubscriptions and the depth of
+            the event error queue are reported. Defaults to None, in which
+            case the event manager keeps its own registry.
+        :type metrics_registry: MetricsRegistry, optional
         """
         self.__logger: logging.Logger = logger
-        self.__device_subscriptions: dict[str, dict[int, bool]] | dict = {}
+        self.__subscription_registry: SubscriptionRegistry = (
+            SubscriptionRegistry()
+        )
         self.__subscription_configuration: dict[str, list] = (
             subscription_configuration
         )
@@ -99,23 +208,100 @@ class EventManager:
         self.__event_subscription_check_period = (
             event_subscription_check_period
         )
-        self.__device_errors_tracker: dict = {}
-        self.__event_error_max_count: int = event_error_max_count
-        self.__status_update_callback: Optional[Callable] = (
-            status_update_callback
+        self.__event_error_detector: EventErrorRateDetector = (
+            EventErrorRateDetector(event_error_max_count, event_error_window)
+        )
+        self.__event_latency_tracker: Optional[EventLatencyTracker] = (
+            event_latency_tracker
+        )
+        self.__queued_event_processing: bool = queued_event_processing
+        self.__event_recorder: Optional[EventRecorder] = event_recorder
+        self.__status_ring: StatusRing = StatusRing(
+            maximum_status_queue_size,
+            status_update_callback,
+            minimum_status_update_interval,
         )
-        self.__status_queue: Queue[str] = Queue(maximum_status_queue_size)
         self.__pending_configuration_lock: threading.RLock = threading.RLock()
-        self.__device_subscriptions_lock: threading.RLock = threading.RLock()
         self.__subscription_configuration_lock: threading.RLock = (
             threading.RLock()
         )
-        self.__device_errors_tracker_lock: threading.RLock = threading.RLock()
         self.__unsubscription_thread_cancellation_lock: threading.RLock = (
             threading.RLock()
         )
         self.__timer_threads_lock: threading.RLock = threading.RLock()
         self.__thread_time_outs_lock: threading.RLock = threading.RLock()
+        self.__error_handling_workers: int = error_handling_workers
+        self.__maximum_error_queue_size: int = maximum_error_queue_size
+        self.__error_handling_pool: Optional[ThreadPoolExecutor] = None
+        self.__error_handling_lock: threading.Lock = threading.Lock()
+        # Event errors being handled, and the latest error received for the
+        # same attribute while it was handled, per (device, attribute) key.
+        self.__error_handling_in_progress: dict[
+            tuple[str, str], Optional[tango.EventData]
+        ] = {}
+        # Attributes whose event timeout errors require a resubscription,
+        # performed by the next error handling worker of the attribute.
+        self.__pending_resubscriptions: set[tuple[str, str]] = set()
+        self.__error_statistics: dict[str, int] = {
+            "queue_depth": 0,
+            "handled": 0,
+            "coalesced": 0,
+            "dropped": 0,
+        }
+        self.__event_driven_resubscription: bool = event_driven_resubscription
+        self.__maximum_resubscription_backoff: float = (
+            maximum_resubscription_backoff
+        )
+        self.__subscription_backoffs: dict[str, DeviceCircuitBreaker] = {}
+        self.__subscription_backoffs_lock: threading.Lock = threading.Lock()
+        self.__subscription_hub: Optional[SubscriptionHub] = subscription_hub
+        self.__polling_fallback_attempts: int = polling_fallback_attempts
+        self.__subscription_failures: dict[tuple[str, str], int] = {}
+        self.__subscription_failures_lock: threading.Lock = threading.Lock()
+        self.__attribute_poller: AttributePoller = AttributePoller(
+            lambda device_name: self.get_device_proxy(device_name),
+            lambda attribute_name: getattr(
+                self, f"{attribute_name.lower()}_event_callback"
+            ),
+            polling_period,
+            logger,
+        )
+        self.__unsubscription_workers: int = unsubscription_workers
+        self.__unsubscription_pool: Optional[ThreadPoolExecutor] = None
+        self.__unsubscription_pool_lock: threading.Lock = threading.Lock()
+        self.__teardown_ids = itertools.count(1)
+        self.__metrics_registry: MetricsRegistry = (
+            metrics_registry or MetricsRegistry()
+        )
+        self.__subscription_counters = {
+            succeeded: self.__metrics_registry.counter(
+                SUBSCRIPTIONS_METRIC,
+                "Event subscription attempts, by result",
+                {"result": "success" if succeeded else "failure"},
+            )
+            for succeeded in (True, False)
+        }
+        self.__event_error_counter = self.__metrics_registry.counter(
+            EVENT_ERRORS_METRIC, "Change events received with an error"
+        )
+        self.__resubscription_counter = self.__metrics_registry.counter(
+            RESUBSCRIPTIONS_METRIC,
+            "Attributes resubscribed after repeated event timeout errors",
+        )
+        self.__metrics_registry.gauge(
+            "tmc_event_error_queue_depth",
+            "Event errors waiting for an error handling worker",
+            function=lambda: self.__error_statistics["queue_depth"],
+        )
+
+    @property
+    def metrics_registry(self) -> MetricsRegistry:
+        """Returns the registry of the metrics of the event manager.
+
+        :return: Returns the metrics registry.
+        :rtype: MetricsRegistry
+        """
+        return self.__metrics_registry
 
     @property
     def pending_configuration(self) -> dict[str, list]:
@@ -168,37 +354,69 @@ class EventManager:
         with self.__subscription_configuration_lock:
             return self.__subscription_configuration
 
+    @property
+    def subscription_registry(self) -> SubscriptionRegistry:
+        """This method provides the registry of the event subscriptions.
+
+        :return: This method returns the subscription registry.
+        :rtype: SubscriptionRegistry
+        """
+        return self.__subscription_registry
+
+    @property
+    def attribute_poller(self) -> AttributePoller:
+        """This method provides the poller of the attributes which could not
+        be subscribed.
+
+        :return: This method returns the attribute poller.
+        :rtype: AttributePoller
+        """
+        return self.__attribute_poller
+
     @property
     def device_subscriptions(
         self,
     ) -> dict[str, dict[int, bool]] | dict:
-        """This method provides the instanc of device subscriptions
-            dictionary.
+        """This method provides a copy of the device subscriptions as
+            a dictionary, for example:
+            {"device_name": {"attribute1": {"subscription_id": 1},
+            "is_subscription_completed": True}}.
 
-        :return: This method returns the value of device subscriptions
-            variable.
+        :return: This method returns the device subscriptions.
         :rtype: dict[str, dict[int, bool]],dict
         """
-        with self.__device_subscriptions_lock:
-            return self.__device_subscriptions
+        return self.__subscription_registry.to_dict()
 
     @device_subscriptions.setter
     def device_subscriptions(self, updated_configuration: dict) -> None:
-        """This method is used to set the device subscriptions
-        dictionary.
+        """This method is used to replace the device subscriptions with the
+        provided dictionary.
 
         :param updated_configuration: This contains the configuration to be
             updated in variable device subscriptions.
         :type updated_configuration: dict
         """
-        with self.__device_subscriptions_lock:
-            self.__device_subscriptions = updated_configuration
+        self.__subscription_registry.load(updated_configuration)
+
+    @property
+    def device_errors_tracker(self) -> dict[str, dict[str, int]]:
+        """This method returns the number of event timeout errors per
+        attribute of every device, within the event error window.
+
+        :return: This method returns the error counts.
+        :rtype: dict[str, dict[str, int]]
+        """
+        return self.__event_error_detector.error_counts()
 
     @property
-    def device_errors_tracker(self) -> None:
-        """This method returns dictionary with device errors."""
-        with self.__device_errors_tracker_lock:
-            return self.__device_errors_tracker
+    def event_error_detector(self) -> EventErrorRateDetector:
+        """This method provides the detector of the event timeout errors
+        which require a resubscription.
+
+        :return: This method returns the event error detector.
+        :rtype: EventErrorRateDetector
+        """
+        return self.__event_error_detector
 
     def init_timeout(self, thread_id: int) -> None:
         """This method initializes timeout flag for the provided
@@ -236,7 +454,7 @@ class EventManager:
         with self.__timer_threads_lock:
             self.__timer_threads.update(
                 {
-                    name: threading.Timer(
+                    name: get_clock().timer(
                         timeout, self.set_timeout, (thread_id,)
                     )
                 }
@@ -253,6 +471,23 @@ class EventManager:
                 self.__timer_threads.get(name).cancel()
                 self.__timer_threads.pop(name)
 
+    def stop(self) -> None:
+        """This method stops the threads of the event manager: the
+        attribute poller, and the event error handling and unsubscription
+        pools once their submitted tasks are completed. The pools are
+        created again on their next use.
+        """
+        self.__attribute_poller.stop()
+        with self.__error_handling_lock:
+            error_handling_pool = self.__error_handling_pool
+            self.__error_handling_pool = None
+        with self.__unsubscription_pool_lock:
+            unsubscription_pool = self.__unsubscription_pool
+            self.__unsubscription_pool = None
+        for pool in (error_handling_pool, unsubscription_pool):
+            if pool is not None:
+                pool.shutdown(wait=True)
+
     def start_event_subscription(
         self,
         subscription_configuration: Optional[dict[str, list]] = None,
@@ -342,37 +577,156 @@ class EventManager:
             that needs to be unsubscribed.
         :type attribute_names: list, optional
         """
+        thread_id: int = threading.get_ident()
+        self.init_unsubscription_cancellation(thread_id)
         try:
-            attribute_list = attribute_names or list(
-                self.device_subscriptions.get(device_name).keys()
-            )
-            thread_id: int = threading.get_ident()
-            self.init_unsubscription_cancellation(thread_id)
-            proxy = self.__device_factory.get_device(device_name)
-            for attribute_name in attribute_list:
-                if self.__unsubscription_thread_cancellation.get(thread_id):
-                    break
-                if attribute_name != COMPLETION_INDICATOR_KEY:
-                    proxy.unsubscribe_event(
-                        self.device_subscriptions.get(device_name)
-                        .get(attribute_name)
-                        .get(SUBSCRITPTION_ID_KEY)
-                    )
-                self.device_subscriptions.get(device_name).pop(attribute_name)
-            if (
-                len(list(self.device_subscriptions.get(device_name).keys()))
-                == 1
-                and COMPLETION_INDICATOR_KEY
-                in self.device_subscriptions.get(device_name).keys()
-            ):
-                self.device_subscriptions.get(device_name).pop(
-                    COMPLETION_INDICATOR_KEY
-                )
-            self.__unsubscription_thread_cancellation.pop(thread_id)
+            self.unsubscribe_device(device_name, attribute_names, thread_id)
         except Exception as exception:
             self.__logger.error(
                 "Error occurred while unsubscribing: %s", exception
             )
+        finally:
+            with self.__unsubscription_thread_cancellation_lock:
+                self.__unsubscription_thread_cancellation.pop(thread_id, None)
+
+    def unsubscribe_device(
+        self,
+        device_name: str,
+        attribute_names: Optional[list] = None,
+        cancellation_id: Optional[int] = None,
+    ) -> list[str]:
+        """This method unsubscribes the events of the attributes of the
+        device, stopping early if the unsubscription identified by the
+        cancellation id is cancelled.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_names: Attribute names under provided device,
+            defaults to all the subscribed attributes of the device.
+        :type attribute_names: list, optional
+        :param cancellation_id: Id provided to cancel_unsubscription_thread
+            to cancel the unsubscription.
+        :type cancellation_id: int, optional
+        :return: Returns the unsubscribed attributes.
+        :rtype: list[str]
+        """
+        registry = self.__subscription_registry
+        attribute_list = attribute_names or registry.subscribed_attributes(
+            device_name
+        )
+        unsubscribed_attributes: list[str] = []
+        proxy = self.__device_factory.get_device(device_name)
+        for attribute_name in attribute_list:
+            if self.__unsubscription_thread_cancellation.get(cancellation_id):
+                break
+            if attribute_name == COMPLETION_INDICATOR_KEY:
+                continue
+            if not self.__attribute_poller.remove(device_name, attribute_name):
+                self.unsubscribe_attribute(
+                    proxy,
+                    registry.get_subscription_id(device_name, attribute_name),
+                )
+                registry.remove_subscription(device_name, attribute_name)
+            unsubscribed_attributes.append(attribute_name)
+        return unsubscribed_attributes
+
+    def unsubscribe_devices(
+        self, device_configuration: dict[str, Optional[list]]
+    ) -> tuple[int, Future]:
+        """This method unsubscribes the events of many devices on a bounded
+        thread pool, instead of a thread per device. The unsubscription can
+        be cancelled by providing the returned id to
+        cancel_unsubscription_thread, or by cancelling the returned future:
+        the devices not unsubscribed yet are then skipped.
+
+        :param device_configuration: attribute names to unsubscribe per
+            device name. All the subscribed attributes of a device are
+            unsubscribed when its attribute names are None.
+            For Example: {"device_name":["attribute1"], "device2": None}.
+        :type device_configuration: dict[str, list | None]
+        :return: Returns the id of the unsubscription, and a future
+            completed with the unsubscribed attributes per device once all
+            the devices are processed. Devices whose unsubscription failed
+            are logged and left out of the result.
+        :rtype: tuple[int, concurrent.futures.Future]
+        """
+        teardown_id: int = next(self.__teardown_ids)
+        self.init_unsubscription_cancellation(teardown_id)
+        teardown_future: Future = Future()
+
+        def teardown_done(future: Future) -> None:
+            if future.cancelled():
+                self.cancel_unsubscription_thread(teardown_id)
+
+        teardown_future.add_done_callback(teardown_done)
+        results: dict[str, list[str]] = {}
+        remaining_devices: list[int] = [len(device_configuration)]
+        results_lock = threading.Lock()
+
+        def device_done(device_name: str, device_future: Future) -> None:
+            if not device_future.cancelled():
+                if device_future.exception() is None:
+                    with results_lock:
+                        results[device_name] = device_future.result()
+                else:
+                    self.__logger.error(
+                        "Error occurred while unsubscribing device %s: %s",
+                        device_name,
+                        device_future.exception(),
+                    )
+            with results_lock:
+                remaining_devices[0] -= 1
+                if remaining_devices[0]:
+                    return
+            with self.__unsubscription_thread_cancellation_lock:
+                self.__unsubscription_thread_cancellation.pop(
+                    teardown_id, None
+                )
+            if not teardown_future.done():
+                teardown_future.set_result(results)
+
+        if not device_configuration:
+            with self.__unsubscription_thread_cancellation_lock:
+                self.__unsubscription_thread_cancellation.pop(teardown_id)
+            teardown_future.set_result(results)
+            return teardown_id, teardown_future
+        pool = self.__get_unsubscription_pool()
+        for device_name, attribute_names in device_configuration.items():
+            pool.submit(
+                self.__run_device_unsubscription,
+                device_name,
+                attribute_names,
+                teardown_id,
+            ).add_done_callback(
+                lambda device_future, device_name=device_name: device_done(
+                    device_name, device_future
+                )
+            )
+        return teardown_id, teardown_future
+
+    def __get_unsubscription_pool(self) -> ThreadPoolExecutor:
+        """Returns the unsubscription pool, created on first use."""
+        with self.__unsubscription_pool_lock:
+            if self.__unsubscription_pool is None:
+                self.__unsubscription_pool = ThreadPoolExecutor(
+                    max_workers=self.__unsubscription_workers,
+                    thread_name_prefix=UNSUBSCRIPTION_THREAD_NAME_PREFIX,
+                )
+            return self.__unsubscription_pool
+
+    def __run_device_unsubscription(
+        self,
+        device_name: str,
+        attribute_names: Optional[list],
+        teardown_id: int,
+    ) -> list[str]:
+        """Unsubscribes the device on the unsubscription pool."""
+        if self.__unsubscription_thread_cancellation.get(teardown_id):
+            return []
+        with tango.EnsureOmniThread():
+            return self.unsubscribe_device(
+                device_name, attribute_names, teardown_id
+            )
 
     def init_device_subscriptions(self, device_name: str) -> None:
         """Initialisation of device configuration dictionary.
@@ -380,8 +734,7 @@ class EventManager:
         :param device_name: device name.
         :type device_name: str
         """
-        if not self.device_subscriptions.get(device_name):
-            self.device_subscriptions.update({device_name: {}})
+        self.__subscription_registry.init_device(device_name)
 
     def update_device_subscriptions(
         self,
@@ -390,8 +743,8 @@ class EventManager:
         subscription_id: Optional[int] = None,
         is_subscription_completed: Optional[bool] = None,
     ) -> None:
-        """This method updates device_subscriptions dictionary
-        with the provided values.
+        """This method updates the subscription registry with the provided
+        values.
 
         :param device_name: tango device FQDN.
         :type device_name: str
@@ -405,13 +758,11 @@ class EventManager:
         :type is_subscription_completed: bool, optional
         """
         if attribute_name and subscription_id:
-            self.device_subscriptions.get(device_name).update(
-                {attribute_name: {SUBSCRITPTION_ID_KEY: subscription_id}}
+            self.__subscription_registry.add_subscription(
+                device_name, attribute_name, subscription_id
             )
         elif device_name and is_subscription_completed:
-            self.device_subscriptions.get(device_name).update(
-                {COMPLETION_INDICATOR_KEY: is_subscription_completed}
-            )
+            self.__subscription_registry.set_completed(device_name)
 
     def get_device_proxy(self, device_name: str) -> tango.DeviceProxy:
         """This method creates device proxy for the provided device name.
@@ -460,6 +811,11 @@ class EventManager:
         :type timeout: int
         """
         with tango.EnsureOmniThread():
+            if self.__event_driven_resubscription:
+                self.subscribe_events_on_availability(
+                    subscription_configuration, timeout
+                )
+                return
             timer_thread_name: str = TIMER_THREAD_NAME_PREFIX + str(
                 time.time()
             )
@@ -476,59 +832,316 @@ class EventManager:
                     device_name,
                     attribute_names,
                 ) in subscription_configuration.items():
-                    subscription_completion: list = []
                     self.init_device_subscriptions(device_name)
                     if not check_device_responsiveness(device_name):
                         continue
                     proxy = self.get_device_proxy(device_name)
                     if not proxy:
                         continue
-                    for attribute_name in attribute_names:
-                        try:
-                            if attribute_name in list(
-                                self.device_subscriptions.get(
-                                    device_name
-                                ).keys()
-                            ):
-                                continue
-                            subscription_id: int = proxy.subscribe_event(
-                                attribute_name,
-                                tango.EventType.CHANGE_EVENT,
-                                getattr(
-                                    self,
-                                    f"{attribute_name.lower()}_event_callback",
-                                ),
-                                stateless=self.stateless_flag,
-                            )
-                            self.update_device_subscriptions(
-                                device_name, attribute_name, subscription_id
-                            )
-                            subscription_completion.append(True)
-                        except Exception as exception:
-                            if self.__log_manager.is_logging_allowed(
-                                f"{attribute_name}_log"
-                            ):
-                                self.__logger.error(
-                                    "Following exception occured: %s"
-                                    "while subscribing to attribute : %s"
-                                    + "of device: %s",
-                                    exception,
-                                    attribute_name,
-                                    device_name,
-                                )
-                            subscription_completion.append(False)
-                    self.update_device_subscriptions(
-                        device_name,
-                        is_subscription_completed=all(subscription_completion),
+                    self.subscribe_device_attributes(
+                        device_name, attribute_names, proxy
                     )
                 self.remove_subscribed_devices(
                     subscription_configuration,
                 )
-                time.sleep(self.__event_subscription_check_period)
+                get_clock().sleep(self.__event_subscription_check_period)
             if subscription_configuration:
                 self.pending_configuration.update(subscription_configuration)
             self.stop_timer(timer_thread_name)
 
+    def subscribe_events_on_availability(
+        self, subscription_configuration: dict[str, list], timeout: int = 1000
+    ) -> None:
+        """This method subscribes to the attributes of the subscription
+        configuration without polling the devices which are down. A device
+        which is not responsive is moved to the pending configuration, its
+        subscription is started again by the device availability callback.
+        A device which is responsive but whose subscription fails is retried
+        once its backoff expires, the backoff doubling after every failed
+        attempt. The method returns as soon as no device is left to retry,
+        so the cost of an outage scales with the number of devices changing
+        state rather than with the number of configured devices.
+
+        :param subscription_configuration: The variable contains the detail
+            of devices and their attributes to be subscribed.
+            For Example: {"device_name":["attribute1","attribute2"]}.
+        :type subscription_configuration: dict[str, list]
+        :param timeout: The duration till when it will try to subscribe,
+            defaults to 1000 seconds
+        :type timeout: int
+        """
+        current_thread_id: int = threading.get_ident()
+        self.init_timeout(current_thread_id)
+        clock = get_clock()
+        deadline: float = clock.monotonic() + timeout
+        check_device_responsiveness = (
+            self.__component_manager.check_device_responsiveness
+        )
+        try:
+            while subscription_configuration and not (
+                self.__thread_time_outs.get(current_thread_id)
+            ):
+                for device_name, attribute_names in list(
+                    subscription_configuration.items()
+                ):
+                    self.init_device_subscriptions(device_name)
+                    if not check_device_responsiveness(device_name):
+                        self.park_device(
+                            device_name,
+                            subscription_configuration.pop(device_name),
+                        )
+                        continue
+                    backoff = self.get_subscription_backoff(device_name)
+                    if not backoff.allow_request():
+                        continue
+                    proxy = self.get_device_proxy(device_name)
+                    if proxy and self.subscribe_device_attributes(
+                        device_name, attribute_names, proxy
+                    ):
+                        backoff.record_success()
+                        subscription_configuration.pop(device_name)
+                    else:
+                        backoff.record_failure()
+                remaining_time: float = deadline - clock.monotonic()
+                if not subscription_configuration or remaining_time <= 0:
+                    break
+                clock.sleep(
+                    min(
+                        remaining_time,
+                        *(
+                            self.get_subscription_backoff(device_name).retry_in
+                            or self.__event_subscription_check_period
+                            for device_name in subscription_configuration
+                        ),
+                    )
+                )
+        finally:
+            if subscription_configuration:
+                self.pending_configuration.update(subscription_configuration)
+            with self.__thread_time_outs_lock:
+                self.__thread_time_outs.pop(current_thread_id, None)
+
+    def park_device(self, device_name: str, attribute_names: list) -> None:
+        """This method moves the attributes of a device which is not
+        responsive to the pending configuration, where the device
+        availability callback picks them up.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_names: Attribute names under provided device.
+        :type attribute_names: list
+        """
+        with self.__pending_configuration_lock:
+            self.__pending_configuration.update({device_name: attribute_names})
+        # The device may have become available before it was parked, in
+        # which case the availability callback had nothing to subscribe.
+        if self.__component_manager.check_device_responsiveness(device_name):
+            self.subscribe_pending_events(device_name)
+
+    def get_subscription_backoff(
+        self, device_name: str
+    ) -> DeviceCircuitBreaker:
+        """This method provides the backoff between the subscription
+        attempts of the device, used in the event driven resubscription
+        mode.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :return: Returns the backoff of the device.
+        :rtype: DeviceCircuitBreaker
+        """
+        with self.__subscription_backoffs_lock:
+            backoff = self.__subscription_backoffs.get(device_name)
+            if backoff is None:
+                backoff = DeviceCircuitBreaker(
+                    base_backoff=self.__event_subscription_check_period,
+                    max_backoff=self.__maximum_resubscription_backoff,
+                    clock=get_clock().monotonic,
+                )
+                self.__subscription_backoffs[device_name] = backoff
+            return backoff
+
+    def subscribe_attribute(
+        self,
+        proxy: tango.DeviceProxy,
+        device_name: str,
+        attribute_name: str,
+    ) -> int:
+        """This method subscribes to the change events of the attribute,
+        through the subscription hub if the event manager has one.
+
+        :param proxy: Device proxy of the device.
+        :type proxy: tango.DeviceProxy
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        :return: Returns the subscription id.
+        :rtype: int
+        """
+        callback: Callable = getattr(
+            self, f"{attribute_name.lower()}_event_callback"
+        )
+        if self.__event_latency_tracker is not None:
+            callback = self.instrument_event_callback(callback)
+        if self.__event_recorder is not None:
+            callback = self.__event_recorder.wrap(callback)
+        if self.__subscription_hub is not None:
+            return self.__subscription_hub.subscribe(
+                device_name,
+                attribute_name,
+                callback,
+                proxy,
+                stateless=self.stateless_flag,
+            )
+        return proxy.subscribe_event(
+            attribute_name,
+            tango.EventType.CHANGE_EVENT,
+            callback,
+            stateless=self.stateless_flag,
+        )
+
+    def instrument_event_callback(self, callback: Callable) -> Callable:
+        """This method wraps the event callback so that the latency of
+        every event it processes is recorded in the event latency tracker.
+        When the events are queued for processing, only the duration of
+        the callback is recorded.
+
+        :param callback: The event callback.
+        :type callback: Callable
+        :return: Returns the instrumented callback.
+        :rtype: Callable
+        """
+        tracker = self.__event_latency_tracker
+        record_event: Callable = (
+            tracker.record_callback
+            if self.__queued_event_processing
+            else tracker.record_event
+        )
+
+        def instrumented_callback(event: tango.EventData) -> None:
+            started_time: float = time.time()
+            try:
+                callback(event)
+            finally:
+                if not event.err:
+                    record_event(event, started_time)
+
+        return instrumented_callback
+
+    def unsubscribe_attribute(
+        self, proxy: tango.DeviceProxy, subscription_id: int
+    ) -> None:
+        """This method removes the subscription made by subscribe_attribute.
+
+        :param proxy: Device proxy of the device.
+        :type proxy: tango.DeviceProxy
+        :param subscription_id: Subscription id of the attribute.
+        :type subscription_id: int
+        """
+        if self.__subscription_hub is not None:
+            self.__subscription_hub.unsubscribe(subscription_id)
+        else:
+            proxy.unsubscribe_event(subscription_id)
+
+    def subscribe_device_attributes(
+        self,
+        device_name: str,
+        attribute_names: list,
+        proxy: tango.DeviceProxy,
+    ) -> bool:
+        """This method subscribes to the attributes of the device which are
+        not subscribed yet, and marks the subscription of the device as
+        completed when all of them succeed.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_names: Attribute names under provided device.
+        :type attribute_names: list
+        :param proxy: Device proxy of the device.
+        :type proxy: tango.DeviceProxy
+        :return: Returns True if all the attributes are subscribed.
+        :rtype: bool
+        """
+        subscription_completion: list = []
+        for attribute_name in attribute_names:
+            try:
+                if self.__subscription_registry.is_subscribed(
+                    device_name, attribute_name
+                ):
+                    continue
+                subscription_id: int = self.subscribe_attribute(
+                    proxy, device_name, attribute_name
+                )
+                self.update_device_subscriptions(
+                    device_name, attribute_name, subscription_id
+                )
+                self.record_subscription_attempt(
+                    device_name, attribute_name, True
+                )
+                subscription_completion.append(True)
+            except Exception as exception:
+                if self.__log_manager.is_logging_allowed(
+                    f"{attribute_name}_log"
+                ):
+                    self.__logger.error(
+                        "Following exception occured: %s"
+                        "while subscribing to attribute : %s"
+                        + "of device: %s",
+                        exception,
+                        attribute_name,
+                        device_name,
+                    )
+                self.record_subscription_attempt(
+                    device_name, attribute_name, False
+                )
+                subscription_completion.append(False)
+        is_subscription_completed: bool = all(subscription_completion)
+        self.update_device_subscriptions(
+            device_name,
+            is_subscription_completed=is_subscription_completed,
+        )
+        return is_subscription_completed
+
+    def record_subscription_attempt(
+        self, device_name: str, attribute_name: str, succeeded: bool
+    ) -> None:
+        """This method accounts for a subscription attempt of the attribute.
+        When the polling fallback is enabled, the attribute is polled once
+        its subscription failed polling_fallback_attempts times in a row,
+        and is no longer polled once its subscription succeeds.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        :param succeeded: True if the subscription succeeded.
+        :type succeeded: bool
+        """
+        self.__subscription_counters[succeeded].inc()
+        if not self.__polling_fallback_attempts:
+            return
+        key: tuple[str, str] = (device_name, attribute_name)
+        if succeeded:
+            with self.__subscription_failures_lock:
+                self.__subscription_failures.pop(key, None)
+            if self.__attribute_poller.remove(device_name, attribute_name):
+                self.update_status_queue(
+                    f"Switched attribute: {attribute_name} of device: "
+                    f"{device_name} back to events"
+                )
+            return
+        with self.__subscription_failures_lock:
+            failures: int = self.__subscription_failures.get(key, 0) + 1
+            self.__subscription_failures[key] = failures
+        if failures >= self.__polling_fallback_attempts and (
+            self.__attribute_poller.add(device_name, attribute_name)
+        ):
+            self.update_status_queue(
+                f"Polling attribute: {attribute_name} of device: "
+                f"{device_name} after {failures} failed subscriptions"
+            )
+
     def remove_subscribed_devices(
         self,
         subscription_configuration: dict,
@@ -540,24 +1153,24 @@ class EventManager:
         :type subscription_configuration: dict
         """
 
-        for (
-            device_name,
-            configuration,
-        ) in self.device_subscriptions.items():
-            if configuration.get(COMPLETION_INDICATOR_KEY):
-                subscription_configuration.pop(device_name, None)
+        for device_name in list(subscription_configuration):
+            if self.__subscription_registry.is_completed(device_name):
+                subscription_configuration.pop(device_name)
 
     def subscribe_pending_events(self, device_name: str):
         """This method checks for pending subscriptions for the
-        device.
+        device, and starts them. The subscriptions are removed from the
+        pending configuration, and added back if they time out again.
 
         :param device_name: tango device FQDN.
         :type device_name: str
         """
-        if self.pending_configuration.get(device_name):
-            self.start_event_subscription(
-                {device_name: self.pending_configuration.get(device_name)}
+        with self.__pending_configuration_lock:
+            attribute_names = self.__pending_configuration.pop(
+                device_name, None
             )
+        if attribute_names:
+            self.start_event_subscription({device_name: attribute_names})
 
     def device_avaiability_callback(self, device_name: str) -> None:
         """This method is called once device is available back again to
@@ -581,12 +1194,21 @@ class EventManager:
         device_name = attribute_fqdn.replace(
             remove_attribute_name_with_slash, ""
         )
-        if not self.device_subscriptions.get(device_name):
+        if device_name not in self.__subscription_registry:
             device_name = device_name.split("/", 3)[-1]
         return device_name, attribute_name
 
     def handle_event_error(self, event: tango.EventData) -> None:
-        """This method handles the event error by tracking
+        """This method handles the event error: it logs the error and, if
+        the event timeout errors of the attribute require it, unsubscribes
+        the attribute and queues it in the pending configuration for a new
+        event subscription thread. The errors are accounted for by
+        submit_event_error, and the worker does not wait for the attribute
+        to be subscribed again. With a subscription hub, the shared Tango
+        subscription is recreated for all its consumers instead, once
+        within the minimum resubscription interval of the hub whatever the
+        number of consumers handling the error, and the attribute is only
+        queued if that fails.
 
         :param event: change event data with error.
         :type event: tango.EventData
@@ -598,42 +1220,78 @@ class EventManager:
                 error_message: str = f"Change event error: {event.errors}"
                 self.__logger.error(error_message)
                 self.update_status_queue(error_message)
-            if (
-                event.errors[0].reason == API_EVENT_TIMEOUT
-                and EVENT_ERROR_DESC in event.errors[0].desc
-            ):
-                device_name, attribute_name = (
-                    self.get_device_and_attribute_name(event.attr_name)
+            device_name, attribute_name = self.get_device_and_attribute_name(
+                event.attr_name
+            )
+            with self.__error_handling_lock:
+                if (
+                    device_name,
+                    attribute_name,
+                ) not in self.__pending_resubscriptions:
+                    return
+                self.__pending_resubscriptions.discard(
+                    (device_name, attribute_name)
                 )
-                if device_name not in self.device_errors_tracker:
-                    self.device_errors_tracker.update(
-                        {device_name: {attribute_name: 1}}
-                    )
-                elif attribute_name not in self.device_errors_tracker.get(
-                    device_name
-                ):
-                    self.device_errors_tracker.get(device_name).update(
-                        {attribute_name: 1}
+            update_msg: str = (
+                f"Resubscribing attribute: {attribute_name}"
+                f" of device: {device_name}"
+            )
+            self.update_status_queue(update_msg)
+            self.__resubscription_counter.inc()
+            if self.__subscription_hub is not None:
+                try:
+                    if self.__subscription_hub.resubscribe(
+                        device_name, attribute_name
+                    ):
+                        return
+                except Exception as exception:
+                    self.__logger.error(
+                        "Error occurred while resubscribing through the "
+                        "subscription hub: %s",
+                        exception,
                     )
-                else:
-                    error_count: int = self.device_errors_tracker.get(
-                        device_name
-                    ).get(attribute_name)
-                    if error_count >= self.__event_error_max_count:
-                        update_msg: str = (
-                            f"Resubscribing attribute: {attribute_name}"
-                            f" of device: {device_name}"
-                        )
-                        self.update_status_queue(update_msg)
-                        self.unsubscribe_events(device_name, [attribute_name])
-                        self.subscribe_events({device_name: [attribute_name]})
-                        self.device_errors_tracker.get(device_name).pop(
-                            attribute_name
-                        )
-                    else:
-                        self.device_errors_tracker[device_name][
-                            attribute_name
-                        ] += 1
+            self.unsubscribe_events(device_name, [attribute_name])
+            self.queue_resubscription(device_name, attribute_name)
+
+    def queue_resubscription(
+        self, device_name: str, attribute_name: str
+    ) -> None:
+        """This method adds the attribute to the pending configuration and
+        starts the subscription of the pending attributes of the device in
+        an event subscription thread.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        """
+        with self.__pending_configuration_lock:
+            attribute_names = self.__pending_configuration.setdefault(
+                device_name, []
+            )
+            if attribute_name not in attribute_names:
+                attribute_names.append(attribute_name)
+        self.subscribe_pending_events(device_name)
+
+    def record_event_timeout(
+        self, device_name: str, attribute_name: str
+    ) -> bool:
+        """This method accounts for an event timeout error of the attribute
+        and checks whether the attribute needs to be resubscribed, which is
+        the case when more than event_error_max_count errors of the
+        attribute were received within event_error_window seconds. The
+        errors of the attribute are forgotten when it does.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        :return: Returns True if the attribute needs to be resubscribed.
+        :rtype: bool
+        """
+        return self.__event_error_detector.record_error(
+            device_name, attribute_name
+        )
 
     def check_and_handle_event_error(self, event: tango.EventData) -> bool:
         """Checks event error and handles the API timeout error if it
@@ -647,24 +1305,106 @@ class EventManager:
         """
         if not event.err:
             return False
-        __error_handling_thread = threading.Thread(
-            target=self.handle_event_error,
-            args=(event,),
-        )
-        __error_handling_thread.start()
+        self.submit_event_error(event)
         return True
 
+    @property
+    def event_error_statistics(self) -> dict[str, int]:
+        """This method provides the statistics of the event error handling.
+
+        :return: Returns the number of errors waiting for a worker, being
+            handled, handled, coalesced with an error of the same attribute
+            and dropped because the queue was full.
+        :rtype: dict[str, int]
+        """
+        with self.__error_handling_lock:
+            statistics = dict(self.__error_statistics)
+            statistics["in_progress"] = len(self.__error_handling_in_progress)
+            return statistics
+
+    def submit_event_error(self, event: tango.EventData) -> None:
+        """This method accounts for the event timeout errors, then queues
+        the event error for handling on the bounded error handling pool. An
+        error for an attribute whose previous error is still being handled
+        is coalesced: only the latest one is kept, and is handled once the
+        previous one completes. Errors are counted before being coalesced
+        or dropped, and an error requiring a resubscription is never
+        dropped.
+
+        :param event: change event data with error.
+        :type event: tango.EventData
+        """
+        self.__event_error_counter.inc()
+        key: tuple[str, str] = self.get_device_and_attribute_name(
+            event.attr_name
+        )
+        resubscribe: bool = (
+            event.errors[0].reason == API_EVENT_TIMEOUT
+            and EVENT_ERROR_DESC in event.errors[0].desc
+            and self.record_event_timeout(*key)
+        )
+        with self.__error_handling_lock:
+            if resubscribe:
+                self.__pending_resubscriptions.add(key)
+            if key in self.__error_handling_in_progress:
+                self.__error_handling_in_progress[key] = event
+                self.__error_statistics["coalesced"] += 1
+                return
+            if (
+                self.__error_statistics["queue_depth"]
+                >= self.__maximum_error_queue_size
+                and key not in self.__pending_resubscriptions
+            ):
+                self.__error_statistics["dropped"] += 1
+                return
+            if self.__error_handling_pool is None:
+                self.__error_handling_pool = ThreadPoolExecutor(
+                    max_workers=self.__error_handling_workers,
+                    thread_name_prefix=ERROR_HANDLER_THREAD_NAME_PREFIX,
+                )
+            self.__error_handling_in_progress[key] = None
+            self.__error_statistics["queue_depth"] += 1
+            error_handling_pool = self.__error_handling_pool
+        error_handling_pool.submit(self.__run_error_handler, key, event)
+
+    def __run_error_handler(
+        self, key: tuple[str, str], event: tango.EventData
+    ) -> None:
+        """Handles the event error, then the latest error coalesced for the
+        same attribute while it was handled, if any."""
+        with self.__error_handling_lock:
+            self.__error_statistics["queue_depth"] -= 1
+        while event is not None:
+            try:
+                self.handle_event_error(event)
+            except Exception as exception:
+                self.__logger.error(
+                    "Error occurred while handling event error: %s",
+                    exception,
+                )
+            with self.__error_handling_lock:
+                self.__error_statistics["handled"] += 1
+                event = self.__error_handling_in_progress.get(key)
+                if event is None:
+                    self.__error_handling_in_progress.pop(key, None)
+                else:
+                    self.__error_handling_in_progress[key] = None
+
+    @property
+    def status_ring(self) -> StatusRing:
+        """This method provides the ring of the latest statuses.
+
+        :return: This method returns the status ring.
+        :rtype: StatusRing
+        """
+        return self.__status_ring
+
     def update_status_queue(self, status: str) -> None:
-        """This method updates status queue.
+        """This method adds the status to the status ring. The status update
+        callback is invoked with the latest statuses at most once per
+        minimum status update interval.
 
         :param status: The status message to update.
         :type status: str
         """
-        date_time: str = datetime.datetime.now().ctime()
-        if not self.__status_queue.full():
-            self.__status_queue.put(date_time + "::" + status)
-        else:
-            self.__status_queue.get()
-            self.__status_queue.put(date_time + "::" + status)
-        if self.__status_update_callback:
-            self.__status_update_callback(list(self.__status_queue.queue))
+        self.__status_ring.append(status)
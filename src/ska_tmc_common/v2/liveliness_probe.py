@@ -4,16 +4,25 @@ Inherited from liveliness probe functionality
 """
 
 # pylint: disable=duplicate-code
+import asyncio
+import functools
+import inspect
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
-from time import sleep
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import tango
+from tango.asyncio_executor import AsyncioExecutor
 
+from ska_tmc_common.clock import get_clock
 from ska_tmc_common.dev_factory import DevFactory
 from ska_tmc_common.device_info import DeviceInfo
 from ska_tmc_common.log_manager import LogManager
+from ska_tmc_common.metrics import MetricsRegistry
+from ska_tmc_common.v2.circuit_breaker import DeviceCircuitBreaker
+from ska_tmc_common.v2.probe_scheduler import ProbeScheduler
 
 
 class BaseLivelinessProbe:
@@ -23,7 +32,8 @@ class BaseLivelinessProbe:
 
     It is inherited for basic liveliness probe functionality.
 
-    TBD: what about scalability? what if we have 1000 devices?
+    For a large number of devices, the StaggeredMultiDeviceLivelinessProbe
+    spreads the probes evenly over the liveliness check period.
     """
 
     def __init__(
@@ -33,7 +43,41 @@ class BaseLivelinessProbe:
         proxy_timeout: int = 500,
         liveliness_check_period: int = 1,
         max_logging_time: int = 5,
+        event_freshness_window: float = 0,
+        circuit_breaker_enabled: bool = False,
+        max_backoff_period: float = 10.0,
+        metrics_registry: Optional[MetricsRegistry] = None,
     ):
+        """
+        :param component_manager: The instance of component manager.
+        :param logger: logger
+        :type logger: Logger
+        :param proxy_timeout: proxy timeout in milliseconds
+        :type proxy_timeout: int
+        :param liveliness_check_period: interval in seconds between two
+            liveliness checks
+        :type liveliness_check_period: int
+        :param max_logging_time: minimum interval in seconds between
+            repeated log messages
+        :type max_logging_time: int
+        :param event_freshness_window: a device that has sent an event within
+            this many seconds is considered alive and is not probed.
+            Defaults to 0, which probes every device in every cycle.
+        :type event_freshness_window: float
+        :param circuit_breaker_enabled: when True, a device which failed
+            its probe is not probed again until its backoff expires. The
+            backoff starts at the liveliness check period and doubles on
+            every failed recovery attempt.
+        :type circuit_breaker_enabled: bool
+        :param max_backoff_period: upper bound in seconds of the backoff of
+            an unresponsive device
+        :type max_backoff_period: float
+        :param metrics_registry: registry in which the probe results, the
+            duration of the probe cycles and the number of unresponsive
+            devices are reported. Defaults to None, in which case the probe
+            keeps its own registry.
+        :type metrics_registry: MetricsRegistry, optional
+        """
         self._thread = threading.Thread(target=self.run)
         self._stop = False
         self._logger = logger
@@ -41,8 +85,31 @@ class BaseLivelinessProbe:
         self._component_manager = component_manager
         self._proxy_timeout = proxy_timeout
         self._liveliness_check_period = liveliness_check_period
+        self._event_freshness_window = event_freshness_window
+        self._circuit_breaker_enabled = circuit_breaker_enabled
+        self._max_backoff_period = max_backoff_period
+        self._circuit_breakers: Dict[str, DeviceCircuitBreaker] = {}
+        self._circuit_breakers_lock = threading.Lock()
         self._dev_factory = DevFactory()
         self.log_manager = LogManager(max_logging_time)
+        self._metrics_registry = metrics_registry or MetricsRegistry()
+        self._probe_counters = {
+            succeeded: self._metrics_registry.counter(
+                "tmc_liveliness_probes_total",
+                "Liveliness probes of the devices, by result",
+                {"result": "success" if succeeded else "failure"},
+            )
+            for succeeded in (True, False)
+        }
+        self._cycle_time_histogram = self._metrics_registry.histogram(
+            "tmc_liveliness_probe_cycle_seconds",
+            "Time taken to probe all the monitored devices once",
+        )
+        self._metrics_registry.gauge(
+            "tmc_liveliness_unresponsive_devices",
+            "Monitored devices which are unresponsive",
+            function=self.unresponsive_device_count,
+        )
 
     def start(self) -> None:
         """
@@ -65,6 +132,143 @@ class BaseLivelinessProbe:
         """
         raise NotImplementedError("This method must be inherited")
 
+    @property
+    def event_freshness_window(self) -> float:
+        """Returns the event freshness window.
+
+        :return: time in seconds for which an event proves the device alive
+        :rtype: float
+        """
+        return self._event_freshness_window
+
+    @event_freshness_window.setter
+    def event_freshness_window(self, value: float) -> None:
+        """Sets the event freshness window.
+
+        :param value: time in seconds for which an event proves the device
+            alive, 0 disables the heartbeat-aware mode
+        :type value: float
+        """
+        self._event_freshness_window = value
+
+    def has_fresh_event(self, dev_info: DeviceInfo) -> bool:
+        """This method checks whether the device has sent a change event
+        within the event freshness window, in which case it is known to be
+        alive and does not need to be probed. Error events, such as the
+        API_EventTimeout errors of a device which is down, do not count.
+
+        :param dev_info: DeviceInfo instance
+        :type dev_info: DeviceInfo
+        :return: True if the device has sent a recent event
+        :rtype: bool
+        """
+        if not self._event_freshness_window or dev_info.unresponsive:
+            return False
+        last_change_event_arrived = dev_info.last_change_event_arrived
+        if last_change_event_arrived is None:
+            return False
+        return (
+            get_clock().time() - last_change_event_arrived
+            < self._event_freshness_window
+        )
+
+    @property
+    def circuit_breaker_enabled(self) -> bool:
+        """Returns whether the probes are guarded by circuit breakers.
+
+        :return: True if the circuit breakers are enabled
+        :rtype: bool
+        """
+        return self._circuit_breaker_enabled
+
+    def get_circuit_breaker(self, dev_name: str) -> DeviceCircuitBreaker:
+        """Returns the circuit breaker of the given device, creating it on
+        first use.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :return: circuit breaker of the device
+        :rtype: DeviceCircuitBreaker
+        """
+        with self._circuit_breakers_lock:
+            circuit_breaker = self._circuit_breakers.get(dev_name)
+            if circuit_breaker is None:
+                circuit_breaker = DeviceCircuitBreaker(
+                    base_backoff=self._liveliness_check_period,
+                    max_backoff=self._max_backoff_period,
+                    clock=get_clock().monotonic,
+                )
+                self._circuit_breakers[dev_name] = circuit_breaker
+            return circuit_breaker
+
+    def is_probe_allowed(self, dev_info: DeviceInfo) -> bool:
+        """Checks the circuit breaker of the device, if enabled, and
+        reports its state in the device info.
+
+        :param dev_info: DeviceInfo instance
+        :type dev_info: DeviceInfo
+        :return: False if the breaker of the device is open
+        :rtype: bool
+        """
+        if not self._circuit_breaker_enabled:
+            return True
+        circuit_breaker = self.get_circuit_breaker(dev_info.dev_name)
+        allowed = circuit_breaker.allow_request()
+        dev_info.circuit_breaker_state = circuit_breaker.state
+        return allowed
+
+    def record_probe_result(
+        self, dev_info: DeviceInfo, probe_succeeded: bool
+    ) -> None:
+        """Records the result of a probe in the metrics and in the circuit
+        breaker of the device, if enabled, and reports its state in the
+        device info.
+
+        :param dev_info: DeviceInfo instance
+        :type dev_info: DeviceInfo
+        :param probe_succeeded: whether the device answered the probe
+        :type probe_succeeded: bool
+        """
+        self._probe_counters[probe_succeeded].inc()
+        if not self._circuit_breaker_enabled:
+            return
+        circuit_breaker = self.get_circuit_breaker(dev_info.dev_name)
+        if probe_succeeded:
+            circuit_breaker.record_success()
+        else:
+            circuit_breaker.record_failure()
+        dev_info.circuit_breaker_state = circuit_breaker.state
+
+    def monitored_device_infos(self) -> List[DeviceInfo]:
+        """Returns the device infos of the monitored devices.
+
+        :return: device infos of the monitored devices
+        :rtype: List[DeviceInfo]
+        """
+        return []
+
+    def unresponsive_device_count(self) -> int:
+        """Returns the number of monitored devices which are unresponsive.
+
+        :return: number of unresponsive devices
+        :rtype: int
+        """
+        return sum(
+            1
+            for dev_info in self.monitored_device_infos()
+            if dev_info is not None and dev_info.unresponsive
+        )
+
+    def discard_circuit_breakers(self, dev_names: List[str]) -> None:
+        """Discards the circuit breakers of the given devices.
+
+        :param dev_names: Tango device FQDNs.
+        :type dev_names: List[str]
+        """
+        with self._circuit_breakers_lock:
+            for dev_name in dev_names:
+                self._circuit_breakers.pop(dev_name, None)
+
     def get_device_and_database(
         self, device_name: str
     ) -> tuple[str, tango.Database]:
@@ -90,10 +294,22 @@ class BaseLivelinessProbe:
         if the device is reachable and able to respond to the state command.
         If the device is not defined in database/unreachable or unable to
         respond to state command, it sets device as unresponsive.
+        The round-trip time of the state command is stored as the ping of
+        the device, in microseconds.
+
+        Devices which have sent an event within the event freshness window
+        are skipped, as the event already proves they are alive. When the
+        circuit breakers are enabled, devices whose breaker is open are
+        skipped until their backoff expires.
 
         :param dev_info: DeviceInfo instance
         :type dev_info: DeviceInfo
         """
+        if self.has_fresh_event(dev_info) or not self.is_probe_allowed(
+            dev_info
+        ):
+            return
+        probe_succeeded = False
         try:
             component_manager = self._component_manager
             update_device_availabiity = (
@@ -120,7 +336,10 @@ class BaseLivelinessProbe:
                     )
             else:
                 proxy = self._dev_factory.get_device(dev_info.dev_name)
+                start_time = time.perf_counter()
                 proxy.state()
+                dev_info.ping = int((time.perf_counter() - start_time) * 1e6)
+                probe_succeeded = True
                 if dev_info.unresponsive:
                     component_manager.update_responsiveness_info(
                         dev_info.dev_name
@@ -186,9 +405,17 @@ class BaseLivelinessProbe:
         if exception_message and dev_info.exception != exception_message:
             update_failure(dev_info, exception_message)
 
+        self.record_probe_result(dev_info, probe_succeeded)
+
 
 class MultiDeviceLivelinessProbe(BaseLivelinessProbe):
-    """A class for monitoring multiple devices"""
+    """A class for monitoring multiple devices
+
+    The monitored devices are kept in insertion order in a dictionary,
+    which makes adding, removing and membership checks O(1). Every change
+    publishes an immutable snapshot of the device names, which the probe
+    thread iterates over without taking the lock.
+    """
 
     def __init__(
         self,
@@ -198,6 +425,10 @@ class MultiDeviceLivelinessProbe(BaseLivelinessProbe):
         proxy_timeout: int = 500,
         liveliness_check_period: int = 1,
         max_logging_time: int = 5,
+        event_freshness_window: float = 0,
+        circuit_breaker_enabled: bool = False,
+        max_backoff_period: float = 10.0,
+        metrics_registry: Optional[MetricsRegistry] = None,
     ):
         super().__init__(
             component_manager,
@@ -205,9 +436,36 @@ class MultiDeviceLivelinessProbe(BaseLivelinessProbe):
             proxy_timeout,
             liveliness_check_period,
             max_logging_time,
+            event_freshness_window,
+            circuit_breaker_enabled,
+            max_backoff_period,
+            metrics_registry,
         )
         self._max_workers = max_workers
-        self._monitoring_devices: List[str] = []
+        self._monitoring_devices: Dict[str, None] = {}
+        self._monitoring_snapshot: Tuple[str, ...] = ()
+        self._monitoring_lock = threading.Lock()
+
+    @property
+    def monitoring_devices(self) -> Tuple[str, ...]:
+        """Returns the names of the monitored devices, in the order they
+        were added.
+
+        :return: snapshot of the monitored device names
+        :rtype: Tuple[str, ...]
+        """
+        return self._monitoring_snapshot
+
+    def monitored_device_infos(self) -> List[DeviceInfo]:
+        """Returns the device infos of the monitored devices.
+
+        :return: device infos of the monitored devices
+        :rtype: List[DeviceInfo]
+        """
+        return [
+            self._component_manager.get_device(dev_name)
+            for dev_name in self._monitoring_snapshot
+        ]
 
     def add_device(self, dev_name: str) -> None:
         """This method is used to add device in the Queue for monitoring
@@ -215,57 +473,555 @@ class MultiDeviceLivelinessProbe(BaseLivelinessProbe):
         :param dev_name: Tango device FQDN.
         :type dev_name: str
         """
-        if dev_name in self._monitoring_devices:
+        self.add_devices([dev_name])
+
+    def add_devices(self, dev_names: Iterable[str]) -> List[str]:
+        """This method is used to add devices in the Queue for monitoring.
+        Devices which are already monitored are ignored.
+
+        :param dev_names: Tango device FQDNs.
+        :type dev_names: Iterable[str]
+        :return: names of the devices which were added
+        :rtype: List[str]
+        """
+        added_devices: List[str] = []
+        with self._monitoring_lock:
+            for dev_name in dev_names:
+                if dev_name in self._monitoring_devices:
+                    self._logger.debug(
+                        "The device: %s is already present in the "
+                        + "monitoring devices list.",
+                        dev_name,
+                    )
+                    continue
+                self._monitoring_devices[dev_name] = None
+                added_devices.append(dev_name)
+            if added_devices:
+                self._monitoring_snapshot = tuple(self._monitoring_devices)
+        if added_devices:
             self._logger.debug(
-                "The device: %s is already present in the monitoring devices "
-                + "list.",
-                dev_name,
+                "Added devices: %s to the list of monitoring devices. "
+                + "Number of monitored devices is: %s",
+                added_devices,
+                len(self._monitoring_snapshot),
             )
-            return
-        self._monitoring_devices.append(dev_name)
-        self._logger.debug(
-            "Added device: %s to the list of monitoring devices. "
-            + "Updated list is: %s",
-            dev_name,
-            self._monitoring_devices,
-        )
+        return added_devices
 
-    def remove_devices(self, dev_names: List[str]) -> None:
+    def remove_devices(self, dev_names: Iterable[str]) -> List[str]:
         """Remove the given devices from the monitoring queue.
 
-        :param dev_names: Names of devices in a list that are to be removed
-            from the monitoring list
-        :type dev_names: `List[str]`
+        :param dev_names: Names of devices that are to be removed from the
+            monitoring list
+        :type dev_names: `Iterable[str]`
+        :return: names of the devices which were removed
+        :rtype: List[str]
         """
-        for dev_name in dev_names:
-            try:
-                self._monitoring_devices.remove(dev_name)
-            except ValueError:
-                self._logger.debug(
-                    "Device: %s is not present in the list of monitoring "
-                    + "devices. Current list is: %s",
-                    dev_name,
-                    self._monitoring_devices,
-                )
+        dev_names = list(dev_names)
+        removed_devices: List[str] = []
+        with self._monitoring_lock:
+            for dev_name in dev_names:
+                if dev_name not in self._monitoring_devices:
+                    self._logger.debug(
+                        "Device: %s is not present in the list of "
+                        + "monitoring devices.",
+                        dev_name,
+                    )
+                    continue
+                del self._monitoring_devices[dev_name]
+                removed_devices.append(dev_name)
+            if removed_devices:
+                self._monitoring_snapshot = tuple(self._monitoring_devices)
+        self.discard_circuit_breakers(dev_names)
+        return removed_devices
 
     def run(self) -> None:
         """A method to run device in the queue for monitoring"""
         with tango.EnsureOmniThread():
             while not self._stop:
                 try:
-                    for dev_name in self._monitoring_devices:
+                    cycle_start_time = time.perf_counter()
+                    for dev_name in self._monitoring_snapshot:
                         dev_info = self._component_manager.get_device(dev_name)
                         self.device_task(dev_info)
+                    self._cycle_time_histogram.observe(
+                        time.perf_counter() - cycle_start_time
+                    )
+                except (AttributeError, tango.DevFailed) as exception:
+                    self._logger.warning("Exception occured: %s", exception)
+                except BaseException as exp_msg:
+                    self._logger.warning("Exception occured: %s", exp_msg)
+                get_clock().sleep(self._liveliness_check_period)
+
+
+class StaggeredMultiDeviceLivelinessProbe(MultiDeviceLivelinessProbe):
+    """A class for monitoring multiple devices, where each device is probed
+    at its own phase within the liveliness check period. The probes are
+    spread evenly over time, so the load on the Tango database and on the
+    devices stays smooth instead of peaking once per period. As there are
+    no probe cycles, no cycle time is reported in the metrics.
+
+    The due probes are run on a pool of max_workers threads, so that a
+    device hanging for the proxy timeout does not delay the probes of the
+    other devices. A device is not probed again while its previous probe is
+    still running.
+    """
+
+    PROBE_THREAD_NAME_PREFIX: str = "staggered_liveliness_probe"
+
+    # Minimum time in seconds between two wake ups of the probe thread.
+    # Probes falling due within this time are run together, which bounds
+    # the number of wake ups per second for very large device counts.
+    SCHEDULING_RESOLUTION: float = 0.005
+
+    def __init__(
+        self,
+        component_manager,
+        logger: Logger,
+        max_workers: int = 5,
+        proxy_timeout: int = 500,
+        liveliness_check_period: int = 1,
+        max_logging_time: int = 5,
+        event_freshness_window: float = 0,
+        circuit_breaker_enabled: bool = False,
+        max_backoff_period: float = 10.0,
+        metrics_registry: Optional[MetricsRegistry] = None,
+    ):
+        super().__init__(
+            component_manager,
+            logger,
+            max_workers,
+            proxy_timeout,
+            liveliness_check_period,
+            max_logging_time,
+            event_freshness_window,
+            circuit_breaker_enabled,
+            max_backoff_period,
+            metrics_registry,
+        )
+        self._scheduler = ProbeScheduler(
+            liveliness_check_period, clock=get_clock().monotonic
+        )
+        self._wakeup_event = threading.Event()
+        self._probe_pool: Optional[ThreadPoolExecutor] = None
+        self._probes_in_progress: set[str] = set()
+        self._probes_in_progress_lock = threading.Lock()
+
+    @property
+    def scheduler(self) -> ProbeScheduler:
+        """Returns the probe scheduler.
+
+        :return: probe scheduler
+        :rtype: ProbeScheduler
+        """
+        return self._scheduler
+
+    def add_device(self, dev_name: str, interval: Optional[float] = None):
+        """This method is used to add device in the schedule for monitoring
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :param interval: interval in seconds between two probes of this
+            device, defaults to the liveliness check period.
+        :type interval: float, optional
+        """
+        self.add_devices([dev_name], interval)
+
+    def add_devices(
+        self, dev_names: Iterable[str], interval: Optional[float] = None
+    ) -> List[str]:
+        """This method is used to add devices in the schedule for
+        monitoring. Devices which are already monitored are ignored.
+
+        :param dev_names: Tango device FQDNs.
+        :type dev_names: Iterable[str]
+        :param interval: interval in seconds between two probes of these
+            devices, defaults to the liveliness check period.
+        :type interval: float, optional
+        :return: names of the devices which were added
+        :rtype: List[str]
+        """
+        added_devices = super().add_devices(dev_names)
+        for dev_name in added_devices:
+            self._scheduler.add_device(dev_name, interval)
+        if added_devices:
+            self._wakeup_event.set()
+        return added_devices
+
+    def remove_devices(self, dev_names: Iterable[str]) -> List[str]:
+        """Remove the given devices from the monitoring schedule.
+
+        :param dev_names: Names of devices that are to be removed from the
+            monitoring list
+        :type dev_names: `Iterable[str]`
+        :return: names of the devices which were removed
+        :rtype: List[str]
+        """
+        removed_devices = super().remove_devices(dev_names)
+        for dev_name in removed_devices:
+            self._scheduler.remove_device(dev_name)
+        return removed_devices
+
+    def stop(self) -> None:
+        """
+        Stops the sub devices
+        """
+        super().stop()
+        self._wakeup_event.set()
+        if self._probe_pool is not None:
+            self._probe_pool.shutdown(wait=False, cancel_futures=True)
+
+    def submit_probe(self, dev_name: str, due_time: float) -> bool:
+        """Submits the probe of the given device to the probe pool, unless
+        the previous probe of the device is still running.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :param due_time: time at which the probe was scheduled, on the
+            scheduler clock.
+        :type due_time: float
+        :return: True if the probe was submitted
+        :rtype: bool
+        """
+        with self._probes_in_progress_lock:
+            if dev_name in self._probes_in_progress:
+                return False
+            self._probes_in_progress.add(dev_name)
+        if self._probe_pool is None:
+            self._probe_pool = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix=self.PROBE_THREAD_NAME_PREFIX,
+            )
+        try:
+            self._probe_pool.submit(self._run_probe, dev_name, due_time)
+        except RuntimeError:
+            # The pool is shut down once the probe is stopped.
+            with self._probes_in_progress_lock:
+                self._probes_in_progress.discard(dev_name)
+            return False
+        return True
+
+    def _run_probe(self, dev_name: str, due_time: float) -> None:
+        """Probes the device on a pool thread."""
+        try:
+            with tango.EnsureOmniThread():
+                self.probe_device(dev_name, due_time)
+        except (AttributeError, tango.DevFailed) as exception:
+            self._logger.warning("Exception occured: %s", exception)
+        except BaseException as exp_msg:
+            self._logger.warning("Exception occured: %s", exp_msg)
+        finally:
+            with self._probes_in_progress_lock:
+                self._probes_in_progress.discard(dev_name)
+
+    def probe_device(self, dev_name: str, due_time: float) -> None:
+        """Probes the given device.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :param due_time: time at which the probe was scheduled, on the
+            scheduler clock.
+        :type due_time: float
+        """
+        dev_info = self._component_manager.get_device(dev_name)
+        self.device_task(dev_info)
+
+    def run(self) -> None:
+        """A method to probe the scheduled devices when they are due"""
+        with tango.EnsureOmniThread():
+            while not self._stop:
+                try:
+                    for dev_name, due_time in self._scheduler.pop_due():
+                        if self._stop:
+                            break
+                        self.submit_probe(dev_name, due_time)
                 except (AttributeError, tango.DevFailed) as exception:
                     self._logger.warning("Exception occured: %s", exception)
                 except BaseException as exp_msg:
                     self._logger.warning("Exception occured: %s", exp_msg)
-                sleep(self._liveliness_check_period)
+                self._wakeup_event.clear()
+                wait_time = self._scheduler.time_until_next()
+                if wait_time is None:
+                    wait_time = self._liveliness_check_period
+                get_clock().wait(
+                    self._wakeup_event,
+                    max(wait_time, self.SCHEDULING_RESOLUTION),
+                )
+
+
+class AsyncMultiDeviceLivelinessProbe(MultiDeviceLivelinessProbe):
+    """A class for monitoring multiple devices from a single asyncio event
+    loop. The devices are probed concurrently through Tango proxies in
+    asyncio green mode, so that hundreds of devices are checked at once
+    without a thread per device.
+
+    The Tango database is only queried for devices which failed their
+    probe, to report whether they are exported. The device proxies are
+    created in the default executor of the event loop, as their creation
+    connects to the device and would block the loop, and are cached. Each
+    event loop has its own Tango asyncio executor, created in the thread of
+    the loop, so that the calls of the proxies are awaited on the loop
+    probing the devices.
+    """
+
+    def __init__(
+        self,
+        component_manager,
+        logger: Logger,
+        max_workers: int = 5,
+        proxy_timeout: int = 500,
+        liveliness_check_period: int = 1,
+        max_logging_time: int = 5,
+        event_freshness_window: float = 0,
+        circuit_breaker_enabled: bool = False,
+        max_backoff_period: float = 10.0,
+        max_concurrent_probes: int = 256,
+        metrics_registry: Optional[MetricsRegistry] = None,
+    ):
+        """
+        :param max_concurrent_probes: maximum number of probes in flight at
+            the same time
+        :type max_concurrent_probes: int
+        """
+        super().__init__(
+            component_manager,
+            logger,
+            max_workers,
+            proxy_timeout,
+            liveliness_check_period,
+            max_logging_time,
+            event_freshness_window,
+            circuit_breaker_enabled,
+            max_backoff_period,
+            metrics_registry,
+        )
+        self._max_concurrent_probes = max_concurrent_probes
+        self._dev_factory = DevFactory(green_mode=tango.GreenMode.Asyncio)
+        self._proxies: Dict[str, tango.DeviceProxy] = {}
+        self._asyncio_executor: Optional[AsyncioExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+
+    def remove_devices(self, dev_names: Iterable[str]) -> List[str]:
+        """Remove the given devices from the monitoring list, and discard
+        their cached proxies.
+
+        :param dev_names: Names of devices that are to be removed from the
+            monitoring list
+        :type dev_names: `Iterable[str]`
+        :return: names of the devices which were removed
+        :rtype: List[str]
+        """
+        removed_devices = super().remove_devices(dev_names)
+        for dev_name in removed_devices:
+            self._proxies.pop(dev_name, None)
+        return removed_devices
+
+    async def get_proxy(self, dev_name: str) -> tango.DeviceProxy:
+        """Returns the cached proxy of the device, which is created in the
+        default executor of the event loop on first use, so that connecting
+        to a slow or down device does not block the other probes.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :return: asyncio device proxy
+        :rtype: tango.DeviceProxy
+        """
+        asyncio_executor = self._get_asyncio_executor()
+        proxy = self._proxies.get(dev_name)
+        if proxy is None:
+            proxy = await asyncio_executor.loop.run_in_executor(
+                None,
+                functools.partial(
+                    self._dev_factory.get_device,
+                    dev_name,
+                    asyncio_executor=asyncio_executor,
+                ),
+            )
+            self._proxies[dev_name] = proxy
+        return proxy
+
+    def _get_asyncio_executor(self) -> AsyncioExecutor:
+        """Returns the Tango asyncio executor of the running event loop.
+        It is created in the thread of the loop, on first use, and the
+        proxies bound to the executor of a previous loop are discarded.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._asyncio_executor is None
+            or self._asyncio_executor.loop is not loop
+        ):
+            self._asyncio_executor = AsyncioExecutor(loop=loop)
+            self._proxies.clear()
+        return self._asyncio_executor
+
+    def stop(self) -> None:
+        """
+        Stops the sub devices
+        """
+        super().stop()
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                # The loop was closed after the check.
+                pass
+
+    def run(self) -> None:
+        """A method to run the event loop probing the devices"""
+        with tango.EnsureOmniThread():
+            asyncio.run(self.run_probe_loop())
+
+    async def run_probe_loop(self) -> None:
+        """Probes all the monitored devices concurrently, once per liveliness
+        check period, until the probe is stopped."""
+        self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self._max_concurrent_probes)
+        while not self._stop:
+            try:
+                cycle_start_time = time.perf_counter()
+                dev_infos = [
+                    self._component_manager.get_device(dev_name)
+                    for dev_name in self._monitoring_snapshot
+                ]
+                results = await asyncio.gather(
+                    *(
+                        self._bounded_device_task(semaphore, dev_info)
+                        for dev_info in dev_infos
+                    ),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        self._logger.warning("Exception occured: %s", result)
+                self._cycle_time_histogram.observe(
+                    time.perf_counter() - cycle_start_time
+                )
+            except Exception as exception:
+                self._logger.warning("Exception occured: %s", exception)
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(), self._liveliness_check_period
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _bounded_device_task(
+        self, semaphore: asyncio.Semaphore, dev_info: DeviceInfo
+    ) -> None:
+        """Runs the probe of the device once a probe slot is free."""
+        async with semaphore:
+            await self.async_device_task(dev_info)
+
+    async def async_device_task(self, dev_info: DeviceInfo) -> None:
+        """This method checks the device state from the event loop and
+        updates the responsiveness of the device through the same component
+        manager callbacks as device_task.
+
+        :param dev_info: DeviceInfo instance
+        :type dev_info: DeviceInfo
+        """
+        if self.has_fresh_event(dev_info) or not self.is_probe_allowed(
+            dev_info
+        ):
+            return
+        component_manager = self._component_manager
+        try:
+            proxy = await self.get_proxy(dev_info.dev_name)
+            start_time = time.perf_counter()
+            result = proxy.state()
+            if inspect.isawaitable(result):
+                await result
+            dev_info.ping = int((time.perf_counter() - start_time) * 1e6)
+        except Exception as exception:
+            exception_message = await self._get_failure_message(
+                dev_info.dev_name, exception
+            )
+            if dev_info.exception != exception_message:
+                component_manager.update_exception_for_unresponsiveness(
+                    dev_info, exception_message
+                )
+            self.record_probe_result(dev_info, False)
+            return
+        if dev_info.unresponsive:
+            component_manager.update_responsiveness_info(dev_info.dev_name)
+            component_manager.update_device_availabiity_for_subscription(
+                dev_info.dev_name
+            )
+        self.record_probe_result(dev_info, True)
+
+    async def _get_failure_message(
+        self, dev_name: str, exception: Exception
+    ) -> str:
+        """Returns the exception message of a failed probe. The blocking
+        database lookup runs in the default executor of the event loop.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :param exception: exception raised by the probe
+        :type exception: Exception
+        :return: exception message
+        :rtype: str
+        """
+        try:
+            exported = await asyncio.get_running_loop().run_in_executor(
+                None, self._is_device_exported, dev_name
+            )
+        except Exception:
+            exported = True
+        if not exported:
+            if self.log_manager.is_logging_allowed("device_unexported"):
+                self._logger.debug(
+                    "Device is not yet exported into the tango database, "
+                    + "liveliness probe will retry "
+                    + "to connect with device: %s",
+                    dev_name,
+                )
+            return (
+                "Device is not yet exported into the tango database:"
+                f" {dev_name}"
+            )
+        if self.log_manager.is_logging_allowed("async_probe_failed"):
+            self._logger.error("Error on %s: %s", dev_name, exception)
+        if isinstance(exception, tango.CommunicationFailed):
+            return f"Communication Failed on {dev_name}: {str(exception)}"
+        if isinstance(exception, tango.ConnectionFailed):
+            match exception.args[0].reason:
+                case "DB_DeviceNotDefined":
+                    return f"Device is not defined in database: {dev_name}"
+                case "API_CantConnectToDevice":
+                    return f"Not able to connect to device: {dev_name}"
+                case "API_CantConnectToDatabase":
+                    return (
+                        "Failed to connect to database, "
+                        + "please check the database host and port"
+                    )
+        return f"Unable to reach device {dev_name}"
+
+    def _is_device_exported(self, dev_name: str) -> bool:
+        """Checks in the Tango database whether the device is exported.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :return: True if the device is exported
+        :rtype: bool
+        """
+        device_name, db = self.get_device_and_database(dev_name)
+        return bool(db.get_device_info(device_name).exported)
 
 
 class SingleDeviceLivelinessProbe(BaseLivelinessProbe):
     """A class for monitoring a single device"""
 
+    def monitored_device_infos(self) -> List[DeviceInfo]:
+        """Returns the device info of the monitored device.
+
+        :return: device info of the monitored device
+        :rtype: List[DeviceInfo]
+        """
+        return [self._component_manager.get_device()]
+
     def run(self) -> None:
         """A method to run single device in the Queue for monitoring"""
         with tango.EnsureOmniThread():
@@ -286,7 +1042,11 @@ class SingleDeviceLivelinessProbe(BaseLivelinessProbe):
                     try:
                         if dev_info.dev_name is None:
                             continue
+                        cycle_start_time = time.perf_counter()
                         self.device_task(dev_info)
+                        self._cycle_time_histogram.observe(
+                            time.perf_counter() - cycle_start_time
+                        )
                     except (AttributeError, tango.DevFailed) as exception:
                         self._logger.error(
                             "Error in submitting the task for %s: %s",
@@ -299,4 +1059,4 @@ class SingleDeviceLivelinessProbe(BaseLivelinessProbe):
                             dev_info.dev_name,
                             exp_msg,
                         )
-                sleep(self._liveliness_check_period)
+                get_clock().sleep(self._liveliness_check_period)
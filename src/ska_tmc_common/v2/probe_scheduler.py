@@ -0,0 +1,210 @@
+"""
+This module provides a scheduler which spreads the liveliness probes of
+the monitored devices evenly over the liveliness check period.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Optional
+
+# Fractional part of the golden ratio. Multiples of it modulo 1 are spread
+# evenly over [0, 1) whatever the number of devices, so every new device
+# lands in the largest gap left between the already scheduled ones.
+GOLDEN_RATIO_FRACTION: float = 0.6180339887498949
+
+
+class ProbeSchedule:
+    """Scheduling information of a single monitored device."""
+
+    __slots__ = ("dev_name", "interval", "phase", "next_due", "generation")
+
+    def __init__(
+        self,
+        dev_name: str,
+        interval: float,
+        phase: float,
+        next_due: float,
+        generation: int,
+    ) -> None:
+        self.dev_name = dev_name
+        self.interval = interval
+        self.phase = phase
+        self.next_due = next_due
+        self.generation = generation
+
+
+class ProbeScheduler:
+    """
+    A heap based scheduler that gives every monitored device its own phase
+    and interval, so that the probes are spread evenly over time instead of
+    being fired in one burst per period.
+
+    Removing a device is O(1): its heap entry is invalidated and discarded
+    lazily when it reaches the top of the heap.
+    """
+
+    def __init__(
+        self,
+        default_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param default_interval: interval in seconds between two probes of
+            the same device, used when a device is added without interval.
+        :type default_interval: float
+        :param clock: monotonic clock used for scheduling, defaults to
+            time.monotonic
+        :type clock: Callable[[], float]
+        """
+        self._default_interval = default_interval
+        self._clock = clock
+        self._heap: list[tuple[float, int, int, str]] = []
+        self._schedules: dict[str, ProbeSchedule] = {}
+        self._sequence = itertools.count()
+        self._generation = itertools.count()
+        self._phase_index = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._schedules)
+
+    def __contains__(self, dev_name: str) -> bool:
+        with self._lock:
+            return dev_name in self._schedules
+
+    @property
+    def device_names(self) -> list[str]:
+        """Returns the names of the scheduled devices.
+
+        :return: device names
+        :rtype: list[str]
+        """
+        with self._lock:
+            return list(self._schedules)
+
+    def get_schedule(self, dev_name: str) -> Optional[ProbeSchedule]:
+        """Returns the schedule of the given device.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :return: schedule of the device, or None if it is not scheduled
+        :rtype: ProbeSchedule, optional
+        """
+        with self._lock:
+            return self._schedules.get(dev_name)
+
+    def add_device(
+        self,
+        dev_name: str,
+        interval: Optional[float] = None,
+        phase: Optional[float] = None,
+    ) -> bool:
+        """Adds a device to the schedule.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :param interval: interval in seconds between two probes of the
+            device, defaults to the scheduler default interval.
+        :type interval: float, optional
+        :param phase: offset in seconds of the first probe within the
+            interval. By default the phases of consecutive devices follow a
+            golden ratio sequence, which keeps them evenly spread.
+        :type phase: float, optional
+        :return: False if the device was already scheduled, else True
+        :rtype: bool
+        """
+        interval = interval or self._default_interval
+        with self._lock:
+            if dev_name in self._schedules:
+                return False
+            if phase is None:
+                phase = (
+                    next(self._phase_index) * GOLDEN_RATIO_FRACTION % 1.0
+                ) * interval
+            schedule = ProbeSchedule(
+                dev_name,
+                interval,
+                phase,
+                self._clock() + phase,
+                next(self._generation),
+            )
+            self._schedules[dev_name] = schedule
+            self._push(schedule)
+            return True
+
+    def remove_device(self, dev_name: str) -> bool:
+        """Removes a device from the schedule.
+
+        :param dev_name: Tango device FQDN.
+        :type dev_name: str
+        :return: False if the device was not scheduled, else True
+        :rtype: bool
+        """
+        with self._lock:
+            return self._schedules.pop(dev_name, None) is not None
+
+    def time_until_next(self) -> Optional[float]:
+        """Returns the time until the next probe is due.
+
+        :return: time in seconds, 0 if a probe is already due, or None if
+            no device is scheduled
+        :rtype: float, optional
+        """
+        with self._lock:
+            self._discard_stale_entries()
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - self._clock())
+
+    def pop_due(self) -> list[tuple[str, float]]:
+        """Returns the devices whose probe is due and schedules their next
+        probe one interval later. A device which is late by more than one
+        interval skips the missed probes instead of being probed repeatedly
+        to catch up.
+
+        :return: list of device name and due time of the probes to run
+        :rtype: list[tuple[str, float]]
+        """
+        due_probes: list[tuple[str, float]] = []
+        with self._lock:
+            now = self._clock()
+            self._discard_stale_entries()
+            while self._heap and self._heap[0][0] <= now:
+                due_time, _, _, dev_name = heapq.heappop(self._heap)
+                schedule = self._schedules[dev_name]
+                due_probes.append((dev_name, due_time))
+                next_due = due_time + schedule.interval
+                if next_due <= now:
+                    missed = (now - due_time) // schedule.interval
+                    next_due = due_time + (missed + 1) * schedule.interval
+                schedule.next_due = next_due
+                self._push(schedule)
+                self._discard_stale_entries()
+        return due_probes
+
+    def _push(self, schedule: ProbeSchedule) -> None:
+        """Pushes the next probe of the given schedule on the heap."""
+        heapq.heappush(
+            self._heap,
+            (
+                schedule.next_due,
+                next(self._sequence),
+                schedule.generation,
+                schedule.dev_name,
+            ),
+        )
+
+    def _discard_stale_entries(self) -> None:
+        """Pops the entries of removed or re-added devices from the top of
+        the heap."""
+        while self._heap:
+            _, _, generation, dev_name = self._heap[0]
+            schedule = self._schedules.get(dev_name)
+            if schedule is not None and schedule.generation == generation:
+                return
+            heapq.heappop(self._heap)
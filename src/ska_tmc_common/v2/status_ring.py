@@ -0,0 +1,122 @@
+"""
+This module contains the ring buffer of the statuses reported by the event
+manager.
+"""
+
+from __future__ import annotations
+
+import datetime
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from ska_tmc_common.clock import get_clock
+
+STATUS_FLUSH_THREAD_NAME: str = "event_manager_status_flush"
+
+
+class StatusEntry:
+    """A status message and the time it was reported."""
+
+    __slots__ = ("timestamp", "message")
+
+    def __init__(self, timestamp: float, message: str) -> None:
+        self.timestamp: float = timestamp
+        self.message: str = message
+
+    def __str__(self) -> str:
+        return (
+            datetime.datetime.fromtimestamp(self.timestamp).ctime()
+            + "::"
+            + self.message
+        )
+
+
+class StatusRing:
+    """
+    Lock protected ring of the latest status entries. The entries are only
+    formatted as strings when they are read. The status update callback is
+    invoked at most once per minimum update interval: the statuses reported
+    in between are coalesced into a single deferred call made at the end of
+    the interval. The times and the interval are measured on the clock of
+    the process.
+    """
+
+    def __init__(
+        self,
+        maximum_size: int = 50,
+        update_callback: Optional[Callable[[list[str]], None]] = None,
+        minimum_update_interval: float = 0.1,
+    ) -> None:
+        """
+        :param maximum_size: maximum number of entries, the oldest entries
+            are discarded when it is exceeded.
+        :type maximum_size: int
+        :param update_callback: callback invoked with the formatted
+            statuses when new statuses are reported.
+        :type update_callback: Callable[[list[str]], None], optional
+        :param minimum_update_interval: minimum interval in seconds between
+            two invocations of the callback, defaults to 0.1 second.
+        :type minimum_update_interval: float
+        """
+        self._entries: deque[StatusEntry] = deque(maxlen=maximum_size)
+        self._update_callback = update_callback
+        self._minimum_update_interval = minimum_update_interval
+        self._last_update: float = float("-inf")
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def entries(self) -> list[StatusEntry]:
+        """Returns the status entries, the oldest first.
+
+        :return: status entries
+        :rtype: list[StatusEntry]
+        """
+        with self._lock:
+            return list(self._entries)
+
+    @property
+    def statuses(self) -> list[str]:
+        """Returns the statuses formatted as "<time>::<message>", the oldest
+        first.
+
+        :return: formatted statuses
+        :rtype: list[str]
+        """
+        return [str(entry) for entry in self.entries]
+
+    def append(self, message: str) -> None:
+        """Adds a status, and invokes the callback now or at the end of the
+        current update interval.
+
+        :param message: status message
+        :type message: str
+        """
+        clock = get_clock()
+        with self._lock:
+            self._entries.append(StatusEntry(clock.time(), message))
+            if self._update_callback is None or self._flush_timer:
+                return
+            now = clock.monotonic()
+            delay = self._last_update + self._minimum_update_interval - now
+            if delay > 0:
+                self._flush_timer = clock.timer(delay, self.flush)
+                self._flush_timer.name = STATUS_FLUSH_THREAD_NAME
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+                return
+            self._last_update = now
+        self._update_callback(self.statuses)
+
+    def flush(self) -> None:
+        """Invokes the callback with the current statuses."""
+        with self._lock:
+            self._flush_timer = None
+            self._last_update = get_clock().monotonic()
+        if self._update_callback:
+            self._update_callback(self.statuses)
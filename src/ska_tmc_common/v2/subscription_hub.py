@@ -0,0 +1,349 @@
+"""
+This module contains a process level hub which shares the Tango event
+subscriptions of the same device attribute between several consumers, such
+as the event managers of the component managers running in one device
+server.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+from typing import Callable, Optional
+
+import tango
+
+from ska_tmc_common.clock import get_clock
+from ska_tmc_common.dev_factory import DevFactory
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class SharedSubscription:
+    """A Tango event subscription shared by several consumers."""
+
+    __slots__ = (
+        "device_name",
+        "attribute_name",
+        "proxy",
+        "subscription_id",
+        "stateless",
+        "last_event",
+        "resubscription_time",
+        "lock",
+        "_callbacks",
+        "_callbacks_snapshot",
+        "_logger",
+    )
+
+    def __init__(
+        self,
+        device_name: str,
+        attribute_name: str,
+        logger: logging.Logger = LOGGER,
+    ) -> None:
+        self.device_name: str = device_name
+        self.attribute_name: str = attribute_name
+        self.proxy: Optional[tango.DeviceProxy] = None
+        self.subscription_id: Optional[int] = None
+        self.stateless: bool = True
+        self.last_event: Optional[tango.EventData] = None
+        self.resubscription_time: Optional[float] = None
+        self.lock: threading.RLock = threading.RLock()
+        self._callbacks: dict[int, Callable] = {}
+        self._callbacks_snapshot: tuple[Callable, ...] = ()
+        self._logger = logger
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+    def add_callback(self, consumer_id: int, callback: Callable) -> None:
+        """Registers the callback of a consumer.
+
+        :param consumer_id: consumer id
+        :type consumer_id: int
+        :param callback: callback invoked with every event
+        :type callback: Callable
+        """
+        self._callbacks[consumer_id] = callback
+        self._callbacks_snapshot = tuple(self._callbacks.values())
+
+    def remove_callback(self, consumer_id: int) -> None:
+        """Unregisters the callback of a consumer.
+
+        :param consumer_id: consumer id
+        :type consumer_id: int
+        """
+        self._callbacks.pop(consumer_id, None)
+        self._callbacks_snapshot = tuple(self._callbacks.values())
+
+    def dispatch(self, event: tango.EventData) -> None:
+        """Forwards the event to the callbacks of all the consumers. This is
+        the callback of the underlying Tango subscription. Error events are
+        not kept as the latest event, so that they are not replayed to the
+        consumers joining the subscription.
+
+        :param event: event data
+        :type event: tango.EventData
+        """
+        if not event.err:
+            self.last_event = event
+        for callback in self._callbacks_snapshot:
+            try:
+                callback(event)
+            except Exception as exception:
+                self._logger.error(
+                    "Error occurred in event callback of attribute %s of "
+                    "device %s: %s",
+                    self.attribute_name,
+                    self.device_name,
+                    exception,
+                )
+
+
+class SubscriptionHub:
+    """
+    Keeps a single Tango change event subscription per device attribute,
+    whatever the number of consumers subscribing to it, and fans the events
+    out to the callbacks of all the consumers. The subscription is reference
+    counted: it is made when the first consumer subscribes and removed when
+    the last one unsubscribes. A consumer joining an existing subscription
+    receives the latest valid event straight away, as it would have from
+    its own subscription. A broken subscription is recreated for all its
+    consumers by resubscribe, once per minimum resubscription interval
+    however many consumers detect that it is broken.
+
+    The hub shared by all the event managers of a process is provided by
+    get_instance.
+    """
+
+    _instance: Optional[SubscriptionHub] = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        device_factory: Optional[DevFactory] = None,
+        logger: logging.Logger = LOGGER,
+        minimum_resubscription_interval: float = 10.0,
+    ) -> None:
+        """
+        :param device_factory: factory of the device proxies used when a
+            consumer does not provide one, defaults to a new DevFactory.
+        :type device_factory: DevFactory, optional
+        :param logger: logger
+        :type logger: logging.Logger
+        :param minimum_resubscription_interval: minimum interval in seconds
+            between two resubscriptions of the same attribute. The
+            consumers of a broken subscription all receive its error events
+            and request its resubscription, only the first request within
+            the interval recreates it. Defaults to 10 seconds.
+        :type minimum_resubscription_interval: float
+        """
+        self._device_factory = device_factory or DevFactory()
+        self._logger = logger
+        self._minimum_resubscription_interval = minimum_resubscription_interval
+        self._subscriptions: dict[tuple[str, str], SharedSubscription] = {}
+        self._consumers: dict[int, tuple[str, str]] = {}
+        self._consumer_ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    @classmethod
+    def get_instance(cls) -> SubscriptionHub:
+        """Returns the hub shared by the whole process.
+
+        :return: process level subscription hub
+        :rtype: SubscriptionHub
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Returns the number of underlying subscriptions and consumers.
+
+        :return: subscription and consumer counts
+        :rtype: dict[str, int]
+        """
+        with self._lock:
+            return {
+                "subscriptions": len(self._subscriptions),
+                "consumers": len(self._consumers),
+            }
+
+    def consumer_count(self, device_name: str, attribute_name: str) -> int:
+        """Returns the number of consumers of the device attribute.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: attribute name
+        :type attribute_name: str
+        :return: number of consumers
+        :rtype: int
+        """
+        with self._lock:
+            subscription = self._subscriptions.get(
+                (device_name, attribute_name.lower())
+            )
+            return len(subscription) if subscription else 0
+
+    def subscribe(
+        self,
+        device_name: str,
+        attribute_name: str,
+        callback: Callable,
+        proxy: Optional[tango.DeviceProxy] = None,
+        stateless: bool = True,
+    ) -> int:
+        """Subscribes the callback to the change events of the device
+        attribute. The Tango subscription is only made for the first
+        consumer of the attribute.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: attribute name
+        :type attribute_name: str
+        :param callback: callback invoked with every event
+        :type callback: Callable
+        :param proxy: proxy of the device, defaults to the one provided by
+            the device factory of the hub.
+        :type proxy: tango.DeviceProxy, optional
+        :param stateless: stateless flag of the Tango subscription
+        :type stateless: bool
+        :raises Exception: the exception raised by the Tango subscription
+        :return: consumer id, to be provided to unsubscribe
+        :rtype: int
+        """
+        key = (device_name, attribute_name.lower())
+        with self._lock:
+            subscription = self._subscriptions.get(key)
+            if subscription is None:
+                subscription = SharedSubscription(
+                    device_name, attribute_name, self._logger
+                )
+                self._subscriptions[key] = subscription
+            consumer_id = next(self._consumer_ids)
+            self._consumers[consumer_id] = key
+            subscription.add_callback(consumer_id, callback)
+        with subscription.lock:
+            if subscription.subscription_id is None:
+                try:
+                    subscription.stateless = stateless
+                    self._subscribe_event(subscription, proxy)
+                except Exception:
+                    self.unsubscribe(consumer_id)
+                    raise
+                return consumer_id
+            last_event = subscription.last_event
+        if last_event is not None:
+            callback(last_event)
+        return consumer_id
+
+    def unsubscribe(self, consumer_id: int) -> bool:
+        """Unsubscribes the consumer. The Tango subscription is removed
+        when its last consumer unsubscribes.
+
+        :param consumer_id: consumer id returned by subscribe
+        :type consumer_id: int
+        :return: False if the consumer is unknown, else True
+        :rtype: bool
+        """
+        with self._lock:
+            key = self._consumers.pop(consumer_id, None)
+            if key is None:
+                return False
+            subscription = self._subscriptions[key]
+            subscription.remove_callback(consumer_id)
+            if len(subscription):
+                return True
+            del self._subscriptions[key]
+        with subscription.lock:
+            if subscription.subscription_id is not None:
+                subscription.proxy.unsubscribe_event(
+                    subscription.subscription_id
+                )
+                subscription.subscription_id = None
+        return True
+
+    def resubscribe(self, device_name: str, attribute_name: str) -> bool:
+        """Tears down the Tango subscription of the device attribute and
+        makes it again, for all its consumers. This is how a subscription
+        which stopped receiving events is recovered: a consumer
+        unsubscribing and subscribing again only leaves and joins the
+        broken subscription while other consumers keep it. If the new Tango
+        subscription fails, it is made again by the next consumer
+        subscribing to the attribute.
+
+        The requests made within the minimum resubscription interval of the
+        previous resubscription of the attribute are ignored, as all the
+        consumers of a broken subscription request its resubscription.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: attribute name
+        :type attribute_name: str
+        :raises Exception: the exception raised by the Tango subscription
+        :return: False if the attribute has no consumer, else True
+        :rtype: bool
+        """
+        with self._lock:
+            subscription = self._subscriptions.get(
+                (device_name, attribute_name.lower())
+            )
+        if subscription is None:
+            return False
+        with subscription.lock:
+            now = get_clock().monotonic()
+            if (
+                subscription.resubscription_time is not None
+                and now - subscription.resubscription_time
+                < self._minimum_resubscription_interval
+            ):
+                self._logger.debug(
+                    "Attribute %s of device %s was already resubscribed",
+                    subscription.attribute_name,
+                    device_name,
+                )
+                return True
+            subscription.resubscription_time = now
+            subscription.last_event = None
+            if subscription.subscription_id is not None:
+                try:
+                    subscription.proxy.unsubscribe_event(
+                        subscription.subscription_id
+                    )
+                except Exception as exception:
+                    self._logger.warning(
+                        "Error occurred while unsubscribing attribute %s of "
+                        "device %s: %s",
+                        subscription.attribute_name,
+                        device_name,
+                        exception,
+                    )
+                subscription.subscription_id = None
+            self._subscribe_event(subscription, subscription.proxy)
+        return True
+
+    def _subscribe_event(
+        self,
+        subscription: SharedSubscription,
+        proxy: Optional[tango.DeviceProxy],
+    ) -> None:
+        """Makes the Tango subscription of the shared subscription, whose
+        lock is held by the caller."""
+        proxy = proxy or self._device_factory.get_device(
+            subscription.device_name
+        )
+        subscription.subscription_id = proxy.subscribe_event(
+            subscription.attribute_name,
+            tango.EventType.CHANGE_EVENT,
+            subscription.dispatch,
+            stateless=subscription.stateless,
+        )
+        subscription.proxy = proxy
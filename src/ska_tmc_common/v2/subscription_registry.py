@@ -0,0 +1,271 @@
+"""
+This module contains the registry of the event subscriptions made by the
+event manager.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Iterator, Optional
+
+COMPLETION_INDICATOR_KEY: str = "is_subscription_completed"
+SUBSCRITPTION_ID_KEY: str = "subscription_id"
+
+
+class DeviceSubscriptions:
+    """Event subscriptions of a single device. The subscription of each
+    attribute is kept as its entry of the legacy nested dictionary format,
+    {"subscription_id": id}, so that the entries loaded from that format
+    are returned unchanged."""
+
+    __slots__ = ("device_name", "subscriptions", "is_completed")
+
+    def __init__(self, device_name: str) -> None:
+        self.device_name: str = device_name
+        self.subscriptions: dict[str, dict] = {}
+        self.is_completed: bool = False
+
+    def __contains__(self, attribute_name: str) -> bool:
+        return attribute_name in self.subscriptions
+
+    def __len__(self) -> int:
+        return len(self.subscriptions)
+
+    def get_subscription_id(self, attribute_name: str) -> Optional[int]:
+        """Returns the subscription id of the attribute.
+
+        :param attribute_name: Attribute name under the device.
+        :type attribute_name: str
+        :return: subscription id, or None if the attribute is not
+            subscribed
+        :rtype: int, optional
+        """
+        subscription = self.subscriptions.get(attribute_name)
+        if subscription is None:
+            return None
+        return subscription.get(SUBSCRITPTION_ID_KEY)
+
+    def to_dict(self) -> dict:
+        """Returns the subscriptions of the device in the legacy nested
+        dictionary format of EventManager.device_subscriptions.
+
+        :return: subscription id per attribute, and the completion flag if
+            the subscription is completed
+        :rtype: dict
+        """
+        result: dict = {
+            attribute_name: dict(subscription)
+            for attribute_name, subscription in self.subscriptions.items()
+        }
+        if self.is_completed:
+            result[COMPLETION_INDICATOR_KEY] = True
+        return result
+
+
+class SubscriptionRegistry:
+    """
+    Thread safe registry of the event subscriptions per device. It keeps
+    the set of devices whose subscription is not completed yet, so that
+    checking whether a device or an attribute is subscribed is O(1), and
+    the bookkeeping of the outstanding devices shrinks as their
+    subscription completes.
+    """
+
+    def __init__(self) -> None:
+        self._devices: dict[str, DeviceSubscriptions] = {}
+        self._incomplete_devices: set[str] = set()
+        self._lock = threading.RLock()
+
+    def __contains__(self, device_name: str) -> bool:
+        with self._lock:
+            return device_name in self._devices
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._devices)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._devices))
+
+    @property
+    def incomplete_devices(self) -> frozenset[str]:
+        """Returns the devices whose subscription is not completed.
+
+        :return: device names
+        :rtype: frozenset[str]
+        """
+        with self._lock:
+            return frozenset(self._incomplete_devices)
+
+    def init_device(self, device_name: str) -> None:
+        """Registers the device, if it is not registered yet.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        """
+        with self._lock:
+            if device_name not in self._devices:
+                self._devices[device_name] = DeviceSubscriptions(device_name)
+                self._incomplete_devices.add(device_name)
+
+    def add_subscription(
+        self,
+        device_name: str,
+        attribute_name: str,
+        subscription_id: Optional[int],
+    ) -> None:
+        """Records the subscription of an attribute.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        :param subscription_id: Subscription ID of the attribute.
+        :type subscription_id: int, optional
+        """
+        with self._lock:
+            self.init_device(device_name)
+            self._devices[device_name].subscriptions[attribute_name] = {
+                SUBSCRITPTION_ID_KEY: subscription_id
+            }
+
+    def set_completed(self, device_name: str) -> None:
+        """Marks the subscription of the device as completed.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        """
+        with self._lock:
+            self.init_device(device_name)
+            self._devices[device_name].is_completed = True
+            self._incomplete_devices.discard(device_name)
+
+    def is_completed(self, device_name: str) -> bool:
+        """Checks whether the subscription of the device is completed.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :return: True if the subscription of the device is completed
+        :rtype: bool
+        """
+        with self._lock:
+            device = self._devices.get(device_name)
+            return device is not None and device.is_completed
+
+    def is_subscribed(self, device_name: str, attribute_name: str) -> bool:
+        """Checks whether the attribute of the device is subscribed.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        :return: True if the attribute is subscribed
+        :rtype: bool
+        """
+        with self._lock:
+            device = self._devices.get(device_name)
+            return device is not None and attribute_name in device
+
+    def get_subscription_id(
+        self, device_name: str, attribute_name: str
+    ) -> Optional[int]:
+        """Returns the subscription id of the attribute.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        :return: subscription id, or None if the attribute is not
+            subscribed
+        :rtype: int, optional
+        """
+        with self._lock:
+            device = self._devices.get(device_name)
+            if device is None:
+                return None
+            return device.get_subscription_id(attribute_name)
+
+    def subscribed_attributes(self, device_name: str) -> list[str]:
+        """Returns the subscribed attributes of the device.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :return: attribute names
+        :rtype: list[str]
+        """
+        with self._lock:
+            device = self._devices.get(device_name)
+            if device is None:
+                return []
+            return list(device.subscriptions)
+
+    def remove_subscription(
+        self, device_name: str, attribute_name: str
+    ) -> None:
+        """Forgets the subscription of the attribute. The device is removed
+        from the registry once it has no subscribed attribute left.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        :param attribute_name: Attribute name under provided device.
+        :type attribute_name: str
+        """
+        with self._lock:
+            device = self._devices.get(device_name)
+            if device is None:
+                return
+            device.subscriptions.pop(attribute_name, None)
+            if not device.subscriptions:
+                self.remove_device(device_name)
+
+    def remove_device(self, device_name: str) -> None:
+        """Forgets the device and all its subscriptions.
+
+        :param device_name: tango device FQDN.
+        :type device_name: str
+        """
+        with self._lock:
+            self._devices.pop(device_name, None)
+            self._incomplete_devices.discard(device_name)
+
+    def clear(self) -> None:
+        """Forgets all the devices."""
+        with self._lock:
+            self._devices.clear()
+            self._incomplete_devices.clear()
+
+    def load(self, device_subscriptions: dict) -> None:
+        """Replaces the content of the registry with the subscriptions in
+        the legacy nested dictionary format.
+
+        :param device_subscriptions: subscriptions as
+            {"device_name": {"attribute_name": {"subscription_id": id}}}
+        :type device_subscriptions: dict
+        """
+        with self._lock:
+            self.clear()
+            for device_name, attributes in device_subscriptions.items():
+                self.init_device(device_name)
+                for attribute_name, subscription in attributes.items():
+                    if attribute_name == COMPLETION_INDICATOR_KEY:
+                        if subscription:
+                            self.set_completed(device_name)
+                        continue
+                    self._devices[device_name].subscriptions[
+                        attribute_name
+                    ] = dict(subscription)
+
+    def to_dict(self) -> dict:
+        """Returns a copy of the subscriptions in the legacy nested
+        dictionary format. Changes made to the copy do not change the
+        registry, which is only changed through its methods.
+
+        :return: subscriptions per device
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                device_name: device.to_dict()
+                for device_name, device in self._devices.items()
+            }
@@ -19,21 +19,28 @@ import tango
 from ska_tango_base.control_model import AdminMode, HealthState
 from ska_tango_base.executor import TaskExecutorComponentManager
 
+from ska_tmc_common.clock import get_clock
 from ska_tmc_common.device_info import (
     DeviceInfo,
     DishDeviceInfo,
     SubArrayDeviceInfo,
 )
 from ska_tmc_common.enum import LivelinessProbeType, TimeoutState
+from ska_tmc_common.event_recorder import EventRecorder
 from ska_tmc_common.exceptions import DeviceNameIncorrect
 from ska_tmc_common.input import InputParameter
+from ska_tmc_common.latency_histogram import EventLatencyTracker
+from ska_tmc_common.latency_statistics import summarise_latency
+from ska_tmc_common.metrics import MetricsRegistry
 from ska_tmc_common.observable import Observable
 from ska_tmc_common.op_state_model import TMCOpStateModel
 from ska_tmc_common.timeout_callback import TimeoutCallback
 from ska_tmc_common.v2.event_manager import EventManager
 from ska_tmc_common.v2.liveliness_probe import (
+    AsyncMultiDeviceLivelinessProbe,
     MultiDeviceLivelinessProbe,
     SingleDeviceLivelinessProbe,
+    StaggeredMultiDeviceLivelinessProbe,
 )
 
 
@@ -104,6 +111,11 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
         proxy_timeout: int = 500,
         event_subscription_check_period: int = 1,
         liveliness_check_period: int = 1,
+        liveliness_event_freshness_window: float = 0,
+        liveliness_circuit_breaker: bool = False,
+        liveliness_max_backoff_period: float = 10.0,
+        event_latency_instrumentation: bool = False,
+        event_recording_path: Optional[str] = None,
         **kwargs,
     ):
         super().__init__(
@@ -116,13 +128,37 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
         self.proxy_timeout = proxy_timeout
         self.event_subscription_check_period = event_subscription_check_period
         self.liveliness_check_period = liveliness_check_period
+        self.liveliness_event_freshness_window = (
+            liveliness_event_freshness_window
+        )
+        self.liveliness_circuit_breaker = liveliness_circuit_breaker
+        self.liveliness_max_backoff_period = liveliness_max_backoff_period
+        self.event_latency_tracker: Optional[EventLatencyTracker] = (
+            EventLatencyTracker() if event_latency_instrumentation else None
+        )
+        self.event_recorder: Optional[EventRecorder] = (
+            EventRecorder(event_recording_path)
+            if event_recording_path
+            else None
+        )
+        self.metrics_registry = MetricsRegistry()
+        self.metrics_registry.gauge(
+            "tmc_threads",
+            "Threads alive in the device server process",
+            function=threading.active_count,
+        )
         self.op_state_model = TMCOpStateModel(logger, callback=None)
         self.lock = threading.Lock()
         self.rlock = threading._RLock()
         self.event_manager_object: Optional[EventManager] = None
         self.timer_object = None
         self.liveliness_probe_object: (
-            Union[SingleDeviceLivelinessProbe, MultiDeviceLivelinessProbe]
+            Union[
+                SingleDeviceLivelinessProbe,
+                MultiDeviceLivelinessProbe,
+                StaggeredMultiDeviceLivelinessProbe,
+                AsyncMultiDeviceLivelinessProbe,
+            ]
             | None
         ) = None
         self._command_id: str = ""
@@ -197,6 +233,21 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
             a subclass!"
         )
 
+    def _liveliness_probe_options(self) -> dict:
+        """Returns the keyword arguments of the liveliness probe.
+
+        :return: liveliness probe options
+        :rtype: dict
+        """
+        return {
+            "proxy_timeout": self.proxy_timeout,
+            "liveliness_check_period": self.liveliness_check_period,
+            "event_freshness_window": self.liveliness_event_freshness_window,
+            "circuit_breaker_enabled": self.liveliness_circuit_breaker,
+            "max_backoff_period": self.liveliness_max_backoff_period,
+            "metrics_registry": self.metrics_registry,
+        }
+
     def start_liveliness_probe(
         self, liveliness_probe_type: LivelinessProbeType
     ) -> None:
@@ -209,8 +260,7 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
                 self.liveliness_probe_object = SingleDeviceLivelinessProbe(
                     self,
                     logger=self.logger,
-                    proxy_timeout=self.proxy_timeout,
-                    liveliness_check_period=self.liveliness_check_period,
+                    **self._liveliness_probe_options(),
                 )
 
             self.liveliness_probe_object.start()
@@ -220,8 +270,27 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
                 self.liveliness_probe_object = MultiDeviceLivelinessProbe(
                     self,
                     logger=self.logger,
-                    proxy_timeout=self.proxy_timeout,
-                    liveliness_check_period=self.liveliness_check_period,
+                    **self._liveliness_probe_options(),
+                )
+            self.liveliness_probe_object.start()
+        elif (
+            liveliness_probe_type == LivelinessProbeType.STAGGERED_MULTI_DEVICE
+        ):
+            if not self.liveliness_probe_object:
+                self.liveliness_probe_object = (
+                    StaggeredMultiDeviceLivelinessProbe(
+                        self,
+                        logger=self.logger,
+                        **self._liveliness_probe_options(),
+                    )
+                )
+            self.liveliness_probe_object.start()
+        elif liveliness_probe_type == LivelinessProbeType.ASYNC_MULTI_DEVICE:
+            if not self.liveliness_probe_object:
+                self.liveliness_probe_object = AsyncMultiDeviceLivelinessProbe(
+                    self,
+                    logger=self.logger,
+                    **self._liveliness_probe_options(),
                 )
             self.liveliness_probe_object.start()
         else:
@@ -259,14 +328,16 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
             self.event_manager_object.cancel_subscription_thread(
                 self.event_thread_id
             )
+        if self.event_recorder is not None:
+            self.event_recorder.flush()
 
     #  pylint: disable=broad-exception-caught
     def start_timer(
         self, timeout_id: str, timeout: int, timeout_callback: TimeoutCallback
     ) -> None:
         """Starts a timer for the command execution which will run for given
-        amount of seconds. After the timer runs out, it will execute the
-        task failed method.
+        amount of seconds, measured on the clock of the process. After the
+        timer runs out, it will execute the task failed method.
 
         :param timeout_id: Id for TimeoutCallback class object.
 
@@ -276,7 +347,7 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
                     as a callable functions to call in the event of timeout.
         """
         try:
-            self.timer_object = threading.Timer(
+            self.timer_object = get_clock().timer(
                 interval=timeout,
                 function=self.timeout_handler,
                 args=[timeout_id, timeout_callback],
@@ -308,7 +379,7 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
         with self.rlock:
             dev_info = self.get_device()
             dev_info.adminMode = admin_mode
-            dev_info.last_event_arrived = time.time()
+            dev_info.record_change_event(get_clock().time())
             dev_info.update_unresponsive(False)
 
     #  pylint: enable=broad-exception-caught
@@ -340,6 +411,54 @@ class BaseTmcComponentManager(TaskExecutorComponentManager):
         if self.event_manager_object:
             self.event_manager_object.device_avaiability_callback(device_name)
 
+    def get_event_latency(self) -> dict:
+        """
+        Return the latency histograms of the change events per attribute,
+        when the event latency instrumentation is enabled
+
+        :return: latency statistics per stage per "device/attribute"
+        :rtype: dict
+        """
+        if self.event_latency_tracker is None:
+            return {}
+        return self.event_latency_tracker.to_dict()
+
+    def get_event_error_rates(self) -> dict:
+        """
+        Return the state of the event error detector of the event manager,
+        i.e. the number of event timeout errors per attribute within the
+        event error window
+
+        :return: event error detector state, empty if the event manager has
+            no detector
+        :rtype: dict
+        """
+        detector = getattr(
+            self.event_manager_object, "event_error_detector", None
+        )
+        if detector is None:
+            return {}
+        return detector.to_dict()
+
+    def get_metrics(self) -> dict:
+        """
+        Return the samples of the metrics reported by the event manager,
+        the liveliness probe, the command trackers and the event queues
+
+        :return: type, description and samples per metric name
+        :rtype: dict
+        """
+        return self.metrics_registry.to_dict()
+
+    def get_metrics_prometheus(self) -> str:
+        """
+        Return the metrics in the Prometheus text exposition format
+
+        :return: metrics in the Prometheus text format
+        :rtype: str
+        """
+        return self.metrics_registry.to_prometheus()
+
 
 class TmcComponentManager(BaseTmcComponentManager):
     """
@@ -395,7 +514,12 @@ class TmcComponentManager(BaseTmcComponentManager):
         self._devices = []
         self._input_parameter = _input_parameter
         self.start_liveliness_probe(_liveliness_probe)
-        self.event_manager_object = EventManager(self)
+        self.event_manager_object = EventManager(
+            self,
+            event_latency_tracker=self.event_latency_tracker,
+            event_recorder=self.event_recorder,
+            metrics_registry=self.metrics_registry,
+        )
 
     def reset(self) -> None:
         """
@@ -444,13 +568,23 @@ class TmcComponentManager(BaseTmcComponentManager):
         """
         return self._component.get_device(device_name)
 
+    def get_latency_summary(self) -> dict:
+        """
+        Return the round-trip latency statistics of the monitored devices,
+        as measured by the liveliness probe
+
+        :return: latency statistics per device and slowest device
+        :rtype: dict
+        """
+        return summarise_latency(self.devices)
+
     def update_event_failure(self, device_name: str) -> None:
         """
         Update the failure status of an event for a specific device.
         """
         with self.lock:
             dev_info = self._component.get_device(device_name)
-            dev_info.last_event_arrived = time.time()
+            dev_info.last_event_arrived = get_clock().time()
             dev_info.update_unresponsive(False)
 
     def update_device_info(self, device_info: DeviceInfo) -> None:
@@ -504,7 +638,7 @@ class TmcComponentManager(BaseTmcComponentManager):
         with self.lock:
             dev_info = self._component.get_device(device_name)
             dev_info.health_state = health_state
-            dev_info.last_event_arrived = time.time()
+            dev_info.record_change_event(get_clock().time())
             dev_info.update_unresponsive(False)
 
     def update_device_state(
@@ -523,7 +657,7 @@ class TmcComponentManager(BaseTmcComponentManager):
         with self.lock:
             dev_info = self._component.get_device(device_name)
             dev_info.state = state
-            dev_info.last_event_arrived = time.time()
+            dev_info.record_change_event(get_clock().time())
             dev_info.update_unresponsive(False)
 
     def is_command_allowed(self, command_name: str):
@@ -612,12 +746,18 @@ class TmcLeafNodeComponentManager(BaseTmcComponentManager):
             proxy_timeout,
             event_subscription_check_period,
             liveliness_check_period,
-            args,
-            kwargs,
+            *args,
+            **kwargs,
         )
         self._device = None
         self.event_processing_methods = {}
-        self.event_manager_object = EventManager(self)
+        self.event_manager_object = EventManager(
+            self,
+            event_latency_tracker=self.event_latency_tracker,
+            queued_event_processing=True,
+            event_recorder=self.event_recorder,
+            metrics_registry=self.metrics_registry,
+        )
 
     def reset(self) -> None:
         """
@@ -632,6 +772,18 @@ class TmcLeafNodeComponentManager(BaseTmcComponentManager):
         """
         return self._device
 
+    def get_latency_summary(self) -> dict:
+        """
+        Return the round-trip latency statistics of the monitored device,
+        as measured by the liveliness probe
+
+        :return: latency statistics of the device
+        :rtype: dict
+        """
+        if self._device is None:
+            return summarise_latency([])
+        return summarise_latency([self._device])
+
     def update_device_info(self, device_info: DeviceInfo) -> None:
         """
         Update a device with correct monitoring information
@@ -651,7 +803,7 @@ class TmcLeafNodeComponentManager(BaseTmcComponentManager):
         :type device_name: str
         """
         with self.lock:
-            self._device.last_event_arrived = time.time()
+            self._device.last_event_arrived = get_clock().time()
 
     def update_device_health_state(self, health_state: HealthState) -> None:
         """
@@ -664,7 +816,7 @@ class TmcLeafNodeComponentManager(BaseTmcComponentManager):
         with self.lock:
 
             self._device.health_state = health_state
-            self._device.last_event_arrived = time.time()
+            self._device.record_change_event(get_clock().time())
 
     def update_device_state(self, state: tango.DevState) -> None:
         """
@@ -678,7 +830,7 @@ class TmcLeafNodeComponentManager(BaseTmcComponentManager):
         with self.lock:
 
             self._device.state = state
-            self._device.last_event_arrived = time.time()
+            self._device.record_change_event(get_clock().time())
 
     def update_exception_for_unresponsiveness(
         self, device_info: DeviceInfo, exception: str
@@ -753,6 +905,7 @@ class TmcLeafNodeComponentManager(BaseTmcComponentManager):
                     block=True, timeout=0.1
                 )
 
+                started_time = time.time()
                 if not self.check_event_error(
                     event_data, f"{attribute_name}_Callback"
                 ):
@@ -760,6 +913,10 @@ class TmcLeafNodeComponentManager(BaseTmcComponentManager):
                     self.event_processing_methods[attribute_name](
                         event_data.attr_value.value,
                     )
+                    if self.event_latency_tracker is not None:
+                        self.event_latency_tracker.record_event(
+                            event_data, started_time
+                        )
             except Empty:
                 # If an empty exception is raised by the Queue, we can
                 # safely ignore it.
@@ -788,6 +945,12 @@ class TmcLeafNodeComponentManager(BaseTmcComponentManager):
         """Start all the event processing threads."""
         for attribute in self.event_processing_methods:
             self.event_queues[attribute] = Queue()
+            self.metrics_registry.gauge(
+                "tmc_event_queue_depth",
+                "Events waiting to be processed, per attribute",
+                {"attribute": attribute},
+                function=self.event_queues[attribute].qsize,
+            )
             thread = threading.Thread(
                 target=self.process_event, args=[attribute], name=attribute
             )
@@ -799,7 +962,7 @@ class TmcLeafNodeComponentManager(BaseTmcComponentManager):
         """
         with self.lock:
             dev_info = self.get_device()
-            dev_info.last_event_arrived = time.time()
+            dev_info.last_event_arrived = get_clock().time()
             dev_info.update_unresponsive(False)
 
     def check_device_responsiveness(self, device_name: str) -> bool:
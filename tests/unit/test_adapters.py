@@ -1,15 +1,17 @@
 import json
 import logging
+import time
 
 import mock
 import pytest
 from ska_tango_base.commands import ResultCode
-from ska_tango_base.control_model import AdminMode
+from ska_tango_base.control_model import AdminMode, HealthState
 from tango import DevState
 
 from ska_tmc_common import (
     AdapterFactory,
     AdapterType,
+    AttributeSnapshot,
     BaseAdapter,
     CspMasterAdapter,
     DishAdapter,
@@ -302,3 +304,56 @@ def test_call_adapter_method_exception(tango_context):
         + "SubarrayAdapter.AssignResources() "
         + "missing 1 required positional argument: 'argin'."
     )
+
+
+def test_base_adapter_read_snapshot(tango_context):
+    factory = AdapterFactory()
+    base_adapter = factory.get_or_create_adapter(
+        HELPER_BASE_DEVICE, AdapterType.BASE
+    )
+    snapshot = base_adapter.read_snapshot(["healthState", "adminMode"])
+    assert isinstance(snapshot, AttributeSnapshot)
+    assert len(snapshot) == 2
+    assert snapshot["healthstate"] == base_adapter.healthState
+    assert snapshot["adminMode"] == base_adapter.adminMode
+    assert not snapshot.failed
+    assert snapshot.timestamp("adminMode") > 0
+    assert "healthState" in snapshot.to_dict()
+
+
+def test_base_adapter_read_snapshot_cache():
+    health_state = mock.Mock(has_failed=False, value=HealthState.OK)
+    health_state.name = "healthState"
+    admin_mode = mock.Mock(has_failed=False, value=AdminMode.ONLINE)
+    admin_mode.name = "adminMode"
+    proxy = mock.Mock()
+    proxy.read_attributes.side_effect = [
+        [health_state, admin_mode],
+        [admin_mode],
+    ]
+    base_adapter = BaseAdapter("test/device/1", proxy)
+
+    snapshot = base_adapter.read_snapshot(
+        ["healthState", "adminMode"], max_age=60
+    )
+    assert snapshot.to_dict() == {
+        "healthState": HealthState.OK,
+        "adminMode": AdminMode.ONLINE,
+    }
+    first_read_time = snapshot.read_time
+    # Cached values are reused, so no further call is made to the proxy,
+    # and the snapshot keeps the time at which they were read.
+    time.sleep(0.01)
+    snapshot = base_adapter.read_snapshot(["healthState"], max_age=60)
+    assert snapshot.get("healthState") == HealthState.OK
+    assert proxy.read_attributes.call_count == 1
+    assert snapshot.read_time == first_read_time
+
+    # Without max_age the value is always read from the device.
+    base_adapter.invalidate_snapshot_cache()
+    snapshot = base_adapter.read_snapshot(["adminMode"])
+    proxy.read_attributes.assert_called_with(["adminMode"])
+    assert snapshot.names == ["adminMode"]
+    assert snapshot.get("healthState", "missing") == "missing"
+    with pytest.raises(KeyError):
+        snapshot.quality("healthState")
@@ -0,0 +1,152 @@
+import threading
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+from tango.asyncio_executor import get_global_executor
+
+from ska_tmc_common.v2.async_event_manager import AsyncEventManager
+
+DEVICE_NAME = "a/a/1"
+ATTRIBUTE_NAME = "attribute1"
+
+
+def wait_for(condition, timeout=5):
+    start_time = time.time()
+    while not condition():
+        if time.time() - start_time > timeout:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def create_event_manager(proxy):
+    component_manager = Mock()
+    component_manager.check_device_responsiveness.return_value = True
+    event_manager = AsyncEventManager(component_manager)
+    event_manager._device_factory = Mock()
+    event_manager._device_factory.get_device.return_value = proxy
+    event_manager.attribute1_event_callback = Mock()
+    return event_manager
+
+
+def test_async_event_manager_subscribe_and_unsubscribe():
+    proxy = Mock()
+    proxy.subscribe_event = AsyncMock(return_value=7)
+    proxy.unsubscribe_event = AsyncMock()
+    event_manager = create_event_manager(proxy)
+
+    event_manager.subscribe_events({DEVICE_NAME: [ATTRIBUTE_NAME]})
+    assert event_manager.device_subscriptions.get(DEVICE_NAME) == {
+        ATTRIBUTE_NAME: {"subscription_id": 7},
+        "is_subscription_completed": True,
+    }
+
+    event_manager.unsubscribe_events(DEVICE_NAME)
+    proxy.unsubscribe_event.assert_awaited_once_with(7)
+    assert not event_manager.device_subscriptions.get(DEVICE_NAME)
+    event_manager.stop()
+
+
+def test_async_event_manager_uses_a_single_thread():
+    proxy = Mock()
+    proxy.subscribe_event.return_value = 1
+    event_manager = create_event_manager(proxy)
+    thread_count = threading.active_count()
+
+    configuration = {f"a/a/{index}": [ATTRIBUTE_NAME] for index in range(200)}
+    event_manager.start_event_subscription(configuration)
+    assert wait_for(lambda: event_manager.active_task_count == 0)
+    assert len(event_manager.device_subscriptions) == 200
+    # The event loop thread, and the threads creating the proxies.
+    assert threading.active_count() <= thread_count + 1 + 4
+    event_manager.stop()
+
+
+def test_async_event_manager_cancel_subscription():
+    proxy = Mock()
+    proxy.subscribe_event.side_effect = Exception("Subscription failed")
+    event_manager = create_event_manager(proxy)
+
+    task_id = event_manager.start_event_subscription(
+        {DEVICE_NAME: [ATTRIBUTE_NAME]}
+    )
+    assert wait_for(lambda: proxy.subscribe_event.called)
+    event_manager.cancel_subscription_thread(task_id)
+    assert wait_for(
+        lambda: event_manager.pending_configuration
+        == {DEVICE_NAME: [ATTRIBUTE_NAME]}
+    )
+    assert event_manager.active_task_count == 0
+    event_manager.stop()
+
+
+def test_async_event_manager_unsubscribe_devices():
+    proxy = Mock()
+    proxy.unsubscribe_event = AsyncMock()
+    event_manager = create_event_manager(proxy)
+    device_names = [f"a/a/{index}" for index in range(50)]
+    for index, device_name in enumerate(device_names):
+        event_manager.update_device_subscriptions(
+            device_name, ATTRIBUTE_NAME, index + 1
+        )
+
+    _, future = event_manager.unsubscribe_devices(
+        {device_name: None for device_name in device_names}
+    )
+    assert future.result(timeout=5) == {
+        device_name: [ATTRIBUTE_NAME] for device_name in device_names
+    }
+    assert proxy.unsubscribe_event.await_count == 50
+    assert event_manager.device_subscriptions == {}
+    event_manager.stop()
+
+
+class ExecutorProxy:
+    """Proxy running its calls through its Tango asyncio executor, as the
+    asyncio green mode proxies do, and recording how many calls overlap."""
+
+    lock = threading.Lock()
+    active_calls = 0
+    max_active_calls = 0
+
+    def __init__(self, dev_name, green_mode=None, asyncio_executor=None):
+        self._executor = asyncio_executor or get_global_executor()
+
+    def subscribe_event(self, *args, **kwargs):
+        return self._executor.run(self._subscribe_event)
+
+    @classmethod
+    def _subscribe_event(cls):
+        with cls.lock:
+            cls.active_calls += 1
+            cls.max_active_calls = max(cls.max_active_calls, cls.active_calls)
+        time.sleep(0.2)
+        with cls.lock:
+            cls.active_calls -= 1
+        return 1
+
+
+def test_async_event_managers_on_separate_loops_overlap_calls():
+    component_manager = Mock()
+    component_manager.check_device_responsiveness.return_value = True
+    with patch("tango.DeviceProxy", ExecutorProxy):
+        event_managers = [AsyncEventManager(component_manager) for _ in "ab"]
+        for index, event_manager in enumerate(event_managers):
+            event_manager.attribute1_event_callback = Mock()
+            event_manager.start_event_subscription(
+                {f"a/{index}/{device}": [ATTRIBUTE_NAME] for device in "abcd"}
+            )
+        for event_manager in event_managers:
+            assert wait_for(lambda: event_manager.active_task_count == 0)
+        # The calls of both event managers are awaited on their own loop.
+        assert ExecutorProxy.max_active_calls > 4
+
+        # The proxies are bound to the executor of the restarted loop.
+        event_manager.stop()
+        ExecutorProxy.max_active_calls = 0
+        event_manager.subscribe_events(
+            {f"b/b/{device}": [ATTRIBUTE_NAME] for device in "abcd"}
+        )
+        assert ExecutorProxy.max_active_calls == 4
+        for event_manager in event_managers:
+            event_manager.stop()
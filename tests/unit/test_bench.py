@@ -0,0 +1,124 @@
+import json
+import logging
+
+import pytest
+from tango import DevState
+
+from ska_tmc_common import DeviceInfo
+from ska_tmc_common.bench import __main__ as bench_main
+from ska_tmc_common.bench import (
+    device_harness,
+    hot_paths,
+    liveliness_asyncio,
+    liveliness_scheduling,
+)
+
+
+def test_liveliness_scheduling_benchmark():
+    report = liveliness_scheduling.run_benchmark(
+        device_count=50, liveliness_check_period=0.2, duration=0.5
+    )
+    assert report["parameters"]["device_count"] == 50
+    for result in report["results"].values():
+        assert result["probes"] >= 50
+        assert result["unresponsive_devices"] == 0
+        assert result["interval_jitter_ms"]["count"] > 0
+    assert "schedule_lateness_ms" in report["results"]["staggered"]
+
+
+def test_liveliness_asyncio_benchmark():
+    report = liveliness_asyncio.run_benchmark(device_counts=(50,))
+    for result in report["results"]["50"].values():
+        assert result["completed"]
+        assert result["probe_time_ms"]["count"] >= 50
+        assert result["unresponsive_devices"] == 0
+
+
+def test_hot_paths_benchmark():
+    report = hot_paths.run_benchmark(device_count=20, iterations=50)
+    assert report["version"]
+    assert set(report["results"]) == set(hot_paths.SCENARIOS)
+    results = report["results"]
+    assert results["event_subscription"]["subscriptions"] == 40
+    assert (
+        results["event_subscription"]["resubscription_time_ms"]["count"] == 20
+    )
+    assert results["probe_cycle"]["asyncio"]["completed"]
+    assert results["command_tracker"]["completed"] == 50
+    assert results["observable_dispatch"]["notifications"] == 20 * 50
+    assert results["adapter_lookup"]["adapters"] == 20
+    assert results["model_serialization"]["model_bytes"] > 0
+    json.dumps(report)
+
+
+def test_device_harness():
+    with device_harness.SimulationHarness(dish_count=4) as harness:
+        assert harness.internal_model == "linear_scan"
+        device_count = len(harness.device_names)
+        assert device_count == 4 * 2 + 4 + 2
+        subscription = harness.measure_subscription(timeout=60)
+        assert subscription["subscribed_devices"] == device_count
+        probe_cycle = harness.measure_probe_cycle(timeout=60)
+        assert probe_cycle["completed"]
+        assert probe_cycle["unresponsive_devices"] == 0
+        fan_out = harness.measure_command_fan_out(timeout=60)
+        assert fan_out["completed"]
+        assert fan_out["command_time_ms"]["count"] == device_count - 1
+        assert fan_out["event_propagation_ms"]["count"] == device_count - 1
+        dish = harness.component_manager.get_device("ska001/elt/master")
+        assert dish.state == DevState.ON
+
+
+@pytest.mark.parametrize(
+    "component_class",
+    [device_harness.HarnessComponent, device_harness.IndexedHarnessComponent],
+)
+def test_harness_components(component_class):
+    component = component_class(logging.getLogger(__name__))
+    dev_info = DeviceInfo("ska001/elt/master")
+    component.update_device(dev_info)
+    assert component.get_device("SKA001/elt/master") is dev_info
+    updated_dev_info = DeviceInfo("ska001/elt/master")
+    component.update_device(updated_dev_info)
+    assert component.get_device("ska001/elt/master") is updated_dev_info
+    assert component.to_dict()["devices"] == [updated_dev_info.to_dict()]
+    assert component.get_device("ska002/elt/master") is None
+
+
+def test_benchmark_command_line(tmp_path, capsys):
+    output = tmp_path / "report.json"
+    disabled_level = logging.root.manager.disable
+    exit_code = bench_main.main(
+        [
+            "event_load",
+            "model_serialization",
+            "--devices",
+            "20",
+            "--event-rate",
+            "20",
+            "--duration",
+            "0.5",
+            "--workers",
+            "2",
+            "--output",
+            str(output),
+        ]
+    )
+    assert exit_code == 0
+    table = capsys.readouterr().out
+    assert "event_load" in table and "events_per_second" in table
+    report = json.loads(output.read_text())
+    assert list(report["results"]) == ["event_load", "model_serialization"]
+    event_load = report["results"]["event_load"]
+    assert event_load["events"] == 20 * 20 * 0.5
+    assert event_load["target_events_per_second"] == 400
+    # The logging disabled during the benchmark is restored.
+    assert logging.root.manager.disable == disabled_level
+
+
+@pytest.mark.parametrize(
+    "option", ["--devices", "--event-rate", "--duration", "--workers"]
+)
+def test_benchmark_command_line_rejects_non_positive_values(option):
+    with pytest.raises(SystemExit):
+        bench_main.parse_arguments(["event_load", option, "0"])
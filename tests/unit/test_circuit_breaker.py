@@ -0,0 +1,71 @@
+import pytest
+
+from ska_tmc_common.enum import CircuitBreakerState
+from ska_tmc_common.v2.circuit_breaker import DeviceCircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_circuit_breaker_opens_and_recovers(clock):
+    breaker = DeviceCircuitBreaker(
+        base_backoff=1.0, max_backoff=10.0, jitter=0.0, clock=clock
+    )
+    assert breaker.state == CircuitBreakerState.CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert not breaker.allow_request()
+
+    clock.now += 1.0
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreakerState.HALF_OPEN
+    # Only a single trial probe is allowed while half-open.
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreakerState.CLOSED
+    assert breaker.consecutive_failures == 0
+    assert breaker.allow_request()
+
+
+def test_circuit_breaker_backoff_grows_up_to_maximum(clock):
+    breaker = DeviceCircuitBreaker(
+        base_backoff=1.0, max_backoff=5.0, jitter=0.0, clock=clock
+    )
+    backoffs = []
+    for _ in range(5):
+        breaker.record_failure()
+        retry_in = breaker.to_dict()["retry_in"]
+        backoffs.append(retry_in)
+        clock.now += retry_in
+        assert breaker.allow_request()
+    assert backoffs == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_circuit_breaker_jitter_brings_retry_forward(clock):
+    breaker = DeviceCircuitBreaker(base_backoff=10.0, jitter=0.5, clock=clock)
+    breaker.record_failure()
+    assert 5.0 <= breaker.to_dict()["retry_in"] <= 10.0
+    assert breaker.retry_in == breaker.to_dict()["retry_in"]
+
+
+def test_circuit_breaker_failure_threshold(clock):
+    breaker = DeviceCircuitBreaker(failure_threshold=3, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreakerState.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert breaker.to_dict()["state"] == str(CircuitBreakerState.OPEN)
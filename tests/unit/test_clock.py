@@ -0,0 +1,81 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from ska_tmc_common.clock import (
+    AcceleratedClock,
+    Clock,
+    VirtualClock,
+    clock_from_environment,
+    get_clock,
+    set_clock,
+)
+from ska_tmc_common.enum import TimeoutState
+from ska_tmc_common.test_helpers.simulation_scheduler import (
+    SimulationScheduler,
+)
+from ska_tmc_common.timekeeper import TimeKeeper
+
+
+@pytest.fixture
+def process_clock():
+    yield
+    set_clock(None)
+
+
+def test_accelerated_clock(process_clock):
+    clock = AcceleratedClock(100)
+    set_clock(clock)
+    assert get_clock() is clock
+    start_time = time.monotonic()
+    clock_start_time = clock.monotonic()
+    clock.sleep(5)
+    assert clock.monotonic() - clock_start_time >= 5
+    assert time.monotonic() - start_time < 1
+
+    timeout_callback = Mock()
+    TimeKeeper(10, Mock()).start_timer("timeout_id", timeout_callback)
+    assert not clock.wait(threading.Event(), 2)
+    timeout_callback.assert_not_called()
+    clock.sleep(10)
+    timeout_callback.assert_called_once_with(
+        timeout_id="timeout_id", timeout_state=TimeoutState.OCCURED
+    )
+    with pytest.raises(ValueError):
+        AcceleratedClock(0)
+
+
+def test_virtual_clock_ordering():
+    clock = VirtualClock(start_time=1000.0)
+    scheduler = SimulationScheduler(clock=clock)
+    calls = []
+    scheduler.call_later(3600, calls.append, "obsState READY")
+    scheduler.call_later(60, calls.append, "obsState CONFIGURING")
+    timer = clock.timer(1800, calls.append, args=["timeout"])
+    timer.start()
+    sleeper = threading.Thread(target=clock.sleep, args=[7200])
+    sleeper.start()
+
+    start_time = time.monotonic()
+    while clock.next_deadline() != 60 and time.monotonic() - start_time < 5:
+        time.sleep(0.001)
+    while sleeper.is_alive() and time.monotonic() - start_time < 5:
+        if clock.next_deadline() is not None:
+            clock.step()
+        time.sleep(0.01)
+    sleeper.join(1)
+    timer.join(1)
+    assert not sleeper.is_alive()
+    assert calls == ["obsState CONFIGURING", "timeout", "obsState READY"]
+    assert clock.monotonic() == 7200
+    assert clock.time() == 8200.0
+    assert time.monotonic() - start_time < 5
+
+
+def test_clock_from_environment(monkeypatch):
+    monkeypatch.delenv("TMC_CLOCK_SPEED", raising=False)
+    assert type(clock_from_environment()) is Clock
+    monkeypatch.setenv("TMC_CLOCK_SPEED", "20")
+    assert clock_from_environment().speed == 20
@@ -6,6 +6,7 @@ from ska_tango_base.commands import ResultCode
 from ska_tango_base.executor import TaskStatus
 
 from ska_tmc_common.command_callback_tracker import CommandCallbackTracker
+from ska_tmc_common.metrics import MetricsRegistry
 
 
 def test_command_callback_tracker_update_timeout_occurred():
@@ -97,3 +98,42 @@ def test_clean_up():
     abort_event.set()
     cct.clean_up()
     command_class_instance.timekeeper.stop_timer.assert_called_once()
+
+
+def test_command_duration_is_labelled_with_result():
+    metrics_registry = MetricsRegistry()
+    attrs = {"component_manager.get_state.return_value": "OFF"}
+    results = ("ok", "timeout", "aborted", "failed")
+    for result in results:
+        command_class_instance = Mock(**attrs)
+        command_class_instance.component_manager.metrics_registry = (
+            metrics_registry
+        )
+        abort_event = threading.Event()
+        cct = CommandCallbackTracker(
+            command_class_instance, logging, abort_event, "get_state", ["ON"]
+        )
+        if result == "ok":
+            command_class_instance.component_manager.get_state.return_value = (
+                "ON"
+            )
+            cct.update_attr_value_change()
+        elif result == "timeout":
+            cct.update_timeout_occurred()
+        elif result == "aborted":
+            abort_event.set()
+            cct.update_attr_value_change()
+        else:
+            cct.command_id = 1
+            cct.lrcr_callback.command_data = {
+                1: {"exception_message": "Exception message"}
+            }
+            cct.update_exception()
+
+    metrics = metrics_registry.to_dict()
+    durations = {
+        sample["labels"]["result"]: sample["count"]
+        for sample in metrics["tmc_command_duration_seconds"]["samples"]
+    }
+    assert durations == {result: 1 for result in results}
+    assert metrics["tmc_commands_in_flight"]["samples"][0]["value"] == 0
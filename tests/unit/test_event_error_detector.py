@@ -0,0 +1,46 @@
+import pytest
+
+from ska_tmc_common.v2.event_error_detector import EventErrorRateDetector
+
+DEVICE_NAME = "a/a/1"
+ATTRIBUTE_NAME = "obsState"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_sporadic_errors_do_not_trigger_resubscription(clock):
+    detector = EventErrorRateDetector(max_count=3, window=60.0, clock=clock)
+    for _ in range(20):
+        assert not detector.record_error(DEVICE_NAME, ATTRIBUTE_NAME)
+        clock.now += 40.0
+    assert detector.error_count(DEVICE_NAME, ATTRIBUTE_NAME) == 1
+    clock.now += 60.0
+    assert detector.error_counts() == {}
+
+
+def test_error_burst_triggers_resubscription(clock):
+    detector = EventErrorRateDetector(max_count=3, window=60.0, clock=clock)
+    for _ in range(3):
+        assert not detector.record_error(DEVICE_NAME, ATTRIBUTE_NAME)
+        clock.now += 10.0
+    assert detector.error_counts() == {DEVICE_NAME: {ATTRIBUTE_NAME: 3}}
+    assert detector.to_dict()["devices"][DEVICE_NAME][ATTRIBUTE_NAME] == {
+        "errors_in_window": 3,
+        "rate_per_minute": 3.0,
+    }
+
+    assert detector.record_error(DEVICE_NAME, ATTRIBUTE_NAME)
+    # The errors are forgotten once the resubscription is triggered.
+    assert detector.error_count(DEVICE_NAME, ATTRIBUTE_NAME) == 0
+    assert not detector.record_error(DEVICE_NAME, ATTRIBUTE_NAME)
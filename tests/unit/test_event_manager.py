@@ -1,8 +1,10 @@
+import threading
+import time
 from unittest.mock import Mock
 
 from tango.test_context import DeviceTestContext
 
-from ska_tmc_common import HelperBaseDevice
+from ska_tmc_common import CircuitBreakerState, HelperBaseDevice
 from ska_tmc_common.v2.event_manager import EventManager
 
 DUMMY_CONFIG = {"device1": ["attribute1"]}
@@ -66,3 +68,238 @@ def test_event_manager():
     )
     assert device_name == DEVICE_NAME
     assert attribute_name == ATTRIBTUE_NAME
+
+
+def create_error_event(attribute_name, reason="API_CorbaException"):
+    event = Mock()
+    event.err = True
+    event.attr_name = f"tango://{TANGO_HOST}/{DEVICE_NAME}/{attribute_name}"
+    event.errors = [
+        Mock(reason=reason, desc="Event channel is not responding anymore")
+    ]
+    return event
+
+
+def test_event_error_handling_is_coalesced_and_bounded():
+    event_manager = EventManager(
+        Mock(), error_handling_workers=1, maximum_error_queue_size=1
+    )
+    handler_release = threading.Event()
+    event_manager.handle_event_error = Mock(
+        side_effect=lambda event: handler_release.wait(5)
+    )
+
+    assert event_manager.check_and_handle_event_error(
+        create_error_event(ATTRIBTUE_NAME)
+    )
+    start_time = time.time()
+    while not event_manager.handle_event_error.called:
+        assert time.time() - start_time < 5
+        time.sleep(0.01)
+    for _ in range(4):
+        event_manager.check_and_handle_event_error(
+            create_error_event(ATTRIBTUE_NAME)
+        )
+    # The single worker is busy, so one other attribute is queued and the
+    # next one is dropped.
+    event_manager.check_and_handle_event_error(create_error_event("state"))
+    event_manager.check_and_handle_event_error(create_error_event("obsState"))
+    statistics = event_manager.event_error_statistics
+    assert statistics["coalesced"] == 4
+    assert statistics["dropped"] == 1
+    assert statistics["in_progress"] == 2
+
+    handler_release.set()
+    start_time = time.time()
+    while event_manager.event_error_statistics["in_progress"]:
+        assert time.time() - start_time < 5
+        time.sleep(0.01)
+    # The errors of the first attribute are handled twice: the first one
+    # and the latest one coalesced while it was handled.
+    assert event_manager.event_error_statistics["handled"] == 3
+    assert event_manager.event_error_statistics["queue_depth"] == 0
+
+
+def test_event_timeouts_are_counted_and_resubscribed_without_blocking():
+    event_manager = EventManager(
+        Mock(), error_handling_workers=1, event_error_max_count=2
+    )
+    handler_release = threading.Event()
+    handle_event_error = event_manager.handle_event_error
+    event_manager.handle_event_error = Mock(
+        side_effect=lambda event: handler_release.wait(5)
+        and handle_event_error(event)
+    )
+    event_manager.unsubscribe_events = Mock()
+    event_manager.subscribe_events = Mock(
+        side_effect=lambda configuration, timeout: time.sleep(5)
+    )
+
+    # The errors coalesced while the first one is handled are counted.
+    for _ in range(3):
+        event_manager.check_and_handle_event_error(
+            create_error_event(ATTRIBTUE_NAME, "API_EventTimeout")
+        )
+    assert event_manager.event_error_statistics["coalesced"] >= 1
+    handler_release.set()
+    start_time = time.time()
+    while not event_manager.subscribe_events.called:
+        assert time.time() - start_time < 5
+        time.sleep(0.01)
+    event_manager.unsubscribe_events.assert_called_once_with(
+        DEVICE_NAME, [ATTRIBTUE_NAME]
+    )
+    event_manager.subscribe_events.assert_called_once_with(
+        {DEVICE_NAME: [ATTRIBTUE_NAME]}, 1000
+    )
+    # The worker does not wait for the attribute to be subscribed again.
+    while event_manager.event_error_statistics["in_progress"]:
+        assert time.time() - start_time < 1
+        time.sleep(0.01)
+    assert event_manager.pending_configuration == {}
+
+
+def test_event_driven_resubscription():
+    responsiveness = {"device1": False, "device2": True}
+    component_manager = Mock()
+    component_manager.check_device_responsiveness.side_effect = (
+        responsiveness.get
+    )
+    event_manager = EventManager(
+        component_manager,
+        event_subscription_check_period=0.01,
+        event_driven_resubscription=True,
+    )
+    event_manager.attribute1_event_callback = Mock()
+    proxy = Mock()
+    proxy.subscribe_event.side_effect = [
+        Exception("Not ready"),
+        Exception("Not ready"),
+        2,
+        3,
+    ]
+    event_manager.get_device_proxy = Mock(return_value=proxy)
+
+    event_manager.subscribe_events(
+        {"device1": [ATTRIBTUE_NAME], "device2": [ATTRIBTUE_NAME]}, timeout=5
+    )
+    # The device which is down is parked without connecting to it, the one
+    # which is up is retried with backoff until it succeeds.
+    assert event_manager.pending_configuration == {"device1": [ATTRIBTUE_NAME]}
+    event_manager.get_device_proxy.assert_called_with("device2")
+    assert proxy.subscribe_event.call_count == 3
+    assert event_manager.subscription_registry.is_completed("device2")
+    assert (
+        event_manager.get_subscription_backoff("device2").state
+        == CircuitBreakerState.CLOSED
+    )
+
+    responsiveness["device1"] = True
+    event_manager.device_avaiability_callback("device1")
+    start_time = time.time()
+    while not event_manager.subscription_registry.is_completed("device1"):
+        assert time.time() - start_time < 5
+        time.sleep(0.01)
+    assert event_manager.pending_configuration == {}
+
+
+def test_polling_fallback():
+    event_manager = EventManager(
+        Mock(), polling_fallback_attempts=2, polling_period=0.01
+    )
+    event_manager.attribute1_event_callback = Mock()
+    proxy = Mock()
+    proxy.subscribe_event.side_effect = [
+        Exception("Event not configured"),
+        Exception("Event not configured"),
+        5,
+    ]
+    proxy.read_attributes.return_value = [Mock(has_failed=False, value=3)]
+    event_manager.get_device_proxy = Mock(return_value=proxy)
+
+    for _ in range(2):
+        assert not event_manager.subscribe_device_attributes(
+            DEVICE_NAME, [ATTRIBTUE_NAME], proxy
+        )
+    assert event_manager.attribute_poller.is_polled(
+        DEVICE_NAME, ATTRIBTUE_NAME
+    )
+    start_time = time.time()
+    while not event_manager.attribute1_event_callback.called:
+        assert time.time() - start_time < 5
+        time.sleep(0.01)
+    proxy.read_attributes.assert_called_with([ATTRIBTUE_NAME])
+    event = event_manager.attribute1_event_callback.call_args[0][0]
+    assert not event.err
+    assert event.attr_value.value == 3
+    assert event.attr_name == f"{DEVICE_NAME}/{ATTRIBTUE_NAME}"
+
+    # The polling stops once the subscription succeeds.
+    assert event_manager.subscribe_device_attributes(
+        DEVICE_NAME, [ATTRIBTUE_NAME], proxy
+    )
+    assert event_manager.attribute_poller.polled_attributes == {}
+
+
+def test_unsubscribe_devices_on_pool():
+    event_manager = EventManager(Mock(), unsubscription_workers=2)
+    proxy = Mock()
+    release_unsubscription = threading.Event()
+    proxy.unsubscribe_event.side_effect = lambda subscription_id: (
+        release_unsubscription.wait(5)
+    )
+    event_manager._EventManager__device_factory = Mock()
+    event_manager._EventManager__device_factory.get_device.return_value = proxy
+    device_names = [f"a/a/{index}" for index in range(20)]
+    for index, device_name in enumerate(device_names):
+        event_manager.update_device_subscriptions(
+            device_name, ATTRIBTUE_NAME, index + 1
+        )
+    thread_count = threading.active_count()
+
+    teardown_id, future = event_manager.unsubscribe_devices(
+        {device_name: None for device_name in device_names}
+    )
+    start_time = time.time()
+    while proxy.unsubscribe_event.call_count < 2:
+        assert time.time() - start_time < 5
+        time.sleep(0.01)
+    assert threading.active_count() <= thread_count + 2
+    # Cancelling skips the devices which are not unsubscribed yet.
+    event_manager.cancel_unsubscription_thread(teardown_id)
+    release_unsubscription.set()
+    results = future.result(timeout=5)
+    assert proxy.unsubscribe_event.call_count == 2
+    assert sum(bool(attributes) for attributes in results.values()) == 2
+    assert len(event_manager.device_subscriptions) == 18
+
+    _, future = event_manager.unsubscribe_devices(
+        {device_name: [ATTRIBTUE_NAME] for device_name in device_names}
+    )
+    future.result(timeout=5)
+    assert event_manager.device_subscriptions == {}
+
+
+def test_stop_shuts_down_error_handling_pool():
+    event_manager = EventManager(Mock())
+    event_manager.handle_event_error = Mock()
+
+    def error_handler_threads():
+        return [
+            thread
+            for thread in threading.enumerate()
+            if thread.name.startswith("event_error_handler")
+        ]
+
+    for handled_count in (1, 2):
+        event_manager.check_and_handle_event_error(
+            create_error_event(ATTRIBTUE_NAME)
+        )
+        start_time = time.time()
+        while event_manager.event_error_statistics["handled"] < handled_count:
+            assert time.time() - start_time < 5
+            time.sleep(0.01)
+        assert error_handler_threads()
+        # The pool is created again by the next event error.
+        event_manager.stop()
+        assert not error_handler_threads()
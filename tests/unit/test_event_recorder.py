@@ -0,0 +1,108 @@
+from unittest.mock import Mock
+
+import pytest
+import tango
+
+from ska_tmc_common.event_recorder import (
+    EventLogReader,
+    EventRecorder,
+    EventReplayer,
+    RecordedError,
+    RecordedEvent,
+    component_manager_callbacks,
+)
+
+DEVICE_NAME = "ska_mid/tm_leaf_node/csp_subarray01"
+
+
+def make_event(attribute_name, value, source_time, errors=()):
+    return RecordedEvent(
+        DEVICE_NAME,
+        attribute_name,
+        value,
+        tango.AttrQuality.ATTR_VALID,
+        source_time,
+        source_time + 0.001,
+        errors,
+    )
+
+
+def test_event_log_round_trip(tmp_path):
+    path = str(tmp_path / "events.log")
+    events = [
+        make_event("state", tango.DevState.ON, 100.0),
+        make_event("healthState", 1, 100.1),
+        make_event("longRunningCommandResult", ("id", "[0, 'ok']"), 100.2),
+        make_event("obsState", 2, 100.3),
+        make_event(
+            "obsState",
+            None,
+            100.4,
+            (RecordedError("API_EventTimeout", "not responding"),),
+        ),
+    ]
+    with EventRecorder(path) as recorder:
+        for event in events[:3]:
+            recorder.record(event)
+    with EventRecorder(path) as recorder:
+        for event in events[3:]:
+            recorder.record(event)
+        assert recorder.event_count == 2
+
+    with EventLogReader(path) as reader:
+        recorded_events = list(reader)
+    assert [event.attr_name for event in recorded_events] == [
+        event.attr_name for event in events
+    ]
+    assert recorded_events[0].attr_value.value == tango.DevState.ON
+    assert recorded_events[1].attr_value.value == 1
+    assert recorded_events[1].attr_value.quality == (
+        tango.AttrQuality.ATTR_VALID
+    )
+    assert recorded_events[1].attr_value.time.totime() == pytest.approx(100.1)
+    assert recorded_events[1].reception_date.totime() == pytest.approx(100.101)
+    assert recorded_events[2].attr_value.value == ("id", "[0, 'ok']")
+    assert recorded_events[4].err
+    assert recorded_events[4].errors[0].reason == "API_EventTimeout"
+
+    # A record truncated by an interrupted recording ends the log.
+    with open(path, "ab") as log_file:
+        log_file.write(b"\x01\x00\x00")
+    with EventLogReader(path) as reader:
+        assert len(list(reader)) == len(events)
+    # Recording again discards the truncated record.
+    with EventRecorder(path) as recorder:
+        recorder.record(make_event("state", tango.DevState.OFF, 100.5))
+    with EventLogReader(path) as reader:
+        recorded_events = list(reader)
+    assert len(recorded_events) == len(events) + 1
+    assert recorded_events[-1].attr_value.value == tango.DevState.OFF
+
+
+def test_event_replay_into_component_manager(tmp_path):
+    path = str(tmp_path / "events.log")
+    with EventRecorder(path) as recorder:
+        for index in range(50):
+            recorder.record(make_event("healthState", index % 3, index * 0.01))
+        recorder.record(make_event("unknownAttribute", 0, 1.0))
+
+    component_manager = Mock(
+        spec=["update_device_health_state", "update_device_state"]
+    )
+    report = EventReplayer(path, speed=10).replay(
+        component_manager_callbacks(component_manager)
+    )
+    assert report["replayed_events"] == 50
+    assert report["skipped_events"] == 1
+    assert report["failed_events"] == 0
+    assert report["duration_s"] == pytest.approx(0.049, abs=0.04)
+    assert report["callback_time_us"]["count"] == 50
+    component_manager.update_device_health_state.assert_called_with(
+        DEVICE_NAME, 49 % 3
+    )
+
+    report = EventReplayer(path, speed=0).replay(
+        component_manager_callbacks(component_manager)
+    )
+    assert report["replayed_events"] == 50
+    assert report["events_per_second"] > 1000
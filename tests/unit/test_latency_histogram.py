@@ -0,0 +1,93 @@
+import time
+from unittest.mock import Mock
+
+import tango
+
+from ska_tmc_common.latency_histogram import (
+    EventLatencyTracker,
+    LatencyHistogram,
+)
+from ska_tmc_common.v2.event_manager import EventManager
+
+DEVICE_NAME = "a/a/1"
+ATTRIBUTE_NAME = "obsState"
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram(significant_bits=5)
+    assert histogram.to_dict()["p99"] == -1
+    for latency in range(1, 100001):
+        histogram.record(latency)
+    statistics = histogram.to_dict()
+    assert statistics["count"] == 100000
+    assert statistics["min"] == 1
+    assert statistics["max"] == 100000
+    for key, expected in (("p50", 50000), ("p90", 90000), ("p99", 99000)):
+        assert abs(statistics[key] - expected) <= expected / 32
+    histogram.record(-5)
+    assert histogram.to_dict()["min"] == 0
+
+
+def create_event(source_time, received_time):
+    event = Mock()
+    event.err = False
+    event.attr_name = f"tango://host:10000/{DEVICE_NAME}/{ATTRIBUTE_NAME}"
+    event.attr_value.time = tango.TimeVal.fromtimestamp(source_time)
+    event.reception_date = tango.TimeVal.fromtimestamp(received_time)
+    return event
+
+
+def test_event_latency_tracker_stages():
+    tracker = EventLatencyTracker()
+    now = time.time()
+    tracker.record_event(
+        create_event(now - 0.5, now - 0.3), now - 0.1, completed_time=now
+    )
+    statistics = tracker.to_dict()[f"{DEVICE_NAME}/{ATTRIBUTE_NAME}"]
+    for stage, expected in (
+        ("transport", 200000),
+        ("queue_wait", 200000),
+        ("handler", 100000),
+        ("end_to_end", 500000),
+    ):
+        assert statistics[stage]["count"] == 1
+        assert abs(statistics[stage]["max"] - expected) < 1000
+
+
+def test_event_manager_records_callback_latency():
+    tracker = EventLatencyTracker()
+    event_manager = EventManager(Mock(), event_latency_tracker=tracker)
+    event_manager.obsstate_event_callback = Mock()
+    proxy = Mock()
+    event_manager.subscribe_attribute(proxy, DEVICE_NAME, ATTRIBUTE_NAME)
+    (_, _, callback), _ = proxy.subscribe_event.call_args
+
+    now = time.time()
+    event = create_event(now, now)
+    callback(event)
+    event_manager.obsstate_event_callback.assert_called_once_with(event)
+    statistics = tracker.to_dict()[f"{DEVICE_NAME}/{ATTRIBUTE_NAME}"]
+    assert statistics["end_to_end"]["count"] == 1
+
+
+def test_queued_events_are_recorded_once():
+    tracker = EventLatencyTracker()
+    event_manager = EventManager(
+        Mock(), event_latency_tracker=tracker, queued_event_processing=True
+    )
+    event_queue = []
+    event_manager.obsstate_event_callback = event_queue.append
+    proxy = Mock()
+    event_manager.subscribe_attribute(proxy, DEVICE_NAME, ATTRIBUTE_NAME)
+    (_, _, callback), _ = proxy.subscribe_event.call_args
+
+    now = time.time()
+    for _ in range(3):
+        callback(create_event(now, now))
+    # The processing thread of the leaf node records the other stages.
+    for event in event_queue:
+        tracker.record_event(event, time.time())
+    statistics = tracker.to_dict()[f"{DEVICE_NAME}/{ATTRIBUTE_NAME}"]
+    for stage in ("transport", "queue_wait", "handler", "end_to_end"):
+        assert statistics[stage]["count"] == 3
+    assert statistics["callback"]["count"] == 3
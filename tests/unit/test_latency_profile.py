@@ -0,0 +1,150 @@
+import json
+import random
+import statistics
+import threading
+import time
+
+import pytest
+
+from ska_tmc_common.test_helpers.latency_profile import (
+    LatencyDistribution,
+    LatencyInjector,
+    LatencyProfile,
+)
+from ska_tmc_common.test_helpers.simulation_scheduler import (
+    SimulationScheduler,
+)
+
+
+def test_latency_distributions():
+    rng = random.Random(3)
+    assert LatencyDistribution("fixed", value=0.2).sample(rng) == 0.2
+    uniform = LatencyDistribution("uniform", low=0.1, high=0.3)
+    assert all(0.1 <= uniform.sample(rng) <= 0.3 for _ in range(100))
+    lognormal = LatencyDistribution("lognormal", median=0.5, sigma=0.5)
+    samples = [lognormal.sample(rng) for _ in range(2000)]
+    assert statistics.median(samples) == pytest.approx(0.5, rel=0.1)
+    stalled = LatencyDistribution(
+        "fixed", value=0.1, stall_probability=1, stall_duration=30
+    )
+    assert stalled.sample(rng) == 30
+    for parameters in (
+        {"distribution": "normal"},
+        {"distribution": "uniform", "low": 1, "high": 0},
+        {"distribution": "lognormal", "median": 0},
+        {"distribution": "fixed", "value": 1, "stall_probability": 2},
+        {"distribution": "fixed", "mean": 1},
+    ):
+        with pytest.raises(ValueError):
+            LatencyDistribution.from_dict(parameters)
+
+    profile_json = json.dumps(
+        {
+            "seed": 1,
+            "commands": {"On": {"distribution": "fixed", "value": 0.5}},
+            "attributes": {
+                "obsState": {
+                    "distribution": "uniform",
+                    "low": 0.1,
+                    "high": 0.2,
+                }
+            },
+            "drop_probability": 0.5,
+        }
+    )
+    profile = LatencyProfile.from_json(profile_json)
+    assert LatencyProfile.from_json(
+        json.dumps(profile.to_dict())
+    ).to_dict() == (profile.to_dict())
+    assert profile.command_latency("On") == 0.5
+    assert profile.command_latency("Off") == 0.0
+    delays = [profile.event_delay("obsstate") for _ in range(1000)]
+    assert 400 < delays.count(None) < 600
+    assert all(0.1 <= delay <= 0.2 for delay in delays if delay is not None)
+    with pytest.raises(ValueError):
+        LatencyProfile.from_json(json.dumps({"jitter": {}}))
+
+
+def test_latency_injector():
+    injector = LatencyInjector(SimulationScheduler())
+    pushed = []
+    all_pushed = threading.Event()
+
+    def push(attr_name, value):
+        pushed.append((attr_name, value, time.monotonic()))
+        if value == "last":
+            all_pushed.set()
+
+    injector.push_change_event(push, "State", "no profile")
+    assert pushed[-1][1] == "no profile"
+    injector.set_profile(
+        json.dumps(
+            {
+                "commands": {
+                    "AssignResources": {"distribution": "fixed", "value": 0.2}
+                },
+                "event_jitter": {
+                    "distribution": "uniform",
+                    "low": 0,
+                    "high": 0.05,
+                },
+            }
+        )
+    )
+    start_time = time.monotonic()
+    injector.push_change_event(
+        push,
+        "longRunningCommandResult",
+        ("1.0-AssignResources", "0"),
+        command_name="AssignResources",
+    )
+    for value in range(50):
+        injector.push_change_event(push, "healthState", value)
+    injector.push_change_event(push, "healthState", "last")
+    assert all_pushed.wait(5)
+    health_states = [
+        value for name, value, _ in pushed if name == "healthState"
+    ]
+    assert health_states == list(range(50)) + ["last"]
+    time.sleep(0.3)
+    result_time = next(
+        push_time
+        for name, _, push_time in pushed
+        if name == "longRunningCommandResult"
+    )
+    assert result_time - start_time >= 0.2
+
+    injector.set_profile(json.dumps({"drop_probability": 1}))
+    injector.push_change_event(push, "State", "dropped")
+    assert injector.dropped_events == 1
+    assert "dropped" not in [value for _, value, _ in pushed]
+    injector.set_profile("{}")
+    assert injector.profile is None
+    assert injector.to_json() == "{}"
+
+
+def test_command_latency_is_applied_by_command_name():
+    injector = LatencyInjector(SimulationScheduler())
+    injector.set_profile(
+        json.dumps(
+            {"commands": {"Allocate": {"distribution": "fixed", "value": 60}}}
+        )
+    )
+    pushed = []
+
+    def push(attr_name, value):
+        pushed.append(value)
+
+    # The command name is not guessed from the unique id of the command.
+    injector.push_change_event(
+        push, "longRunningCommandResult", ("1.0-Allocate", "0")
+    )
+    assert pushed == [("1.0-Allocate", "0")]
+    injector.push_change_event(
+        push,
+        "longRunningCommandResult",
+        ("1.0-Allocate", "1"),
+        command_name="Allocate",
+    )
+    time.sleep(0.1)
+    assert pushed == [("1.0-Allocate", "0")]
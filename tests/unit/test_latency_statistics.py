@@ -0,0 +1,41 @@
+from ska_tmc_common import DeviceInfo, LatencyStatistics
+from ska_tmc_common.latency_statistics import summarise_latency
+
+
+def test_latency_statistics():
+    statistics = LatencyStatistics(window=100)
+    assert statistics.to_dict()["p99"] == -1
+
+    for latency in range(1, 201):
+        statistics.add_sample(latency)
+    result = statistics.to_dict()
+    # Only the last 100 samples are kept.
+    assert len(statistics) == 100
+    assert result["min"] == 101
+    assert result["mean"] == 150.5
+    assert result["p99"] == 199
+    assert result["last"] == 200
+
+    statistics.reset()
+    assert statistics.to_dict()["count"] == 0
+
+
+def test_device_info_ping_statistics():
+    dev_info = DeviceInfo("dummy/monitored/device")
+    dev_info.ping = 300
+    dev_info.ping = 500
+    dev_info.update_unresponsive(True, "Device is unresponsive")
+    assert dev_info.ping == -1
+    assert dev_info.to_dict()["pingStatistics"]["count"] == 2
+    assert dev_info.to_dict()["pingStatistics"]["min"] == 300
+
+
+def test_summarise_latency():
+    fast_device = DeviceInfo("dummy/fast/device")
+    slow_device = DeviceInfo("dummy/slow/device")
+    fast_device.ping = 100
+    slow_device.ping = 10000
+    summary = summarise_latency([fast_device, slow_device])
+    assert summary["slowest_device"] == "dummy/slow/device"
+    assert summary["devices"]["dummy/fast/device"]["mean"] == 100
+    assert summarise_latency([])["slowest_device"] is None
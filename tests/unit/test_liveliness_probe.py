@@ -1,6 +1,19 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
 import pytest
+from tango import DevFailed, DevState
+from tango.asyncio_executor import get_global_executor
 
-from ska_tmc_common import DishDeviceInfo, InputParameter, LivelinessProbeType
+from ska_tmc_common import (
+    CircuitBreakerState,
+    DeviceInfo,
+    DishDeviceInfo,
+    InputParameter,
+    LivelinessProbeType,
+)
 from ska_tmc_common.v1.liveliness_probe import BaseLivelinessProbe
 from ska_tmc_common.v1.liveliness_probe import (
     BaseLivelinessProbe as baselivelinessprobe,
@@ -13,6 +26,11 @@ from ska_tmc_common.v1.tmc_component_manager import TmcLeafNodeComponentManager
 from ska_tmc_common.v1.tmc_component_manager import (
     TmcLeafNodeComponentManager as TmcLNCM,
 )
+from ska_tmc_common.v2.liveliness_probe import (
+    AsyncMultiDeviceLivelinessProbe,
+    MultiDeviceLivelinessProbe,
+    StaggeredMultiDeviceLivelinessProbe,
+)
 from tests.settings import logger
 
 
@@ -88,3 +106,297 @@ def test_add_and_remove_device(dev_name, component_manager):
     assert len(lp._monitoring_devices) == initial_size
     lp.remove_devices([dev_name])
     assert len(lp._monitoring_devices) == initial_size
+
+
+def test_event_freshness_window_skips_probe(dev_name):
+    component_manager = mock.Mock()
+    probe = MultiDeviceLivelinessProbe(
+        component_manager, logger, event_freshness_window=5
+    )
+    probe._dev_factory = mock.Mock()
+    probe.get_device_and_database = mock.Mock(
+        return_value=(dev_name, mock.Mock())
+    )
+    dev_info = DeviceInfo(dev_name)
+
+    # A device which sent an event recently is not probed.
+    dev_info.record_change_event(time.time())
+    probe.device_task(dev_info)
+    probe.get_device_and_database.assert_not_called()
+    probe._dev_factory.get_device.assert_not_called()
+
+    # A silent device is probed and its round-trip latency is measured.
+    dev_info.record_change_event(time.time() - 10)
+    probe.device_task(dev_info)
+    probe._dev_factory.get_device.assert_called_once_with(dev_name)
+    assert dev_info.ping >= 0
+    assert dev_info.ping_statistics.to_dict()["count"] == 1
+
+    # An unresponsive device is always probed.
+    dev_info.record_change_event(time.time())
+    dev_info.update_unresponsive(True, "Device is unresponsive")
+    probe.device_task(dev_info)
+    assert probe._dev_factory.get_device.call_count == 2
+
+    # The heartbeat-aware mode is disabled by default.
+    probe.event_freshness_window = 0
+    assert not probe.has_fresh_event(DeviceInfo(dev_name))
+
+
+def test_event_freshness_window_ignores_error_events(dev_name):
+    component_manager = mock.Mock()
+    probe = MultiDeviceLivelinessProbe(
+        component_manager, logger, event_freshness_window=5
+    )
+    probe._dev_factory = mock.Mock()
+    probe._dev_factory.get_device.return_value.state.side_effect = DevFailed()
+    probe.get_device_and_database = mock.Mock(
+        return_value=(dev_name, mock.Mock())
+    )
+    dev_info = DeviceInfo(dev_name)
+    dev_info.record_change_event(time.time() - 10)
+
+    # API_EventTimeout errors of a dead device keep arriving within the
+    # window, as recorded by update_event_failure, but do not make it
+    # fresh: the device is still probed.
+    for _ in range(3):
+        dev_info.last_event_arrived = time.time()
+        dev_info.update_unresponsive(False)
+        assert not probe.has_fresh_event(dev_info)
+        probe.device_task(dev_info)
+    assert probe._dev_factory.get_device.call_count == 3
+    component_manager.update_exception_for_unresponsiveness.assert_called()
+
+
+def test_staggered_probe_add_and_remove_device(dev_name):
+    probe = StaggeredMultiDeviceLivelinessProbe(mock.Mock(), logger)
+    probe.add_device(dev_name)
+    probe.add_device(dev_name, interval=5)
+    probe.add_device("dummy/monitored/device2", interval=5)
+    assert len(probe.scheduler) == 2
+    assert probe.scheduler.get_schedule(dev_name).interval == 1
+    assert (
+        probe.scheduler.get_schedule("dummy/monitored/device2").interval == 5
+    )
+
+    probe.remove_devices([dev_name])
+    assert dev_name not in probe.scheduler
+    assert dev_name not in probe._monitoring_devices
+
+
+def test_staggered_probe_runs_probes_concurrently(dev_name):
+    hanging_device = "dummy/monitored/hanging"
+    release_hanging_probe = threading.Event()
+    probed_devices = []
+
+    def device_task(dev_info):
+        if dev_info.dev_name == hanging_device:
+            release_hanging_probe.wait(5)
+        probed_devices.append(dev_info.dev_name)
+
+    component_manager = mock.Mock()
+    component_manager.get_device.side_effect = DeviceInfo
+    probe = StaggeredMultiDeviceLivelinessProbe(
+        component_manager, logger, max_workers=2
+    )
+    probe.device_task = device_task
+    assert probe.submit_probe(hanging_device, 0)
+    assert probe.submit_probe(dev_name, 0)
+    # The hanging device is not probed twice at the same time.
+    assert not probe.submit_probe(hanging_device, 1)
+
+    start_time = time.time()
+    while dev_name not in probed_devices and time.time() - start_time < 2:
+        time.sleep(0.01)
+    assert probed_devices == [dev_name]
+    release_hanging_probe.set()
+    while len(probed_devices) < 2 and time.time() - start_time < 5:
+        time.sleep(0.01)
+    assert probed_devices == [dev_name, hanging_device]
+    probe.stop()
+    assert not probe.submit_probe(dev_name, 2)
+
+
+def test_circuit_breaker_backs_off_unresponsive_device(dev_name):
+    component_manager = mock.Mock()
+    component_manager.update_exception_for_unresponsiveness.side_effect = (
+        lambda dev_info, exception: dev_info.update_unresponsive(
+            True, exception
+        )
+    )
+    probe = MultiDeviceLivelinessProbe(
+        component_manager,
+        logger,
+        liveliness_check_period=60,
+        circuit_breaker_enabled=True,
+    )
+    probe._dev_factory = mock.Mock()
+    probe._dev_factory.get_device.return_value.state.side_effect = Exception(
+        "Device is down"
+    )
+    probe.get_device_and_database = mock.Mock(
+        return_value=(dev_name, mock.Mock())
+    )
+    dev_info = DeviceInfo(dev_name)
+
+    probe.device_task(dev_info)
+    assert dev_info.unresponsive
+    assert dev_info.circuit_breaker_state == CircuitBreakerState.OPEN
+    assert dev_info.to_dict()["circuitBreakerState"] == str(
+        CircuitBreakerState.OPEN
+    )
+
+    # The device is not probed again until its backoff expires.
+    probe.device_task(dev_info)
+    assert probe._dev_factory.get_device.call_count == 1
+
+    probe.remove_devices([dev_name])
+    assert (
+        probe.get_circuit_breaker(dev_name).state == CircuitBreakerState.CLOSED
+    )
+
+
+def test_async_probe_device_task(dev_name):
+    component_manager = mock.Mock()
+    component_manager.update_exception_for_unresponsiveness.side_effect = (
+        lambda dev_info, exception: dev_info.update_unresponsive(
+            True, exception
+        )
+    )
+    probe = AsyncMultiDeviceLivelinessProbe(component_manager, logger)
+    proxy = mock.Mock()
+    proxy.state = mock.AsyncMock(side_effect=Exception("Device is down"))
+    probe._dev_factory = mock.Mock()
+    probe._dev_factory.get_device.return_value = proxy
+    probe._is_device_exported = mock.Mock(return_value=True)
+    dev_info = DeviceInfo(dev_name)
+
+    asyncio.run(probe.async_device_task(dev_info))
+    assert dev_info.unresponsive
+    assert dev_info.exception == f"Unable to reach device {dev_name}"
+
+    proxy.state = mock.AsyncMock(return_value=DevState.ON)
+    asyncio.run(probe.async_device_task(dev_info))
+    component_manager.update_responsiveness_info.assert_called_once_with(
+        dev_name
+    )
+    (
+        component_manager.update_device_availabiity_for_subscription
+    ).assert_called_once_with(dev_name)
+    assert dev_info.ping >= 0
+
+
+def test_async_probe_does_not_block_event_loop():
+    probe = AsyncMultiDeviceLivelinessProbe(mock.Mock(), logger)
+    proxy = mock.Mock()
+    proxy.state = mock.AsyncMock(return_value=DevState.ON)
+
+    def get_device(dev_name, **kwargs):
+        # Latency of the connection to the device.
+        time.sleep(0.2)
+        return proxy
+
+    probe._dev_factory = mock.Mock()
+    probe._dev_factory.get_device.side_effect = get_device
+    dev_infos = [
+        DeviceInfo(f"dummy/monitored/device{index}") for index in range(4)
+    ]
+
+    async def probe_devices():
+        loop_gaps = []
+        probes = asyncio.gather(
+            *(probe.async_device_task(dev_info) for dev_info in dev_infos)
+        )
+        last_time = time.perf_counter()
+        while not probes.done():
+            await asyncio.sleep(0.01)
+            loop_gaps.append(time.perf_counter() - last_time)
+            last_time = time.perf_counter()
+        await probes
+        return loop_gaps
+
+    loop_gaps = asyncio.run(probe_devices())
+    assert max(loop_gaps) < 0.1
+    assert all(dev_info.ping >= 0 for dev_info in dev_infos)
+
+    async def probe_devices_twice():
+        await probe_devices()
+        await probe_devices()
+
+    # The proxies are cached for the event loop, and created again for a
+    # new event loop.
+    asyncio.run(probe_devices_twice())
+    assert probe._dev_factory.get_device.call_count == 8
+
+
+def test_bulk_add_and_remove_devices():
+    probe = MultiDeviceLivelinessProbe(mock.Mock(), logger)
+    dev_names = [f"dummy/monitored/device{index}" for index in range(500)]
+    assert probe.add_devices(dev_names) == dev_names
+    assert probe.add_devices(dev_names[:10]) == []
+    snapshot = probe.monitoring_devices
+    assert snapshot == tuple(dev_names)
+
+    removed = probe.remove_devices(dev_names[::2] + ["dummy/unknown/device"])
+    assert removed == dev_names[::2]
+    assert probe.monitoring_devices == tuple(dev_names[1::2])
+    # A snapshot taken before a change is not affected by it.
+    assert len(snapshot) == 500
+
+
+class ExecutorProxy:
+    """Proxy running its calls through its Tango asyncio executor, as the
+    asyncio green mode proxies do, and recording how many calls overlap."""
+
+    lock = threading.Lock()
+    active_calls = 0
+    max_active_calls = 0
+    call_count = 0
+
+    def __init__(self, dev_name, green_mode=None, asyncio_executor=None):
+        self._executor = asyncio_executor or get_global_executor()
+
+    def state(self):
+        return self._executor.run(self._state)
+
+    @classmethod
+    def _state(cls):
+        with cls.lock:
+            cls.active_calls += 1
+            cls.max_active_calls = max(cls.max_active_calls, cls.active_calls)
+        time.sleep(0.2)
+        with cls.lock:
+            cls.active_calls -= 1
+            cls.call_count += 1
+        return DevState.ON
+
+
+def test_async_probes_on_separate_loops_overlap_calls():
+    device_infos = {}
+    component_manager = mock.Mock()
+    component_manager.get_device.side_effect = (
+        lambda dev_name: device_infos.setdefault(
+            dev_name, DeviceInfo(dev_name)
+        )
+    )
+    with mock.patch("tango.DeviceProxy", ExecutorProxy):
+        probes = []
+        for probe_index in range(2):
+            probe = AsyncMultiDeviceLivelinessProbe(
+                component_manager, logger, liveliness_check_period=60
+            )
+            probe.add_devices(
+                f"dummy/probe{probe_index}/device{index}" for index in range(4)
+            )
+            probe.start()
+            probes.append(probe)
+        start_time = time.time()
+        while ExecutorProxy.call_count < 8 and time.time() - start_time < 5:
+            time.sleep(0.01)
+        for probe in probes:
+            probe.stop()
+            probe._thread.join(timeout=5)
+
+    assert ExecutorProxy.call_count == 8
+    # The calls of both probes are awaited on their own loop.
+    assert ExecutorProxy.max_active_calls > 4
@@ -0,0 +1,123 @@
+import json
+import logging
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from ska_tmc_common.metrics import MetricsRegistry
+from ska_tmc_common.v2.event_manager import EventManager
+from ska_tmc_common.v2.liveliness_probe import MultiDeviceLivelinessProbe
+
+logger = logging.getLogger(__name__)
+
+
+def test_metrics_registry_exposition():
+    registry = MetricsRegistry()
+    counter = registry.counter(
+        "tmc_events_total", "Events received", {"device": 'a/"b"/1'}
+    )
+    assert (
+        registry.counter("tmc_events_total", labels={"device": 'a/"b"/1'})
+        is counter
+    )
+
+    def increment():
+        for _ in range(10000):
+            counter.inc()
+
+    threads = [threading.Thread(target=increment) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc()
+    assert counter.value == 80001
+
+    gauge = registry.gauge("tmc_in_flight", "Commands in flight")
+    gauge.inc(3)
+    gauge.dec()
+    assert gauge.value == 2
+    gauge.set(7)
+    assert gauge.value == 7
+    registry.gauge("tmc_queue_depth", "Queue depth", function=lambda: 4)
+    histogram = registry.histogram(
+        "tmc_duration_seconds", "Durations", buckets=(0.1, 1.0)
+    )
+    for value in (0.05, 0.5, 0.5, 5):
+        histogram.observe(value)
+    with pytest.raises(ValueError):
+        registry.gauge("tmc_events_total")
+    with pytest.raises(ValueError):
+        registry.histogram("tmc_other_seconds", buckets=(1.0, 0.1))
+
+    metrics = json.loads(registry.to_json())
+    assert metrics["tmc_queue_depth"]["samples"] == [
+        {"labels": {}, "value": 4}
+    ]
+    assert metrics["tmc_duration_seconds"]["samples"][0]["buckets"] == {
+        "0.1": 1,
+        "1": 3,
+        "+Inf": 4,
+    }
+    lines = registry.to_prometheus().splitlines()
+    assert lines[:3] == [
+        "# HELP tmc_events_total Events received",
+        "# TYPE tmc_events_total counter",
+        'tmc_events_total{device="a/\\"b\\"/1"} 80001',
+    ]
+    assert "# TYPE tmc_duration_seconds histogram" in lines
+    assert 'tmc_duration_seconds_bucket{le="1"} 3' in lines
+    assert "tmc_duration_seconds_sum 6.05" in lines
+    assert "tmc_duration_seconds_count 4" in lines
+
+
+def test_event_manager_and_probe_metrics():
+    registry = MetricsRegistry()
+    event_manager = EventManager(Mock(), metrics_registry=registry)
+    assert event_manager.metrics_registry is registry
+    event_manager.record_subscription_attempt("a/a/1", "obsState", True)
+    event_manager.record_subscription_attempt("a/a/1", "state", False)
+    event = Mock()
+    event.attr_name = "tango://host:10000/a/a/1/obsState"
+    event.errors = [Mock(reason="API_CorbaException", desc="")]
+    event_manager.submit_event_error(event)
+
+    component_manager = Mock()
+    component_manager.get_device.side_effect = lambda dev_name: Mock(
+        dev_name=dev_name, unresponsive=dev_name == "a/a/2"
+    )
+    probe = MultiDeviceLivelinessProbe(
+        component_manager, logger, metrics_registry=registry
+    )
+    probe.add_devices(["a/a/1", "a/a/2", "a/a/3"])
+    probe.record_probe_result(Mock(dev_name="a/a/2"), False)
+
+    metrics = registry.to_dict()
+    subscriptions = {
+        sample["labels"]["result"]: sample["value"]
+        for sample in metrics["tmc_event_subscriptions_total"]["samples"]
+    }
+    assert subscriptions == {"success": 1, "failure": 1}
+    assert metrics["tmc_event_errors_total"]["samples"][0]["value"] == 1
+    probes = {
+        sample["labels"]["result"]: sample["value"]
+        for sample in metrics["tmc_liveliness_probes_total"]["samples"]
+    }
+    assert probes == {"success": 0, "failure": 1}
+    assert (
+        metrics["tmc_liveliness_unresponsive_devices"]["samples"][0]["value"]
+        == 1
+    )
+
+
+def test_cells_of_terminated_threads_are_retired():
+    counter = MetricsRegistry().counter("tmc_test_total", "Test counter")
+    for _ in range(100):
+        thread = threading.Thread(target=counter.inc)
+        thread.start()
+        thread.join()
+    # The cell of a terminated thread is retired when the next thread
+    # registers its cell, before the counter is collected.
+    assert len(counter._cells._cells) == 1
+    assert counter.value == 100
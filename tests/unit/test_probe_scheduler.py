@@ -0,0 +1,73 @@
+import pytest
+
+from ska_tmc_common.v2.probe_scheduler import ProbeScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_phases_are_spread_over_the_interval(clock):
+    scheduler = ProbeScheduler(1.0, clock=clock)
+    for index in range(100):
+        assert scheduler.add_device(f"test/device/{index}")
+    assert not scheduler.add_device("test/device/0")
+    assert len(scheduler) == 100
+
+    phases = sorted(
+        scheduler.get_schedule(f"test/device/{index}").phase
+        for index in range(100)
+    )
+    gaps = [later - earlier for earlier, later in zip(phases, phases[1:])]
+    assert all(0 <= phase < 1.0 for phase in phases)
+    assert max(gaps) < 0.03
+
+
+def test_pop_due_reschedules_devices(clock):
+    scheduler = ProbeScheduler(1.0, clock=clock)
+    scheduler.add_device("test/device/1", phase=0.0)
+    scheduler.add_device("test/device/2", phase=0.5)
+    scheduler.add_device("test/device/3", interval=2.0, phase=0.25)
+
+    assert scheduler.pop_due() == [("test/device/1", 100.0)]
+    assert scheduler.time_until_next() == pytest.approx(0.25)
+
+    clock.now = 100.6
+    assert [name for name, _ in scheduler.pop_due()] == [
+        "test/device/3",
+        "test/device/2",
+    ]
+    assert scheduler.get_schedule("test/device/1").next_due == 101.0
+    assert scheduler.get_schedule("test/device/3").next_due == 102.25
+
+
+def test_late_devices_skip_missed_probes(clock):
+    scheduler = ProbeScheduler(1.0, clock=clock)
+    scheduler.add_device("test/device/1", phase=0.0)
+    clock.now = 103.5
+    assert scheduler.pop_due() == [("test/device/1", 100.0)]
+    assert scheduler.get_schedule("test/device/1").next_due == 104.0
+    assert scheduler.pop_due() == []
+
+
+def test_removed_devices_are_not_probed(clock):
+    scheduler = ProbeScheduler(1.0, clock=clock)
+    assert scheduler.time_until_next() is None
+    scheduler.add_device("test/device/1", phase=0.0)
+    scheduler.add_device("test/device/2", phase=0.1)
+    assert scheduler.remove_device("test/device/1")
+    assert not scheduler.remove_device("test/device/1")
+    assert "test/device/1" not in scheduler
+
+    clock.now = 100.5
+    assert scheduler.pop_due() == [("test/device/2", 100.1)]
+    assert scheduler.device_names == ["test/device/2"]
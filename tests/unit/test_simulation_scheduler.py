@@ -0,0 +1,31 @@
+import threading
+import time
+
+from ska_tmc_common.test_helpers.simulation_scheduler import (
+    SimulationScheduler,
+)
+
+
+def test_scheduled_calls_order():
+    scheduler = SimulationScheduler()
+    calls = []
+    done = threading.Event()
+    start_time = time.monotonic()
+    scheduler.call_later(0.2, done.set)
+    scheduler.call_later(0.1, calls.append, "second")
+    scheduler.call_later(0.05, calls.append, "first")
+    scheduler.call_later(0.1, calls.append, "third")
+    cancelled = scheduler.timer(0.05, calls.append, args=["cancelled"])
+    cancelled.start()
+    cancelled.cancel()
+    scheduler.call_later(0.0, lambda: 1 / 0)
+    assert done.wait(5)
+    assert time.monotonic() - start_time >= 0.2
+    assert calls == ["first", "second", "third"]
+    assert len(scheduler) == 0
+
+
+def test_shared_scheduler():
+    assert SimulationScheduler.get_instance() is (
+        SimulationScheduler.get_instance()
+    )
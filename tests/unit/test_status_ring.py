@@ -0,0 +1,74 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from ska_tmc_common.clock import VirtualClock, set_clock
+from ska_tmc_common.v2.status_ring import StatusRing
+
+
+@pytest.fixture
+def process_clock():
+    yield
+    set_clock(None)
+
+
+def test_status_ring_keeps_latest_entries():
+    ring = StatusRing(maximum_size=3)
+    for index in range(5):
+        ring.append(f"status {index}")
+    assert len(ring) == 3
+    assert [entry.message for entry in ring.entries] == [
+        "status 2",
+        "status 3",
+        "status 4",
+    ]
+    assert ring.statuses[-1].endswith("::status 4")
+
+
+def test_status_update_callback_is_coalesced():
+    callback = Mock()
+    ring = StatusRing(
+        maximum_size=3, update_callback=callback, minimum_update_interval=0.2
+    )
+    for index in range(100):
+        ring.append(f"status {index}")
+    callback.assert_called_once()
+    assert callback.call_args[0][0][0].endswith("::status 0")
+
+    start_time = time.time()
+    while callback.call_count < 2:
+        assert time.time() - start_time < 5
+        time.sleep(0.01)
+    statuses = callback.call_args[0][0]
+    assert [status.split("::")[-1] for status in statuses] == [
+        "status 97",
+        "status 98",
+        "status 99",
+    ]
+    time.sleep(0.3)
+    assert callback.call_count == 2
+
+
+def test_status_ring_uses_process_clock(process_clock):
+    clock = VirtualClock(start_time=1000.0)
+    set_clock(clock)
+    callback = Mock()
+    ring = StatusRing(update_callback=callback, minimum_update_interval=60)
+    ring.append("status 0")
+    ring.append("status 1")
+    assert [entry.timestamp for entry in ring.entries] == [1000.0, 1000.0]
+    callback.assert_called_once()
+
+    # The deferred call is made once the clock reaches the end of the
+    # interval, whatever the real time.
+    start_time = time.time()
+    while clock.next_deadline() != 60:
+        assert time.time() - start_time < 5
+        time.sleep(0.001)
+    assert callback.call_count == 1
+    clock.advance(60)
+    while callback.call_count < 2:
+        assert time.time() - start_time < 5
+        time.sleep(0.001)
+    assert len(callback.call_args[0][0]) == 2
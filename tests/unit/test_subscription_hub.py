@@ -0,0 +1,199 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from ska_tmc_common.clock import VirtualClock, set_clock
+from ska_tmc_common.v2.event_manager import EventManager
+from ska_tmc_common.v2.subscription_hub import SubscriptionHub
+
+DEVICE_NAME = "a/a/1"
+ATTRIBUTE_NAME = "obsState"
+
+
+@pytest.fixture
+def process_clock():
+    yield
+    set_clock(None)
+
+
+def create_timeout_event():
+    event = Mock()
+    event.attr_name = f"{DEVICE_NAME}/{ATTRIBUTE_NAME}"
+    event.errors = [
+        Mock(
+            reason="API_EventTimeout",
+            desc="Event channel is not responding anymore",
+        )
+    ]
+    return event
+
+
+def test_subscription_is_shared_and_reference_counted():
+    hub = SubscriptionHub()
+    proxy = Mock()
+    proxy.subscribe_event.return_value = 42
+    first_callback = Mock()
+    second_callback = Mock()
+
+    first_id = hub.subscribe(
+        DEVICE_NAME, ATTRIBUTE_NAME, first_callback, proxy
+    )
+    (_, _, dispatch), _ = proxy.subscribe_event.call_args
+    initial_event = Mock(err=False)
+    dispatch(initial_event)
+    # The second consumer gets the latest event on joining, then every
+    # event, from the same underlying subscription.
+    second_id = hub.subscribe(
+        DEVICE_NAME, ATTRIBUTE_NAME.lower(), second_callback, proxy
+    )
+    second_callback.assert_called_once_with(initial_event)
+    event = Mock()
+    dispatch(event)
+    first_callback.assert_called_with(event)
+    second_callback.assert_called_with(event)
+    proxy.subscribe_event.assert_called_once()
+    assert hub.consumer_count(DEVICE_NAME, ATTRIBUTE_NAME) == 2
+
+    assert hub.unsubscribe(first_id)
+    proxy.unsubscribe_event.assert_not_called()
+    assert hub.unsubscribe(second_id)
+    proxy.unsubscribe_event.assert_called_once_with(42)
+    assert not hub.unsubscribe(second_id)
+    assert hub.statistics == {"subscriptions": 0, "consumers": 0}
+
+
+def test_failed_subscription_is_not_shared():
+    hub = SubscriptionHub()
+    proxy = Mock()
+    proxy.subscribe_event.side_effect = [Exception("Not ready"), 7]
+    with pytest.raises(Exception, match="Not ready"):
+        hub.subscribe(DEVICE_NAME, ATTRIBUTE_NAME, Mock(), proxy)
+    assert len(hub) == 0
+    assert hub.subscribe(DEVICE_NAME, ATTRIBUTE_NAME, Mock(), proxy)
+    assert len(hub) == 1
+
+
+def test_event_managers_share_subscriptions_through_hub():
+    hub = SubscriptionHub()
+    proxy = Mock()
+    proxy.subscribe_event.return_value = 1
+    event_managers = [
+        EventManager(Mock(), subscription_hub=hub) for _ in range(2)
+    ]
+    for event_manager in event_managers:
+        event_manager.obsstate_event_callback = Mock()
+        assert event_manager.subscribe_device_attributes(
+            DEVICE_NAME, [ATTRIBUTE_NAME], proxy
+        )
+    proxy.subscribe_event.assert_called_once()
+
+    event = Mock()
+    (_, _, dispatch), _ = proxy.subscribe_event.call_args
+    dispatch(event)
+    for event_manager in event_managers:
+        event_manager.obsstate_event_callback.assert_called_once_with(event)
+
+    event_managers[0]._EventManager__device_factory = Mock()
+    event_managers[0]._EventManager__device_factory.get_device.return_value = (
+        proxy
+    )
+    event_managers[0].unsubscribe_events(DEVICE_NAME)
+    assert hub.consumer_count(DEVICE_NAME, ATTRIBUTE_NAME) == 1
+    proxy.unsubscribe_event.assert_not_called()
+
+
+def test_resubscribe_recreates_shared_subscription():
+    hub = SubscriptionHub()
+    proxy = Mock()
+    proxy.subscribe_event.side_effect = [1, 2]
+    first_callback = Mock()
+    second_callback = Mock()
+    hub.subscribe(DEVICE_NAME, ATTRIBUTE_NAME, first_callback, proxy)
+    hub.subscribe(DEVICE_NAME, ATTRIBUTE_NAME, second_callback, proxy)
+    (_, _, dispatch), _ = proxy.subscribe_event.call_args
+    error_event = Mock(err=True)
+    dispatch(error_event)
+    # Error events are forwarded but not replayed to a joining consumer.
+    third_callback = Mock()
+    hub.subscribe(DEVICE_NAME, ATTRIBUTE_NAME, third_callback, proxy)
+    third_callback.assert_not_called()
+
+    assert hub.resubscribe(DEVICE_NAME, ATTRIBUTE_NAME)
+    proxy.unsubscribe_event.assert_called_once_with(1)
+    assert proxy.subscribe_event.call_count == 2
+    assert hub.consumer_count(DEVICE_NAME, ATTRIBUTE_NAME) == 3
+    event = Mock(err=False)
+    dispatch(event)
+    for callback in (first_callback, second_callback, third_callback):
+        callback.assert_called_with(event)
+    assert not hub.resubscribe(DEVICE_NAME, "healthState")
+
+
+def test_event_manager_resubscribes_through_hub():
+    hub = SubscriptionHub()
+    proxy = Mock()
+    proxy.subscribe_event.side_effect = [1, 2]
+    event_managers = [
+        EventManager(Mock(), subscription_hub=hub, event_error_max_count=0)
+        for _ in range(2)
+    ]
+    for event_manager in event_managers:
+        event_manager.obsstate_event_callback = Mock()
+        event_manager.subscribe_device_attributes(
+            DEVICE_NAME, [ATTRIBUTE_NAME], proxy
+        )
+    event_managers[0].check_and_handle_event_error(create_timeout_event())
+    start_time = time.time()
+    while event_managers[0].event_error_statistics["handled"] < 1:
+        assert time.time() - start_time < 5
+        time.sleep(0.01)
+    proxy.unsubscribe_event.assert_called_once_with(1)
+    assert proxy.subscribe_event.call_count == 2
+    assert hub.consumer_count(DEVICE_NAME, ATTRIBUTE_NAME) == 2
+
+
+def test_resubscribe_is_debounced(process_clock):
+    clock = VirtualClock(start_time=1000.0)
+    set_clock(clock)
+    hub = SubscriptionHub(minimum_resubscription_interval=10.0)
+    proxy = Mock()
+    proxy.subscribe_event.side_effect = [1, 2, 3]
+    hub.subscribe(DEVICE_NAME, ATTRIBUTE_NAME, Mock(), proxy)
+
+    assert hub.resubscribe(DEVICE_NAME, ATTRIBUTE_NAME)
+    clock.advance(5.0)
+    assert hub.resubscribe(DEVICE_NAME, ATTRIBUTE_NAME)
+    proxy.unsubscribe_event.assert_called_once_with(1)
+    assert proxy.subscribe_event.call_count == 2
+
+    clock.advance(5.0)
+    assert hub.resubscribe(DEVICE_NAME, ATTRIBUTE_NAME)
+    proxy.unsubscribe_event.assert_called_with(2)
+    assert proxy.subscribe_event.call_count == 3
+
+
+def test_consumers_resubscribe_shared_subscription_once():
+    hub = SubscriptionHub()
+    proxy = Mock()
+    proxy.subscribe_event.side_effect = [1, 2]
+    event_managers = [
+        EventManager(Mock(), subscription_hub=hub, event_error_max_count=0)
+        for _ in range(3)
+    ]
+    for event_manager in event_managers:
+        event_manager.obsstate_event_callback = Mock()
+        event_manager.subscribe_device_attributes(
+            DEVICE_NAME, [ATTRIBUTE_NAME], proxy
+        )
+    # Every consumer receives the error event of the shared subscription.
+    for event_manager in event_managers:
+        event_manager.check_and_handle_event_error(create_timeout_event())
+    start_time = time.time()
+    for event_manager in event_managers:
+        while event_manager.event_error_statistics["handled"] < 1:
+            assert time.time() - start_time < 5
+            time.sleep(0.01)
+    proxy.unsubscribe_event.assert_called_once_with(1)
+    assert proxy.subscribe_event.call_count == 2
+    assert hub.consumer_count(DEVICE_NAME, ATTRIBUTE_NAME) == 3
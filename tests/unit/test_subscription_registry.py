@@ -0,0 +1,62 @@
+from ska_tmc_common.v2.subscription_registry import SubscriptionRegistry
+
+DEVICE_NAME = "a/a/1"
+
+
+def test_subscription_registry():
+    registry = SubscriptionRegistry()
+    registry.init_device(DEVICE_NAME)
+    assert DEVICE_NAME in registry
+    assert registry.incomplete_devices == {DEVICE_NAME}
+    assert not registry.is_completed(DEVICE_NAME)
+
+    registry.add_subscription(DEVICE_NAME, "state", 1)
+    registry.add_subscription(DEVICE_NAME, "healthState", 2)
+    assert registry.is_subscribed(DEVICE_NAME, "state")
+    assert not registry.is_subscribed(DEVICE_NAME, "obsState")
+    assert registry.get_subscription_id(DEVICE_NAME, "healthState") == 2
+
+    registry.set_completed(DEVICE_NAME)
+    assert registry.is_completed(DEVICE_NAME)
+    assert registry.incomplete_devices == frozenset()
+    assert registry.to_dict() == {
+        DEVICE_NAME: {
+            "state": {"subscription_id": 1},
+            "healthState": {"subscription_id": 2},
+            "is_subscription_completed": True,
+        }
+    }
+
+    registry.remove_subscription(DEVICE_NAME, "state")
+    assert registry.subscribed_attributes(DEVICE_NAME) == ["healthState"]
+    registry.remove_subscription(DEVICE_NAME, "healthState")
+    assert DEVICE_NAME not in registry
+
+
+def test_subscription_registry_load():
+    registry = SubscriptionRegistry()
+    subscriptions = {
+        DEVICE_NAME: {
+            "state": {"subscription_id": 1},
+            "is_subscription_completed": True,
+        },
+        "a/a/2": {},
+    }
+    registry.load(subscriptions)
+    assert registry.to_dict() == subscriptions
+    assert registry.incomplete_devices == {"a/a/2"}
+
+
+def test_subscription_registry_returns_copies():
+    registry = SubscriptionRegistry()
+    subscriptions = {DEVICE_NAME: {"state": {"subscription_id": 1}}}
+    registry.load(subscriptions)
+    subscriptions[DEVICE_NAME]["state"]["subscription_id"] = 2
+
+    copy = registry.to_dict()
+    copy[DEVICE_NAME]["state"]["subscription_id"] = 3
+    copy[DEVICE_NAME]["is_subscription_completed"] = True
+    copy.pop(DEVICE_NAME)
+
+    assert registry.get_subscription_id(DEVICE_NAME, "state") == 1
+    assert registry.incomplete_devices == {DEVICE_NAME}